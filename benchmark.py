@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+성능 벤치마크 스크립트
+
+사용 예:
+    python benchmark.py json                          # 샘플 데이터로 만든 응답으로 측정
+    python benchmark.py json --samples llm_responses  # 기록된 LLM 응답(.txt)으로 측정
+    python benchmark.py prompts                       # 프롬프트별 토큰 수 (원본/최소화)
+    python benchmark.py storage --data-dir data       # 시나리오 저장 형식별 파일 크기와 읽기 시간
+    python benchmark.py serializer --data-dir data    # JSON 직렬화기별 직렬화/역직렬화 시간
+
+LLM 원본 응답은 LLM_RESPONSE_LOG_DIR 환경 변수를 설정하고 게임을 생성하면 기록됩니다.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data, iter_stored_scenarios
+from src.models.scenario import validate_scenario
+from src.utils.file_manager import json_checksum
+from src.utils.serializer import available_serializers
+from src.utils.scenario_codec import encode_scenario, decode_scenario, COMPRESSION_ZSTD, COMPRESSION_ZLIB
+from src.utils.json_extractor import extract_json_array
+from src.utils.prompts import get_prompt_token_report
+
+
+def _timeit(func, sample, repeat):
+    """sample에 func를 repeat번 적용한 평균 시간(ms)과 마지막 결과를 반환"""
+    result = None
+    started_at = time.perf_counter()
+    for _ in range(repeat):
+        result = func(sample)
+    elapsed = (time.perf_counter() - started_at) / repeat
+    return elapsed * 1000, result
+
+
+# --- JSON 추출 ---
+
+def _legacy_extract(content):
+    """기존 generate_game_data의 추출 방식 (코드 블록 제거 → json.loads → 정규식 2종)"""
+    cleaned_content = content.strip()
+    if cleaned_content.startswith("```"):
+        lines = cleaned_content.split("\n")
+        if len(lines) >= 3 and lines[0].startswith("```") and "```" in lines[-1]:
+            cleaned_content = "\n".join(lines[1:-1])
+    cleaned_content = cleaned_content.strip()
+    try:
+        json.loads(cleaned_content)
+        return cleaned_content
+    except json.JSONDecodeError:
+        pass
+    array_match = re.search(r'(\[\s*\{.*\}\s*\])', cleaned_content, re.DOTALL)
+    if array_match:
+        try:
+            json.loads(array_match.group(1))
+            return array_match.group(1)
+        except json.JSONDecodeError:
+            pass
+    objects = re.findall(r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})', cleaned_content, re.DOTALL)
+    if objects:
+        try:
+            json_array = "[" + ",".join(objects) + "]"
+            json.loads(json_array)
+            return json_array
+        except json.JSONDecodeError:
+            pass
+    return None
+
+
+def _new_extract(content):
+    """json_extractor 기반 추출 (복구가 적용된 경우에만 재검증)"""
+    json_content, repairs = extract_json_array(content)
+    if json_content is None:
+        return None
+    if repairs:
+        try:
+            json.loads(json_content)
+        except json.JSONDecodeError:
+            return None
+    return json_content
+
+
+def _synthesize_responses():
+    """샘플 게임 데이터로 LLM 응답에서 자주 보이는 형태들을 만듭니다."""
+    pretty = json.dumps(create_sample_game_data(), ensure_ascii=False, indent=2)
+    trailing_comma = pretty[:-2] + ",\n]"
+    return {
+        "clean": pretty,
+        "fenced": f"```json\n{pretty}\n```",
+        "prose": f"요청하신 시나리오입니다!\n\n```json\n{pretty}\n```\n\n즐거운 게임 되세요.",
+        "trailing_comma": trailing_comma,
+        "truncated": pretty[: int(len(pretty) * 0.8)],
+    }
+
+
+def _load_recorded_responses(samples_dir):
+    """기록된 LLM 응답 파일(.txt)을 읽어옵니다."""
+    responses = {}
+    for filename in sorted(os.listdir(samples_dir)):
+        if filename.endswith(".txt"):
+            with open(os.path.join(samples_dir, filename), 'r', encoding='utf-8') as f:
+                responses[filename] = f.read()
+    return responses
+
+
+def benchmark_json(args):
+    """JSON 추출 방식 비교"""
+    if args.samples:
+        responses = _load_recorded_responses(args.samples)
+        if not responses:
+            print(f"{args.samples}에 기록된 응답(.txt)이 없습니다.")
+            return
+    else:
+        responses = _synthesize_responses()
+
+    print(f"{'응답':<32}{'길이':>8}{'기존(ms)':>12}{'신규(ms)':>12}  복구된 턴 수(기존/신규)")
+    total_legacy = total_new = 0.0
+    for name, content in responses.items():
+        legacy_ms, legacy_result = _timeit(_legacy_extract, content, args.repeat)
+        new_ms, new_result = _timeit(_new_extract, content, args.repeat)
+        total_legacy += legacy_ms
+        total_new += new_ms
+        print(f"{name[:30]:<32}{len(content):>8}{legacy_ms:>12.3f}{new_ms:>12.3f}  "
+              f"{_count_turns(legacy_result)}/{_count_turns(new_result)}")
+    print(f"{'합계':<40}{total_legacy:>12.3f}{total_new:>12.3f}")
+
+
+def _count_turns(json_content):
+    """추출 결과에서 turn_number가 있는 턴 객체 수를 셉니다."""
+    if json_content is None:
+        return 0
+    return sum(1 for turn in json.loads(json_content) if isinstance(turn, dict) and "turn_number" in turn)
+
+
+# --- 프롬프트 토큰 ---
+
+def benchmark_prompts(args):
+    """프롬프트별 길이와 토큰 수 (--exact면 Gemini 토크나이저로 계산, API 키 필요)"""
+    if args.exact:
+        from src.models.llm_handler import initialize_llm
+        report = get_prompt_token_report(initialize_llm().get_num_tokens)
+    else:
+        report = get_prompt_token_report()
+
+    print(f"{'프롬프트':<20}{'글자 수':>10}{'토큰':>10}{'최소화 글자 수':>16}{'최소화 토큰':>14}{'절감':>8}")
+    for row in report:
+        saved = 1 - row["minimized_tokens"] / row["tokens"] if row["tokens"] else 0
+        print(f"{row['name']:<20}{row['chars']:>10}{row['tokens']:>10}"
+              f"{row['minimized_chars']:>16}{row['minimized_tokens']:>14}{saved:>8.1%}")
+    if not args.exact:
+        print("(토큰 수는 추정치입니다. 정확한 값은 --exact 옵션을 사용하세요.)")
+
+
+# --- 시나리오 저장 형식 ---
+
+def _storage_formats():
+    """저장 형식 이름 → (인코딩 함수, 디코딩 함수)"""
+    def encode_envelope(turns):
+        envelope = {"format": 1, "checksum": json_checksum(turns), "data": turns}
+        return json.dumps(envelope, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def decode_envelope(data):
+        envelope = json.loads(data)
+        if json_checksum(envelope["data"]) != envelope["checksum"]:
+            raise ValueError("checksum mismatch")
+        return envelope["data"]
+
+    return {
+        "json (indent=2, 기존)": (lambda turns: json.dumps(turns, ensure_ascii=False, indent=2).encode("utf-8"),
+                                 json.loads),
+        "json (압축 표현+체크섬)": (encode_envelope, decode_envelope),
+        "scn (zstd)": (lambda turns: encode_scenario(turns, COMPRESSION_ZSTD), decode_scenario),
+        "scn (zlib)": (lambda turns: encode_scenario(turns, COMPRESSION_ZLIB), decode_scenario),
+    }
+
+
+def benchmark_storage(args):
+    """저장 형식별 전체 파일 크기와 시나리오 하나를 읽는(디코딩+검증) 평균 시간"""
+    if args.data_dir:
+        scenarios = [scenario.turns for _, scenario in iter_stored_scenarios(args.data_dir)]
+        if not scenarios:
+            print(f"{args.data_dir}에 시나리오 파일이 없습니다.")
+            return
+    else:
+        scenarios = [create_sample_game_data()]
+
+    print(f"시나리오 {len(scenarios)}개")
+    print(f"{'형식':<28}{'전체 크기(바이트)':>18}{'비율':>8}{'읽기(ms)':>12}")
+    baseline = None
+    for name, (encode, decode) in _storage_formats().items():
+        encoded = [encode(turns) for turns in scenarios]
+        size = sum(len(data) for data in encoded)
+        baseline = baseline or size
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            for data, turns in zip(encoded, scenarios):
+                decoded = decode(data)
+                validate_scenario(decoded)
+        elapsed = (time.perf_counter() - started_at) / (args.repeat * len(scenarios)) * 1000
+        assert decoded == turns, f"{name}: 원래 데이터와 다르게 복원되었습니다."
+        print(f"{name:<28}{size:>18,}{size / baseline:>8.1%}{elapsed:>12.3f}")
+
+
+# --- JSON 직렬화기 ---
+
+def benchmark_serializer(args):
+    """설치된 JSON 직렬화기별 시나리오 파일 직렬화/역직렬화 평균 시간"""
+    if args.data_dir:
+        payloads = []
+        for filename in sorted(os.listdir(args.data_dir)):
+            if filename.endswith(".json"):
+                with open(os.path.join(args.data_dir, filename), 'rb') as f:
+                    payloads.append(json.loads(f.read()))
+        if not payloads:
+            print(f"{args.data_dir}에 JSON 시나리오 파일이 없습니다.")
+            return
+    else:
+        payloads = [create_sample_game_data()]
+
+    print(f"파일 {len(payloads)}개")
+    print(f"{'직렬화기':<12}{'직렬화(ms)':>14}{'역직렬화(ms)':>16}{'크기(바이트)':>14}")
+    for serializer in available_serializers():
+        encoded = [serializer.dumps(payload) for payload in payloads]
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            for payload in payloads:
+                serializer.dumps(payload)
+        dumps_ms = (time.perf_counter() - started_at) / (args.repeat * len(payloads)) * 1000
+        started_at = time.perf_counter()
+        for _ in range(args.repeat):
+            for data in encoded:
+                serializer.loads(data)
+        loads_ms = (time.perf_counter() - started_at) / (args.repeat * len(payloads)) * 1000
+        print(f"{serializer.name:<12}{dumps_ms:>14.4f}{loads_ms:>16.4f}{sum(map(len, encoded)):>14,}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="성능 벤치마크")
+    subparsers = parser.add_subparsers(dest="target", required=True)
+
+    json_parser = subparsers.add_parser("json", help="LLM 응답 JSON 추출 벤치마크")
+    json_parser.add_argument("--samples", type=str, help="기록된 LLM 응답(.txt)이 있는 디렉토리")
+    json_parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    json_parser.set_defaults(func=benchmark_json)
+
+    prompts_parser = subparsers.add_parser("prompts", help="프롬프트 토큰 수 보고")
+    prompts_parser.add_argument("--exact", action="store_true", help="Gemini 토크나이저로 정확히 계산")
+    prompts_parser.set_defaults(func=benchmark_prompts)
+
+    storage_parser = subparsers.add_parser("storage", help="시나리오 저장 형식 비교")
+    storage_parser.add_argument("--data-dir", type=str, help="시나리오 저장 디렉토리 (기본값: 샘플 데이터)")
+    storage_parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+    storage_parser.set_defaults(func=benchmark_storage)
+
+    serializer_parser = subparsers.add_parser("serializer", help="JSON 직렬화기 비교")
+    serializer_parser.add_argument("--data-dir", type=str, help="시나리오 저장 디렉토리 (기본값: 샘플 데이터)")
+    serializer_parser.add_argument("--repeat", type=int, default=200, help="반복 횟수")
+    serializer_parser.set_defaults(func=benchmark_serializer)
+
+    args = parser.parse_args()
+    args.func(args)
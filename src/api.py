@@ -1,7 +1,11 @@
 import os
 import sys
 import json
-from fastapi import FastAPI, HTTPException, Query, Path
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Path, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
@@ -14,16 +18,112 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from src.utils.config import load_api_key, get_model_settings
+from src.utils.config import load_api_key, get_model_settings, get_api_settings
 from src.utils.prompts import get_system_prompt, get_game_scenario_prompt
 from src.models.llm_handler import initialize_llm, create_prompt_template, generate_game_data
-from src.data.data_handler import parse_json_data, save_game_data, load_game_data, create_sample_game_data
+from src.models.context_cache import get_context_cache
+from src.data.data_handler import (parse_json_data, save_game_data, create_sample_game_data,
+                                   DuplicateScenarioError)
+from src.data.scenario_repository import ScenarioRepository
+from src.data.session_store import create_session_store
+from src.game.game_session import (GameSession, OrderError, GameFinishedError, new_game_session, submit_turn,
+                                   game_state)
+from src.models.scenario import validate_scenario_safely
+from src.utils import serializer
 from src.simulation.simulator import run_automated_simulation
+from src.visualization.chart_renderer import CHART_FORMATS, DEFAULT_SIZE, DEFAULT_DPI
+from src.visualization.chart_cache import ChartCache, get_chart_cache
+
+class FastJSONResponse(JSONResponse):
+    """
+    설정된 JSON 직렬화기(orjson 등, 없으면 표준 json)로 응답 본문을 만드는 응답 클래스
+
+    큰 응답을 돌려주는 엔드포인트는 response_model=None으로 두어 FastAPI의 응답 모델 검증/변환
+    (jsonable_encoder) 없이 이 클래스가 바로 직렬화하도록 합니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return serializer.dumps(content)
+
+BASE_DATA_DIR = os.path.join(project_root, "data")
+if not os.path.exists(BASE_DATA_DIR):
+    os.makedirs(BASE_DATA_DIR)
+
+api_settings = get_api_settings()
+# 시나리오 파일 인덱스 + 검증된 시나리오 캐시 (요청마다 파일을 다시 파싱하지 않음)
+scenario_repository = ScenarioRepository(BASE_DATA_DIR, cache_size=api_settings["scenario_cache_size"])
+# API로 진행하는 게임 세션 (시나리오는 ID로만 참조)
+game_sessions = create_session_store(api_settings["game_session_store"], "game_sessions",
+                                     api_settings["game_session_ttl"], api_settings["max_game_sessions"])
+# 만료된 게임 세션을 정리하는 간격(초)
+SESSION_EVICTION_INTERVAL = 60
+
+# 시작 준비(warm-up) 상태 - /health/ready에서 조회
+_warmup_state = {"ready": False, "preloaded_scenarios": 0, "llm_ready": False, "llm_error": None,
+                 "elapsed_seconds": None}
+_llm = None
+_llm_lock = threading.Lock()
+
+
+def get_llm():
+    """
+    공유 LLM 클라이언트를 반환합니다. (처음 호출할 때 한 번만 생성)
+
+    Raises:
+        ValueError: API 키를 불러올 수 없는 경우
+    """
+    global _llm
+    with _llm_lock:
+        if _llm is None:
+            _llm = initialize_llm()
+        return _llm
+
+
+def warm_up():
+    """
+    시나리오 인덱스를 만들고 많이 쓰인 시나리오를 미리 읽은 뒤 LLM 클라이언트를 생성합니다.
+    끝나면 준비 완료 상태가 됩니다. (LLM 클라이언트 생성 실패는 기록만 하고 준비 완료로 처리)
+    """
+    start_time = time.perf_counter()
+    scenario_repository.load_usage()
+    _warmup_state["preloaded_scenarios"] = scenario_repository.warm_up(api_settings["warmup_scenarios"])
+    try:
+        get_llm()
+        _warmup_state["llm_ready"] = True
+    except Exception as e:
+        _warmup_state["llm_error"] = str(e)
+        print(f"LLM 클라이언트를 미리 생성하지 못했습니다: {e}")
+    _warmup_state["elapsed_seconds"] = round(time.perf_counter() - start_time, 3)
+    _warmup_state["ready"] = True
+    print(f"API 준비 완료: 시나리오 {_warmup_state['preloaded_scenarios']}개 미리 읽음 "
+          f"({_warmup_state['elapsed_seconds']}초)")
+
+
+async def evict_game_sessions():
+    """만료된 게임 세션을 주기적으로 지웁니다."""
+    while True:
+        await asyncio.sleep(SESSION_EVICTION_INTERVAL)
+        removed = await asyncio.to_thread(game_sessions.evict_expired)
+        if removed:
+            print(f"만료된 게임 세션 {removed}개를 정리했습니다.")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 준비 작업은 백그라운드에서 진행 - 서버는 바로 요청을 받고, 준비 전에는 /health/ready가 503 응답
+    warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    eviction_task = asyncio.create_task(evict_game_sessions())
+    yield
+    eviction_task.cancel()
+    if warmup_task.done():
+        scenario_repository.save_usage()
 
 app = FastAPI(
     title="스토리텔링 주식 투자 시뮬레이션 API",
     description="LLM을 활용한 주식 투자 시나리오 생성 및 시뮬레이션 API입니다.",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS 미들웨어 설정 - 프론트엔드가 API에 접근할 수 있도록 함
@@ -53,13 +153,16 @@ class SimulationResponse(BaseModel):
     best_strategy: Optional[str] = None
     best_profit_rate: Optional[float] = None
 
-# --- API 엔드포인트 ---
+class GameCreateRequest(BaseModel):
+    scenario_id: str = Field(..., description="플레이할 시나리오 ID (파일명, 확장자 생략 가능)")
+    player_id: Optional[str] = Field(default=None, description="플레이어 ID")
 
-BASE_DATA_DIR = os.path.join(project_root, "data")
-if not os.path.exists(BASE_DATA_DIR):
-    os.makedirs(BASE_DATA_DIR)
+class TurnOrdersRequest(BaseModel):
+    orders: Dict[str, int] = Field(default_factory=dict, description="상점 이름 → 수량 변화 (양수 매수, 음수 매도)")
 
-@app.post("/scenario/generate", summary="새로운 게임 시나리오 생성", response_model=Dict[str, Any])
+# --- API 엔드포인트 ---
+
+@app.post("/scenario/generate", summary="새로운 게임 시나리오 생성", response_model=None)
 async def generate_new_scenario(params: Optional[ScenarioParameters] = None):
     """
     LLM을 사용하여 새로운 게임 시나리오를 생성하고 JSON으로 반환합니다.
@@ -71,13 +174,15 @@ async def generate_new_scenario(params: Optional[ScenarioParameters] = None):
         if params and params.scenario_type:
             scenario_type = params.scenario_type
         
-        llm = initialize_llm()
+        llm = get_llm()
         system_prompt = get_system_prompt()
         prompt_template = create_prompt_template(system_prompt)
         # 선택된 시나리오 타입을 사용하여 프롬프트 생성
         game_scenario_prompt_text = get_game_scenario_prompt(scenario_type)
 
-        json_content = generate_game_data(llm, prompt_template, game_scenario_prompt_text)
+        json_content = generate_game_data(llm, prompt_template, "",
+                                          static_prompt=game_scenario_prompt_text,
+                                          context_cache=get_context_cache())
         game_data = parse_json_data(json_content)
 
         if game_data is None:
@@ -85,49 +190,87 @@ async def generate_new_scenario(params: Optional[ScenarioParameters] = None):
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"game_scenario_{scenario_type}_{timestamp}.json"
-        save_game_data(game_data, BASE_DATA_DIR, output_filename)
+        try:
+            save_path = save_game_data(game_data, BASE_DATA_DIR, output_filename)
+        except DuplicateScenarioError as e:
+            # 유사한 시나리오가 이미 있으면 저장하지 않고 기존 시나리오를 반환
+            existing = scenario_repository.get(e.duplicate_of)
+            if existing is not None:
+                return {"scenario_id": e.duplicate_of, "scenario_type": scenario_type, "data": existing.turns,
+                        "duplicate_of": e.duplicate_of}
+            raise
+        scenario = validate_scenario_safely(game_data)
+        if scenario is not None:
+            scenario_repository.add(os.path.basename(save_path), scenario)
         
-        return {"scenario_id": output_filename, "scenario_type": scenario_type, "data": game_data}
+        return {"scenario_id": os.path.basename(save_path), "scenario_type": scenario_type, "data": game_data}
 
     except Exception as e:
         # 실제 운영 환경에서는 더 구체적인 오류 처리 및 로깅이 필요합니다.
         raise HTTPException(status_code=500, detail=f"시나리오 생성 중 오류 발생: {str(e)}")
 
-@app.get("/scenario/{scenario_id}", summary="특정 게임 시나리오 조회", response_model=Dict[str, Any])
+@app.get("/scenario/{scenario_id}", summary="특정 게임 시나리오 조회", response_model=None)
 async def get_scenario_by_id(scenario_id: str = Path(..., description="조회할 시나리오의 파일명 (예: game_scenario_20250520_153342.json)")):
     """
     저장된 게임 시나리오를 ID(파일명)를 통해 조회합니다.
     """
-    file_path = os.path.join(BASE_DATA_DIR, scenario_id)
-    if not scenario_id.endswith(".json"): # 간단한 유효성 검사
-        file_path_with_ext = f"{file_path}.json"
-        if os.path.exists(file_path_with_ext):
-            file_path = file_path_with_ext
-        else: # 확장자 없이도 파일이 없다면 원래 경로로 진행하여 에러 처리
-             pass
+    # 확장자를 생략한 ID도 허용 (예: game_scenario_20250520_153342)
+    scenario = scenario_repository.get(scenario_id)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail=f"시나리오 '{scenario_id}'를 찾을 수 없습니다.")
+    return {"scenario_id": scenario_id, "data": scenario.turns}
 
+# 차트 한 변의 최대 픽셀 수 (인치 × dpi)
+MAX_CHART_PIXELS = 4000
 
-    game_data = load_game_data(file_path)
-    if game_data is None:
+@app.get("/scenario/{scenario_id}/chart.{fmt}", summary="시나리오 차트 이미지 조회", response_class=Response,
+         responses={200: {"content": {media_type: {} for media_type in CHART_FORMATS.values()}}})
+async def get_scenario_chart(
+    request: Request,
+    scenario_id: str = Path(..., description="시나리오 ID (파일명, 확장자 생략 가능)"),
+    fmt: str = Path(..., description="이미지 형식 (png 또는 svg)"),
+    width: float = Query(DEFAULT_SIZE[0], gt=0, le=40, description="그림 너비(인치)"),
+    height: float = Query(DEFAULT_SIZE[1], gt=0, le=40, description="그림 높이(인치)"),
+    dpi: int = Query(DEFAULT_DPI, ge=20, le=300, description="해상도")
+):
+    """
+    시나리오의 턴별 주식 가치 변동 차트를 PNG/SVG 이미지로 반환합니다.
+    같은 시나리오·옵션의 이미지는 차트 캐시에서 바로 응답하며, ETag로 변경 여부를 확인할 수 있습니다.
+    """
+    if fmt not in CHART_FORMATS:
+        raise HTTPException(status_code=404, detail=f"지원하지 않는 이미지 형식입니다: {fmt}")
+    if max(width, height) * dpi > MAX_CHART_PIXELS:
+        raise HTTPException(status_code=400, detail=f"이미지가 너무 큽니다. (한 변 최대 {MAX_CHART_PIXELS}픽셀)")
+    scenario = scenario_repository.get(scenario_id)
+    if scenario is None:
         raise HTTPException(status_code=404, detail=f"시나리오 '{scenario_id}'를 찾을 수 없습니다.")
-    return {"scenario_id": scenario_id, "data": game_data}
+
+    size = (width, height)
+    headers = {
+        "ETag": f'"{ChartCache.key(scenario.content_hash, fmt, size, dpi)}"',
+        "Cache-Control": "public, max-age=3600",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    # 렌더링은 CPU 작업이므로 이벤트 루프 밖(스레드)에서 실행
+    image = await asyncio.to_thread(get_chart_cache().get_or_render, scenario, fmt, size, dpi)
+    return Response(content=image, media_type=CHART_FORMATS[fmt], headers=headers)
 
 @app.post("/simulation/run_automated", summary="자동 투자 시뮬레이션 실행", response_model=SimulationResponse)
 async def run_automated_investment_simulation(request: SimulationRequest):
     """
     주어진 시나리오 ID와 전략들을 사용하여 자동 투자 시뮬레이션을 실행하고 결과를 반환합니다.
     """
-    scenario_file_path = os.path.join(BASE_DATA_DIR, request.scenario_id)
-    game_data = load_game_data(scenario_file_path)
+    scenario = scenario_repository.get(request.scenario_id)
 
-    if game_data is None:
+    if scenario is None:
         raise HTTPException(status_code=404, detail=f"시뮬레이션을 위한 시나리오 '{request.scenario_id}'를 찾을 수 없습니다.")
 
     simulation_results: Dict[str, Optional[SimulationResultItem]] = {}
     for strategy in request.strategies:
         try:
             # run_automated_simulation 함수가 반환하는 값의 형태에 따라 result 처리
-            raw_result = run_automated_simulation(game_data, strategy) # 기존 함수 호출
+            raw_result = run_automated_simulation(scenario.turns, strategy) # 기존 함수 호출
             if raw_result and 'final_capital' in raw_result and 'profit_rate' in raw_result:
                  simulation_results[strategy] = SimulationResultItem(
                     final_capital=raw_result['final_capital'],
@@ -158,6 +301,88 @@ async def run_automated_investment_simulation(request: SimulationRequest):
         best_profit_rate=best_profit
     )
 
+# --- 게임 세션 ---
+# 세션 저장소(SQLite 등) 호출이 이벤트 루프를 막지 않도록 게임 엔드포인트는 일반 함수로 정의해
+# FastAPI가 스레드 풀에서 실행하게 합니다.
+
+def _load_game(game_id: str):
+    """게임 세션과 시나리오를 가져옵니다. 없으면 404"""
+    data = game_sessions.get(game_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"게임 '{game_id}'를 찾을 수 없습니다. (만료되었을 수 있습니다)")
+    session = GameSession.from_dict(data)
+    scenario = scenario_repository.get(session.scenario_id, record_usage=False)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail=f"시나리오 '{session.scenario_id}'를 찾을 수 없습니다.")
+    return session, scenario
+
+@app.post("/games", summary="새 게임 시작", status_code=201, response_model=None)
+def create_game(request: GameCreateRequest):
+    """
+    저장된 시나리오로 새 게임을 시작하고 첫 턴 상태를 반환합니다.
+    """
+    scenario = scenario_repository.get(request.scenario_id)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail=f"시나리오 '{request.scenario_id}'를 찾을 수 없습니다.")
+    session = new_game_session(scenario_repository.resolve(request.scenario_id), request.player_id)
+    game_sessions.put(session.game_id, session.to_dict(), session.player_id, session.scenario_id)
+    return game_state(session, scenario)
+
+@app.get("/games", summary="게임 목록 조회", response_model=None)
+def list_games(
+    player_id: Optional[str] = Query(None, description="이 플레이어의 게임만"),
+    scenario_id: Optional[str] = Query(None, description="이 시나리오의 게임만"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 개수")
+):
+    """
+    게임 ID, 플레이어 ID, 시나리오 ID, 마지막 변경 시각을 최근 변경 순으로 반환합니다.
+    """
+    return [{"game_id": entry["session_id"], "player_id": entry["player_id"], "scenario_id": entry["scenario_id"],
+             "updated_at": entry["updated_at"]}
+            for entry in game_sessions.list_sessions(player_id, scenario_id, limit)]
+
+@app.get("/games/{game_id}", summary="게임 상태 조회", response_model=None)
+def get_game(game_id: str = Path(..., description="게임 ID")):
+    """
+    잔액, 보유 수량, 총 자산, 턴별 기록과 현재 턴(뉴스·상점 가격)을 반환합니다.
+    """
+    session, scenario = _load_game(game_id)
+    return game_state(session, scenario)
+
+@app.post("/games/{game_id}/turns", summary="이번 턴 주문 제출", response_model=None)
+def submit_game_turn(request: TurnOrdersRequest, game_id: str = Path(..., description="게임 ID")):
+    """
+    현재 턴의 매수/매도 주문을 적용하고 다음 턴으로 진행한 뒤 상태를 반환합니다.
+    주문을 적용할 수 없으면 400, 이미 끝난 게임이면 409를 반환합니다. (이때 게임은 바뀌지 않음)
+    """
+    _, scenario = _load_game(game_id)
+    played = []
+
+    def play_turn(data):
+        session = GameSession.from_dict(data)
+        submit_turn(session, scenario, request.orders)
+        played.append(session)
+        return session.to_dict()
+
+    try:
+        game_sessions.update(game_id, play_turn)
+    except GameFinishedError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except OrderError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not played:
+        raise HTTPException(status_code=404, detail=f"게임 '{game_id}'를 찾을 수 없습니다. (만료되었을 수 있습니다)")
+    return game_state(played[0], scenario)
+
+@app.delete("/games/{game_id}", summary="게임 종료", status_code=204, response_class=Response)
+def delete_game(game_id: str = Path(..., description="게임 ID")):
+    """
+    게임 세션을 지웁니다.
+    """
+    if not game_sessions.delete(game_id):
+        raise HTTPException(status_code=404, detail=f"게임 '{game_id}'를 찾을 수 없습니다.")
+    return Response(status_code=204)
+
 @app.get("/scenario-types", summary="사용 가능한 시나리오 타입 조회", response_model=Dict[str, Any])
 async def get_scenario_types():
     """
@@ -188,19 +413,43 @@ async def get_scenario_types():
         ]
     }
 
-@app.get("/scenarios", summary="저장된 모든 시나리오 목록 조회", response_model=List[str])
+@app.get("/scenarios", summary="저장된 모든 시나리오 목록 조회", response_model=None)
 async def list_all_scenarios():
     """
     'data' 디렉토리에 저장된 모든 게임 시나리오 파일 목록을 반환합니다.
     """
     try:
-        files = [f for f in os.listdir(BASE_DATA_DIR) if os.path.isfile(os.path.join(BASE_DATA_DIR, f)) and f.endswith(".json")]
-        return files
-    except FileNotFoundError:
-        return [] # data 디렉토리가 없는 경우 빈 리스트 반환
+        return scenario_repository.list_ids()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"시나리오 목록 조회 중 오류 발생: {str(e)}")
 
+@app.get("/health/live", summary="프로세스 동작 확인", response_model=Dict[str, Any])
+async def liveness():
+    """
+    서버 프로세스가 요청에 응답하는지만 확인합니다.
+    """
+    return {"status": "ok"}
+
+@app.get("/health/ready", summary="요청 처리 준비 상태 조회", response_model=Dict[str, Any])
+async def readiness():
+    """
+    시작 준비(시나리오 인덱스·미리 읽기, LLM 클라이언트 생성)가 끝났으면 200, 아니면 503을 반환합니다.
+    """
+    state = {**_warmup_state, "cached_scenarios": scenario_repository.cached_count}
+    if not state["ready"]:
+        return FastJSONResponse(status_code=503, content=state)
+    return state
+
+@app.get("/metrics/context-cache", summary="컨텍스트 캐시 지표 조회", response_model=Dict[str, Any])
+async def get_context_cache_metrics():
+    """
+    시나리오 생성 요청의 컨텍스트 캐시 적중률과 캐시에서 읽은 입력 토큰 수를 반환합니다.
+    """
+    context_cache = get_context_cache()
+    if context_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, "backend": type(context_cache).__name__, **context_cache.stats.as_dict()}
+
 
 # --- Uvicorn 실행을 위한 설정 (선택 사항) ---
 # 이 파일이 직접 실행될 때 uvicorn 서버를 시작하려면 아래 주석을 해제합니다.
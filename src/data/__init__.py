@@ -0,0 +1,3 @@
+"""
+초기화 파일 - 패키지 구조를 위한 필수 파일
+"""
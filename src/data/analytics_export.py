@@ -0,0 +1,178 @@
+"""
+시나리오/시뮬레이션 분석용 컬럼 저장소 내보내기 모듈
+
+저장소의 JSON 시나리오를 분석하기 쉬운 Parquet 데이터셋으로 내보냅니다.
+시나리오 타입과 생성 날짜로 파티션(`scenario_type=.../date=YYYY-MM-DD/`)을 나누므로
+분석할 때 필요한 파티션만 읽을 수 있습니다.
+
+- price_paths: 시나리오 × 턴 × 상점별 가격, 변동률, 급등/급락 이벤트 플래그
+- simulations: 시나리오 × 전략별 자동 시뮬레이션 결과
+"""
+import io
+import os
+import re
+import contextlib
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from src.data.data_handler import iter_stored_scenarios
+from src.simulation.simulator import run_automated_simulation
+
+TABLES = ("price_paths", "simulations")
+DEFAULT_STRATEGIES = ("random", "conservative", "aggressive", "trend")
+
+# 직전 턴 대비 변동률(%)이 이 값 이상이면 급등, -이 값 이하이면 급락 이벤트로 표시
+EVENT_THRESHOLD = 10.0
+
+# 파일명 예: game_scenario_magic_kingdom_20250525_133010.json
+_FILENAME_PATTERN = re.compile(r"^game_scenario_(?:(?P<type>[a-z_]+?)_)?(?P<date>\d{8})_\d{6}")
+
+_PARTITIONING = ds.partitioning(pa.schema([("scenario_type", pa.string()), ("date", pa.string())]),
+                                flavor="hive")
+
+_SCHEMAS = {
+    "price_paths": pa.schema([
+        ("scenario_id", pa.string()),
+        ("turn_number", pa.int16()),
+        ("stock_name", pa.string()),
+        ("risk_level", pa.string()),
+        ("price", pa.float64()),
+        ("change_pct", pa.float64()),
+        ("surge", pa.bool_()),
+        ("crash", pa.bool_()),
+        ("news_tag", pa.string()),
+        ("scenario_type", pa.string()),
+        ("date", pa.string()),
+    ]),
+    "simulations": pa.schema([
+        ("scenario_id", pa.string()),
+        ("strategy", pa.string()),
+        ("final_capital", pa.float64()),
+        ("profit_rate", pa.float64()),
+        ("scenario_type", pa.string()),
+        ("date", pa.string()),
+    ]),
+}
+
+
+def _scenario_partition(data_dir, filename):
+    """파일명에서 (시나리오 타입, 생성 날짜)를 구합니다. 날짜가 없으면 파일 수정 시각을 사용"""
+    match = _FILENAME_PATTERN.match(filename)
+    scenario_type = (match and match.group("type")) or "unknown"
+    if match:
+        date = datetime.strptime(match.group("date"), "%Y%m%d")
+    else:
+        date = datetime.fromtimestamp(os.path.getmtime(os.path.join(data_dir, filename)))
+    return scenario_type, date.strftime("%Y-%m-%d")
+
+
+def _price_path_rows(scenario_id, scenario, partition):
+    rows = []
+    for index, (turn, prices) in enumerate(zip(scenario.turns, scenario.prices)):
+        previous = scenario.prices[index - 1] if index else prices
+        for name, risk_level, price, before in zip(scenario.stock_names, scenario.risk_levels, prices, previous):
+            change_pct = (price - before) / before * 100
+            rows.append({
+                "scenario_id": scenario_id,
+                "turn_number": turn["turn_number"],
+                "stock_name": name,
+                "risk_level": risk_level,
+                "price": price,
+                "change_pct": change_pct,
+                "surge": change_pct >= EVENT_THRESHOLD,
+                "crash": change_pct <= -EVENT_THRESHOLD,
+                "news_tag": turn.get("news_tag", ""),
+                "scenario_type": partition[0],
+                "date": partition[1],
+            })
+    return rows
+
+
+def _simulation_rows(scenario_id, scenario, partition, strategies):
+    rows = []
+    # 시뮬레이터의 턴별 진행 출력은 대량 내보내기에서 생략
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = {strategy: run_automated_simulation(scenario.turns, strategy) for strategy in strategies}
+    for strategy, result in results.items():
+        if result is None:
+            continue
+        rows.append({
+            "scenario_id": scenario_id,
+            "strategy": strategy,
+            "final_capital": result["final_capital"],
+            "profit_rate": result["profit_rate"],
+            "scenario_type": partition[0],
+            "date": partition[1],
+        })
+    return rows
+
+
+def export_analytics(data_dir, output_dir, strategies=DEFAULT_STRATEGIES):
+    """
+    저장소의 시나리오와 자동 시뮬레이션 결과를 Parquet 데이터셋으로 내보냅니다.
+
+    같은 파티션을 다시 내보내면 기존 파일을 지우고 새로 쓰므로, 주기적으로 실행해
+    작은 파일들을 파티션당 하나로 합치는(compaction) 용도로도 사용할 수 있습니다.
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        output_dir (str): 데이터셋을 쓸 디렉토리 (테이블별 하위 디렉토리 생성)
+        strategies (tuple, optional): 실행할 시뮬레이션 전략. 비어 있으면 시뮬레이션 생략
+
+    Returns:
+        dict: 테이블 이름 → 내보낸 행 수
+    """
+    rows = {table: [] for table in TABLES}
+    for filename, scenario in iter_stored_scenarios(data_dir):
+        partition = _scenario_partition(data_dir, filename)
+        rows["price_paths"].extend(_price_path_rows(filename, scenario, partition))
+        rows["simulations"].extend(_simulation_rows(filename, scenario, partition, strategies))
+
+    for table, table_rows in rows.items():
+        ds.write_dataset(
+            pa.Table.from_pylist(table_rows, schema=_SCHEMAS[table]),
+            os.path.join(output_dir, table),
+            format="parquet",
+            partitioning=_PARTITIONING,
+            existing_data_behavior="delete_matching",
+            basename_template="part-{i}.parquet",
+        )
+    print(f"분석용 데이터셋을 {output_dir}에 내보냈습니다: "
+          + ", ".join(f"{table} {len(table_rows)}행" for table, table_rows in rows.items()))
+    return {table: len(table_rows) for table, table_rows in rows.items()}
+
+
+def query_analytics(output_dir, table, scenario_type=None, start_date=None, end_date=None, columns=None):
+    """
+    내보낸 데이터셋을 읽어 DataFrame으로 반환합니다. 조건에 맞는 파티션만 읽습니다.
+
+    Args:
+        output_dir (str): export_analytics로 내보낸 디렉토리
+        table (str): 테이블 이름 ("price_paths" 또는 "simulations")
+        scenario_type (str, optional): 시나리오 타입
+        start_date (str, optional): 시작 날짜 (YYYY-MM-DD, 포함)
+        end_date (str, optional): 종료 날짜 (YYYY-MM-DD, 포함)
+        columns (list, optional): 읽을 컬럼 목록. 기본값은 전체
+
+    Returns:
+        pandas.DataFrame: 조회 결과
+    """
+    if table not in TABLES:
+        raise ValueError(f"알 수 없는 테이블입니다: {table} (가능한 값: {', '.join(TABLES)})")
+
+    dataset = ds.dataset(os.path.join(output_dir, table), format="parquet",
+                         partitioning=_PARTITIONING, schema=_SCHEMAS[table])
+    conditions = []
+    if scenario_type:
+        conditions.append(ds.field("scenario_type") == scenario_type)
+    if start_date:
+        conditions.append(ds.field("date") >= start_date)
+    if end_date:
+        conditions.append(ds.field("date") <= end_date)
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
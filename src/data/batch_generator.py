@@ -0,0 +1,140 @@
+"""
+시나리오 대량 생성 모듈
+
+학기 시작 전 수백 개의 시나리오를 미리 만들어 두기 위한 배치 생성기입니다.
+시나리오 타입별 개수를 받아 동시 요청 수를 제한한 채로 병렬 생성하고, 검증과 (유사) 중복
+제거를 거친 시나리오만 시나리오 저장소(data 디렉토리)에 저장합니다.
+"""
+import time
+import threading
+from datetime import datetime
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from langchain_core.callbacks import get_usage_metadata_callback
+
+from src.models.context_cache import get_context_cache
+from src.models.llm_handler import create_prompt_template, generate_game_data
+from src.models.scenario import validate_scenario_safely
+from src.data.data_handler import save_game_data, DuplicateScenarioError
+from src.utils.json_extractor import parse_json_array
+from src.utils.prompts import get_system_prompt, get_game_scenario_prompt
+
+
+@dataclass
+class BatchReport:
+    """배치 생성 결과와 처리량 지표"""
+    requested: int = 0
+    generated: int = 0
+    attempts: int = 0
+    failed_attempts: int = 0
+    duplicates: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    elapsed_seconds: float = 0.0
+    saved_files: list = field(default_factory=list)
+
+    @property
+    def scenarios_per_minute(self):
+        """분당 생성(저장)된 시나리오 수"""
+        return self.generated * 60 / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def tokens_per_minute(self):
+        """분당 사용한 토큰 수 (입력 + 출력)"""
+        tokens = self.input_tokens + self.output_tokens
+        return tokens * 60 / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def failure_rate(self):
+        """생성 요청 대비 실패(응답 오류, 검증 실패, 중복) 비율"""
+        return self.failed_attempts / self.attempts if self.attempts else 0.0
+
+    def summary(self):
+        """처리량 요약 문자열"""
+        return (f"생성 {self.generated}/{self.requested}개 "
+                f"(요청 {self.attempts}회, 실패 {self.failed_attempts}회, 중복 {self.duplicates}회) | "
+                f"{self.elapsed_seconds:.1f}초 | "
+                f"{self.scenarios_per_minute:.1f} 시나리오/분, {self.tokens_per_minute:,.0f} 토큰/분, "
+                f"실패율 {self.failure_rate:.1%}")
+
+
+def generate_scenario_batch(llm, counts, data_dir, workers=4, max_attempts=3, similarity_threshold=0.8):
+    """
+    시나리오를 병렬로 생성하여 저장소에 저장합니다.
+
+    시나리오 하나마다 최대 max_attempts번 요청하며, 검증에 실패했거나 저장소/이번 배치에
+    같거나 유사한 시나리오가 있으면 실패로 보고 다시 요청합니다.
+
+    Args:
+        llm: 언어 모델 인스턴스 (모든 작업이 공유)
+        counts (dict): 시나리오 타입 → 생성할 개수
+        data_dir (str): 시나리오 저장 디렉토리
+        workers (int, optional): 동시에 보낼 최대 요청 수. 기본값은 4
+        max_attempts (int, optional): 시나리오마다 시도할 최대 요청 수. 기본값은 3
+        similarity_threshold (float, optional): 유사 시나리오 판정 기준 (0~1). 기본값은 0.8
+
+    Returns:
+        BatchReport: 생성 결과와 처리량 지표
+    """
+    report = BatchReport(requested=sum(counts.values()))
+    prompt_template = create_prompt_template(get_system_prompt())
+    scenario_prompts = {scenario_type: get_game_scenario_prompt(scenario_type) for scenario_type in counts}
+    context_cache = get_context_cache()
+    lock = threading.Lock()
+
+    def generate_one(scenario_type, number):
+        for attempt in range(1, max_attempts + 1):
+            print(f"[{scenario_type} #{number}] 생성 중... (시도 {attempt}/{max_attempts})")
+            with get_usage_metadata_callback() as usage:
+                json_content = generate_game_data(llm, prompt_template, "",
+                                                  static_prompt=scenario_prompts[scenario_type],
+                                                  context_cache=context_cache)
+            game_data = parse_json_array(json_content) if json_content else None
+            scenario = validate_scenario_safely(game_data) if game_data is not None else None
+
+            with lock:
+                report.attempts += 1
+                for model_usage in usage.usage_metadata.values():
+                    report.input_tokens += model_usage.get("input_tokens", 0)
+                    report.output_tokens += model_usage.get("output_tokens", 0)
+                if scenario is None:
+                    report.failed_attempts += 1
+                    continue
+
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"game_scenario_{scenario_type}_{timestamp}_{scenario.content_hash[:8]}.json"
+            # 저장소 인덱스가 중복 확인부터 저장·추가까지 잠금 안에서 처리 (저장에 성공한 시나리오만 추가)
+            try:
+                save_path = save_game_data(scenario, data_dir, filename, similarity_threshold=similarity_threshold)
+            except DuplicateScenarioError as e:
+                with lock:
+                    report.failed_attempts += 1
+                    report.duplicates += 1
+                print(f"[{scenario_type} #{number}] {e.duplicate_of}와 유사한 시나리오라 다시 생성합니다.")
+                continue
+            except OSError as e:
+                with lock:
+                    report.failed_attempts += 1
+                print(f"[{scenario_type} #{number}] 저장에 실패했습니다: {e}")
+                continue
+            with lock:
+                report.generated += 1
+                report.saved_files.append(save_path)
+            return save_path
+
+        print(f"[{scenario_type} #{number}] {max_attempts}번 시도했지만 생성에 실패했습니다.")
+        return None
+
+    started_at = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="scenario-batch") as executor:
+        futures = [executor.submit(generate_one, scenario_type, number)
+                   for scenario_type, count in counts.items()
+                   for number in range(1, count + 1)]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"배치 생성 작업 중 오류 발생: {e}")
+    report.elapsed_seconds = time.monotonic() - started_at
+    return report
@@ -0,0 +1,190 @@
+"""
+게임 데이터 처리 모듈 - 게임 데이터 로드/저장/파싱
+"""
+import os
+import json
+
+from src.models.scenario import validate_scenario, validate_scenario_safely, ScenarioValidationError
+from src.utils.json_extractor import parse_json_array
+from src.utils.file_manager import (ensure_dir, save_scenario_to_file, load_scenario_from_file,
+                                    read_scenario_file, is_scenario_file, ChecksumMismatchError)
+from src.utils.scenario_codec import ScenarioCodecError
+
+# 샘플 데이터용 상점 정보 (마법 왕국)
+_SAMPLE_STOCKS = [
+    ("🍞 빵집", "마을 사람들이 매일 필요로 하는 빵을 만드는 곳", "저위험"),
+    ("🎪 서커스단", "가끔 마을에 와서 공연하는 유명한 서커스단", "중위험"),
+    ("🔮 마법연구소", "새로운 마법을 개발하는 신비한 연구소", "고위험"),
+]
+
+# 샘플 데이터용 턴별 (결과, 뉴스, 힌트, 상점별 변동률)
+_SAMPLE_TURNS = [
+    ("마법 왕국에 오신 것을 환영합니다, 어린 투자 마법사님! 당신의 7일간의 마법 같은 모험이 지금 시작됩니다!",
+     "내일 왕국 전체에 마법 축제가 열린다는 소문이 있어요!",
+     "축제에는 사람들이 많이 모여요. 어떤 상점이 바빠질까요?",
+     (0, 0, 0)),
+    ("마법 축제 덕분에 빵집은 손님이 많아졌고(+5%), 서커스단은 대성공을 거뒀어요(+8%). 마법연구소는 조용했어요(+1%).",
+     "옆 마을에서 감기가 유행하기 시작했다는 소식이 들려요!",
+     "사람들이 아프면 밖에 잘 나오지 않아요.",
+     (0.05, 0.08, 0.01)),
+    ("감기 때문에 서커스 공연이 취소되었어요(-5%). 빵집은 여전히 꾸준했고(+2%), 마법연구소는 감기약 마법을 연구하기 시작했어요(+3%).",
+     "마법연구소가 감기를 낫게 하는 마법을 곧 발표한대요!",
+     "새로운 마법이 성공하면 큰 일이 생길지도 몰라요. 하지만 실패할 수도 있어요!",
+     (0.02, -0.05, 0.03)),
+    ("감기 치료 마법이 대성공! 마법연구소의 가치가 크게 올랐어요(+25%). 빵집(+2%)과 서커스단(+3%)도 조금씩 회복했어요.",
+     "왕국에 큰 비가 며칠 동안 내릴 거래요.",
+     "비가 오면 야외에서 하는 일들은 어려워져요.",
+     (0.02, 0.03, 0.25)),
+    ("큰 비 때문에 서커스 천막이 망가졌어요(-5%). 빵집은 조금 손님이 줄었고(-1%), 마법연구소는 변화가 없었어요(0%).",
+     "마법연구소의 새 실험이 위험하다는 소문이 돌고 있어요.",
+     "소문이 사실이라면 마법연구소가 곤란해질 수 있어요.",
+     (-0.01, -0.05, 0.0)),
+    ("실험이 실패해서 마법연구소의 가치가 크게 떨어졌어요(-20%). 빵집(+3%)과 서커스단(+5%)은 맑은 날씨 덕분에 좋아졌어요.",
+     "왕이 마을을 방문해서 잔치를 연대요!",
+     "잔치에는 맛있는 음식과 즐거운 공연이 빠질 수 없겠죠?",
+     (0.03, 0.05, -0.2)),
+    ("왕의 잔치 덕분에 빵집(+4%)과 서커스단(+10%)이 모두 바빴어요. 마법연구소도 다시 연구를 시작했어요(+5%).",
+     "7일간의 모험이 끝났어요! 그동안의 투자를 돌아보세요.",
+     "여러 상점에 나누어 투자하면 위험을 줄일 수 있어요.",
+     (0.04, 0.1, 0.05)),
+]
+
+
+def parse_json_data(json_content):
+    """
+    JSON 문자열을 파싱하고 시나리오 규칙을 검증하여 게임 데이터로 변환합니다.
+
+    Args:
+        json_content (str): LLM이 생성한 JSON 문자열
+
+    Returns:
+        list: 파싱/검증된 게임 데이터, 실패 시 None
+    """
+    if not json_content:
+        print("파싱할 JSON 데이터가 없습니다.")
+        return None
+
+    game_data = parse_json_array(json_content)
+    if game_data is None:
+        print("JSON 데이터 파싱에 실패했습니다.")
+        return None
+
+    scenario = validate_scenario_safely(game_data)
+    return scenario.turns if scenario else None
+
+
+class DuplicateScenarioError(ValueError):
+    """저장소에 같거나 유사한 시나리오가 이미 있는 경우"""
+
+    def __init__(self, filename, duplicate_of):
+        super().__init__(f"{duplicate_of}와 유사한 시나리오라 {filename}로 저장하지 않았습니다.")
+        self.filename = filename
+        self.duplicate_of = duplicate_of
+
+
+def save_game_data(game_data, data_dir, filename, check_duplicates=True, similarity_threshold=0.8):
+    """
+    게임 데이터를 시나리오 파일로 저장합니다. (압축 형식 설정이면 확장자가 .scn으로 바뀜)
+
+    저장 전에 저장소의 유사 시나리오 인덱스를 확인해 같거나 유사한 시나리오는 저장하지 않습니다.
+
+    Args:
+        game_data (list | Scenario): 저장할 게임 데이터
+        data_dir (str): 저장할 디렉토리 경로
+        filename (str): 저장할 파일 이름
+        check_duplicates (bool, optional): 유사 시나리오 확인 여부. 기본값은 True
+        similarity_threshold (float, optional): 유사 시나리오 판정 기준 (0~1). 기본값은 0.8
+
+    Returns:
+        str: 저장된 파일 경로
+
+    Raises:
+        DuplicateScenarioError: 유사한 시나리오가 이미 저장되어 있는 경우
+    """
+    ensure_dir(data_dir)
+    if not check_duplicates:
+        save_path = save_scenario_to_file(game_data, os.path.join(data_dir, filename))
+    else:
+        # near_duplicates가 이 모듈을 사용하므로 여기서 가져옴
+        from src.data.near_duplicates import get_store_index
+        store_index = get_store_index(data_dir, similarity_threshold)
+        with store_index.lock:
+            duplicate = store_index.find_duplicate(game_data, filename)
+            if duplicate is not None:
+                raise DuplicateScenarioError(filename, duplicate)
+            save_path = save_scenario_to_file(game_data, os.path.join(data_dir, filename))
+            # 저장에 성공한 시나리오만 인덱스에 추가
+            store_index.add(os.path.basename(save_path), game_data)
+    print(f"게임 데이터가 {save_path}에 저장되었습니다.")
+    return save_path
+
+
+def load_game_data(file_path):
+    """
+    JSON 파일에서 게임 데이터를 로드합니다.
+
+    Args:
+        file_path (str): 로드할 파일 경로
+
+    Returns:
+        list: 로드된 게임 데이터, 실패 시 None
+    """
+    game_data = load_scenario_from_file(file_path)
+    if game_data is None:
+        print(f"게임 데이터를 로드할 수 없습니다: {file_path}")
+    return game_data
+
+
+def iter_stored_scenarios(data_dir):
+    """
+    저장소의 시나리오 파일을 파일명 순으로 읽어옵니다. (손상되었거나 검증에 실패한 파일은 건너뜀)
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+
+    Yields:
+        tuple: (파일명, Scenario)
+    """
+    if not os.path.isdir(data_dir):
+        return
+    for filename in sorted(os.listdir(data_dir)):
+        if not is_scenario_file(filename):
+            continue
+        try:
+            scenario = validate_scenario(read_scenario_file(os.path.join(data_dir, filename)))
+        except (OSError, json.JSONDecodeError, ChecksumMismatchError, ScenarioCodecError, ScenarioValidationError):
+            continue
+        yield filename, scenario
+
+
+def create_sample_game_data():
+    """
+    LLM 없이 사용할 수 있는 샘플 게임 데이터(마법 왕국, 7턴)를 생성합니다.
+
+    Returns:
+        list: 샘플 게임 데이터
+    """
+    game_data = []
+    values = [100] * len(_SAMPLE_STOCKS)
+
+    for turn_number, (result, news, news_tag, changes) in enumerate(_SAMPLE_TURNS, start=1):
+        values = [round(value * (1 + change)) for value, change in zip(values, changes)]
+        stocks = []
+        for (name, description, risk_level), value in zip(_SAMPLE_STOCKS, values):
+            stocks.append({
+                "name": name,
+                "description": description,
+                "before_value": 100,
+                "current_value": value,
+                "risk_level": risk_level,
+                "expectation": "뉴스와 힌트를 잘 읽고 예상해보세요!"
+            })
+        game_data.append({
+            "turn_number": turn_number,
+            "result": result,
+            "news": news,
+            "news_tag": news_tag,
+            "stocks": stocks
+        })
+
+    return game_data
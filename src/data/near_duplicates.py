@@ -0,0 +1,311 @@
+"""
+유사(준중복) 시나리오 탐지 모듈
+
+높은 temperature로 대량 생성해도 거의 같은 이야기가 반복해서 나오므로, 저장 전에
+기존 시나리오와 비교해 다양성을 유지합니다. 모든 쌍을 비교(O(n²))하지 않도록
+뉴스 텍스트의 MinHash 서명을 LSH 버킷에 넣어 후보만 고른 뒤, 텍스트 유사도와
+가격 흐름 유사도를 합쳐 최종 판정합니다.
+"""
+import os
+import re
+import zlib
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from src.models.scenario import validate_scenario
+from src.data.data_handler import iter_stored_scenarios
+from src.utils.file_manager import is_scenario_file, read_scenario_file
+
+# 비교에 사용할 턴 텍스트 필드
+TEXT_FIELDS = ("news", "result", "news_tag")
+
+# MinHash 순열에 쓰는 메르센 소수 (해시값과 계수가 모두 31비트라 곱이 uint64를 넘지 않음)
+_MERSENNE_PRIME = (1 << 31) - 1
+_SHINGLE_SIZE = 3
+_WHITESPACE = re.compile(r"\s+")
+
+# 가격 흐름 차이(평균 절대 차이)가 이 값 이상이면 가격 유사도 0
+PRICE_TOLERANCE = 20.0
+
+
+def _shingles(scenario):
+    """시나리오 텍스트 필드의 글자 n-gram 집합 (공백은 하나로 합침)"""
+    shingles = set()
+    for turn in scenario.turns:
+        for field in TEXT_FIELDS:
+            text = _WHITESPACE.sub(" ", str(turn.get(field, ""))).strip()
+            if len(text) <= _SHINGLE_SIZE:
+                if text:
+                    shingles.add(text)
+                continue
+            shingles.update(text[i:i + _SHINGLE_SIZE] for i in range(len(text) - _SHINGLE_SIZE + 1))
+    return shingles
+
+
+def price_similarity(prices_a, prices_b):
+    """
+    두 가격 흐름(턴 × 상점 행렬)의 유사도를 0~1로 반환합니다. 모양이 다르면 0
+
+    Args:
+        prices_a (tuple): 첫 번째 시나리오의 가격 행렬
+        prices_b (tuple): 두 번째 시나리오의 가격 행렬
+
+    Returns:
+        float: 가격 유사도
+    """
+    a = np.asarray(prices_a, dtype=float)
+    b = np.asarray(prices_b, dtype=float)
+    if a.shape != b.shape or a.size == 0:
+        return 0.0
+    return float(max(0.0, 1.0 - np.abs(a - b).mean() / PRICE_TOLERANCE))
+
+
+class NearDuplicateIndex:
+    """
+    MinHash + LSH 기반 유사 시나리오 인덱스
+
+    유사도 = text_weight × 텍스트 자카드 유사도(추정) + (1 - text_weight) × 가격 흐름 유사도
+    이며, threshold 이상이면 유사 시나리오로 판정합니다. 내용이 완전히 같은 시나리오는
+    내용 해시로 바로 찾습니다.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=32, text_weight=0.8, seed=1):
+        """
+        Args:
+            threshold (float, optional): 유사 시나리오 판정 기준. 기본값은 0.8
+            num_perm (int, optional): MinHash 서명 길이. 기본값은 128
+            bands (int, optional): LSH 밴드 수 (num_perm의 약수). 기본값은 32
+            text_weight (float, optional): 유사도에서 텍스트 유사도의 비중. 기본값은 0.8
+            seed (int, optional): 해시 순열 시드 (같은 시드끼리만 서명 비교 가능). 기본값은 1
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm({num_perm})은 bands({bands})의 배수여야 합니다.")
+        self.threshold = threshold
+        self.text_weight = text_weight
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._entries = {}  # 키 → (서명, 가격 행렬)
+        self._hashes = {}  # 내용 해시 → 키
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def signature(self, scenario):
+        """
+        시나리오 텍스트의 MinHash 서명을 계산합니다.
+
+        Args:
+            scenario (Scenario | list): 시나리오
+
+        Returns:
+            numpy.ndarray: 길이 num_perm의 서명
+        """
+        scenario = validate_scenario(scenario, expected_turns=None)
+        shingles = _shingles(scenario)
+        if not shingles:
+            return np.full(len(self._a), _MERSENNE_PRIME, dtype=np.uint64)
+        hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) % _MERSENNE_PRIME for s in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        permuted = (np.outer(hashes, self._a) + self._b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+    def add(self, key, scenario):
+        """
+        시나리오를 인덱스에 추가합니다.
+
+        Args:
+            key (str): 시나리오 식별자 (파일명 등)
+            scenario (Scenario | list): 시나리오
+        """
+        scenario = validate_scenario(scenario, expected_turns=None)
+        signature = self.signature(scenario)
+        self._entries[key] = (signature, scenario.prices)
+        self._hashes.setdefault(scenario.content_hash, key)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band][band_key].append(key)
+
+    def remove(self, key):
+        """시나리오를 인덱스에서 지웁니다. (같은 키로 다시 저장하는 경우)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for content_hash in [h for h, k in self._hashes.items() if k == key]:
+            del self._hashes[content_hash]
+        for band, band_key in enumerate(self._band_keys(entry[0])):
+            bucket = self._buckets[band].get(band_key)
+            if bucket and key in bucket:
+                bucket.remove(key)
+
+    def find_exact(self, scenario):
+        """내용이 완전히 같은 시나리오의 키를 반환합니다. 없으면 None"""
+        return self._hashes.get(validate_scenario(scenario, expected_turns=None).content_hash)
+
+    def query(self, scenario):
+        """
+        유사한 시나리오를 찾습니다. (LSH 버킷이 겹치는 후보만 비교)
+
+        Args:
+            scenario (Scenario | list): 시나리오
+
+        Returns:
+            list: (키, 유사도) 목록, 유사도 내림차순
+        """
+        scenario = validate_scenario(scenario, expected_turns=None)
+        exact = self._hashes.get(scenario.content_hash)
+        if exact is not None:
+            return [(exact, 1.0)]
+
+        signature = self.signature(scenario)
+        candidates = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            other_signature, other_prices = self._entries[key]
+            text_score = float(np.mean(signature == other_signature))
+            score = (self.text_weight * text_score
+                     + (1 - self.text_weight) * price_similarity(scenario.prices, other_prices))
+            if score >= self.threshold:
+                matches.append((key, round(score, 4)))
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def find_duplicate(self, scenario):
+        """가장 유사한 시나리오의 키를 반환합니다. 없으면 None"""
+        matches = self.query(scenario)
+        return matches[0][0] if matches else None
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+
+def build_index(data_dir, **index_options):
+    """
+    저장소의 시나리오로 유사 시나리오 인덱스를 만듭니다.
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        **index_options: NearDuplicateIndex 생성 옵션
+
+    Returns:
+        NearDuplicateIndex: 저장된 시나리오가 모두 들어 있는 인덱스
+    """
+    index = NearDuplicateIndex(**index_options)
+    for filename, scenario in iter_stored_scenarios(data_dir):
+        index.add(filename, scenario)
+    return index
+
+
+def find_near_duplicates(data_dir, **index_options):
+    """
+    저장소에서 먼저 저장된 시나리오와 유사한 시나리오를 찾습니다. (배치 작업용)
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        **index_options: NearDuplicateIndex 생성 옵션
+
+    Returns:
+        list: (유사 시나리오 파일명, 원본 파일명, 유사도) 목록
+    """
+    index = NearDuplicateIndex(**index_options)
+    duplicates = []
+    for filename, scenario in iter_stored_scenarios(data_dir):
+        matches = index.query(scenario)
+        if matches:
+            duplicates.append((filename, *matches[0]))
+        else:
+            index.add(filename, scenario)
+    return duplicates
+
+
+class StoreIndex:
+    """
+    시나리오 저장소 하나의 공유 유사 시나리오 인덱스
+
+    처음 만들 때 저장소 전체를 읽고, 이후에는 다른 프로세스가 저장한 새 파일만 추가로 읽으며
+    지워진 파일(dedupe --delete 등)은 인덱스에서 뺍니다.
+    중복 확인부터 저장까지 `lock`을 잡고 진행해야 같은 시나리오가 동시에 저장되지 않습니다.
+
+    Attributes:
+        data_dir (str): 시나리오 저장 디렉토리
+        index (NearDuplicateIndex): 유사 시나리오 인덱스
+        lock (threading.RLock): 확인-저장-추가 구간 잠금
+    """
+
+    def __init__(self, data_dir, **index_options):
+        self.data_dir = data_dir
+        self.index = NearDuplicateIndex(**index_options)
+        self.lock = threading.RLock()
+        self._known = set()
+
+    def refresh(self):
+        """인덱스에 없는 시나리오 파일을 읽어 추가하고, 지워진 파일은 인덱스에서 뺍니다."""
+        with self.lock:
+            filenames = set(os.listdir(self.data_dir)) if os.path.isdir(self.data_dir) else set()
+            for filename in self._known - filenames:
+                self._known.discard(filename)
+                self.index.remove(filename)
+            for filename in sorted(filenames):
+                if filename in self._known or not is_scenario_file(filename):
+                    continue
+                self._known.add(filename)
+                try:
+                    scenario = validate_scenario(read_scenario_file(os.path.join(self.data_dir, filename)))
+                except (OSError, ValueError):
+                    continue
+                self.index.add(filename, scenario)
+
+    def find_duplicate(self, scenario, filename=None):
+        """
+        유사한 저장 시나리오의 파일명을 반환합니다.
+        filename과 같은 이름의 파일은 내용을 바꿔 덮어쓰는 경우이므로 제외합니다. (내용이 같으면 중복)
+
+        Returns:
+            str: 유사 시나리오 파일명, 없으면 None
+        """
+        exact = self.index.find_exact(scenario)
+        if exact is not None:
+            return exact
+        stem = os.path.splitext(filename)[0] if filename else None
+        for key, _ in self.index.query(scenario):
+            if os.path.splitext(key)[0] != stem:
+                return key
+        return None
+
+    def add(self, filename, scenario):
+        """저장한 시나리오를 인덱스에 추가합니다. (같은 파일명의 이전 내용은 지움)"""
+        with self.lock:
+            self.index.remove(filename)
+            self.index.add(filename, scenario)
+            self._known.add(filename)
+
+
+_store_indexes = {}
+_store_indexes_lock = threading.Lock()
+
+
+def get_store_index(data_dir, threshold=0.8):
+    """
+    저장소별 공유 인덱스를 반환합니다. (프로세스에 저장소·기준별로 하나, 새 파일은 매번 반영)
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        threshold (float, optional): 유사 시나리오 판정 기준. 기본값은 0.8
+
+    Returns:
+        StoreIndex: 저장소 인덱스
+    """
+    key = (os.path.abspath(data_dir), threshold)
+    with _store_indexes_lock:
+        store_index = _store_indexes.get(key)
+        if store_index is None:
+            store_index = _store_indexes[key] = StoreIndex(data_dir, threshold=threshold)
+    store_index.refresh()
+    return store_index
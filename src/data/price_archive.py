@@ -0,0 +1,188 @@
+"""
+가격 흐름 아카이브 모듈 (메모리 맵 바이너리 형식)
+
+수만 개 시나리오로 전략을 백테스트할 때 시나리오마다 JSON을 파싱해 dict로 들고 있으면
+메모리와 시간이 많이 듭니다. 저장소의 시나리오 가격만 고정 모양의 float32 배열로 모아
+한 파일에 쓰고, 읽을 때는 파일을 mmap 하여 복사 없이 numpy 배열로 바로 사용합니다.
+
+파일 구조 (리틀 엔디언):
+    헤더     매직(8) 버전(u16) 턴 수(u16) 상점 수(u16) 예약(u16) 시나리오 수(u64) 식별자 길이(u64)
+    가격     float32[시나리오 수, 턴 수, 상점 수]  (HEADER_SIZE 위치에서 시작)
+    위험도   uint8[시나리오 수, 상점 수]           (RISK_LEVELS 인덱스)
+    인덱스   uint64[시나리오 수]                   (시나리오별 가격 배열의 바이트 오프셋)
+    식별자   UTF-8 JSON 문자열 목록                (시나리오 파일명)
+"""
+import json
+import mmap
+import struct
+
+import numpy as np
+
+from src.data.data_handler import iter_stored_scenarios
+from src.models.scenario import SCENARIO_TURNS, RISK_LEVELS
+from src.utils.file_manager import write_file_atomic
+
+MAGIC = b"EDUPRICE"
+VERSION = 1
+_HEADER = struct.Struct("<8sHHHHQQ")
+# 가격 배열이 캐시 라인 경계에서 시작하도록 헤더 영역을 64바이트로 맞춤
+HEADER_SIZE = 64
+PRICE_DTYPE = np.dtype("<f4")
+
+
+class PriceArchiveError(ValueError):
+    """아카이브 파일 형식이 잘못된 경우의 예외"""
+
+
+def write_price_archive(path, scenarios, turns=SCENARIO_TURNS, stocks=3):
+    """
+    (식별자, Scenario) 목록을 가격 아카이브 파일로 씁니다.
+
+    모양(턴 수 × 상점 수)이 다른 시나리오는 건너뜁니다.
+
+    Args:
+        path (str): 아카이브 파일 경로
+        scenarios (iterable): (식별자, Scenario) 튜플
+        turns (int, optional): 턴 수. 기본값은 7
+        stocks (int, optional): 상점 수. 기본값은 3
+
+    Returns:
+        int: 기록한 시나리오 수
+    """
+    ids, prices, risks = [], [], []
+    for scenario_id, scenario in scenarios:
+        if len(scenario.prices) != turns or len(scenario.stock_names) != stocks:
+            print(f"가격 아카이브: 모양이 다른 시나리오를 건너뜁니다: {scenario_id}")
+            continue
+        ids.append(scenario_id)
+        prices.append(scenario.prices)
+        risks.append([RISK_LEVELS.index(level) for level in scenario.risk_levels])
+
+    count = len(ids)
+    price_block = np.asarray(prices, dtype=PRICE_DTYPE).reshape(count, turns, stocks)
+    risk_block = np.asarray(risks, dtype=np.uint8).reshape(count, stocks)
+    offsets = HEADER_SIZE + np.arange(count, dtype="<u8") * (turns * stocks * PRICE_DTYPE.itemsize)
+    id_block = json.dumps(ids, ensure_ascii=False).encode("utf-8")
+
+    header = _HEADER.pack(MAGIC, VERSION, turns, stocks, 0, count, len(id_block)).ljust(HEADER_SIZE, b"\0")
+    # 백테스트가 열어 둔 아카이브를 덮어써도 잘린 파일을 보지 않도록 원자적으로 교체
+    write_file_atomic(path, b"".join([header, price_block.tobytes(), risk_block.tobytes(),
+                                      offsets.tobytes(), id_block]))
+    return count
+
+
+def build_price_archive(data_dir, path, turns=SCENARIO_TURNS, stocks=3):
+    """
+    저장소의 시나리오로 가격 아카이브를 만듭니다.
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        path (str): 아카이브 파일 경로
+
+    Returns:
+        int: 기록한 시나리오 수
+    """
+    count = write_price_archive(path, iter_stored_scenarios(data_dir), turns, stocks)
+    print(f"가격 아카이브를 {path}에 저장했습니다. (시나리오 {count}개)")
+    return count
+
+
+class PriceArchive:
+    """
+    mmap으로 연 가격 아카이브 - 가격/위험도 배열은 파일을 그대로 가리키는 읽기 전용 뷰입니다.
+
+    Attributes:
+        prices (numpy.ndarray): float32[시나리오 수, 턴 수, 상점 수]
+        risk_codes (numpy.ndarray): uint8[시나리오 수, 상점 수] (RISK_LEVELS 인덱스)
+        offsets (numpy.ndarray): uint64[시나리오 수]
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 아카이브 파일 경로
+
+        Raises:
+            PriceArchiveError: 아카이브 형식이 아니거나 파일이 잘린 경우
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PriceArchiveError(f"빈 파일입니다: {path}") from None
+
+        if len(self._mmap) < HEADER_SIZE:
+            self.close()
+            raise PriceArchiveError(f"가격 아카이브 파일이 아닙니다: {path}")
+        magic, version, turns, stocks, _, count, id_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise PriceArchiveError(f"가격 아카이브 파일이 아닙니다: {path}")
+        self.turns, self.stocks = turns, stocks
+
+        price_size = count * turns * stocks * PRICE_DTYPE.itemsize
+        risk_offset = HEADER_SIZE + price_size
+        index_offset = risk_offset + count * stocks
+        id_offset = index_offset + count * 8
+        if len(self._mmap) != id_offset + id_length:
+            self.close()
+            raise PriceArchiveError(f"가격 아카이브 파일 크기가 맞지 않습니다: {path}")
+
+        self.prices = np.frombuffer(self._mmap, dtype=PRICE_DTYPE, count=count * turns * stocks,
+                                    offset=HEADER_SIZE).reshape(count, turns, stocks)
+        self.risk_codes = np.frombuffer(self._mmap, dtype=np.uint8, count=count * stocks,
+                                        offset=risk_offset).reshape(count, stocks)
+        self.offsets = np.frombuffer(self._mmap, dtype="<u8", count=count, offset=index_offset)
+        self._id_range = (id_offset, id_offset + id_length)
+        self._ids = None
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, index):
+        """index번째 시나리오의 (가격 배열 뷰, 위험도 코드 뷰)"""
+        return self.prices[index], self.risk_codes[index]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def ids(self):
+        """시나리오 식별자 목록 (처음 접근할 때 한 번만 디코딩)"""
+        if self._ids is None:
+            start, end = self._id_range
+            self._ids = json.loads(self._mmap[start:end].decode("utf-8"))
+        return self._ids
+
+    def chunks(self, chunk_size=4096):
+        """
+        (시작 인덱스, 가격 뷰, 위험도 뷰)를 chunk_size개씩 반환합니다. (복사 없음)
+
+        Args:
+            chunk_size (int, optional): 한 번에 처리할 시나리오 수. 기본값은 4096
+        """
+        for start in range(0, len(self), chunk_size):
+            yield start, self.prices[start:start + chunk_size], self.risk_codes[start:start + chunk_size]
+
+    def close(self):
+        """
+        mmap과 파일을 닫습니다. 밖에서 아직 배열 뷰를 참조하고 있으면 mmap은 그 뷰가
+        해제될 때 닫힙니다.
+        """
+        self.prices = self.risk_codes = self.offsets = None
+        if getattr(self, "_mmap", None) is not None and not self._mmap.closed:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+        if not self._file.closed:
+            self._file.close()
@@ -0,0 +1,187 @@
+"""
+시나리오 저장소 인덱스/캐시 모듈
+
+API처럼 같은 시나리오를 반복해서 읽는 곳에서 매 요청마다 디렉토리를 훑고 파일을 파싱·검증하지
+않도록, 저장소의 파일 인덱스와 검증된 시나리오(`Scenario`, 가격 행렬 포함)의 LRU 캐시를
+관리합니다. 시나리오별 조회 횟수를 기록해 두었다가 다음 시작 때 많이 쓰인 시나리오부터
+미리 읽어 올 수 있습니다.
+"""
+import os
+import threading
+from collections import Counter, OrderedDict
+
+from src.models.scenario import validate_scenario_safely
+from src.utils.file_manager import (is_scenario_file, read_scenario_file, read_checked_json, write_checked_json,
+                                    SCENARIO_EXTENSIONS)
+
+# 조회 횟수 기록 파일 (시나리오 목록에 나오지 않도록 .json이 아닌 이름 사용)
+USAGE_FILENAME = ".scenario_usage"
+
+
+class ScenarioRepository:
+    """
+    시나리오 파일 인덱스와 검증된 시나리오 캐시
+
+    Attributes:
+        data_dir (str): 시나리오 저장 디렉토리
+        cache_size (int): 메모리에 유지할 최대 시나리오 수
+    """
+
+    def __init__(self, data_dir, cache_size=128):
+        """
+        Args:
+            data_dir (str): 시나리오 저장 디렉토리
+            cache_size (int, optional): 메모리에 유지할 최대 시나리오 수. 기본값은 128
+        """
+        self.data_dir = data_dir
+        self.cache_size = cache_size
+        self._index = {}  # 시나리오 ID(파일명) → 수정 시각
+        self._cache = OrderedDict()  # 시나리오 ID → (수정 시각, Scenario)
+        self._usage = Counter()
+        self._lock = threading.RLock()
+
+    def refresh(self):
+        """디렉토리를 다시 읽어 파일 인덱스를 갱신합니다."""
+        index = {}
+        if os.path.isdir(self.data_dir):
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and is_scenario_file(entry.name):
+                        index[entry.name] = entry.stat().st_mtime
+        with self._lock:
+            self._index = index
+            for scenario_id in list(self._cache):
+                if scenario_id not in index:
+                    del self._cache[scenario_id]
+
+    def list_ids(self, refresh=True):
+        """
+        저장된 시나리오 ID(파일명) 목록을 반환합니다.
+
+        Args:
+            refresh (bool, optional): 디렉토리를 다시 읽을지 여부. 기본값은 True
+        """
+        if refresh:
+            self.refresh()
+        with self._lock:
+            return sorted(self._index)
+
+    def resolve(self, scenario_id):
+        """확장자가 생략된 ID도 실제 파일명으로 바꿉니다. 없으면 None"""
+        candidates = [scenario_id] if is_scenario_file(scenario_id) else []
+        candidates += [f"{scenario_id}{extension}" for extension in SCENARIO_EXTENSIONS]
+        with self._lock:
+            for candidate in candidates:
+                if candidate in self._index:
+                    return candidate
+        # 다른 프로세스(배치 생성 등)가 인덱스 갱신 이후에 저장한 파일
+        for candidate in candidates:
+            if os.path.basename(candidate) == candidate and os.path.isfile(os.path.join(self.data_dir, candidate)):
+                return candidate
+        return None
+
+    def get(self, scenario_id, record_usage=True):
+        """
+        시나리오를 반환합니다. 캐시에 있고 파일이 바뀌지 않았으면 파일을 다시 읽지 않습니다.
+
+        Args:
+            scenario_id (str): 시나리오 ID (파일명, 확장자 생략 가능)
+            record_usage (bool, optional): 조회 횟수 기록 여부. 기본값은 True
+
+        Returns:
+            Scenario: 검증된 시나리오, 없거나 읽을 수 없으면 None
+        """
+        filename = self.resolve(scenario_id)
+        if filename is None:
+            return None
+        path = os.path.join(self.data_dir, filename)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            with self._lock:
+                self._index.pop(filename, None)
+                self._cache.pop(filename, None)
+            return None
+
+        with self._lock:
+            if record_usage:
+                self._usage[filename] += 1
+            cached = self._cache.get(filename)
+            if cached and cached[0] == mtime:
+                self._cache.move_to_end(filename)
+                return cached[1]
+
+        try:
+            scenario = validate_scenario_safely(read_scenario_file(path))
+        except (OSError, ValueError) as e:
+            print(f"시나리오 파일을 읽을 수 없습니다: {filename} ({e})")
+            scenario = None
+        if scenario is None:
+            return None
+        self._store(filename, mtime, scenario)
+        return scenario
+
+    def add(self, scenario_id, scenario):
+        """새로 저장한 시나리오를 인덱스와 캐시에 추가합니다."""
+        path = os.path.join(self.data_dir, scenario_id)
+        self._store(scenario_id, os.stat(path).st_mtime, scenario)
+
+    def most_used(self, limit):
+        """
+        조회 횟수가 많은 순(같으면 최근 파일 순)으로 시나리오 ID를 반환합니다.
+
+        Args:
+            limit (int): 최대 개수
+        """
+        with self._lock:
+            ranked = sorted(self._index, key=lambda name: (self._usage[name], self._index[name]), reverse=True)
+        return ranked[:limit]
+
+    def warm_up(self, limit):
+        """
+        인덱스를 만들고 많이 쓰인 시나리오 limit개를 미리 읽어 캐시에 올립니다.
+
+        Args:
+            limit (int): 미리 읽을 시나리오 수
+
+        Returns:
+            int: 캐시에 올린 시나리오 수
+        """
+        self.refresh()
+        loaded = 0
+        for scenario_id in self.most_used(min(limit, self.cache_size)):
+            if self.get(scenario_id, record_usage=False) is not None:
+                loaded += 1
+        return loaded
+
+    def load_usage(self):
+        """기록해 둔 조회 횟수를 읽어 옵니다. (파일이 없거나 손상되었으면 무시)"""
+        try:
+            usage = read_checked_json(os.path.join(self.data_dir, USAGE_FILENAME))
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            self._usage.update({name: count for name, count in usage.items() if isinstance(count, int)})
+
+    def save_usage(self):
+        """조회 횟수를 파일에 기록합니다. (존재하는 시나리오만)"""
+        with self._lock:
+            usage = {name: count for name, count in self._usage.items() if name in self._index}
+        try:
+            write_checked_json(os.path.join(self.data_dir, USAGE_FILENAME), usage)
+        except OSError as e:
+            print(f"시나리오 조회 횟수 기록 실패: {e}")
+
+    @property
+    def cached_count(self):
+        """캐시에 있는 시나리오 수"""
+        with self._lock:
+            return len(self._cache)
+
+    def _store(self, filename, mtime, scenario):
+        with self._lock:
+            self._index[filename] = mtime
+            self._cache[filename] = (mtime, scenario)
+            self._cache.move_to_end(filename)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
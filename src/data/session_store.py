@@ -0,0 +1,378 @@
+"""
+게임 세션/저장 게임 저장소 모듈
+
+API 게임 세션과 Streamlit에서 저장한 게임을 (ID → JSON으로 저장할 수 있는 dict)으로 보관합니다.
+항목마다 플레이어 ID, 시나리오 ID, 마지막 변경 시각을 함께 기록해 두고 이 값으로 목록을 조회하거나
+한꺼번에 정리합니다. 마지막 변경 후 TTL이 지난 항목은 만료됩니다.
+
+- MemorySessionStore: 프로세스 메모리 (최대 개수를 넘으면 가장 오래 쓰이지 않은 항목부터 지움)
+- SQLiteSessionStore: SQLite 파일 (플레이어, 시나리오, 변경 시각 인덱스) - 서버를 다시 시작해도 유지
+"""
+import os
+import glob
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from src.utils import serializer
+from src.utils.config import get_storage_settings
+from src.utils.file_manager import DATA_DIR, SAVED_GAME_PREFIX, read_checked_json
+
+# SQLite 저장소 기본 파일 (시나리오 목록에 나오지 않도록 숨김 파일)
+DEFAULT_DB_PATH = os.path.join(DATA_DIR, ".sessions.db")
+
+
+class SessionStore(ABC):
+    """
+    세션 저장소 기본 클래스
+
+    하위 클래스는 `_put`, `_get`, `_meta`, `delete`, `list_sessions`, `cleanup`을 구현합니다.
+
+    Attributes:
+        ttl_seconds (float): 마지막 변경 후 항목을 유지할 시간(초), None이면 만료되지 않음
+        persistent (bool): 프로세스를 다시 시작해도 항목이 남는 저장소인지 여부
+    """
+
+    persistent = False
+
+    def __init__(self, ttl_seconds=None):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+
+    def put(self, session_id, data, player_id=None, scenario_id=None):
+        """
+        항목을 저장합니다. (같은 ID가 있으면 덮어씀)
+
+        Args:
+            session_id (str): 세션 ID
+            data (dict): JSON으로 저장할 수 있는 세션 데이터
+            player_id (str, optional): 플레이어 ID
+            scenario_id (str, optional): 시나리오 ID
+        """
+        with self._lock:
+            self._put(session_id, data, player_id, scenario_id, time.time())
+
+    def get(self, session_id, player_id=None):
+        """
+        항목을 반환합니다.
+
+        Args:
+            session_id (str): 세션 ID
+            player_id (str, optional): 지정하면 이 플레이어의 항목만 반환
+
+        Returns:
+            dict: 세션 데이터, 없거나 만료되었거나 다른 플레이어의 항목이면 None
+        """
+        with self._lock:
+            entry = self._get(session_id)
+            if entry is None:
+                return None
+            data, updated_at = entry
+            if self._expired(updated_at, time.time()):
+                self.delete(session_id)
+                return None
+            if player_id is not None and self._meta(session_id)["player_id"] != player_id:
+                return None
+            return data
+
+    def update(self, session_id, apply):
+        """
+        저장소를 잠근 채 data = apply(data)를 적용해 다시 저장합니다. (같은 세션의 동시 요청이 섞이지 않음)
+
+        Returns:
+            dict: 바뀐 세션 데이터, 없거나 만료되었으면 None
+        """
+        with self._lock:
+            data = self.get(session_id)
+            if data is None:
+                return None
+            meta = self._meta(session_id)
+            data = apply(data)
+            self._put(session_id, data, meta["player_id"], meta["scenario_id"], time.time())
+            return data
+
+    @abstractmethod
+    def delete(self, session_id):
+        """항목을 지웁니다. 지웠으면 True"""
+
+    @abstractmethod
+    def list_sessions(self, player_id=None, scenario_id=None, limit=100):
+        """
+        항목 목록을 최근 변경 순으로 반환합니다. (데이터 제외, 만료된 항목 포함)
+
+        Args:
+            player_id (str, optional): 이 플레이어의 항목만
+            scenario_id (str, optional): 이 시나리오의 항목만
+            limit (int, optional): 최대 개수. 기본값은 100
+
+        Returns:
+            list: {"session_id", "player_id", "scenario_id", "updated_at"} 목록
+        """
+
+    @abstractmethod
+    def cleanup(self, older_than=None, player_id=None, scenario_id=None):
+        """
+        조건에 맞는 항목을 한꺼번에 지웁니다. (조건이 없으면 전부)
+
+        Args:
+            older_than (float, optional): 이 시각(epoch 초) 이전에 마지막으로 변경된 항목만
+            player_id (str, optional): 이 플레이어의 항목만
+            scenario_id (str, optional): 이 시나리오의 항목만
+
+        Returns:
+            int: 지운 항목 수
+        """
+
+    def evict_expired(self):
+        """
+        만료된 항목을 지웁니다.
+
+        Returns:
+            int: 지운 항목 수
+        """
+        if self.ttl_seconds is None:
+            return 0
+        return self.cleanup(older_than=time.time() - self.ttl_seconds)
+
+    def _expired(self, updated_at, now):
+        return self.ttl_seconds is not None and now - updated_at > self.ttl_seconds
+
+    @abstractmethod
+    def _meta(self, session_id):
+        """{"player_id", "scenario_id"} (잠금을 잡은 채 호출됨)"""
+
+    @abstractmethod
+    def _put(self, session_id, data, player_id, scenario_id, updated_at):
+        """항목을 저장합니다. (잠금을 잡은 채 호출됨)"""
+
+    @abstractmethod
+    def _get(self, session_id):
+        """(데이터, 마지막 변경 시각), 없으면 None (잠금을 잡은 채 호출됨)"""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    메모리 세션 저장소 (TTL + LRU)
+
+    Attributes:
+        max_sessions (int): 최대 항목 수
+    """
+
+    def __init__(self, ttl_seconds=None, max_sessions=10000):
+        """
+        Args:
+            ttl_seconds (float, optional): 마지막 변경 후 항목을 유지할 시간(초)
+            max_sessions (int, optional): 최대 항목 수. 기본값은 10000
+        """
+        super().__init__(ttl_seconds)
+        self.max_sessions = max_sessions
+        self._entries = OrderedDict()  # 세션 ID → {메타데이터, "data"}, 오래 쓰이지 않은 순
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def delete(self, session_id):
+        with self._lock:
+            return self._entries.pop(session_id, None) is not None
+
+    def list_sessions(self, player_id=None, scenario_id=None, limit=100):
+        with self._lock:
+            entries = [self._public(entry) for entry in self._entries.values() if self._matches(entry, player_id, scenario_id)]
+        return sorted(entries, key=lambda entry: entry["updated_at"], reverse=True)[:limit]
+
+    def cleanup(self, older_than=None, player_id=None, scenario_id=None):
+        with self._lock:
+            removed = [session_id for session_id, entry in self._entries.items()
+                       if self._matches(entry, player_id, scenario_id)
+                       and (older_than is None or entry["updated_at"] < older_than)]
+            for session_id in removed:
+                del self._entries[session_id]
+        return len(removed)
+
+    def _meta(self, session_id):
+        return self._public(self._entries[session_id])
+
+    def _put(self, session_id, data, player_id, scenario_id, updated_at):
+        self._entries[session_id] = {"session_id": session_id, "player_id": player_id, "scenario_id": scenario_id,
+                                     "updated_at": updated_at, "data": data}
+        self._entries.move_to_end(session_id)
+        while len(self._entries) > self.max_sessions:
+            self._entries.popitem(last=False)
+
+    def _get(self, session_id):
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(session_id)
+        return entry["data"], entry["updated_at"]
+
+    @staticmethod
+    def _public(entry):
+        return {key: entry[key] for key in ("session_id", "player_id", "scenario_id", "updated_at")}
+
+    @staticmethod
+    def _matches(entry, player_id, scenario_id):
+        return ((player_id is None or entry["player_id"] == player_id)
+                and (scenario_id is None or entry["scenario_id"] == scenario_id))
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 세션 저장소
+
+    Attributes:
+        path (str): 데이터베이스 파일 경로
+        table (str): 테이블 이름 (한 파일에 API 게임 세션과 저장 게임을 따로 보관)
+    """
+
+    persistent = True
+
+    def __init__(self, path, table="sessions", ttl_seconds=None):
+        """
+        Args:
+            path (str): 데이터베이스 파일 경로 (":memory:"도 가능)
+            table (str, optional): 테이블 이름. 기본값은 "sessions"
+            ttl_seconds (float, optional): 마지막 변경 후 항목을 유지할 시간(초)
+        """
+        super().__init__(ttl_seconds)
+        if not table.isidentifier():
+            raise ValueError(f"사용할 수 없는 테이블 이름입니다: {table}")
+        self.path = path
+        self.table = table
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 연결 하나를 잠금으로 보호해 여러 스레드(API 요청)가 함께 사용
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (session_id TEXT PRIMARY KEY, player_id TEXT, "
+                               f"scenario_id TEXT, updated_at REAL NOT NULL, data BLOB NOT NULL)")
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_player ON {table} (player_id, updated_at)")
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_scenario ON {table} (scenario_id, updated_at)")
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_updated ON {table} (updated_at)")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+    def delete(self, session_id):
+        with self._lock, self._conn:
+            return self._conn.execute(f"DELETE FROM {self.table} WHERE session_id = ?", (session_id,)).rowcount > 0
+
+    def list_sessions(self, player_id=None, scenario_id=None, limit=100):
+        where, params = self._where(None, player_id, scenario_id)
+        with self._lock:
+            rows = self._conn.execute(f"SELECT session_id, player_id, scenario_id, updated_at FROM {self.table}{where} "
+                                      f"ORDER BY updated_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [dict(zip(("session_id", "player_id", "scenario_id", "updated_at"), row)) for row in rows]
+
+    def cleanup(self, older_than=None, player_id=None, scenario_id=None):
+        where, params = self._where(older_than, player_id, scenario_id)
+        with self._lock, self._conn:
+            return self._conn.execute(f"DELETE FROM {self.table}{where}", params).rowcount
+
+    def _meta(self, session_id):
+        row = self._conn.execute(f"SELECT player_id, scenario_id FROM {self.table} WHERE session_id = ?",
+                                 (session_id,)).fetchone()
+        return {"player_id": row[0], "scenario_id": row[1]}
+
+    def _put(self, session_id, data, player_id, scenario_id, updated_at):
+        with self._conn:
+            self._conn.execute(f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?, ?)",
+                               (session_id, player_id, scenario_id, updated_at, serializer.dumps(data)))
+
+    def _get(self, session_id):
+        row = self._conn.execute(f"SELECT data, updated_at FROM {self.table} WHERE session_id = ?",
+                                 (session_id,)).fetchone()
+        if row is None:
+            return None
+        return serializer.loads(row[0]), row[1]
+
+    @staticmethod
+    def _where(older_than, player_id, scenario_id):
+        conditions, params = [], []
+        for condition, value in (("updated_at < ?", older_than), ("player_id = ?", player_id),
+                                 ("scenario_id = ?", scenario_id)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), tuple(params)
+
+
+def create_session_store(backend, table="sessions", ttl_seconds=None, max_sessions=10000, path=None):
+    """
+    설정값으로 세션 저장소를 만듭니다.
+
+    Args:
+        backend (str): "memory" 또는 "sqlite"
+        table (str, optional): SQLite 테이블 이름
+        ttl_seconds (float, optional): 마지막 변경 후 항목을 유지할 시간(초)
+        max_sessions (int, optional): 메모리 저장소의 최대 항목 수
+        path (str, optional): SQLite 파일 경로 (없으면 설정의 session_db_path, 그것도 없으면 data/.sessions.db)
+
+    Returns:
+        SessionStore: 세션 저장소
+    """
+    if backend == "memory":
+        return MemorySessionStore(ttl_seconds, max_sessions)
+    if backend == "sqlite":
+        return SQLiteSessionStore(path or get_storage_settings()["session_db_path"] or DEFAULT_DB_PATH,
+                                  table, ttl_seconds)
+    raise ValueError(f"알 수 없는 세션 저장소입니다: {backend}")
+
+
+def import_saved_game_files(store, data_dir=DATA_DIR):
+    """
+    data/의 예전 saved_game_<시각>.json 파일을 저장소로 옮기고 파일은 지웁니다.
+    영구 저장소가 아니면 (메모리 저장소) 다시 시작할 때 잃어버리지 않도록 파일을 그대로 둡니다.
+
+    Returns:
+        int: 옮긴 파일 수
+    """
+    if not store.persistent:
+        return 0
+    imported = 0
+    for path in glob.glob(os.path.join(data_dir, SAVED_GAME_PREFIX + "*.json")):
+        try:
+            data = read_checked_json(path)
+        except (OSError, ValueError) as e:
+            print(f"저장된 게임 파일을 읽을 수 없습니다: {path} ({e})")
+            continue
+        session_id = os.path.splitext(os.path.basename(path))[0]
+        store.put(session_id, data)
+        os.remove(path)
+        imported += 1
+    if imported:
+        print(f"저장된 게임 파일 {imported}개를 게임 저장소로 옮겼습니다.")
+    return imported
+
+
+_saved_game_store = None
+_saved_game_store_lock = threading.Lock()
+
+
+def get_saved_game_store():
+    """
+    설정(SAVED_GAME_STORE, SESSION_DB_PATH, SAVED_GAME_TTL_DAYS)에 따른 공유 저장 게임 저장소를 반환합니다.
+    처음 만들 때 data/의 예전 저장 게임 파일을 옮겨 옵니다. (영구 저장소인 경우)
+
+    Returns:
+        SessionStore: 저장 게임 저장소
+    """
+    global _saved_game_store
+    with _saved_game_store_lock:
+        if _saved_game_store is None:
+            settings = get_storage_settings()
+            ttl_days = settings["saved_game_ttl_days"]
+            _saved_game_store = create_session_store(settings["saved_game_store"], "saved_games",
+                                                     ttl_days * 86400 if ttl_days else None)
+            import_saved_game_files(_saved_game_store)
+        return _saved_game_store
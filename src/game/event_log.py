@@ -0,0 +1,188 @@
+"""
+이벤트 기반 게임 상태 모듈
+
+게임 진행을 매수/매도/턴 마감 이벤트의 추가 전용 기록으로 저장하고, 현재 상태(잔액, 보유
+수량)는 이벤트를 적용하며 유지합니다. 일정 이벤트마다 (잔액, 보유 수량) 스냅샷을 남겨 두어
+어느 턴의 상태든 가장 가까운 스냅샷부터 몇 개의 이벤트만 다시 적용해 복원합니다.
+
+이벤트는 JSON 배열 하나로 직렬화됩니다.
+    ["buy", 턴, 상점 이름, 수량, 가격]
+    ["sell", 턴, 상점 이름, 수량, 가격]
+    ["advance", 턴, 잔액, 총 자산]
+"""
+from dataclasses import dataclass, field
+
+INITIAL_BALANCE = 1000
+LOG_FORMAT = 1
+
+EVENT_BUY = "buy"
+EVENT_SELL = "sell"
+EVENT_ADVANCE = "advance"
+
+
+@dataclass
+class GameState:
+    """
+    특정 시점의 게임 상태
+
+    Attributes:
+        turns_completed (int): 마감한 턴 수
+        balance (float): 잔액
+        holdings (dict): 상점 이름 → 보유 수량 (0주인 상점은 없음)
+        history (list): 턴별 {"turn", "balance", "total_asset_value"} 기록
+    """
+    turns_completed: int = 0
+    balance: float = INITIAL_BALANCE
+    holdings: dict = field(default_factory=dict)
+    history: list = field(default_factory=list)
+
+
+class GameEventLog:
+    """
+    추가 전용 게임 이벤트 기록
+
+    Attributes:
+        initial_balance (float): 시작 잔액
+        events (list): 이벤트 목록
+    """
+
+    def __init__(self, initial_balance=INITIAL_BALANCE, snapshot_interval=16):
+        """
+        Args:
+            initial_balance (float, optional): 시작 잔액. 기본값은 1000
+            snapshot_interval (int, optional): 스냅샷을 남길 이벤트 간격. 기본값은 16
+        """
+        self.initial_balance = initial_balance
+        self.snapshot_interval = snapshot_interval
+        self.events = []
+        self._snapshots = [(0, initial_balance, {})]  # (이벤트 위치, 잔액, 보유 수량)
+        self._advance_positions = []  # 턴 마감 이벤트 위치 (턴 순서)
+        self._balance = initial_balance
+        self._holdings = {}
+
+    def __len__(self):
+        return len(self.events)
+
+    @property
+    def balance(self):
+        """현재 잔액"""
+        return self._balance
+
+    @property
+    def holdings(self):
+        """현재 보유 수량 (복사본)"""
+        return dict(self._holdings)
+
+    @property
+    def turns_completed(self):
+        """마감한 턴 수"""
+        return len(self._advance_positions)
+
+    def buy(self, turn, stock_name, shares, price):
+        """매수 이벤트를 추가합니다."""
+        self._append([EVENT_BUY, turn, stock_name, shares, price])
+
+    def sell(self, turn, stock_name, shares, price):
+        """매도 이벤트를 추가합니다. (shares는 양수)"""
+        self._append([EVENT_SELL, turn, stock_name, shares, price])
+
+    def trade(self, turn, stock_name, shares_change, price):
+        """수량 변화의 부호에 따라 매수/매도 이벤트를 추가합니다."""
+        if shares_change > 0:
+            self.buy(turn, stock_name, shares_change, price)
+        elif shares_change < 0:
+            self.sell(turn, stock_name, -shares_change, price)
+
+    def advance(self, turn, total_assets):
+        """
+        턴 마감 이벤트를 추가합니다.
+
+        Args:
+            turn (int): 마감하는 턴 번호
+            total_assets (float): 마감 시점 총 자산 (턴 가격 기준)
+        """
+        self._append([EVENT_ADVANCE, turn, self._balance, total_assets])
+
+    def history(self, turns_completed=None):
+        """
+        턴별 기록을 반환합니다.
+
+        Args:
+            turns_completed (int, optional): 이 턴 수까지만. 없으면 전체
+
+        Returns:
+            list: {"turn", "balance", "total_asset_value"} 목록
+        """
+        positions = self._advance_positions[:turns_completed]
+        return [{'turn': self.events[p][1], 'balance': self.events[p][2], 'total_asset_value': self.events[p][3]}
+                for p in positions]
+
+    def state_at(self, turns_completed=None):
+        """
+        turns_completed개 턴을 마감한 직후의 상태를 복원합니다.
+
+        Args:
+            turns_completed (int, optional): 마감한 턴 수. 없으면 현재 상태
+
+        Returns:
+            GameState: 게임 상태
+        """
+        if turns_completed is None:
+            end = len(self.events)
+            turns_completed = self.turns_completed
+        elif turns_completed <= 0:
+            end, turns_completed = 0, 0
+        else:
+            turns_completed = min(turns_completed, self.turns_completed)
+            end = self._advance_positions[turns_completed - 1] + 1 if turns_completed else 0
+
+        # end 이전의 가장 가까운 스냅샷부터 다시 적용
+        snapshot = max((s for s in self._snapshots if s[0] <= end), key=lambda s: s[0])
+        position, balance, holdings = snapshot[0], snapshot[1], dict(snapshot[2])
+        for event in self.events[position:end]:
+            balance = self._apply(event, balance, holdings)
+        return GameState(turns_completed, balance, holdings, self.history(turns_completed))
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 dict로 변환합니다. (스냅샷은 불러올 때 다시 만듦)"""
+        return {"format": LOG_FORMAT, "initial_balance": self.initial_balance, "events": self.events}
+
+    @classmethod
+    def from_dict(cls, data, snapshot_interval=16):
+        """
+        to_dict로 만든 dict에서 기록을 복원합니다.
+
+        Raises:
+            ValueError: 형식이 다르거나 알 수 없는 이벤트가 있는 경우
+        """
+        if data.get("format") != LOG_FORMAT:
+            raise ValueError(f"알 수 없는 게임 기록 형식입니다: {data.get('format')}")
+        log = cls(data.get("initial_balance", INITIAL_BALANCE), snapshot_interval)
+        for event in data.get("events", []):
+            log._append(list(event))
+        return log
+
+    def _append(self, event):
+        self._balance = self._apply(event, self._balance, self._holdings)
+        self.events.append(event)
+        if event[0] == EVENT_ADVANCE:
+            self._advance_positions.append(len(self.events) - 1)
+        if len(self.events) % self.snapshot_interval == 0:
+            self._snapshots.append((len(self.events), self._balance, dict(self._holdings)))
+
+    @staticmethod
+    def _apply(event, balance, holdings):
+        """이벤트를 적용한 잔액을 반환하고 보유 수량(holdings)은 그 자리에서 바꿉니다."""
+        kind = event[0]
+        if kind == EVENT_ADVANCE:
+            return balance
+        if kind not in (EVENT_BUY, EVENT_SELL):
+            raise ValueError(f"알 수 없는 게임 이벤트입니다: {kind}")
+        _, _, stock_name, shares, price = event
+        change = shares if kind == EVENT_BUY else -shares
+        count = holdings.get(stock_name, 0) + change
+        if count:
+            holdings[stock_name] = count
+        else:
+            holdings.pop(stock_name, None)
+        return balance - change * price
@@ -1,10 +1,19 @@
 
-import streamlit as st
-import json
 import os
-from src.models.llm_handler import initialize_llm, create_prompt_template, generate_game_data
+import json
+import uuid
+import streamlit as st
+import numpy as np
+from src.models.llm_handler import create_prompt_template, generate_game_data
+from src.models.context_cache import get_context_cache
+from src.models.scenario import validate_scenario, ScenarioValidationError
+from src.game.turn_generator import TurnByTurnGenerator
+from src.game.event_log import GameEventLog, INITIAL_BALANCE
 from src.utils.prompts import get_system_prompt, get_game_scenario_prompt
-from src.utils.file_manager import save_scenario_to_file, generate_filename
+from src.utils.file_manager import generate_filename
+from src.data.data_handler import save_game_data, DuplicateScenarioError
+from src.data.session_store import get_saved_game_store
+from src.game.resources import get_llm_client, invalidate_scenario_list, load_scenario
 
 
 @st.cache_data(ttl=3600)
@@ -14,33 +23,30 @@ def generate_game_scenario_data_llm(scenario_type: str, google_api_key: str):
         return None
 
     try:
-        os.environ["GOOGLE_API_KEY"] = google_api_key
-        llm = initialize_llm()
+        llm = get_llm_client(google_api_key)
         system_prompt_str = get_system_prompt()
         prompt_template = create_prompt_template(system_prompt_str)
         game_prompt_str = get_game_scenario_prompt(scenario_type)
         
-        json_content = generate_game_data(llm, prompt_template, game_prompt_str)
+        # 대화형 "새 게임 시작" 흐름은 대기 시간이 중요하므로 헤징 요청 사용
+        json_content = generate_game_data(llm, prompt_template, "", hedge=True,
+                                          static_prompt=game_prompt_str,
+                                          context_cache=get_context_cache())
         
         if json_content:
             try:
-                raw_json_output = json_content
-                if raw_json_output.startswith("```json\n"):
-                    raw_json_output = raw_json_output[7:]
-                if raw_json_output.endswith("\n```"):
-                    raw_json_output = raw_json_output[:-4]
-                
-                game_data = json.loads(raw_json_output)
+                # generate_game_data가 코드 블록 등을 이미 제거한 JSON 배열만 반환함
+                game_data = json.loads(json_content)
                 
-                # 데이터 유효성 검사
-                if not isinstance(game_data, list) or len(game_data) == 0:
-                    st.error("생성된 게임 데이터가 올바르지 않습니다.")
-                    return None
-                
-                return game_data
+                # 시나리오 규칙 검증 (이후 게임 로직은 검증된 구조를 그대로 사용)
+                return validate_scenario(game_data).turns
             except json.JSONDecodeError as e:
                 st.error(f"게임 데이터 파싱 실패: {e}")
                 return None
+            except ScenarioValidationError as e:
+                st.error("생성된 게임 데이터가 올바르지 않습니다.")
+                print(e)
+                return None
         else:
             return None
             
@@ -49,76 +55,196 @@ def generate_game_scenario_data_llm(scenario_type: str, google_api_key: str):
         return None
 
 
+def start_turn_by_turn_game_llm(scenario_type: str, google_api_key: str):
+    """
+    턴별 생성 모드로 게임 시나리오 생성 시작
+    
+    첫 턴만 생성한 뒤 바로 반환하고, 나머지 턴은 백그라운드에서 이어서 생성합니다.
+    모든 턴이 생성되면 시나리오 파일로 저장합니다. (저장한 파일명은 generator.saved_file)
+    """
+    if not google_api_key:
+        return None
+
+    try:
+        llm = get_llm_client(google_api_key)
+        filename = generate_filename(scenario_type)
+        generator = TurnByTurnGenerator(
+            llm, scenario_type,
+            on_complete=lambda turns: _save_scenario(turns, filename)
+        )
+        
+        if generator.generate_next_turn() is None:
+            st.error("첫 턴 생성에 실패했어요.")
+            return None
+        
+        generator.start_background()
+        return generator
+            
+    except Exception as e:
+        st.error(f"시나리오 생성 실패: {e}")
+        return None
+
+
+def _save_scenario(game_data, filename):
+    """
+    시나리오를 저장하고 공유 시나리오 목록을 무효화합니다. (유사한 시나리오가 이미 있으면 저장하지 않음)
+    
+    Returns:
+        str: 저장한 시나리오 파일명, 저장하지 않았으면 None
+    """
+    try:
+        # 저장 형식 설정(SCENARIO_CODEC)에 따라 확장자가 바뀔 수 있으므로 실제로 쓴 경로를 사용
+        save_path = save_game_data(game_data, os.path.dirname(filename), os.path.basename(filename))
+    except DuplicateScenarioError as e:
+        print(e)
+        return None
+    invalidate_scenario_list()
+    return os.path.basename(save_path)
+
+
+def get_turn_quotes(current_turn_data):
+    """
+    현재 턴의 상점 색인과 가격 배열을 반환합니다. (턴마다 한 번만 만들어 세션에 보관)
+    
+    Returns:
+        dict: {"turn": 턴 데이터, "position": 상점 이름 → 위치, "prices": 위치별 current_value 배열}
+    """
+    cached = st.session_state.get('turn_quotes')
+    if cached is not None and cached['turn'] is current_turn_data:
+        return cached
+    
+    stocks = current_turn_data['stocks']
+    quotes = {
+        'turn': current_turn_data,
+        'position': {stock['name']: i for i, stock in enumerate(stocks)},
+        # 정수 가격이면 정수 배열 - 잔액/자산이 원래처럼 정수로 유지됨
+        'prices': np.asarray([stock['current_value'] for stock in stocks]),
+    }
+    st.session_state['turn_quotes'] = quotes
+    return quotes
+
+
+def holdings_vector(holdings, position):
+    """상점 이름 → 수량 dict를 턴의 상점 순서 배열로 변환 (이 턴에 없는 상점은 무시)"""
+    shares = np.zeros(len(position), dtype=np.int64)
+    for stock_name, count in holdings.items():
+        index = position.get(stock_name)
+        if index is not None:
+            shares[index] = count
+    return shares
+
+
+def portfolio_value(balance, shares, prices):
+    """
+    잔액 + 보유 수량(양수만) × 가격
+    
+    Args:
+        balance (float | numpy.ndarray): 잔액 (여러 포트폴리오면 [N] 배열)
+        shares (numpy.ndarray): [상점 수] 또는 [N, 상점 수] 보유 수량
+        prices (numpy.ndarray): [상점 수] 또는 [N, 상점 수] 가격
+        
+    Returns:
+        포트폴리오별 총 자산 (입력이 1차원이면 스칼라)
+    """
+    return balance + (np.maximum(shares, 0) * prices).sum(axis=-1)
+
+
+def get_event_log():
+    """
+    세션의 게임 이벤트 기록을 반환합니다. (없으면 현재 잔액으로 시작하는 기록을 만듦)
+    
+    Returns:
+        GameEventLog: 게임 이벤트 기록
+    """
+    log = st.session_state.get('game_events')
+    if log is None:
+        log = GameEventLog(st.session_state.get('player_balance', INITIAL_BALANCE))
+        st.session_state['game_events'] = log
+    return log
+
+
 def calculate_total_assets(current_turn_data):
-    """현재 총 자산 계산"""
-    total_assets = st.session_state.player_balance
-    for stock_name, shares in st.session_state.player_investments.items():
-        if shares > 0:  # 양수인 주식만 계산
-            stock_info = next((s for s in current_turn_data['stocks'] if s['name'] == stock_name), None)
-            if stock_info:
-                total_assets += shares * stock_info['current_value']
+    """현재 총 자산 계산 (잔액·보유 수량·턴이 그대로면 세션에 보관한 값 사용)"""
+    balance = st.session_state.player_balance
+    investments = st.session_state.player_investments
+    quotes = get_turn_quotes(current_turn_data)
+    key = (balance, tuple(investments.items()))
+    
+    cached = st.session_state.get('asset_valuation')
+    if cached is not None and cached[0] is quotes and cached[1] == key:
+        return cached[2]
+    
+    total_assets = portfolio_value(balance, holdings_vector(investments, quotes['position']), quotes['prices']).item()
+    st.session_state['asset_valuation'] = (quotes, key, total_assets)
     return total_assets
 
 
 def process_investment(investment_inputs, current_turn_data, turn_number):
     """투자 처리 로직"""
-    total_cost = 0
+    quotes = get_turn_quotes(current_turn_data)
+    position, prices = quotes['position'], quotes['prices']
+    stocks = current_turn_data['stocks']
     
     # 총 비용 계산 (매수만)
-    for stock_name, shares_change in investment_inputs.items():
-        if shares_change > 0:  # 매수만 비용 계산
-            stock_info = next((s for s in current_turn_data['stocks'] if s['name'] == stock_name), None)
-            if stock_info:
-                total_cost += shares_change * stock_info['current_value']
+    changes = holdings_vector(investment_inputs, position)
+    total_cost = (np.maximum(changes, 0) * prices).sum()
     
     # 잔액 확인 (매수 비용만)
     if total_cost > st.session_state.player_balance:
         st.error("💸 코인이 부족해요!")
         return False
     
-    # 투자 실행
+    # 투자 실행 (이벤트 기록에 추가하고 잔액/보유 수량은 기록에서 가져옴)
+    log = get_event_log()
     actions = []
     for stock_name, shares_change in investment_inputs.items():
-        if shares_change != 0:
-            stock_info = next((s for s in current_turn_data['stocks'] if s['name'] == stock_name), None)
-            if stock_info:
-                cost = shares_change * stock_info['current_value']
-                st.session_state.player_balance -= cost
-                
-                current_shares = st.session_state.player_investments.get(stock_name, 0)
-                st.session_state.player_investments[stock_name] = current_shares + shares_change
-                
-                action_type = "매수" if shares_change > 0 else "매도"
-                actions.append(f"{stock_name} {abs(shares_change)}주 {action_type}")
+        if shares_change != 0 and stock_name in position:
+            log.trade(turn_number, stock_name, shares_change, stocks[position[stock_name]]['current_value'])
+            
+            action_type = "매수" if shares_change > 0 else "매도"
+            actions.append(f"{stock_name} {abs(shares_change)}주 {action_type}")
+    st.session_state.player_balance = log.balance
+    st.session_state.player_investments = log.holdings
     
     if actions:
         st.success(f"✅ 투자 완료: {', '.join(actions)}")
     else:
         st.info("변경사항이 없어요.")
     
-    # 히스토리 기록
-    total_assets = calculate_total_assets(current_turn_data)
-    
-    st.session_state.investment_history.append({
-        'turn': turn_number,
-        'balance': st.session_state.player_balance,
-        'total_asset_value': total_assets,
-        'investments': dict(st.session_state.player_investments)
-    })
+    # 턴 마감 기록 (보유 수량은 기록에서 다시 계산할 수 있으므로 히스토리에는 자산만 남김)
+    log.advance(turn_number, calculate_total_assets(current_turn_data))
+    st.session_state.investment_history.append(log.history()[-1])
     
     return True
 
 
-def initialize_new_game(game_data, scenario_type):
-    """새 게임 초기화"""
-    st.session_state.game_data = game_data
-    filename = generate_filename(scenario_type)
-    save_scenario_to_file(game_data, filename)
+def initialize_new_game(game_data, scenario_type, generator=None, scenario_file=None):
+    """
+    새 게임 초기화
+    
+    Args:
+        game_data (list): 시나리오 턴 데이터 (턴별 생성 모드면 None)
+        scenario_type (str): 시나리오 타입
+        generator (TurnByTurnGenerator, optional): 턴별 생성 모드면 생성 중인 턴 목록을 그대로 사용
+        scenario_file (str, optional): 불러온 시나리오의 파일명. 없으면 새 시나리오를 저장한 파일명을
+            사용 (턴별 생성 모드면 generator가 저장을 마친 뒤 generator.saved_file)
+    """
+    st.session_state.scenario_generator = generator
+    if generator is not None:
+        # 시나리오 파일은 모든 턴이 생성된 뒤 generator가 저장함
+        st.session_state.game_data = generator.turns
+    else:
+        st.session_state.game_data = game_data
+        if scenario_file is None:
+            scenario_file = _save_scenario(game_data, generate_filename(scenario_type))
+    st.session_state.scenario_file = scenario_file
     
     # 게임 상태 초기화
+    st.session_state.scenario_type = scenario_type
     st.session_state.current_turn_index = 0
+    st.session_state.game_events = GameEventLog(INITIAL_BALANCE)
     st.session_state.player_investments = {}
-    st.session_state.player_balance = 1000
+    st.session_state.player_balance = INITIAL_BALANCE
     st.session_state.investment_history = []
     st.session_state.game_log = []
     st.session_state.game_started = True
@@ -127,9 +253,144 @@ def initialize_new_game(game_data, scenario_type):
 
 def reset_game_state():
     """게임 상태 초기화"""
+    # 생성 중인 시나리오는 버리는 게임이므로 백그라운드 생성(과 저장)을 멈춤
+    generator = st.session_state.get('scenario_generator')
+    if generator is not None:
+        generator.stop()
+    
     keys_to_reset = ['game_data', 'current_turn_index', 'player_investments', 
-                     'player_balance', 'investment_history', 'game_log', 'game_started']
+                     'player_balance', 'investment_history', 'game_log', 'game_started',
+                     'scenario_generator', 'turn_quotes', 'asset_valuation', 'game_events',
+                     'scenario_type', 'scenario_file', 'saved_game']
     
     for key in keys_to_reset:
         if key in st.session_state:
             del st.session_state[key]
+
+
+def get_scenario_file():
+    """
+    현재 게임의 시나리오 파일명을 반환합니다.
+    
+    Returns:
+        str: 시나리오 파일명, 저장되지 않았거나 아직 생성 중이면 None
+    """
+    generator = st.session_state.get('scenario_generator')
+    if generator is not None:
+        return generator.saved_file
+    return st.session_state.get('scenario_file')
+
+
+def export_game_state():
+    """
+    현재 게임을 저장용 dict로 변환합니다. (턴별 보유 수량 사본 대신 이벤트 기록만 저장)
+    
+    시나리오가 파일로 저장되어 있고 저장 게임 저장소가 영구 저장소이면 턴 데이터는 넣지 않고
+    파일명으로만 참조하므로, 저장할 때마다 다시 쓰는 내용은 이벤트 기록과 진행 상태뿐입니다.
+    (영구 저장소의 저장 게임이 참조하는 시나리오는 dedupe --delete가 지우지 않음)
+    
+    Returns:
+        dict: 시나리오(또는 시나리오 파일명), 현재 턴, 이벤트 기록, 게임 로그
+    """
+    game_data = st.session_state.game_data
+    scenario_file = get_scenario_file()
+    save_data = {
+        'scenario_file': scenario_file,
+        'current_turn_index': st.session_state.current_turn_index,
+        'events': get_event_log().to_dict(),
+        'game_log': st.session_state.get('game_log', []),
+        'scenario_type': st.session_state.get('scenario_type'),
+    }
+    # 생성 중이거나 저장되지 않은 시나리오(파일이 없거나 내용이 다름)는 턴 데이터를 함께 저장
+    scenario = load_scenario(scenario_file) if scenario_file and get_saved_game_store().persistent else None
+    if scenario is None or scenario.turns != game_data:
+        save_data['game_data'] = game_data
+    return save_data
+
+
+def restore_game_state(save_data):
+    """
+    저장된 게임을 세션에 복원합니다. (이벤트 기록을 다시 적용해 잔액/보유 수량/히스토리를 만듦)
+    
+    Args:
+        save_data (dict): export_game_state로 만든 dict
+            (이벤트 기록이 없는 이전 형식이면 저장된 잔액/보유 수량/히스토리를 그대로 사용)
+    
+    Raises:
+        ValueError: 참조하는 시나리오 파일을 찾을 수 없는 경우
+    """
+    game_data = save_data.get('game_data')
+    if game_data is None:
+        scenario = load_scenario(save_data.get('scenario_file') or "")
+        if scenario is None:
+            raise ValueError(f"시나리오 파일을 찾을 수 없습니다: {save_data.get('scenario_file')}")
+        game_data = scenario.turns
+    
+    reset_game_state()
+    if 'events' in save_data:
+        log = GameEventLog.from_dict(save_data['events'])
+        balance, investments, history = log.balance, log.holdings, log.history()
+    else:
+        balance = save_data.get('player_balance', INITIAL_BALANCE)
+        investments = dict(save_data.get('player_investments', {}))
+        history = [{key: record[key] for key in ('turn', 'balance', 'total_asset_value')}
+                   for record in save_data.get('investment_history', [])]
+        log = GameEventLog(balance)
+        for stock_name, shares in investments.items():
+            # 이전 형식에는 거래 내역이 없으므로 가격 0의 매수로 보유 수량만 옮김
+            log.buy(0, stock_name, shares, 0)
+    
+    st.session_state.game_data = game_data
+    st.session_state.current_turn_index = save_data.get('current_turn_index', len(history))
+    st.session_state.game_events = log
+    st.session_state.player_balance = balance
+    st.session_state.player_investments = investments
+    st.session_state.investment_history = history
+    st.session_state.game_log = list(save_data.get('game_log', []))
+    st.session_state.scenario_type = save_data.get('scenario_type')
+    st.session_state.scenario_file = save_data.get('scenario_file')
+    st.session_state.scenario_generator = None
+    st.session_state.game_started = True
+    st.session_state.current_step = 'result' if st.session_state.current_turn_index >= len(st.session_state.game_data) else 'game'
+
+
+def get_player_id():
+    """
+    저장 게임을 구분하는 플레이어 ID를 반환합니다. (처음이면 만들어 URL의 player 값으로 남김)
+    
+    저장 게임 저장소는 서버의 모든 세션이 함께 쓰므로, 목록·불러오기·삭제는 이 ID의 저장 게임으로
+    한정합니다. 같은 주소로 다시 접속하면 같은 플레이어로 이어집니다.
+    
+    Returns:
+        str: 플레이어 ID
+    """
+    player_id = st.session_state.get('player_id') or st.query_params.get('player')
+    if not player_id:
+        player_id = uuid.uuid4().hex
+    if st.query_params.get('player') != player_id:
+        st.query_params['player'] = player_id
+    st.session_state.player_id = player_id
+    return player_id
+
+
+def load_saved_game(game_id):
+    """
+    현재 플레이어의 저장 게임을 저장소에서 불러와 세션에 복원합니다. 이후 저장은 같은 항목을 갱신합니다.
+    
+    Args:
+        game_id (str): 저장 게임 ID
+        
+    Returns:
+        bool: 불러오기 성공 여부 (없거나 다른 플레이어의 저장 게임이면 False)
+    """
+    save_data = get_saved_game_store().get(game_id, player_id=get_player_id())
+    if save_data is None:
+        return False
+    try:
+        restore_game_state(save_data)
+    except (KeyError, ValueError) as e:
+        print(f"저장된 게임을 불러올 수 없습니다: {game_id} ({e})")
+        return False
+    st.session_state.saved_game = {'id': game_id, 'events': len(get_event_log()),
+                                   'turn': st.session_state.current_turn_index}
+    return True
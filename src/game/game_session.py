@@ -0,0 +1,145 @@
+"""
+API 게임 세션 모듈
+
+Streamlit 세션 없이 게임을 진행할 수 있도록, 게임 하나를 (시나리오 ID, 현재 턴, 이벤트 기록)
+으로 표현하고 한 턴의 주문을 적용하는 규칙을 제공합니다. 시나리오 데이터는 세션에 복사하지
+않고 시나리오 저장소에서 ID로 가져옵니다.
+"""
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from src.game.event_log import GameEventLog, INITIAL_BALANCE
+
+
+class OrderError(ValueError):
+    """주문을 적용할 수 없는 경우 (잔액 부족, 없는 상점, 보유 수량 초과 매도)"""
+    pass
+
+
+class GameFinishedError(OrderError):
+    """이미 끝난 게임에 주문을 낸 경우"""
+    pass
+
+
+@dataclass
+class GameSession:
+    """
+    게임 세션
+
+    Attributes:
+        game_id (str): 게임 ID
+        scenario_id (str): 시나리오 ID (파일명)
+        player_id (str): 플레이어 ID (없으면 None)
+        current_turn_index (int): 현재 턴 위치 (0부터)
+        events (GameEventLog): 게임 이벤트 기록
+        created_at (float): 생성 시각 (epoch 초)
+        updated_at (float): 마지막 변경 시각 (epoch 초)
+    """
+    game_id: str
+    scenario_id: str
+    player_id: str = None
+    current_turn_index: int = 0
+    events: GameEventLog = field(default_factory=GameEventLog)
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_dict(self):
+        """JSON으로 저장할 수 있는 dict로 변환합니다."""
+        return {
+            "game_id": self.game_id,
+            "scenario_id": self.scenario_id,
+            "player_id": self.player_id,
+            "current_turn_index": self.current_turn_index,
+            "events": self.events.to_dict(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict로 만든 dict에서 세션을 복원합니다."""
+        return cls(data["game_id"], data["scenario_id"], data.get("player_id"),
+                   data.get("current_turn_index", 0), GameEventLog.from_dict(data["events"]),
+                   data.get("created_at", time.time()), data.get("updated_at", time.time()))
+
+
+def new_game_session(scenario_id, player_id=None, initial_balance=INITIAL_BALANCE):
+    """새 게임 세션을 만듭니다."""
+    return GameSession(uuid.uuid4().hex, scenario_id, player_id, events=GameEventLog(initial_balance))
+
+
+def _turn_prices(turn_data):
+    return {stock['name']: stock['current_value'] for stock in turn_data['stocks']}
+
+
+def _total_assets(events, prices):
+    """잔액 + 보유 수량(양수만) × 가격 (이 턴에 없는 상점은 0)"""
+    return events.balance + sum(max(count, 0) * prices.get(name, 0) for name, count in events.holdings.items())
+
+
+def submit_turn(session, scenario, orders):
+    """
+    현재 턴의 주문을 적용하고 턴을 마감합니다.
+
+    Args:
+        session (GameSession): 게임 세션 (그 자리에서 바뀜)
+        scenario (Scenario): 세션의 시나리오
+        orders (dict): 상점 이름 → 수량 변화 (양수 매수, 음수 매도)
+
+    Raises:
+        GameFinishedError: 이미 끝난 게임인 경우
+        OrderError: 주문을 적용할 수 없는 경우 (세션은 바뀌지 않음)
+    """
+    if session.current_turn_index >= len(scenario.turns):
+        raise GameFinishedError("이미 끝난 게임입니다.")
+    turn_data = scenario.turns[session.current_turn_index]
+    prices = _turn_prices(turn_data)
+    events = session.events
+
+    # 모든 주문을 확인한 뒤에 기록 (일부만 적용되지 않도록)
+    holdings = events.holdings
+    total_cost = 0
+    for stock_name, shares_change in orders.items():
+        if stock_name not in prices:
+            raise OrderError(f"이번 턴에 없는 상점입니다: {stock_name}")
+        if shares_change < 0 and -shares_change > holdings.get(stock_name, 0):
+            raise OrderError(f"보유 수량보다 많이 팔 수 없습니다: {stock_name}")
+        total_cost += max(shares_change, 0) * prices[stock_name]
+    if total_cost > events.balance:
+        raise OrderError("코인이 부족합니다.")
+
+    turn_number = turn_data['turn_number']
+    for stock_name, shares_change in orders.items():
+        events.trade(turn_number, stock_name, shares_change, prices[stock_name])
+    events.advance(turn_number, _total_assets(events, prices))
+    session.current_turn_index += 1
+    session.updated_at = time.time()
+
+
+def game_state(session, scenario):
+    """
+    API 응답용 게임 상태를 만듭니다.
+
+    Returns:
+        dict: 잔액, 보유 수량, 총 자산, 턴별 기록, 현재 턴 데이터(끝났으면 None)
+    """
+    total_turns = len(scenario.turns)
+    finished = session.current_turn_index >= total_turns
+    current_turn = None if finished else scenario.turns[session.current_turn_index]
+    # 진행 중이면 현재 턴 가격, 끝났으면 마지막 턴 가격 기준
+    prices = _turn_prices(scenario.turns[min(session.current_turn_index, total_turns - 1)])
+    events = session.events
+    return {
+        "game_id": session.game_id,
+        "scenario_id": session.scenario_id,
+        "player_id": session.player_id,
+        "current_turn_index": session.current_turn_index,
+        "total_turns": total_turns,
+        "finished": finished,
+        "balance": events.balance,
+        "holdings": events.holdings,
+        "total_asset_value": _total_assets(events, prices),
+        "history": events.history(),
+        "current_turn": current_turn,
+    }
@@ -0,0 +1,76 @@
+"""
+Streamlit 프로세스 공유 리소스 모듈
+
+LLM 클라이언트, 시나리오 목록, 검증된 시나리오처럼 세션마다 새로 만들 필요가 없는 객체를
+`st.cache_resource`로 프로세스에 하나씩만 두고 모든 세션이 함께 사용합니다.
+파일이 바뀌는 리소스는 명시적으로 무효화합니다. (시나리오 저장 시 목록 무효화 등)
+"""
+import os
+
+import streamlit as st
+
+from src.models.llm_handler import initialize_llm
+from src.models.scenario import validate_scenario_safely
+from src.utils.file_manager import get_available_scenarios, read_scenario_file, DATA_DIR
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_llm_client(google_api_key):
+    """
+    API 키별 공유 LLM 클라이언트를 반환합니다.
+
+    키를 환경 변수에 쓰지 않고 클라이언트에 직접 넘기므로, 여러 세션이 서로 다른 키를
+    써도 간섭하지 않습니다.
+
+    Args:
+        google_api_key (str): Google API 키
+
+    Returns:
+        ChatGoogleGenerativeAI: LLM 클라이언트
+    """
+    return initialize_llm(google_api_key)
+
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def list_scenarios(data_dir=DATA_DIR):
+    """
+    저장된 시나리오 파일 목록 (최신순). 시나리오를 저장하면 invalidate_scenario_list로 무효화합니다.
+
+    Returns:
+        tuple: 시나리오 파일명 목록
+    """
+    return tuple(get_available_scenarios(data_dir))
+
+
+def invalidate_scenario_list():
+    """시나리오 목록 캐시를 비웁니다. (새 시나리오를 저장한 뒤 호출)"""
+    list_scenarios.clear()
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _load_scenario(path, mtime):
+    try:
+        data = read_scenario_file(path)
+    except (OSError, ValueError) as e:
+        print(f"시나리오 파일을 읽을 수 없습니다: {path} ({e})")
+        return None
+    return validate_scenario_safely(data)
+
+
+def load_scenario(filename, data_dir=DATA_DIR):
+    """
+    검증된 시나리오를 반환합니다. 파일 수정 시각이 같으면 다시 읽지 않고 공유 객체를 사용합니다.
+
+    Args:
+        filename (str): 시나리오 파일명
+        data_dir (str, optional): 시나리오 저장 디렉토리
+
+    Returns:
+        Scenario: 검증된 시나리오 (여러 세션이 공유하므로 수정하지 말 것), 없거나 읽을 수 없으면 None
+    """
+    path = os.path.join(data_dir, filename)
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    return _load_scenario(path, mtime)
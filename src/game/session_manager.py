@@ -14,6 +14,7 @@ def initialize_session_state():
         'game_log': [],
         'game_started': False,
         'current_step': 'welcome',
+        'scenario_generator': None,
         'google_api_key': load_api_key()
     }
     
@@ -32,6 +33,14 @@ def set_session_value(key, value):
     st.session_state[key] = value
 
 
+def get_total_turns():
+    """전체 턴 수 (턴별 생성 중이면 아직 생성되지 않은 턴까지 포함)"""
+    generator = get_session_value('scenario_generator')
+    if generator is not None:
+        return generator.total_turns
+    return len(get_session_value('game_data') or [])
+
+
 def is_game_finished():
     """게임이 끝났는지 확인"""
     game_data = get_session_value('game_data')
@@ -40,7 +49,19 @@ def is_game_finished():
     if not game_data:
         return False
     
-    return current_turn_index >= len(game_data)
+    return current_turn_index >= get_total_turns()
+
+
+def wait_for_current_turn():
+    """턴별 생성 중이면 현재 턴이 생성될 때까지 기다림 (생성에 실패하면 False)"""
+    generator = get_session_value('scenario_generator')
+    current_turn_index = get_session_value('current_turn_index', 0)
+    
+    if generator is None or generator.is_turn_ready(current_turn_index) or is_game_finished():
+        return True
+    
+    with st.spinner("📖 다음 날 이야기를 만들고 있어요..."):
+        return generator.wait_for_turn(current_turn_index) is not None
 
 
 def get_current_turn_data():
@@ -0,0 +1,168 @@
+"""
+턴별(점진적) 시나리오 생성 모듈
+
+7턴 전체를 한 번의 긴 요청으로 만드는 대신 한 턴씩 생성합니다.
+첫 턴이 준비되면 바로 게임을 시작하고, 나머지 턴은 아이가 플레이하는 동안
+백그라운드 스레드에서 이어서 생성합니다. (Streamlit에 의존하지 않음)
+"""
+import json
+import threading
+
+from src.models.context_cache import get_context_cache
+from src.models.llm_handler import create_prompt_template, generate_game_data
+from src.models.scenario import SCENARIO_TURNS, validate_scenario, ScenarioValidationError
+from src.utils.prompts import get_system_prompt, get_scenario_background, get_turn_request_prompt
+
+
+class TurnByTurnGenerator:
+    """
+    시나리오를 한 턴씩 생성하고, 생성된 턴을 `turns`에 순서대로 추가합니다.
+
+    Attributes:
+        turns (list): 지금까지 생성·검증된 턴 데이터 (게임이 그대로 사용하는 dict 목록)
+        total_turns (int): 생성할 전체 턴 수
+        error (str): 생성이 중단된 경우 그 이유, 그 외에는 None
+        saved_file (str): 완료 후 on_complete가 반환한 값 (저장한 시나리오 파일명), 그 전에는 None
+    """
+
+    def __init__(self, llm, scenario_type, total_turns=SCENARIO_TURNS, max_attempts=3, on_complete=None,
+                 context_cache=None):
+        """
+        Args:
+            llm: 언어 모델 인스턴스
+            scenario_type (str): 시나리오 타입
+            total_turns (int, optional): 생성할 전체 턴 수. 기본값은 7
+            max_attempts (int, optional): 턴마다 생성을 시도할 최대 횟수. 기본값은 3
+            on_complete (callable, optional): 모든 턴이 생성되면 턴 목록을 인자로 호출할 함수
+                (반환값은 `saved_file`에 기록 - 예: 저장한 시나리오 파일명)
+            context_cache (ContextCache, optional): 모든 턴이 공유하는 배경 스토리를 올려 둘
+                컨텍스트 캐시. 지정하지 않으면 설정에 따른 공용 캐시를 사용합니다.
+        """
+        self.llm = llm
+        self.scenario_type = scenario_type
+        self.total_turns = total_turns
+        self.max_attempts = max_attempts
+        self.on_complete = on_complete
+        self.turns = []
+        self.error = None
+        self.saved_file = None
+        self.context_cache = context_cache if context_cache is not None else get_context_cache()
+        self._prompt_template = create_prompt_template(get_system_prompt())
+        self._background = get_scenario_background(scenario_type)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._cancelled = threading.Event()
+
+    @property
+    def is_complete(self):
+        """모든 턴이 생성되었는지 여부"""
+        return len(self.turns) >= self.total_turns
+
+    @property
+    def is_running(self):
+        """백그라운드 생성이 진행 중인지 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def is_cancelled(self):
+        """stop으로 생성이 취소되었는지 여부"""
+        return self._cancelled.is_set()
+
+    def stop(self):
+        """
+        남은 턴 생성을 취소합니다. 진행 중인 요청이 끝나면 더 요청하지 않고,
+        on_complete(시나리오 저장)도 호출하지 않습니다.
+        """
+        self._cancelled.set()
+        with self._condition:
+            if self.error is None and not self.is_complete:
+                self.error = "시나리오 생성이 취소되었습니다."
+            self._condition.notify_all()
+
+    def is_turn_ready(self, index):
+        """index(0부터 시작)번째 턴이 준비되었는지 여부"""
+        return index < len(self.turns)
+
+    def generate_next_turn(self):
+        """
+        다음 턴 하나를 생성하여 `turns`에 추가합니다.
+
+        이전 턴들과 함께 검증을 통과한 응답만 추가하며, 실패하면 `max_attempts`번까지 다시 요청합니다.
+
+        Returns:
+            dict: 생성된 턴 데이터, 모든 시도가 실패하면 None (`error`에 이유 기록)
+        """
+        turn_number = len(self.turns) + 1
+        prompt = get_turn_request_prompt(turn_number, self.turns, self.total_turns)
+
+        for attempt in range(1, self.max_attempts + 1):
+            if self.is_cancelled:
+                return None
+            print(f"{turn_number}턴 생성 중... (시도 {attempt}/{self.max_attempts})")
+            turn = self._request_turn(prompt)
+            if turn is None:
+                continue
+            try:
+                scenario = validate_scenario(self.turns + [turn], expected_turns=None)
+            except ScenarioValidationError as e:
+                print(e)
+                continue
+
+            with self._condition:
+                if self.is_cancelled:
+                    return None
+                self.turns.append(scenario.turns[-1])
+                self._condition.notify_all()
+            return self.turns[-1]
+
+        with self._condition:
+            if self.is_cancelled:
+                return None
+            self.error = f"{turn_number}턴 생성에 {self.max_attempts}번 실패했습니다."
+            self._condition.notify_all()
+        print(self.error)
+        return None
+
+    def start_background(self):
+        """남은 턴들을 백그라운드 스레드에서 생성하기 시작합니다."""
+        if self.is_running or self.is_complete or self.is_cancelled:
+            return
+        self._thread = threading.Thread(target=self._generate_remaining_turns, daemon=True)
+        self._thread.start()
+
+    def wait_for_turn(self, index, timeout=None):
+        """
+        index(0부터 시작)번째 턴이 생성될 때까지 기다립니다.
+
+        Args:
+            index (int): 기다릴 턴 인덱스
+            timeout (float, optional): 최대 대기 시간(초). 기본값은 무제한
+
+        Returns:
+            dict: 턴 데이터, 생성이 실패했거나 시간이 초과되면 None
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self.is_turn_ready(index) or self.error is not None, timeout)
+            return self.turns[index] if self.is_turn_ready(index) else None
+
+    def _generate_remaining_turns(self):
+        while not self.is_complete:
+            if self.generate_next_turn() is None:
+                return
+        if self.on_complete and not self.is_cancelled:
+            try:
+                self.saved_file = self.on_complete(list(self.turns))
+            except Exception as e:
+                print(f"시나리오 완료 처리 중 오류 발생: {e}")
+
+    def _request_turn(self, prompt):
+        """LLM에 한 턴을 요청하고 턴 객체(dict)를 반환합니다. 실패 시 None"""
+        json_content = generate_game_data(self.llm, self._prompt_template, prompt, expected_turns=1,
+                                          static_prompt=self._background, context_cache=self.context_cache)
+        if not json_content:
+            return None
+        turns = json.loads(json_content)
+        if len(turns) != 1:
+            print(f"턴 1개를 요청했지만 {len(turns)}개가 생성되었습니다.")
+            return None
+        return turns[0]
@@ -6,6 +6,8 @@ import sys
 import argparse
 from datetime import datetime
 
+import numpy as np
+
 # 현재 파일의 상위 디렉토리를 시스템 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -13,10 +15,22 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.utils.config import load_api_key, get_model_settings
 from src.utils.prompts import get_system_prompt, get_game_scenario_prompt
 from src.models.llm_handler import initialize_llm, create_prompt_template, generate_game_data
-from src.data.data_handler import parse_json_data, save_game_data, load_game_data
+from src.models.context_cache import get_context_cache
+from src.data.data_handler import parse_json_data, save_game_data, load_game_data, DuplicateScenarioError
+from src.data.batch_generator import generate_scenario_batch
+from src.data.near_duplicates import find_near_duplicates
+from src.data.session_store import get_saved_game_store
+from src.data.analytics_export import export_analytics, DEFAULT_STRATEGIES
+from src.data.price_archive import build_price_archive
+from src.simulation.backtest import backtest_archive
 from src.visualization.visualize import visualize_stock_values, save_visualization
+from src.visualization.chart_renderer import render_scenario_thumbnails, THUMBNAIL_SIZE, THUMBNAIL_DPI
+from src.visualization.chart_cache import get_chart_cache
+from src.models.scenario import validate_scenario_safely
 from src.simulation.simulator import run_simulation, run_automated_simulation
 
+SCENARIO_TYPE_CHOICES = ["magic_kingdom", "foodtruck_kingdom", "moonlight_thief", "three_little_pigs"]
+
 def create_directory_if_not_exists(path):
     """지정된 경로가 존재하지 않으면 생성합니다."""
     if not os.path.exists(path):
@@ -109,8 +123,13 @@ def generate_pipeline(args):
                 prompt_template = create_prompt_template(system_prompt)
                 game_scenario_prompt = get_game_scenario_prompt(scenario_type)  # 선택된 시나리오 타입 전달
                 
-                # 게임 데이터 생성
-                json_content = generate_game_data(llm, prompt_template, game_scenario_prompt)
+                # 게임 데이터 생성 (시나리오 프롬프트 전체가 정적이므로 컨텍스트 캐시 대상)
+                context_cache = get_context_cache()
+                json_content = generate_game_data(llm, prompt_template, "",
+                                                  static_prompt=game_scenario_prompt,
+                                                  context_cache=context_cache)
+                if context_cache is not None:
+                    print(f"컨텍스트 캐시 지표: {context_cache.stats.as_dict()}")
                 
                 # JSON 파싱
                 game_data = parse_json_data(json_content)
@@ -143,7 +162,11 @@ def generate_pipeline(args):
         else:
             output_file = f"game_scenario_{scenario_type}_{timestamp}.json"  # 시나리오 타입 포함
         
-        save_path = save_game_data(game_data, data_dir, output_file)
+        try:
+            save_path = save_game_data(game_data, data_dir, output_file)
+        except DuplicateScenarioError as e:
+            print(e)
+            save_path = os.path.join(data_dir, e.duplicate_of)
     
     # 데이터 시각화
     if args.visualize:
@@ -155,9 +178,18 @@ def generate_pipeline(args):
             viz_dir = os.path.join(project_dir, "visualization_results")
             create_directory_if_not_exists(viz_dir)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            viz_path = os.path.join(viz_dir, f"stock_values_{timestamp}.png")
-            save_visualization(game_data, viz_path)
+            # 같은 시나리오는 같은 파일 이름 (내용 해시) - 같은 그림을 중복 저장하지 않음
+            scenario = validate_scenario_safely(game_data)
+            if scenario is None:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                viz_path = os.path.join(viz_dir, f"stock_values_{timestamp}.png")
+                save_visualization(game_data, viz_path)
+            else:
+                viz_path = os.path.join(viz_dir, f"stock_values_{scenario.content_hash[:16]}.png")
+                if os.path.exists(viz_path):
+                    print(f"같은 시나리오의 시각화가 이미 있습니다: {viz_path}")
+                else:
+                    save_visualization(scenario.turns, viz_path, cache=get_chart_cache())
     
     # 시뮬레이션 실행
     if args.simulate:
@@ -192,6 +224,118 @@ def generate_pipeline(args):
     
     print("\n파이프라인 실행 완료!")
 
+def parse_scenario_counts(values):
+    """
+    'scenario_type=개수' 형태의 인자 목록을 시나리오 타입별 개수로 변환합니다.
+    
+    Args:
+        values (list): 명령줄 인자 목록 (예: ["magic_kingdom=50", "moonlight_thief=20"])
+        
+    Returns:
+        dict: 시나리오 타입 → 생성할 개수
+        
+    Raises:
+        argparse.ArgumentTypeError: 형식이 잘못되었거나 알 수 없는 시나리오 타입인 경우
+    """
+    counts = {}
+    for value in values:
+        scenario_type, _, count = value.partition("=")
+        if scenario_type not in SCENARIO_TYPE_CHOICES:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오 타입입니다: {scenario_type}")
+        if not count.isdigit() or int(count) < 1:
+            raise argparse.ArgumentTypeError(f"개수는 1 이상의 정수여야 합니다: {value}")
+        counts[scenario_type] = counts.get(scenario_type, 0) + int(count)
+    return counts
+
+def generate_batch(args):
+    """여러 시나리오를 병렬로 생성하여 저장소에 저장합니다."""
+    try:
+        counts = parse_scenario_counts(args.counts)
+    except argparse.ArgumentTypeError as e:
+        print(f"❌ {e}")
+        return
+    
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = args.data_dir or os.path.join(project_dir, "data")
+    create_directory_if_not_exists(data_dir)
+    
+    try:
+        llm = initialize_llm()
+    except ValueError as e:
+        print(f"❌ {e} API 키를 먼저 설정해주세요.")
+        return
+    
+    print(f"시나리오 대량 생성 시작: {counts} (동시 요청 {args.workers}개)")
+    report = generate_scenario_batch(llm, counts, data_dir,
+                                     workers=args.workers, max_attempts=args.max_attempts,
+                                     similarity_threshold=args.similarity_threshold)
+    
+    print("\n===== 배치 생성 결과 =====")
+    print(report.summary())
+    context_cache = get_context_cache()
+    if context_cache is not None:
+        print(f"컨텍스트 캐시 지표: {context_cache.stats.as_dict()}")
+
+def dedupe_scenarios(args):
+    """저장소에서 먼저 저장된 시나리오와 유사한 시나리오를 찾고, 요청 시 삭제합니다."""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = args.data_dir or os.path.join(project_dir, "data")
+    
+    duplicates = find_near_duplicates(data_dir, threshold=args.threshold)
+    saved_games = get_saved_game_store() if args.delete else None
+    deleted = 0
+    for filename, original, score in duplicates:
+        print(f"{filename} ≈ {original} (유사도 {score:.2f})")
+        if args.delete:
+            # 저장 게임이 파일명으로 참조하는 시나리오는 지우면 게임을 이어할 수 없으므로 남김
+            if saved_games.list_sessions(scenario_id=filename, limit=1):
+                print(f"  저장된 게임이 사용 중인 시나리오라 지우지 않습니다: {filename}")
+                continue
+            os.remove(os.path.join(data_dir, filename))
+            deleted += 1
+    
+    if args.delete:
+        print(f"\n유사 시나리오 {len(duplicates)}개 중 {deleted}개 삭제")
+    else:
+        print(f"\n유사 시나리오 {len(duplicates)}개 발견")
+
+def export_analytics_dataset(args):
+    """저장소의 시나리오와 시뮬레이션 결과를 분석용 Parquet 데이터셋으로 내보냅니다."""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = args.data_dir or os.path.join(project_dir, "data")
+    output_dir = args.output_dir or os.path.join(project_dir, "analytics")
+    strategies = () if args.no_simulate else DEFAULT_STRATEGIES
+    export_analytics(data_dir, output_dir, strategies)
+
+def run_backtest(args):
+    """가격 아카이브로 전략별 대규모 백테스트를 실행합니다. (아카이브가 없으면 저장소에서 생성)"""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = args.data_dir or os.path.join(project_dir, "data")
+    archive_path = args.archive or os.path.join(data_dir, "price_paths.bin")
+    if args.rebuild or not os.path.exists(archive_path):
+        build_price_archive(data_dir, archive_path)
+    
+    results = backtest_archive(archive_path, seed=args.seed)
+    print("\n===== 전략별 백테스트 결과 =====")
+    for strategy, profit_rates in results.items():
+        if len(profit_rates) == 0:
+            print(f"{strategy}: 시나리오 없음")
+            continue
+        print(f"{strategy}: 시나리오 {len(profit_rates)}개, 평균 수익률 {profit_rates.mean():.1f}%, "
+              f"중앙값 {np.median(profit_rates):.1f}%, 손실 비율 {(profit_rates < 0).mean():.1%}")
+
+def render_charts(args):
+    """저장소의 모든 시나리오 차트(썸네일)를 프로세스 풀에서 렌더링하여 저장합니다."""
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    data_dir = args.data_dir or os.path.join(project_dir, "data")
+    output_dir = args.output_dir or os.path.join(project_dir, "visualization_results", "thumbnails")
+    start_time = datetime.now()
+    count = render_scenario_thumbnails(data_dir, output_dir, fmt=args.format, size=(args.width, args.height),
+                                       dpi=args.dpi, workers=args.workers)
+    elapsed = (datetime.now() - start_time).total_seconds()
+    if count:
+        print(f"렌더링 시간: {elapsed:.1f}초 (차트당 {elapsed / count * 1000:.0f}ms)")
+
 if __name__ == "__main__":
     # 명령줄 인자 파싱
     parser = argparse.ArgumentParser(description="스토리텔링 주식 투자 시뮬레이션")
@@ -210,9 +354,81 @@ if __name__ == "__main__":
                         help="시뮬레이션 실행")
     parser.add_argument("--auto-sim", action="store_true", 
                         help="자동화된 시뮬레이션 실행")
-    parser.add_argument("--scenario-type", type=str, choices=["magic_kingdom", "foodtruck_kingdom", "moonlight_thief", "three_little_pigs"], 
+    parser.add_argument("--scenario-type", type=str, choices=SCENARIO_TYPE_CHOICES, 
                         help="시나리오 타입 선택 (magic_kingdom, foodtruck_kingdom, moonlight_thief, 또는 three_little_pigs)")
     
+    # 대량 생성 명령 (예: python src/main.py generate-batch magic_kingdom=50 moonlight_thief=20 --workers 8)
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser("generate-batch", help="여러 시나리오를 병렬로 생성하여 저장")
+    batch_parser.add_argument("counts", nargs="+", metavar="SCENARIO_TYPE=COUNT",
+                              help="시나리오 타입별 생성 개수 (예: magic_kingdom=50)")
+    batch_parser.add_argument("--workers", type=int, default=4,
+                              help="동시에 보낼 최대 생성 요청 수 (기본값: 4)")
+    batch_parser.add_argument("--max-attempts", type=int, default=3,
+                              help="시나리오마다 시도할 최대 요청 수 (기본값: 3)")
+    batch_parser.add_argument("--data-dir", type=str,
+                              help="시나리오 저장 디렉토리 (기본값: data)")
+    batch_parser.add_argument("--similarity-threshold", type=float, default=0.8,
+                              help="기존 시나리오와 이 값 이상 유사하면 다시 생성 (기본값: 0.8)")
+    
+    # 유사 시나리오 정리 명령 (예: python src/main.py dedupe --delete)
+    dedupe_parser = subparsers.add_parser("dedupe", help="저장소에서 유사(준중복) 시나리오 찾기")
+    dedupe_parser.add_argument("--threshold", type=float, default=0.8,
+                               help="유사 시나리오 판정 기준 (기본값: 0.8)")
+    dedupe_parser.add_argument("--delete", action="store_true",
+                               help="먼저 저장된 시나리오만 남기고 유사 시나리오 파일 삭제")
+    dedupe_parser.add_argument("--data-dir", type=str,
+                               help="시나리오 저장 디렉토리 (기본값: data)")
+    
+    # 분석용 데이터셋 내보내기 (예: python src/main.py export-analytics)
+    export_parser = subparsers.add_parser("export-analytics",
+                                          help="시나리오 가격 흐름과 시뮬레이션 결과를 Parquet으로 내보내기")
+    export_parser.add_argument("--output-dir", type=str,
+                               help="데이터셋을 쓸 디렉토리 (기본값: analytics)")
+    export_parser.add_argument("--no-simulate", action="store_true",
+                               help="전략별 자동 시뮬레이션 결과는 내보내지 않음")
+    export_parser.add_argument("--data-dir", type=str,
+                               help="시나리오 저장 디렉토리 (기본값: data)")
+    
+    # 가격 아카이브 기반 대규모 백테스트 (예: python src/main.py backtest --rebuild)
+    backtest_parser = subparsers.add_parser("backtest", help="저장된 모든 시나리오로 전략별 백테스트")
+    backtest_parser.add_argument("--archive", type=str,
+                                 help="가격 아카이브 파일 경로 (기본값: data/price_paths.bin)")
+    backtest_parser.add_argument("--rebuild", action="store_true",
+                                 help="저장소에서 가격 아카이브를 다시 생성")
+    backtest_parser.add_argument("--seed", type=int,
+                                 help="난수 시드 (재현용)")
+    backtest_parser.add_argument("--data-dir", type=str,
+                                 help="시나리오 저장 디렉토리 (기본값: data)")
+    
+    # 차트 일괄 렌더링 (예: python src/main.py render-charts --workers 8)
+    render_parser = subparsers.add_parser("render-charts", help="저장된 모든 시나리오의 차트 이미지(썸네일) 생성")
+    render_parser.add_argument("--output-dir", type=str,
+                               help="이미지를 저장할 디렉토리 (기본값: visualization_results/thumbnails)")
+    render_parser.add_argument("--format", choices=["png", "svg"], default="png",
+                               help="이미지 형식 (기본값: png)")
+    render_parser.add_argument("--width", type=float, default=THUMBNAIL_SIZE[0],
+                               help=f"그림 너비(인치) (기본값: {THUMBNAIL_SIZE[0]})")
+    render_parser.add_argument("--height", type=float, default=THUMBNAIL_SIZE[1],
+                               help=f"그림 높이(인치) (기본값: {THUMBNAIL_SIZE[1]})")
+    render_parser.add_argument("--dpi", type=int, default=THUMBNAIL_DPI,
+                               help=f"해상도 (기본값: {THUMBNAIL_DPI})")
+    render_parser.add_argument("--workers", type=int,
+                               help="렌더링 프로세스 수 (기본값: CPU 수)")
+    render_parser.add_argument("--data-dir", type=str,
+                               help="시나리오 저장 디렉토리 (기본값: data)")
+    
     args = parser.parse_args()
     
-    generate_pipeline(args)
+    if args.command == "generate-batch":
+        generate_batch(args)
+    elif args.command == "dedupe":
+        dedupe_scenarios(args)
+    elif args.command == "export-analytics":
+        export_analytics_dataset(args)
+    elif args.command == "backtest":
+        run_backtest(args)
+    elif args.command == "render-charts":
+        render_charts(args)
+    else:
+        generate_pipeline(args)
@@ -0,0 +1,219 @@
+"""
+컨텍스트(프리픽스) 캐시 모듈
+
+모든 생성 요청이 똑같이 보내는 시스템 프롬프트와 시나리오 규칙(정적 접두부)을 한 번만
+업로드해 두고, 이후 요청에서는 캐시 이름만 참조하도록 합니다. 입력 토큰 비용과
+첫 토큰까지의 시간을 줄이기 위한 것으로, 대량 사전 생성에서 효과가 큽니다.
+
+- GeminiContextCache: Gemini 명시적 컨텍스트 캐시(CachedContent)를 사용
+- LocalContextCache: 실제 업로드 없이 캐시 적중을 흉내 내는 로컬 대체 구현 (테스트/측정용)
+"""
+import time
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from src.utils.config import get_model_settings
+from src.utils.prompts import estimate_tokens
+
+# 캐시를 참조하는 요청에서 동적 내용이 없을 때 보내는 요청 문구
+CACHED_REQUEST_PROMPT = "위의 안내에 따라 응답해주세요."
+
+
+@dataclass
+class ContextCacheStats:
+    """컨텍스트 캐시 사용 지표"""
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    creations: int = 0
+    failures: int = 0
+    input_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def hit_rate(self):
+        """조회 대비 캐시 적중률"""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def cached_token_ratio(self):
+        """입력 토큰 중 캐시에서 읽은 토큰 비율"""
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def as_dict(self):
+        stats = asdict(self)
+        stats["hit_rate"] = round(self.hit_rate, 4)
+        stats["cached_token_ratio"] = round(self.cached_token_ratio, 4)
+        return stats
+
+
+class ContextCache(ABC):
+    """
+    정적 접두부(시스템 프롬프트 + 고정 프롬프트) → 캐시 이름 매핑을 관리하는 기본 클래스
+
+    하위 클래스는 `_create`(캐시 생성)를 구현합니다.
+    `provider_cache`가 False인 구현의 캐시 이름은 제공자에 보내지 않습니다. (요청은 전체 프롬프트로)
+    """
+
+    provider_cache = True
+    # 캐시 생성에 실패한 접두부는 이 시간(초) 동안 다시 만들지 않고 캐시 없이 요청
+    failure_backoff_seconds = 60
+
+    def __init__(self, ttl_seconds=3600):
+        """
+        Args:
+            ttl_seconds (int, optional): 캐시 유지 시간(초). 기본값은 3600
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stats = ContextCacheStats()
+        self._entries = {}  # 키 → (캐시 이름, 만료 시각)
+        self._creating = set()  # 생성 중인 키
+        self._failed_until = {}  # 키 → 다시 생성을 시도할 시각
+        self._lock = threading.Lock()
+        self._created = threading.Condition(self._lock)
+
+    def lookup(self, llm, system_prompt, static_prompt):
+        """
+        정적 접두부에 해당하는 캐시 이름을 반환합니다. 없거나 만료되었으면 새로 만듭니다.
+
+        같은 접두부의 캐시는 한 요청만 만들고 (나머지는 생성이 끝날 때까지 대기), 생성(업로드)은
+        잠금 밖에서 진행하므로 다른 접두부의 조회는 기다리지 않습니다.
+
+        Args:
+            llm: 언어 모델 인스턴스 (캐시는 모델별로 관리)
+            system_prompt (str): 시스템 프롬프트
+            static_prompt (str): 모든 요청에서 동일한 프롬프트 접두부
+
+        Returns:
+            str: 캐시 이름, 캐시를 만들 수 없으면 None
+        """
+        key = self._make_key(llm, system_prompt, static_prompt)
+        with self._lock:
+            self.stats.lookups += 1
+            while key in self._creating:
+                self._created.wait()
+            entry = self._entries.get(key)
+            if entry and entry[1] > time.monotonic():
+                self.stats.hits += 1
+                self._on_hit(system_prompt, static_prompt)
+                return entry[0]
+            self.stats.misses += 1
+            if self._failed_until.get(key, 0) > time.monotonic():
+                return None
+            self._creating.add(key)
+
+        # 만료 직전 캐시를 참조하지 않도록 여유(10%)를 두고 만료 처리
+        expires_at = time.monotonic() + self.ttl_seconds * 0.9
+        name = None
+        try:
+            name = self._create(llm, system_prompt, static_prompt)
+        except Exception as e:
+            print(f"컨텍스트 캐시 생성 실패 (캐시 없이 요청합니다): {e}")
+        with self._lock:
+            self._creating.discard(key)
+            if name is None:
+                self.stats.failures += 1
+                self._failed_until[key] = time.monotonic() + self.failure_backoff_seconds
+            else:
+                self.stats.creations += 1
+                self._entries[key] = (name, expires_at)
+                self._failed_until.pop(key, None)
+            self._created.notify_all()
+        return name
+
+    def invalidate(self, name):
+        """캐시 이름에 해당하는 항목을 제거합니다. (제공자 쪽에서 만료/삭제된 경우)"""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry[0] == name:
+                    del self._entries[key]
+
+    def record_usage(self, message):
+        """응답 메시지의 토큰 사용량(usage_metadata)을 지표에 반영합니다."""
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return
+        with self._lock:
+            self.stats.input_tokens += usage.get("input_tokens", 0)
+            self.stats.cached_tokens += usage.get("input_token_details", {}).get("cache_read", 0)
+
+    def _make_key(self, llm, system_prompt, static_prompt):
+        model_name = getattr(llm, "model", type(llm).__name__)
+        content = "\0".join([model_name, system_prompt, static_prompt])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @abstractmethod
+    def _create(self, llm, system_prompt, static_prompt):
+        """캐시를 만들고 캐시 이름을 반환합니다."""
+
+    def _on_hit(self, system_prompt, static_prompt):
+        pass
+
+
+class GeminiContextCache(ContextCache):
+    """Gemini 명시적 컨텍스트 캐시 (모델별 최소 토큰 수보다 짧은 접두부는 생성에 실패하고 캐시 없이 요청)"""
+
+    def _create(self, llm, system_prompt, static_prompt):
+        return llm.create_cached_content(
+            [SystemMessage(content=system_prompt), HumanMessage(content=static_prompt)],
+            display_name="edustock-prompt-prefix",
+            ttl=self.ttl_seconds,
+        )
+
+
+class LocalContextCache(ContextCache):
+    """
+    로컬 대체 구현 - 실제 업로드 없이 캐시 이름을 발급하고, 적중 시 접두부 토큰이 캐시에서
+    읽힌 것으로 지표를 기록합니다. (테스트 및 캐시 효과 추정용)
+    발급한 이름은 실제 캐시가 아니므로 요청은 항상 전체 프롬프트로 보냅니다.
+    """
+
+    provider_cache = False
+
+    def _create(self, llm, system_prompt, static_prompt):
+        return f"local-cache/{self._make_key(llm, system_prompt, static_prompt)[:16]}"
+
+    def _on_hit(self, system_prompt, static_prompt):
+        prefix_tokens = estimate_tokens(system_prompt) + estimate_tokens(static_prompt)
+        self.stats.input_tokens += prefix_tokens
+        self.stats.cached_tokens += prefix_tokens
+
+
+_CONTEXT_CACHE_BACKENDS = {
+    "gemini": GeminiContextCache,
+    "local": LocalContextCache,
+}
+
+_context_cache = None
+_context_cache_lock = threading.Lock()
+_warned_backends = set()  # 이미 경고한 알 수 없는 설정값 (요청마다 같은 경고를 출력하지 않도록)
+
+
+def get_context_cache():
+    """
+    설정에 따른 공용 컨텍스트 캐시를 반환합니다.
+
+    Returns:
+        ContextCache: 컨텍스트 캐시, 설정에서 꺼져 있거나 알 수 없는 값이면 None
+    """
+    global _context_cache
+    settings = get_model_settings()
+    backend = settings["context_cache"]
+    if not backend:
+        return None
+
+    with _context_cache_lock:
+        if backend not in _CONTEXT_CACHE_BACKENDS:
+            # 설정 오타 등으로 생성이 모두 실패하지 않도록 캐시 없이 진행
+            if backend not in _warned_backends:
+                _warned_backends.add(backend)
+                print(f"알 수 없는 컨텍스트 캐시 설정입니다 (캐시 없이 요청합니다): {backend} "
+                      f"(사용 가능: {', '.join(_CONTEXT_CACHE_BACKENDS)})")
+            return None
+        if _context_cache is None:
+            _context_cache = _CONTEXT_CACHE_BACKENDS[backend](ttl_seconds=settings["context_cache_ttl"])
+        return _context_cache
@@ -2,27 +2,53 @@
 LLM 모델 관리 모듈
 """
 import os
-from langchain.prompts import ChatPromptTemplate
+import json
+import time
+import threading
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
+from langchain_core.runnables import RunnableLambda
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
 
+from src.models.context_cache import CACHED_REQUEST_PROMPT
+from src.models.scenario import SCENARIO_TURNS, get_turn_json_schema
 from src.utils.config import load_api_key, get_model_settings
+from src.utils.json_extractor import extract_json_array
 
-def initialize_llm():
+# 최근 완료된 생성 요청의 응답 시간(초) - 헤징 지연 시간(p90) 계산에 사용
+_latency_samples = deque(maxlen=100)
+_latency_lock = threading.Lock()
+
+# JSON 스키마 타입 → Gemini 응답 스키마 타입
+_GEMINI_SCHEMA_TYPES = {
+    "string": "STRING",
+    "integer": "INTEGER",
+    "number": "NUMBER",
+    "boolean": "BOOLEAN",
+    "array": "ARRAY",
+    "object": "OBJECT",
+}
+
+def initialize_llm(api_key=None):
     """
     LLM 모델을 초기화합니다.
     
+    API 키는 클라이언트에 직접 넘기며 환경 변수는 바꾸지 않습니다. (동시에 여러 세션이
+    서로 다른 키로 클라이언트를 만들어도 간섭하지 않도록)
+    
+    Args:
+        api_key (str, optional): Google API 키. 없으면 load_api_key()로 불러옴
+    
     Returns:
         ChatGoogleGenerativeAI: 초기화된 ChatGoogleGenerativeAI 모델
     """
-    # 환경 변수 초기화 (캐시 문제 해결)
-    if 'GOOGLE_API_KEY' in os.environ:
-        del os.environ['GOOGLE_API_KEY']
-    
-    api_key = load_api_key()
+    api_key = api_key or load_api_key()
     if not api_key:
         raise ValueError("Google API 키를 불러올 수 없습니다.")
     
-    os.environ["GOOGLE_API_KEY"] = api_key
     settings = get_model_settings()
     
     return ChatGoogleGenerativeAI(
@@ -48,7 +74,125 @@ def create_prompt_template(system_message, user_template="{question}"):
         ("user", user_template)
     ])
 
-def generate_game_data(llm, prompt_template, prompt_content):
+@lru_cache(maxsize=None)
+def build_response_schema(expected_turns=SCENARIO_TURNS):
+    """
+    시나리오 모델의 JSON 스키마를 Gemini 구조화 출력용 응답 스키마로 변환합니다.
+    
+    Gemini 응답 스키마는 OpenAPI 스키마의 일부만 지원하므로 `$ref`를 펼치고,
+    int | float 유니언은 NUMBER로 합치며, 생성 결과에 모든 필드가 채워지도록 모든 속성을
+    필수로 지정합니다.
+    
+    Args:
+        expected_turns (int, optional): 생성할 턴 수. 기본값은 7
+        
+    Returns:
+        dict: Gemini 응답 스키마
+    """
+    json_schema = get_turn_json_schema()
+    schema = _to_gemini_schema(json_schema, json_schema.get("$defs", {}))
+    if expected_turns is not None:
+        schema["min_items"] = expected_turns
+        schema["max_items"] = expected_turns
+    return schema
+
+def _to_gemini_schema(node, definitions):
+    """JSON 스키마 노드 하나를 Gemini 응답 스키마 노드로 변환합니다."""
+    if "$ref" in node:
+        return _to_gemini_schema(definitions[node["$ref"].split("/")[-1]], definitions)
+    
+    if "anyOf" in node:
+        types = {option.get("type") for option in node["anyOf"]}
+        if types <= {"integer", "number"}:
+            node = {**node, "type": "number"}
+        else:
+            raise ValueError(f"응답 스키마로 변환할 수 없는 유니언 타입입니다: {types}")
+    
+    schema = {"type": _GEMINI_SCHEMA_TYPES[node["type"]]}
+    if "description" in node:
+        schema["description"] = node["description"]
+    if "enum" in node:
+        schema["format"] = "enum"
+        schema["enum"] = list(node["enum"])
+    if "items" in node:
+        schema["items"] = _to_gemini_schema(node["items"], definitions)
+    if "minItems" in node:
+        schema["min_items"] = node["minItems"]
+    if "properties" in node:
+        schema["properties"] = {
+            name: _to_gemini_schema(child, definitions)
+            for name, child in node["properties"].items()
+        }
+        schema["required"] = list(node["properties"])
+    return schema
+
+def _build_chain(llm, prompt_template, structured, expected_turns=SCENARIO_TURNS, cached_content=None):
+    """
+    생성 체인을 만듭니다.
+    
+    구조화 출력을 지원하는 모델(Gemini)이면 응답 스키마를 지정한 체인을 만들고,
+    백엔드가 스키마 요청을 거부하면 일반 체인으로 대신 요청합니다.
+    cached_content가 있으면 모든 요청이 해당 컨텍스트 캐시를 참조합니다.
+    """
+    if not isinstance(llm, ChatGoogleGenerativeAI):
+        return prompt_template | llm
+    if cached_content:
+        llm = llm.bind(cached_content=cached_content)
+    plain_chain = prompt_template | llm
+    if not structured:
+        return plain_chain
+    
+    structured_llm = llm.bind(generation_config={
+        "response_mime_type": "application/json",
+        "response_schema": build_response_schema(expected_turns),
+    })
+    return (prompt_template | structured_llm).with_fallbacks(
+        [plain_chain],
+        exceptions_to_handle=(ChatGoogleGenerativeAIError, TypeError, ValueError),
+    )
+
+def _build_static_prefix_chain(llm, prompt_template, static_prompt, prompt_content, context_cache,
+                               structured, expected_turns):
+    """
+    정적 접두부가 있는 요청의 체인과 질문을 만듭니다.
+    
+    제공자 컨텍스트 캐시가 있으면 시스템 프롬프트와 정적 접두부를 캐시에 올리고 요청에는 동적 내용만
+    보냅니다. 캐시를 참조한 요청이 실패하면(제공자 쪽 만료 등) 캐시를 무효화하고 전체
+    프롬프트로 다시 요청합니다.
+    
+    Returns:
+        tuple: (체인, 질문 문자열)
+    """
+    full_question = f"{static_prompt}\n\n{prompt_content}" if prompt_content else static_prompt
+    full_chain = _build_chain(llm, prompt_template, structured, expected_turns)
+    
+    cached_content = None
+    if context_cache is not None:
+        cached_content = context_cache.lookup(llm, _get_system_prompt(prompt_template), static_prompt)
+    if not cached_content or not context_cache.provider_cache:
+        # 로컬 대체 구현은 적중만 기록하고, 제공자가 모르는 캐시 이름은 보내지 않음
+        return full_chain, full_question
+    
+    def request_without_cache(_inputs):
+        print("컨텍스트 캐시 요청 실패로 전체 프롬프트로 다시 요청합니다.")
+        context_cache.invalidate(cached_content)
+        return full_chain.invoke({"question": full_question})
+    
+    cached_template = ChatPromptTemplate.from_messages([("user", "{question}")])
+    cached_chain = _build_chain(llm, cached_template, structured, expected_turns, cached_content)
+    return (cached_chain.with_fallbacks([RunnableLambda(request_without_cache)]),
+            prompt_content or CACHED_REQUEST_PROMPT)
+
+def _get_system_prompt(prompt_template):
+    """프롬프트 템플릿의 시스템 메시지 내용을 반환합니다. (없으면 빈 문자열)"""
+    for message in prompt_template.messages:
+        if isinstance(message, SystemMessagePromptTemplate):
+            return message.format().content
+    return ""
+
+def generate_game_data(llm, prompt_template, prompt_content, hedge=False, hedge_delay=None,
+                       structured=None, expected_turns=SCENARIO_TURNS, static_prompt=None,
+                       context_cache=None):
     """
     게임 데이터를 생성합니다.
     
@@ -56,14 +200,124 @@ def generate_game_data(llm, prompt_template, prompt_content):
         llm (ChatGoogleGenerativeAI): 초기화된 LLM 모델
         prompt_template (ChatPromptTemplate): 프롬프트 템플릿
         prompt_content (str): 프롬프트 내용
+        hedge (bool, optional): 헤징 요청 사용 여부. 첫 요청이 지연되면 동일한 요청을
+            하나 더 보내고 먼저 유효한 JSON을 돌려준 응답을 사용합니다. 기본값은 False
+        hedge_delay (float, optional): 두 번째 요청을 보내기까지 기다릴 시간(초).
+            지정하지 않으면 설정값 또는 최근 응답 시간의 p90 값을 사용합니다.
+        structured (bool, optional): 시나리오 스키마 기반 구조화 출력 요청 여부.
+            지정하지 않으면 설정값을 사용합니다.
+        expected_turns (int, optional): 구조화 출력 스키마에 지정할 턴 수. 기본값은 7
+            (턴별 생성에서는 1)
+        static_prompt (str, optional): 모든 요청에서 동일한 프롬프트 접두부 (시나리오 규칙 등).
+            prompt_content 앞에 붙여 보내며, context_cache가 있으면 캐시를 참조합니다.
+        context_cache (ContextCache, optional): 시스템 프롬프트와 static_prompt를 올려 둘 컨텍스트 캐시
         
     Returns:
         str: 생성된 게임 데이터 (JSON 문자열)
     """
     print("게임 시나리오 데이터 생성 중...")
+    if structured is None:
+        structured = get_model_settings()["structured_output"]
+    if static_prompt is not None:
+        chain, prompt_content = _build_static_prefix_chain(
+            llm, prompt_template, static_prompt, prompt_content, context_cache, structured, expected_turns
+        )
+    else:
+        chain = _build_chain(llm, prompt_template, structured, expected_turns)
+    if hedge:
+        return _generate_hedged(chain, prompt_content, hedge_delay, context_cache)
+    return _request_game_data(chain, prompt_content, context_cache)
+
+def get_hedge_delay():
+    """
+    헤징 요청을 보내기 전 대기 시간(초)을 반환합니다.
+    
+    설정에 고정값이 있으면 그 값을, 없으면 최근 응답 시간의 p90 값을 사용합니다.
+    표본이 충분하지 않으면 기본 지연 시간을 사용합니다.
+    
+    Returns:
+        float: 대기 시간(초)
+    """
+    settings = get_model_settings()
+    if settings["hedge_delay"] is not None:
+        return float(settings["hedge_delay"])
+    
+    with _latency_lock:
+        samples = sorted(_latency_samples)
+    if len(samples) < settings["hedge_min_samples"]:
+        return float(settings["hedge_fallback_delay"])
+    
+    index = min(len(samples) - 1, int(len(samples) * 0.9))
+    return samples[index]
+
+def _generate_hedged(chain, prompt_content, hedge_delay=None, context_cache=None):
+    """
+    헤징 요청으로 게임 데이터를 생성합니다.
+    
+    첫 요청이 hedge_delay 안에 유효한 JSON을 돌려주지 않으면 동일한 요청을 하나 더 보내고,
+    먼저 유효한 JSON을 돌려준 응답을 사용합니다. 남은 요청은 취소합니다
+    (이미 실행 중인 요청은 결과를 버립니다).
+    
+    Args:
+        chain: 프롬프트 템플릿과 LLM이 연결된 체인
+        prompt_content (str): 프롬프트 내용
+        hedge_delay (float, optional): 두 번째 요청을 보내기까지 기다릴 시간(초)
+        context_cache (ContextCache, optional): 토큰 사용량을 기록할 컨텍스트 캐시
+        
+    Returns:
+        str: 생성된 게임 데이터 (JSON 문자열)
+    """
+    if hedge_delay is None:
+        hedge_delay = get_hedge_delay()
+    
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-hedge")
     try:
-        chain = prompt_template | llm
+        pending = {executor.submit(_request_game_data, chain, prompt_content, context_cache)}
+        hedged = False
+        
+        while pending:
+            done, pending = wait(pending, timeout=None if hedged else hedge_delay,
+                                 return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"헤징 요청 중 오류 발생: {e}")
+                    result = None
+                if result is not None:
+                    for loser in pending:
+                        loser.cancel()
+                    return result
+            
+            # 시간 초과 또는 첫 요청 실패 시 동일한 요청을 하나 더 보냄
+            if not hedged:
+                hedged = True
+                print(f"응답 지연 또는 실패로 헤징 요청을 보냅니다. (대기 {hedge_delay:.1f}초)")
+                pending.add(executor.submit(_request_game_data, chain, prompt_content, context_cache))
+        
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _request_game_data(chain, prompt_content, context_cache=None):
+    """
+    LLM에 한 번 요청하여 응답에서 JSON 데이터를 추출합니다.
+    
+    Args:
+        chain: 프롬프트 템플릿과 LLM이 연결된 체인
+        prompt_content (str): 프롬프트 내용
+        context_cache (ContextCache, optional): 토큰 사용량을 기록할 컨텍스트 캐시
+        
+    Returns:
+        str: 추출된 게임 데이터 (JSON 문자열), 실패 시 None
+    """
+    try:
+        started_at = time.monotonic()
         response = chain.invoke({"question": prompt_content})
+        _record_latency(time.monotonic() - started_at)
+        if context_cache is not None:
+            context_cache.record_usage(response)
         
         # 응답 내용 확인
         content = response.content
@@ -74,69 +328,44 @@ def generate_game_data(llm, prompt_template, prompt_content):
         # 응답 출력 (디버깅용)
         print("\nLLM 원본 응답:")
         print(content)
+        _save_raw_response(content)
         
-        # 마크다운 코드 블록 처리
-        cleaned_content = content.strip()
-        
-        # JSON, javascript, js 등의 마크다운 코드 블록 제거
-        if cleaned_content.startswith("```"):
-            # 첫 번째 줄과 마지막 줄 제거
-            lines = cleaned_content.split("\n")
-            if len(lines) >= 3:  # 최소한 3줄 이상 (시작 태그, 내용, 종료 태그)
-                if lines[0].startswith("```") and "```" in lines[-1]:
-                    # 첫 줄이 ```json, ```javascript 등으로 시작하면 제거
-                    # 마지막 줄에 ``` 포함되어 있으면 제거
-                    cleaned_content = "\n".join(lines[1:-1])
-                    print("코드 블록 마크다운 제거됨")
-        
-        # 앞뒤 공백 제거
-        cleaned_content = cleaned_content.strip()
-        
-        # JSON 형식 확인 및 추출
-        import json
-        try:
-            # 직접 JSON 파싱 시도
-            json.loads(cleaned_content)
-            print("유효한 JSON 형식 확인됨!")
-            return cleaned_content
-        except json.JSONDecodeError:
-            print("JSON 파싱 실패, JSON 형식 추출 시도...")
-            
-            # JSON 구조 추출 시도
-            import re
-            # 가장 외부 대괄호를 포함한 전체 JSON 배열 찾기
-            json_array_pattern = r'(\[\s*\{.*\}\s*\])'
-            array_match = re.search(json_array_pattern, cleaned_content, re.DOTALL)
-            
-            if array_match:
-                json_content = array_match.group(1)
-                print(f"JSON 배열 구조 추출 성공! (길이: {len(json_content)})")
-                
-                # 추출된 JSON 유효성 확인
-                try:
-                    json.loads(json_content)
-                    print("추출된 JSON 유효성 확인됨!")
-                    return json_content
-                except json.JSONDecodeError as e:
-                    print(f"추출된 JSON 구조 파싱 실패: {e}")
-            
-            # 대안: 개별 JSON 객체들 찾기
-            objects_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-            objects = re.findall(objects_pattern, cleaned_content, re.DOTALL)
-            
-            if objects:
-                try:
-                    # 객체들을 배열로 묶기
-                    json_array = "[" + ",".join(objects) + "]"
-                    json.loads(json_array)  # 유효성 확인
-                    print(f"개별 JSON 객체 {len(objects)}개를 배열로 결합 성공!")
-                    return json_array
-                except json.JSONDecodeError:
-                    print("JSON 객체 결합 실패")
-            
+        # 코드 블록, 앞뒤 설명, trailing comma, 잘린 꼬리 등을 한 번에 처리
+        json_content, repairs = extract_json_array(content)
+        if json_content is None:
             print("응답에서 유효한 JSON 구조를 찾을 수 없습니다.")
             return None
         
+        # 복구를 거친 경우에만 다시 유효성 확인 (복구 없이 추출된 배열은 이미 디코딩으로 검증됨)
+        if repairs:
+            print(f"JSON 복구 적용: {', '.join(repairs)}")
+            try:
+                json.loads(json_content)
+            except json.JSONDecodeError as e:
+                print(f"추출된 JSON 구조 파싱 실패: {e}")
+                return None
+        
+        print(f"유효한 JSON 형식 확인됨! (길이: {len(json_content)})")
+        return json_content
+        
     except Exception as e:
         print(f"LLM 데이터 생성 중 오류 발생: {e}")
         return None
+
+def _record_latency(elapsed):
+    """완료된 생성 요청의 응답 시간을 기록합니다."""
+    with _latency_lock:
+        _latency_samples.append(elapsed)
+
+def _save_raw_response(content):
+    """설정된 경우 LLM 원본 응답을 파일로 기록합니다. (JSON 추출 벤치마크용)"""
+    log_dir = get_model_settings()["response_log_dir"]
+    if not log_dir:
+        return
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        filename = f"response_{time.strftime('%Y%m%d_%H%M%S')}_{time.monotonic_ns()}.txt"
+        with open(os.path.join(log_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(content)
+    except OSError as e:
+        print(f"LLM 응답 기록 실패: {e}")
@@ -0,0 +1,216 @@
+"""
+게임 시나리오 데이터 모델 및 검증 모듈
+
+LLM이 생성했거나 파일에서 읽어온 시나리오는 저장/제공되기 전에 이 모듈에서 한 번만 검증합니다.
+검증을 통과한 시나리오(`Scenario`)는 턴 수, 턴별 상점 구성, 숫자형 가격, 위험도가
+보장되므로 이후 코드에서는 키 존재 여부 등을 다시 확인하지 않아도 됩니다.
+"""
+import json
+import hashlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, field_validator
+
+# 시나리오 규칙 (프롬프트의 생성 가이드라인과 동일)
+SCENARIO_TURNS = 7
+INITIAL_STOCK_VALUE = 100
+RISK_LEVELS = ("저위험", "중위험", "고위험")
+
+
+class ScenarioValidationError(ValueError):
+    """시나리오 검증 실패 예외 - `errors`에 위치별 오류 메시지 목록을 담습니다."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        super().__init__("시나리오 검증 실패:\n" + "\n".join(f"- {error}" for error in self.errors))
+
+
+class StockModel(BaseModel):
+    """턴별 상점(주식) 정보"""
+    model_config = ConfigDict(extra="allow")
+
+    name: str = Field(min_length=1)
+    description: str = ""
+    before_value: Union[int, float] = INITIAL_STOCK_VALUE
+    current_value: Union[int, float] = Field(gt=0)
+    risk_level: str = Field(json_schema_extra={"enum": list(RISK_LEVELS)})
+    expectation: str = ""
+
+    @field_validator("risk_level")
+    @classmethod
+    def _normalize_risk_level(cls, value):
+        """'저위험 (안정적)'처럼 꾸밈말이 붙은 값도 표준 위험도로 정규화합니다."""
+        matches = [level for level in RISK_LEVELS if level in value]
+        if len(matches) != 1:
+            raise ValueError(f"위험도는 {', '.join(RISK_LEVELS)} 중 하나여야 합니다: {value!r}")
+        return matches[0]
+
+
+class TurnModel(BaseModel):
+    """한 턴의 시나리오 정보"""
+    model_config = ConfigDict(extra="allow")
+
+    turn_number: int = Field(ge=1)
+    result: str
+    news: str
+    news_tag: str = ""
+    stocks: List[StockModel] = Field(min_length=1)
+
+
+# 유니언 타입 오류 위치에 붙는 멤버 이름
+_UNION_MEMBER_TAGS = ("int", "float")
+
+# 턴 목록 검증기 (모듈 로드 시 한 번만 컴파일)
+_turns_adapter = TypeAdapter(List[TurnModel])
+
+
+def get_turn_json_schema():
+    """
+    턴 목록(시나리오)의 JSON 스키마를 반환합니다.
+
+    Returns:
+        dict: JSON 스키마
+    """
+    return _turns_adapter.json_schema()
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    검증을 통과한 시나리오
+
+    Attributes:
+        turns (list): 정규화된 턴 데이터 (기존 게임 로직이 사용하는 dict 목록)
+        stock_names (tuple): 상점 이름 (첫 턴 순서)
+        risk_levels (tuple): 상점별 위험도
+        prices (tuple): 턴 × 상점 `current_value` 행렬
+    """
+    turns: list
+    stock_names: Tuple[str, ...]
+    risk_levels: Tuple[str, ...]
+    prices: Tuple[Tuple[float, ...], ...]
+
+    def __len__(self):
+        return len(self.turns)
+
+    @cached_property
+    def content_hash(self):
+        """시나리오 내용의 SHA-256 해시 (캐시 키 등에 사용)"""
+        canonical = json.dumps(self.turns, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def validate_scenario(game_data, expected_turns=SCENARIO_TURNS):
+    """
+    시나리오 데이터를 검증하고 `Scenario` 객체로 변환합니다.
+
+    검증 항목:
+        - 턴 목록 구조와 필드 타입 (숫자형 `current_value`, 표준 위험도 등)
+        - 턴 수 (`expected_turns`가 None이면 확인하지 않음)
+        - `turn_number`가 1부터 순서대로 증가하는지
+        - 모든 턴의 상점 구성과 위험도가 첫 턴과 같은지
+        - 첫 턴의 모든 상점 가격이 100으로 시작하는지
+
+    Args:
+        game_data (list): 검증할 시나리오 데이터
+        expected_turns (int, optional): 기대하는 턴 수. 기본값은 7
+
+    Returns:
+        Scenario: 검증된 시나리오
+
+    Raises:
+        ScenarioValidationError: 검증에 실패한 경우 (모든 오류 위치 포함)
+    """
+    if isinstance(game_data, Scenario):
+        return game_data
+
+    try:
+        turns = _turns_adapter.validate_python(game_data)
+    except ValidationError as e:
+        raise ScenarioValidationError(_format_pydantic_errors(e)) from None
+
+    errors = []
+    if not turns:
+        raise ScenarioValidationError(["시나리오에 턴이 없습니다."])
+    if expected_turns is not None and len(turns) != expected_turns:
+        errors.append(f"턴 수가 {expected_turns}개가 아닙니다: {len(turns)}개")
+
+    first_stocks = turns[0].stocks
+    stock_names = tuple(stock.name for stock in first_stocks)
+    risk_levels = tuple(stock.risk_level for stock in first_stocks)
+    if len(set(stock_names)) != len(stock_names):
+        errors.append(f"턴 1: 상점 이름이 중복되었습니다: {list(stock_names)}")
+
+    for stock in first_stocks:
+        if stock.current_value != INITIAL_STOCK_VALUE or stock.before_value != INITIAL_STOCK_VALUE:
+            errors.append(f"턴 1 > {stock.name}: 첫 턴 가격은 {INITIAL_STOCK_VALUE}이어야 합니다 "
+                          f"(before_value={stock.before_value}, current_value={stock.current_value})")
+
+    prices = []
+    for index, turn in enumerate(turns):
+        label = f"턴 {index + 1}"
+        if turn.turn_number != index + 1:
+            errors.append(f"{label}: turn_number가 {index + 1}이어야 합니다: {turn.turn_number}")
+
+        by_name = {stock.name: stock for stock in turn.stocks}
+        if set(by_name) != set(stock_names) or len(turn.stocks) != len(stock_names):
+            errors.append(f"{label}: 상점 구성이 첫 턴과 다릅니다: {[stock.name for stock in turn.stocks]}")
+            continue
+        for name, risk_level in zip(stock_names, risk_levels):
+            if by_name[name].risk_level != risk_level:
+                errors.append(f"{label} > {name}: 위험도가 첫 턴과 다릅니다: {by_name[name].risk_level}")
+        prices.append(tuple(float(by_name[name].current_value) for name in stock_names))
+
+    if errors:
+        raise ScenarioValidationError(errors)
+
+    return Scenario(
+        turns=[turn.model_dump() for turn in turns],
+        stock_names=stock_names,
+        risk_levels=risk_levels,
+        prices=tuple(prices),
+    )
+
+
+def _format_pydantic_errors(error):
+    """pydantic 검증 오류를 '턴 N > stocks[i] > 필드: 메시지' 형태로 변환합니다."""
+    messages = []
+    seen_locations = set()
+    for detail in error.errors():
+        # 숫자 필드(int | float)는 유니언 멤버마다 오류가 나오므로 위치별로 하나만 보고
+        location = [item for item in detail["loc"] if item not in _UNION_MEMBER_TAGS]
+        if tuple(location) in seen_locations:
+            continue
+        seen_locations.add(tuple(location))
+        parts = []
+        if location and isinstance(location[0], int):
+            parts.append(f"턴 {location.pop(0) + 1}")
+        for item in location:
+            if isinstance(item, int) and parts:
+                parts[-1] = f"{parts[-1]}[{item}]"
+            else:
+                parts.append(str(item))
+        prefix = " > ".join(parts) if parts else "시나리오"
+        messages.append(f"{prefix}: {detail['msg']} (입력값: {detail.get('input')!r})")
+    return messages
+
+
+def validate_scenario_safely(game_data, expected_turns=SCENARIO_TURNS):
+    """
+    시나리오를 검증하고 실패 시 오류를 출력한 뒤 None을 반환합니다.
+
+    Args:
+        game_data (list): 검증할 시나리오 데이터
+        expected_turns (int, optional): 기대하는 턴 수. 기본값은 7
+
+    Returns:
+        Scenario: 검증된 시나리오, 실패 시 None
+    """
+    try:
+        return validate_scenario(game_data, expected_turns)
+    except ScenarioValidationError as e:
+        print(e)
+        return None
+
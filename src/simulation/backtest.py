@@ -0,0 +1,100 @@
+"""
+대규모 전략 백테스트 모듈
+
+가격 아카이브(mmap)의 가격 배열을 청크 단위로 그대로 읽어, `run_automated_simulation`과
+같은 규칙의 자동 투자 전략을 시나리오 여러 개에 한꺼번에(벡터 연산으로) 적용합니다.
+시나리오 수와 관계없이 메모리 사용량은 청크 크기에만 비례합니다.
+"""
+import numpy as np
+
+from src.data.price_archive import PriceArchive
+
+STRATEGIES = ("random", "conservative", "aggressive", "trend")
+INITIAL_CAPITAL = 1000
+
+# 전략별 위험도(저/중/고위험) 선택 가중치 - run_automated_simulation과 동일
+_RISK_WEIGHTS = {
+    "conservative": np.array([0.5, 0.3, 0.1]),
+    "aggressive": np.array([0.1, 0.2, 0.6]),
+}
+_PASS_WEIGHT = 0.1
+
+
+def _choice_weights(strategy, prices, risk_codes, turn_index):
+    """턴별 선택 가중치 [시나리오 수, 상점 수 + 1(패스)]"""
+    count, _, stocks = prices.shape
+    if strategy in _RISK_WEIGHTS:
+        stock_weights = _RISK_WEIGHTS[strategy][risk_codes]
+    elif strategy == "trend" and turn_index > 0:
+        growth = prices[:, turn_index] / prices[:, turn_index - 1] - 1
+        stock_weights = np.select([growth > 0.1, growth > 0, growth > -0.1], [0.7, 0.5, 0.2], 0.05)
+    else:
+        # random 전략, trend 전략의 첫 턴, 알 수 없는 전략은 패스를 포함해 균등 선택
+        return np.ones((count, stocks + 1))
+    return np.concatenate([stock_weights, np.full((count, 1), _PASS_WEIGHT)], axis=1)
+
+
+def simulate_price_paths(prices, risk_codes, strategy, rng=None, initial_capital=INITIAL_CAPITAL):
+    """
+    여러 시나리오에 자동 투자 전략을 한꺼번에 적용합니다.
+
+    매 턴 전략의 가중치로 상점 하나(또는 패스)를 골라 다음 턴 가격 변동만큼 자본금이 변하며,
+    마지막 턴은 ±10% 무작위 변동을 적용합니다. (run_automated_simulation과 같은 규칙)
+
+    Args:
+        prices (numpy.ndarray): [시나리오 수, 턴 수, 상점 수] 가격 배열
+        risk_codes (numpy.ndarray): [시나리오 수, 상점 수] 위험도 코드 (RISK_LEVELS 인덱스)
+        strategy (str): 투자 전략 ("random", "conservative", "aggressive", "trend")
+        rng (numpy.random.Generator, optional): 난수 생성기
+        initial_capital (float, optional): 초기 자본금. 기본값은 1000
+
+    Returns:
+        numpy.ndarray: 시나리오별 수익률(%)
+    """
+    rng = rng or np.random.default_rng()
+    prices = np.asarray(prices, dtype=np.float64)
+    count, turns, stocks = prices.shape
+    rows = np.arange(count)
+    capital = np.full(count, float(initial_capital))
+
+    for turn_index in range(turns):
+        weights = _choice_weights(strategy, prices, risk_codes, turn_index)
+        cumulative = np.cumsum(weights, axis=1)
+        draws = rng.random(count) * cumulative[:, -1]
+        choices = (cumulative <= draws[:, None]).sum(axis=1)
+        invested = choices < stocks
+        picked = np.minimum(choices, stocks - 1)
+
+        current = prices[rows, turn_index, picked]
+        if turn_index < turns - 1:
+            rate = prices[rows, turn_index + 1, picked] / current - 1
+        else:
+            rate = rng.uniform(-0.1, 0.1, count)
+        capital *= 1 + np.where(invested & (current > 0), rate, 0.0)
+
+    return (capital - initial_capital) / initial_capital * 100
+
+
+def backtest_archive(path, strategies=STRATEGIES, chunk_size=4096, seed=None):
+    """
+    가격 아카이브 전체에 전략별 백테스트를 실행합니다.
+
+    Args:
+        path (str): 가격 아카이브 파일 경로
+        strategies (tuple, optional): 실행할 전략 목록
+        chunk_size (int, optional): 한 번에 처리할 시나리오 수. 기본값은 4096
+        seed (int, optional): 난수 시드 (재현용)
+
+    Returns:
+        dict: 전략 → 시나리오별 수익률(%) 배열 (아카이브 순서)
+    """
+    rng = np.random.default_rng(seed)
+    with PriceArchive(path) as archive:
+        results = {strategy: np.empty(len(archive)) for strategy in strategies}
+        prices = risk_codes = None
+        for start, prices, risk_codes in archive.chunks(chunk_size):
+            for strategy in strategies:
+                results[strategy][start:start + len(prices)] = simulate_price_paths(prices, risk_codes, strategy, rng)
+        # 청크 뷰를 놓아야 아카이브의 mmap을 닫을 수 있음
+        prices = risk_codes = None
+    return results
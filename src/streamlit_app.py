@@ -11,6 +11,7 @@ st.set_page_config(
 import os
 import sys
 import json
+import uuid
 from datetime import datetime
 
 # 현재 디렉토리를 패스에 추가
@@ -19,15 +20,18 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 from src.utils.config import load_api_key
-from src.utils.file_manager import SCENARIO_TYPES, get_available_scenarios, load_scenario_from_file, DATA_DIR
-from src.game.game_logic import generate_game_scenario_data_llm, initialize_new_game, reset_game_state, calculate_total_assets, process_investment
-from src.game.session_manager import get_current_turn_data, advance_turn
+from src.utils.file_manager import SCENARIO_TYPES
+from src.game.resources import list_scenarios, load_scenario
+from src.data.session_store import get_saved_game_store
+from src.game.game_logic import generate_game_scenario_data_llm, start_turn_by_turn_game_llm, initialize_new_game, reset_game_state, calculate_total_assets, process_investment, get_event_log, export_game_state, load_saved_game, get_player_id
+from src.game.session_manager import get_current_turn_data, get_total_turns, wait_for_current_turn, advance_turn
 from src.ui.components import create_metric_card, create_news_card, create_stock_card, create_investment_history_chart
 import plotly.graph_objects as go
 
 
+@st.cache_resource
 def get_custom_css():
-    """CSS 스타일 반환"""
+    """CSS 스타일 반환 (프로세스에서 한 번만 만들어 모든 세션이 공유)"""
     return """
     <style>
         .main > div { padding-top: 2rem; padding-bottom: 2rem; }
@@ -57,7 +61,8 @@ def initialize_session_state():
         'investment_history': [], 
         'game_log': [],
         'game_started': False, 
-        'current_step': 'welcome'
+        'current_step': 'welcome',
+        'scenario_generator': None
     }
     
     for key, default_value in defaults.items():
@@ -83,9 +88,17 @@ def show_setup_screen():
         st.markdown("### 🎲 게임 모드")
         game_mode = st.radio(
             "게임 모드를 선택하세요",
-            options=["새 게임 시작", "저장된 게임 불러오기"]
+            options=["새 게임 시작", "저장된 게임 불러오기", "저장한 게임 이어하기"]
         )
         
+        fast_start = False
+        if game_mode == "새 게임 시작":
+            fast_start = st.checkbox(
+                "⚡ 빠른 시작",
+                value=True,
+                help="첫째 날 이야기가 준비되면 바로 시작하고, 나머지 날은 플레이하는 동안 만들어요."
+            )
+        
         # API 키 확인 및 처리
         current_api_key = st.session_state.get('google_api_key') or load_api_key()
         
@@ -125,11 +138,19 @@ def show_setup_screen():
         # 저장된 게임 불러오기 옵션
         selected_file = None
         if game_mode == "저장된 게임 불러오기":
-            available_files = get_available_scenarios()
+            available_files = list_scenarios()
             if available_files:
                 selected_file = st.selectbox("불러올 게임을 선택하세요:", available_files)
             else:
                 st.warning("저장된 게임이 없어요. 새 게임을 시작해주세요.")
+        elif game_mode == "저장한 게임 이어하기":
+            saved_games = get_saved_game_store().list_sessions(player_id=get_player_id())
+            if saved_games:
+                labels = {entry['session_id']: f"{entry['session_id']} ({entry['scenario_id'] or '저장되지 않은 시나리오'})"
+                          for entry in saved_games}
+                selected_file = st.selectbox("이어서 할 게임을 선택하세요:", list(labels), format_func=labels.get)
+            else:
+                st.warning("저장한 게임이 없어요. 새 게임을 시작해주세요.")
         
         if st.button("다음 단계", use_container_width=True):
             # API 키 재확인
@@ -138,7 +159,7 @@ def show_setup_screen():
                 st.error("API 키를 먼저 설정해주세요.")
             else:
                 st.session_state.google_api_key = final_api_key
-                handle_setup_button(game_mode, selected_theme, selected_file)
+                handle_setup_button(game_mode, selected_theme, selected_file, fast_start)
 
 
 
@@ -185,9 +206,23 @@ def show_welcome_screen():
             st.rerun()
 
 
-def handle_setup_button(game_mode, selected_theme, selected_file):
+def handle_setup_button(game_mode, selected_theme, selected_file, fast_start=False):
     """설정 화면 버튼 처리"""
-    if game_mode == "새 게임 시작":
+    if game_mode == "새 게임 시작" and fast_start:
+        if st.session_state.google_api_key:
+            with st.spinner("🎮 첫째 날 이야기를 만들고 있어요..."):
+                scenario_type = SCENARIO_TYPES[selected_theme]
+                generator = start_turn_by_turn_game_llm(scenario_type, st.session_state.google_api_key)
+                
+                if generator:
+                    initialize_new_game(None, scenario_type, generator=generator)
+                    st.success("게임을 시작해요! 🎉")
+                    st.rerun()
+                else:
+                    st.error("게임 생성에 실패했어요.")
+        else:
+            st.error("API 키를 먼저 설정해주세요.")
+    elif game_mode == "새 게임 시작":
         if st.session_state.google_api_key:
             with st.spinner("🎮 게임 세상을 만들고 있어요..."):
                 scenario_type = SCENARIO_TYPES[selected_theme]
@@ -201,11 +236,20 @@ def handle_setup_button(game_mode, selected_theme, selected_file):
                     st.error("게임 생성에 실패했어요.")
         else:
             st.error("API 키를 먼저 설정해주세요.")
+    elif game_mode == "저장한 게임 이어하기":
+        if selected_file:
+            if load_saved_game(selected_file):
+                st.success("저장한 게임을 이어서 해요! 🎉")
+                st.rerun()
+            else:
+                st.error("저장한 게임을 불러올 수 없어요.")
     else:
         if selected_file:
-            game_data = load_scenario_from_file(os.path.join(DATA_DIR, selected_file))
+            # 프로세스 공유 캐시 - 같은 파일은 다시 읽고 검증하지 않음
+            scenario = load_scenario(selected_file)
+            game_data = scenario.turns if scenario else None
             if game_data:
-                initialize_new_game(game_data, "loaded")
+                initialize_new_game(game_data, "loaded", scenario_file=selected_file)
                 st.success("게임을 불러왔어요! 🎉")
                 st.rerun()
             else:
@@ -218,21 +262,21 @@ def show_game_screen():
         st.error("게임 데이터가 없습니다.")
         return
     
+    # 턴별 생성 모드에서 아직 만들어지지 않은 턴이면 생성될 때까지 대기
+    if not wait_for_current_turn():
+        st.error("다음 날 이야기를 만들지 못했어요. 새 게임을 시작해주세요.")
+        return
+    
     current_turn_data = get_current_turn_data()
     if not current_turn_data:
         st.session_state.current_step = 'result'
         st.rerun()
         return
     
-    # 턴 데이터 유효성 검사
-    if 'stocks' not in current_turn_data or not current_turn_data['stocks']:
-        st.error("게임 데이터에 문제가 있습니다. 새 게임을 시작해주세요.")
-        return
-    
     turn_number = current_turn_data.get('turn', st.session_state.current_turn_index + 1)
     
     # 상단 정보 표시
-    display_game_status(turn_number, len(st.session_state.game_data), current_turn_data)
+    display_game_status(turn_number, get_total_turns(), current_turn_data)
     
     # 뉴스 카드
     st.markdown(create_news_card(current_turn_data), unsafe_allow_html=True)
@@ -403,24 +447,27 @@ def display_educational_feedback():
 
 def analyze_investment_patterns():
     """투자 패턴 분석"""
-    investment_history = st.session_state.investment_history
+    # 턴별 보유 수량은 이벤트 기록에서 복원
+    game_events = get_event_log()
+    game_data = st.session_state.game_data or []
     
     # 각 종목별 투자 금액 및 수익률 계산
     stock_investments = {}
     stock_performance = {}
     
-    for record in investment_history:
-        for stock_name, shares in record.get('investments', {}).items():
+    for turn_index in range(min(game_events.turns_completed, len(game_data))):
+        stocks = game_data[turn_index]['stocks']
+        for stock_name, shares in game_events.state_at(turn_index + 1).holdings.items():
             if stock_name not in stock_investments:
                 stock_investments[stock_name] = 0
                 stock_performance[stock_name] = []
             
             # 투자 금액 누적
-            stock_value = next((s['current_value'] for s in record.get('stocks', []) if s['name'] == stock_name), 0)
+            stock_value = next((s['current_value'] for s in stocks if s['name'] == stock_name), 0)
             stock_investments[stock_name] += shares * stock_value
             
             # 수익률 기록
-            initial_value = next((s['initial_value'] for s in record.get('stocks', []) if s['name'] == stock_name), 100)
+            initial_value = next((s.get('initial_value', 100) for s in stocks if s['name'] == stock_name), 100)
             if initial_value > 0:
                 return_rate = (stock_value - initial_value) / initial_value * 100
                 stock_performance[stock_name].append(return_rate)
@@ -485,7 +532,9 @@ def display_investment_chart(investment_history):
     """투자 히스토리 차트 표시"""
     if len(investment_history) > 1:
         st.markdown("### 📊 내 투자 여정")
-        fig = create_investment_history_chart(investment_history)
+        # 세션마다 그림을 보관해 두고 새 턴만 이어 붙임
+        fig = create_investment_history_chart(investment_history,
+                                              cache=st.session_state.setdefault('history_chart_cache', {}))
         if fig:
             st.plotly_chart(fig, use_container_width=True)
 
@@ -557,32 +606,25 @@ def save_current_game():
         return
     
     try:
-        from datetime import datetime
-        import json
-        import os
+        # 마지막 저장 이후 새 이벤트가 없으면 다시 쓰지 않음
+        event_count = len(get_event_log())
+        saved = st.session_state.get('saved_game')
+        if saved and saved['events'] == event_count and saved['turn'] == st.session_state.current_turn_index:
+            st.info(f"이미 저장된 게임입니다: {saved['id']}")
+            return
         
-        # 저장할 데이터 구성
-        save_data = {
-            'game_data': st.session_state.game_data,
-            'current_turn_index': st.session_state.current_turn_index,
-            'player_investments': st.session_state.player_investments,
-            'player_balance': st.session_state.player_balance,
-            'investment_history': st.session_state.investment_history,
-            'game_log': st.session_state.game_log,
-            'saved_at': datetime.now().isoformat()
-        }
+        # 저장할 데이터 구성 (턴별 보유 수량 사본 없이 이벤트 기록만 저장)
+        save_data = export_game_state()
+        save_data['saved_at'] = datetime.now().isoformat()
         
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"saved_game_{timestamp}.json"
-        filepath = os.path.join("data", filename)
+        # 같은 게임은 처음 저장할 때 만든 항목을 계속 갱신 (저장소를 여러 플레이어가 함께 쓰므로 ID가 겹치지 않게)
+        game_id = saved['id'] if saved else f"saved_game_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        get_saved_game_store().put(game_id, save_data, player_id=get_player_id(),
+                                   scenario_id=save_data['scenario_file'])
+        st.session_state.saved_game = {'id': game_id, 'events': event_count,
+                                       'turn': st.session_state.current_turn_index}
         
-        # 파일 저장
-        os.makedirs("data", exist_ok=True)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
-        
-        st.success(f"게임이 저장되었습니다: {filename}")
+        st.success(f"게임이 저장되었습니다: {game_id}")
         
     except Exception as e:
         st.error(f"저장 중 오류가 발생했습니다: {str(e)}")
@@ -608,7 +650,20 @@ def show_data_cleanup_options():
                 st.warning("한 번 더 클릭하면 게임이 초기화됩니다.")
     
     with col2:
-        st.info("저장된 게임 파일을 정리하려면 data/ 폴더를 직접 확인하세요.")
+        # 공유 저장소이므로 이 플레이어의 저장 게임만 세고 지움
+        store = get_saved_game_store()
+        player_id = get_player_id()
+        st.write(f"저장된 게임: {len(store.list_sessions(player_id=player_id, limit=1000))}개")
+        if st.button("오래된 저장 게임 정리", use_container_width=True):
+            st.success(f"만료된 저장 게임 {store.evict_expired()}개를 정리했습니다.")
+        if st.button("저장 게임 모두 삭제", use_container_width=True):
+            if st.session_state.get('confirm_cleanup'):
+                st.success(f"저장 게임 {store.cleanup(player_id=player_id)}개를 삭제했습니다.")
+                st.session_state.pop('saved_game', None)
+                st.session_state.confirm_cleanup = False
+            else:
+                st.session_state.confirm_cleanup = True
+                st.warning("한 번 더 클릭하면 저장된 게임이 모두 삭제됩니다.")
 
 
 if __name__ == "__main__":
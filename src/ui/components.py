@@ -1,14 +1,65 @@
 
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
 import streamlit as st
 import plotly.graph_objects as go
-import pandas as pd
+
+from src.models.scenario import Scenario
+
+
+# Streamlit은 위젯을 조작할 때마다 스크립트 전체를 다시 실행하므로, 같은 시나리오의 주식 차트는
+# 한 번만 만들고 모든 세션이 같은 그림 객체를 재사용합니다. (반환된 그림은 수정하지 말 것)
+_STOCK_PLOT_CACHE_SIZE = 128
+_stock_plot_cache = OrderedDict()
+_stock_plot_lock = threading.Lock()
 
 
-def create_simple_stock_plot(game_data, title="🎯 우리의 투자 모험"):
-    """간단하고 깔끔한 주식 차트 생성 (아동 친화적 버전)"""
+def _scenario_key(game_data):
+    """시나리오 내용 해시 (Scenario면 미리 계산된 해시 사용)"""
+    if isinstance(game_data, Scenario):
+        return game_data.content_hash
+    canonical = json.dumps(game_data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def create_simple_stock_plot(game_data, title="🎯 우리의 투자 모험", current_turn=None):
+    """
+    간단하고 깔끔한 주식 차트 생성 (아동 친화적 버전)
+    
+    (시나리오 내용 해시, 표시할 턴 수, 제목)이 같으면 이전에 만든 그림을 그대로 반환합니다.
+    
+    Args:
+        game_data (list | Scenario): 게임 데이터
+        title (str, optional): 차트 제목
+        current_turn (int, optional): 이 턴 수까지만 표시. 없으면 전체
+    """
     if not game_data:
         return None
     
+    key = (_scenario_key(game_data), current_turn, title)
+    with _stock_plot_lock:
+        fig = _stock_plot_cache.get(key)
+        if fig is not None:
+            _stock_plot_cache.move_to_end(key)
+            return fig
+    
+    turns_data = game_data.turns if isinstance(game_data, Scenario) else game_data
+    if current_turn is not None:
+        turns_data = turns_data[:current_turn]
+    fig = _build_stock_plot(turns_data, title)
+    
+    with _stock_plot_lock:
+        _stock_plot_cache[key] = fig
+        while len(_stock_plot_cache) > _STOCK_PLOT_CACHE_SIZE:
+            _stock_plot_cache.popitem(last=False)
+    return fig
+
+
+def _build_stock_plot(game_data, title):
+    """주식 차트 그림을 새로 만듭니다."""
     turns = []
     stock_data = {}
     
@@ -195,22 +246,54 @@ def create_stock_card(stock):
 </div>"""
 
 
-def create_investment_history_chart(investment_history):
-    """투자 히스토리 차트 생성 (아동 친화적 버전)"""
+def create_investment_history_chart(investment_history, cache=None):
+    """
+    투자 히스토리 차트 생성 (아동 친화적 버전)
+    
+    Args:
+        investment_history (list): 턴별 투자 기록
+        cache (dict, optional): 세션별 그림 보관용 dict (예: 세션 상태의 항목).
+            주어지면 기록이 그대로일 때는 같은 그림을 반환하고, 턴이 추가되었으면 새 턴만 기존 그림에 이어 붙임
+    """
     if len(investment_history) <= 1:
         return None
-        
-    history_df = pd.DataFrame([
-        {'턴': h['turn'], '총자산': h['total_asset_value'], '현금': h['balance']} 
-        for h in investment_history
-    ])
+    
+    points = [(h['turn'], h['total_asset_value'], h['balance']) for h in investment_history]
+    if cache is not None and cache.get('figure') is not None:
+        previous = cache.get('points', [])
+        if previous == points:
+            return cache['figure']
+        if previous and points[:len(previous)] == previous:
+            _extend_investment_history_chart(cache['figure'], points[len(previous):])
+            cache['points'] = points
+            return cache['figure']
+    
+    fig = _build_investment_history_chart(points)
+    if cache is not None:
+        cache['figure'] = fig
+        cache['points'] = points
+    return fig
+
+
+def _extend_investment_history_chart(fig, new_points):
+    """히스토리 차트의 총 자산/현금 선에 새 턴의 점을 이어 붙입니다."""
+    turns = tuple(point[0] for point in new_points)
+    with fig.batch_update():
+        for trace, column in zip(fig.data[:2], (1, 2)):
+            trace.x = tuple(trace.x) + turns
+            trace.y = tuple(trace.y) + tuple(point[column] for point in new_points)
+
+
+def _build_investment_history_chart(points):
+    """히스토리 차트 그림을 새로 만듭니다. (points: (턴, 총자산, 현금) 목록)"""
+    turns = [point[0] for point in points]
     
     fig = go.Figure()
     
     # 더 밝고 친근한 색상
     fig.add_trace(go.Scatter(
-        x=history_df['턴'], 
-        y=history_df['총자산'],
+        x=turns, 
+        y=[point[1] for point in points],
         mode='lines+markers',
         name='💰 총 자산 (모든 돈)',
         line=dict(color='#4CAF50', width=4),  # 밝은 녹색
@@ -219,8 +302,8 @@ def create_investment_history_chart(investment_history):
     ))
     
     fig.add_trace(go.Scatter(
-        x=history_df['턴'], 
-        y=history_df['현금'],
+        x=turns, 
+        y=[point[2] for point in points],
         mode='lines+markers',
         name='💵 현금 (바로 쓸 수 있는 돈)',
         line=dict(color='#FF9800', width=4),  # 밝은 주황색
@@ -1,6 +1,5 @@
 
 import streamlit as st
-import os
 from src.ui.components import (
     create_metric_card, create_news_card, create_stock_card, 
     display_api_key_warning, display_game_intro, create_investment_history_chart
@@ -10,11 +9,11 @@ from src.game.game_logic import (
     initialize_new_game, reset_game_state, calculate_total_assets
 )
 from src.game.session_manager import (
-    get_session_value, set_session_value, get_current_turn_data, advance_turn
-)
-from src.utils.file_manager import (
-    SCENARIO_TYPES, get_available_scenarios, load_scenario_from_file, DATA_DIR
+    get_session_value, set_session_value, get_current_turn_data, get_total_turns,
+    wait_for_current_turn, advance_turn
 )
+from src.utils.file_manager import SCENARIO_TYPES
+from src.game.resources import list_scenarios, load_scenario
 
 
 def show_welcome_screen():
@@ -62,7 +61,7 @@ def show_setup_screen():
         # 저장된 게임 불러오기 옵션
         selected_file = None
         if game_mode == "저장된 게임 불러오기":
-            available_files = get_available_scenarios()
+            available_files = list_scenarios()
             if available_files:
                 selected_file = st.selectbox("불러올 게임을 선택하세요:", available_files)
             else:
@@ -95,9 +94,11 @@ def _handle_setup_button_click(game_mode, selected_theme, selected_file):
     else:
         # 저장된 게임 불러오기
         if selected_file:
-            game_data = load_scenario_from_file(os.path.join(DATA_DIR, selected_file))
+            # 프로세스 공유 캐시 - 같은 파일은 다시 읽고 검증하지 않음
+            scenario = load_scenario(selected_file)
+            game_data = scenario.turns if scenario else None
             if game_data:
-                initialize_new_game(game_data, "loaded")
+                initialize_new_game(game_data, "loaded", scenario_file=selected_file)
                 st.success("게임을 불러왔어요! 🎉")
                 st.rerun()
             else:
@@ -113,21 +114,21 @@ def show_game_screen():
         st.error("게임 데이터가 없습니다.")
         return
     
+    # 턴별 생성 모드에서 아직 만들어지지 않은 턴이면 생성될 때까지 대기
+    if not wait_for_current_turn():
+        st.error("다음 날 이야기를 만들지 못했어요. 새 게임을 시작해주세요.")
+        return
+    
     current_turn_data = get_current_turn_data()
     if not current_turn_data:
         set_session_value('current_step', 'result')
         st.rerun()
         return
     
-    # 턴 데이터 유효성 검사
-    if 'stocks' not in current_turn_data or not current_turn_data['stocks']:
-        st.error("게임 데이터에 문제가 있습니다. 새 게임을 시작해주세요.")
-        return
-    
     turn_number = current_turn_data.get('turn', get_session_value('current_turn_index', 0) + 1)
     
     # 상단 정보 표시
-    _display_game_status(turn_number, len(game_data), current_turn_data)
+    _display_game_status(turn_number, get_total_turns(), current_turn_data)
     
     # 뉴스 카드
     st.markdown(create_news_card(current_turn_data), unsafe_allow_html=True)
@@ -267,7 +268,12 @@ def _display_investment_chart(investment_history):
     """투자 히스토리 차트 표시"""
     if len(investment_history) > 1:
         st.markdown("### 📊 내 투자 여정")
-        fig = create_investment_history_chart(investment_history)
+        # 세션마다 그림을 보관해 두고 새 턴만 이어 붙임
+        chart_cache = get_session_value('history_chart_cache')
+        if chart_cache is None:
+            chart_cache = {}
+            set_session_value('history_chart_cache', chart_cache)
+        fig = create_investment_history_chart(investment_history, cache=chart_cache)
         if fig:
             st.plotly_chart(fig, use_container_width=True)
 
@@ -3,7 +3,6 @@
 """
 import os
 from dotenv import load_dotenv
-import streamlit as st
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리 찾기
@@ -19,6 +18,9 @@ def load_api_key():
     # 매번 .env 파일을 다시 로드하여 확실히 환경변수를 설정
     load_dotenv(env_file, override=True)
     
+    # streamlit(과 pandas 등 의존성)은 무거우므로 CLI/API 시작 시 불러오지 않도록 필요할 때 가져옴
+    import streamlit as st
+    
     # 1. Streamlit secrets에서 먼저 시도
     try:
         if hasattr(st, 'secrets') and 'GOOGLE_API_KEY' in st.secrets:
@@ -49,5 +51,62 @@ def get_model_settings():
     return {
         "model_name": "gemini-2.5-flash-preview-05-20",
         "temperature": 1.0,  # Gemini의 권장 온도 설정
-        "max_tokens": 65536
+        "max_tokens": 65536,
+        # 시나리오 스키마 기반 구조화 출력(JSON 모드) 사용 여부
+        "structured_output": True,
+        # 최소화 프롬프트(참고용 섹션·들여쓰기·강조 표시 제거) 사용 여부
+        "minimized_prompts": False,
+        # 컨텍스트 캐시: "gemini"(명시적 컨텍스트 캐시), "local"(로컬 시뮬레이션) 또는 None(사용 안 함)
+        "context_cache": os.getenv("LLM_CONTEXT_CACHE") or None,
+        "context_cache_ttl": 3600,
+        # 헤징(hedging) 요청 설정: 첫 요청이 이 시간(초) 안에 끝나지 않으면 동일한 요청을 하나 더 보냅니다.
+        # None이면 최근 응답 시간의 p90 값을 사용합니다.
+        "hedge_delay": None,
+        "hedge_fallback_delay": 45.0,
+        "hedge_min_samples": 10,
+        # LLM 원본 응답을 기록할 디렉토리 (JSON 추출 벤치마크용, 비어 있으면 기록하지 않음)
+        "response_log_dir": os.getenv("LLM_RESPONSE_LOG_DIR")
+    }
+
+def get_storage_settings():
+    """
+    시나리오 저장 설정값을 반환합니다.
+    
+    Returns:
+        dict: 저장 설정값
+    """
+    return {
+        # 시나리오 저장 형식: "json"(체크섬 포함 JSON, .json) 또는 "compact"(상점 정보 중복 제거 + 압축, .scn)
+        "scenario_codec": os.getenv("SCENARIO_CODEC", "json"),
+        # JSON 직렬화기: "orjson", "msgspec", "json" 또는 None(설치된 것 중 가장 빠른 것)
+        "serializer": os.getenv("JSON_SERIALIZER") or None,
+        # 렌더링된 차트 캐시 디렉토리(None이면 visualization_results/cache)와 크기 한도(MB)
+        "chart_cache_dir": os.getenv("CHART_CACHE_DIR") or None,
+        "chart_cache_max_mb": int(os.getenv("CHART_CACHE_MAX_MB", "256")),
+        # 게임 세션/저장 게임 SQLite 파일 (None이면 data/.sessions.db)
+        "session_db_path": os.getenv("SESSION_DB_PATH") or None,
+        # 저장 게임 저장소: "sqlite" 또는 "memory"(서버를 다시 시작하면 사라짐)
+        "saved_game_store": os.getenv("SAVED_GAME_STORE", "sqlite"),
+        # 마지막 저장 후 저장 게임을 유지할 기간(일), 0이면 만료되지 않음
+        "saved_game_ttl_days": int(os.getenv("SAVED_GAME_TTL_DAYS", "30")),
+    }
+
+def get_api_settings():
+    """
+    API 서버 설정값을 반환합니다.
+    
+    Returns:
+        dict: API 서버 설정값
+    """
+    return {
+        # 시작할 때 미리 읽어 둘 시나리오 수 (조회 횟수가 많은 순, 기록이 없으면 최근 파일 순)
+        "warmup_scenarios": int(os.getenv("API_WARMUP_SCENARIOS", "32")),
+        # 메모리에 유지할 최대 시나리오 수
+        "scenario_cache_size": int(os.getenv("API_SCENARIO_CACHE_SIZE", "256")),
+        # 게임 세션 저장소: "memory" 또는 "sqlite"(서버를 다시 시작해도 유지, SESSION_DB_PATH 파일 사용)
+        "game_session_store": os.getenv("API_GAME_SESSION_STORE", "memory"),
+        # 마지막 주문 후 게임 세션을 유지할 시간(초)
+        "game_session_ttl": int(os.getenv("API_GAME_SESSION_TTL", "3600")),
+        # 메모리 저장소에 유지할 최대 게임 세션 수
+        "max_game_sessions": int(os.getenv("API_MAX_GAME_SESSIONS", "10000")),
     }
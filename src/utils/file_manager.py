@@ -1,13 +1,27 @@
 
 import json
 import os
+import hashlib
+import tempfile
 from datetime import datetime
 
+from src.models.scenario import validate_scenario, validate_scenario_safely
+from src.utils import serializer
+from src.utils.config import get_storage_settings
+from src.utils.scenario_codec import encode_scenario, decode_scenario, ScenarioCodecError
+
 
 # 설정 상수
 DATA_DIR = "data"
 VISUALIZATION_DIR = "visualization_results"
 DEFAULT_SCENARIO_TYPE = "magic_kingdom"
+# 시나리오 파일 확장자 (.json: 체크섬 포함 JSON, .scn: 압축 형식)
+SCENARIO_EXTENSIONS = (".json", ".scn")
+COMPACT_EXTENSION = ".scn"
+# 예전 버전이 data/에 남긴 저장 게임 파일 접두사 (시나리오 파일이 아님)
+SAVED_GAME_PREFIX = "saved_game_"
+# 체크섬을 담은 저장 파일 형식 버전 ({"format": 1, "checksum": "sha256:...", "data": ...})
+STORAGE_FORMAT = 1
 SCENARIO_TYPES = {
     "🏰 마법 왕국": "magic_kingdom",
     "🚚 푸드트럭 왕국": "foodtruck_kingdom", 
@@ -22,34 +36,166 @@ def ensure_dir(directory_path):
         os.makedirs(directory_path)
 
 
+def is_scenario_file(filename):
+    """시나리오 파일 확장자(.json, .scn)인지 여부 (예전 저장 게임 파일 saved_game_*.json은 제외)"""
+    return filename.endswith(SCENARIO_EXTENSIONS) and not filename.startswith(SAVED_GAME_PREFIX)
+
+
 def generate_filename(scenario_type, prefix="game_scenario"):
     """타임스탬프를 포함한 파일명 생성"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     return os.path.join(DATA_DIR, f"{prefix}_{scenario_type}_{timestamp}.json")
 
 
-def save_scenario_to_file(scenario_data, filename):
-    """게임 시나리오를 JSON 파일로 저장"""
-    ensure_dir(DATA_DIR)
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(scenario_data, f, ensure_ascii=False, indent=2)
+class ChecksumMismatchError(ValueError):
+    """저장 파일의 체크섬이 내용과 맞지 않는 경우 (손상되었거나 잘린 파일)"""
+
+
+def json_checksum(data):
+    """키 정렬·공백 없는 정규 JSON 표현의 SHA-256 체크섬 (Scenario.content_hash와 같은 방식)"""
+    canonical = json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def write_file_atomic(path, content):
+    """
+    임시 파일에 쓰고 fsync 한 뒤 이름을 바꿔, 중간에 중단되어도 잘린 파일이 남지 않게 저장합니다.
+
+    임시 파일은 같은 디렉토리에 '.'으로 시작하고 '.tmp'로 끝나는 이름으로 만들어
+    시나리오 목록(*.json, *.scn)에 노출되지 않습니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        content (bytes | str): 파일 내용 (str이면 UTF-8로 저장)
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 소유자 전용(0600)으로 만들므로 일반 파일과 같은 권한으로 맞춤
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    # 이름 변경 자체가 디스크에 남도록 디렉토리도 fsync (지원하지 않는 플랫폼은 생략)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def write_checked_json(path, data, indent=False):
+    """
+    데이터를 체크섬과 함께 원자적으로 저장합니다. 기본은 공백 없는 압축 표현입니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        data: JSON으로 저장할 데이터
+        indent (bool, optional): 2칸 들여쓰기 여부 (사람이 읽을 파일이 필요할 때만 지정)
+    """
+    envelope = {"format": STORAGE_FORMAT, "checksum": json_checksum(data), "data": data}
+    write_file_atomic(path, serializer.dumps(envelope, indent=bool(indent)))
+
+
+def read_checked_json(path):
+    """
+    write_checked_json으로 저장한 파일을 읽고 체크섬을 확인합니다.
+    체크섬이 없는 예전 형식 파일은 내용을 그대로 반환합니다.
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        저장된 데이터
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        json.JSONDecodeError: JSON 형식이 아닌 경우 (잘린 예전 형식 파일 등)
+        ChecksumMismatchError: 체크섬이 맞지 않는 경우
+    """
+    with open(path, 'rb') as f:
+        content = serializer.loads(f.read())
+    if not (isinstance(content, dict) and "checksum" in content and "data" in content):
+        return content
+    if json_checksum(content["data"]) != content["checksum"]:
+        raise ChecksumMismatchError(f"파일 체크섬이 맞지 않습니다 (손상된 파일): {path}")
+    return content["data"]
+
+
+def save_scenario_to_file(scenario_data, filename, codec=None):
+    """
+    게임 시나리오를 원자적으로 저장합니다.
+
+    Args:
+        scenario_data (list): 시나리오 데이터
+        filename (str): 저장할 파일 경로
+        codec (str, optional): "json" 또는 "compact". 지정하지 않으면 설정값을 사용하며,
+            "compact"이면 확장자를 .scn으로 바꿔 압축 형식으로 저장합니다.
+
+    Returns:
+        str: 실제로 저장된 파일 경로
+
+    Raises:
+        ScenarioValidationError: 검증에 실패한 경우
+    """
+    scenario = validate_scenario(scenario_data)
+    ensure_dir(os.path.dirname(os.path.abspath(filename)))
+    codec = codec or get_storage_settings()["scenario_codec"]
+    if codec == "compact":
+        filename = os.path.splitext(filename)[0] + COMPACT_EXTENSION
+        write_file_atomic(filename, encode_scenario(scenario.turns))
+    else:
+        write_checked_json(filename, scenario.turns)
+    return filename
+
+
+def read_scenario_file(filename):
+    """
+    시나리오 파일을 형식(.scn 압축 / 체크섬 JSON / 예전 JSON)에 맞게 읽어 검증 전 데이터로 반환합니다.
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+        json.JSONDecodeError, ChecksumMismatchError, ScenarioCodecError: 파일이 손상된 경우
+    """
+    if filename.endswith(COMPACT_EXTENSION):
+        with open(filename, 'rb') as f:
+            return decode_scenario(f.read())
+    return read_checked_json(filename)
 
 
 def load_scenario_from_file(filename):
-    """JSON 파일에서 게임 시나리오 로드"""
+    """시나리오 파일에서 게임 시나리오 로드 (파일이 없거나 손상되었거나 검증에 실패하면 None)"""
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
-    except (FileNotFoundError, json.JSONDecodeError):
+        data = read_scenario_file(filename)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, ChecksumMismatchError, ScenarioCodecError) as e:
+        print(f"시나리오 파일을 읽을 수 없습니다: {filename} ({e})")
         return None
+    scenario = validate_scenario_safely(data)
+    return scenario.turns if scenario else None
 
 
 def get_available_scenarios(data_dir=DATA_DIR):
     """사용 가능한 게임 시나리오 파일 목록 반환"""
     if not os.path.exists(data_dir):
         return []
-    files = [f for f in os.listdir(data_dir) if f.startswith("game_scenario_") and f.endswith(".json")]
+    files = [f for f in os.listdir(data_dir) if f.startswith("game_scenario_") and is_scenario_file(f)]
     return sorted(files, reverse=True)
 
 
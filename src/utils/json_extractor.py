@@ -0,0 +1,178 @@
+"""
+LLM 응답에서 JSON 배열을 추출하고 복구하는 모듈
+
+LLM 응답에는 마크다운 코드 블록, 앞뒤 설명 문장, 마지막 원소 뒤의 쉼표(trailing comma),
+주석, 토큰 한도로 잘린 꼬리 등이 섞여 있을 수 있습니다. 이 모듈은 응답 전체를 한 번만
+훑어서(선형 시간) 가장 바깥쪽 JSON 배열을 찾고, 복구 가능한 부분은 고쳐서 반환합니다.
+"""
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def find_array_start(text):
+    """
+    객체 배열(`[` 다음에 공백을 건너뛰고 `{`가 오는 위치)의 시작 인덱스를 찾습니다.
+
+    Args:
+        text (str): LLM 응답 텍스트
+
+    Returns:
+        int: 배열 시작 인덱스, 찾지 못하면 None
+    """
+    position = text.find("[")
+    while position != -1:
+        cursor = position + 1
+        while cursor < len(text) and text[cursor] in _WHITESPACE:
+            cursor += 1
+        if cursor < len(text) and text[cursor] == "{":
+            return position
+        # 이미 확인한 공백은 다시 보지 않도록 cursor부터 다음 후보 탐색
+        position = text.find("[", cursor)
+    return None
+
+
+def extract_json_array(text):
+    """
+    LLM 응답에서 가장 바깥쪽 JSON 배열을 추출합니다.
+
+    정상적인 배열은 C 구현 디코더로 바로 잘라내고, 그렇지 않은 경우에만
+    `repair_json_array`로 한 번 훑으면서 복구합니다.
+
+    Args:
+        text (str): LLM 응답 텍스트
+
+    Returns:
+        tuple: (JSON 배열 문자열, 적용된 복구 목록). 배열을 찾지 못하면 (None, [])
+    """
+    if not text:
+        return None, []
+
+    start = find_array_start(text)
+    if start is None:
+        return None, []
+
+    try:
+        data, end = _decoder.raw_decode(text, start)
+        if isinstance(data, list):
+            return text[start:end], []
+    except json.JSONDecodeError:
+        pass
+
+    return repair_json_array(text, start)
+
+
+def repair_json_array(text, start=0):
+    """
+    `start` 위치의 `[`부터 한 번 훑으면서 JSON 배열을 복구합니다.
+
+    처리하는 문제:
+        - `]`, `}` 바로 앞의 쉼표(trailing comma) 제거
+        - 문자열 밖의 `//` 한 줄 주석 제거
+        - 문자열 안의 줄바꿈/탭 문자 이스케이프
+        - 응답이 중간에 잘린 경우 마지막으로 완성된 원소까지만 남기고 배열 닫기
+
+    Args:
+        text (str): LLM 응답 텍스트
+        start (int): 배열 시작(`[`) 인덱스
+
+    Returns:
+        tuple: (JSON 배열 문자열, 적용된 복구 목록). 복구할 수 없으면 (None, 복구 목록)
+    """
+    output = []
+    repairs = []
+    stack = []
+    in_string = False
+    escaped = False
+    # 가장 바깥 배열에서 마지막으로 완성된 원소가 끝난 output 위치
+    last_complete = None
+    # 마지막으로 출력한 공백이 아닌 문자의 output 위치
+    last_significant = None
+
+    index = start
+    length = len(text)
+    while index < length:
+        char = text[index]
+
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                char = "\\n"
+                _note(repairs, "문자열 안의 줄바꿈 이스케이프")
+            elif char == "\t":
+                char = "\\t"
+                _note(repairs, "문자열 안의 탭 이스케이프")
+            output.append(char)
+            last_significant = len(output) - 1
+            index += 1
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in "[{":
+            stack.append("]" if char == "[" else "}")
+        elif char in "]}":
+            if not stack or stack[-1] != char:
+                # 짝이 맞지 않는 닫는 괄호는 버림
+                _note(repairs, "짝이 맞지 않는 괄호 제거")
+                index += 1
+                continue
+            if last_significant is not None and output[last_significant] == ",":
+                del output[last_significant:]
+                _note(repairs, "trailing comma 제거")
+            stack.pop()
+            if not stack:
+                output.append(char)
+                return "".join(output), repairs
+            if len(stack) == 1:
+                last_complete = len(output) + 1
+        elif char == "/" and text.startswith("//", index):
+            newline = text.find("\n", index)
+            index = length if newline == -1 else newline
+            _note(repairs, "주석 제거")
+            continue
+        elif char in _WHITESPACE:
+            output.append(char)
+            index += 1
+            continue
+
+        output.append(char)
+        last_significant = len(output) - 1
+        index += 1
+
+    # 응답이 잘린 경우: 마지막으로 완성된 원소까지만 남기고 배열을 닫음
+    if last_complete is None:
+        return None, repairs
+    _note(repairs, "잘린 응답을 마지막 완성 원소까지 복구")
+    return "".join(output[:last_complete]) + "]", repairs
+
+
+def parse_json_array(text):
+    """
+    LLM 응답에서 JSON 배열을 추출하여 파이썬 객체로 변환합니다.
+
+    Args:
+        text (str): LLM 응답 텍스트
+
+    Returns:
+        list: 파싱된 배열, 실패 시 None
+    """
+    json_content, _ = extract_json_array(text)
+    if json_content is None:
+        return None
+    try:
+        return json.loads(json_content)
+    except json.JSONDecodeError:
+        return None
+
+
+def _note(repairs, message):
+    """복구 내역을 중복 없이 기록합니다."""
+    if message not in repairs:
+        repairs.append(message)
@@ -1,649 +1,890 @@
 """
 프롬프트 관리 모듈
+
+시나리오 프롬프트는 시나리오별 고유 부분(배경 스토리, 상점 설명, 응답 예시, 고유 가이드라인)과
+모든 시나리오가 공유하는 게임 메커니즘/최종 검증 사항으로 나누어 정의합니다.
+모듈 로드 시 한 번만 조립·정규화(들여쓰기 제거 등)하여 레지스트리에 보관하고,
+토큰을 줄인 최소화 버전도 함께 만들어 둡니다.
+"""
+import re
+import json
+import textwrap
+
+from src.utils.config import get_model_settings
+
+_SYSTEM_PROMPT = """
+당신은 10세 이하 아동을 위한 교육용 게임 콘텐츠 제작 전문가입니다. 아이들이 이해하기 쉬운 언어와 친숙한 표현으로 돈과 투자의 기본 개념을 알려주는 것이 목표입니다.
+중요: 응답은 반드시 유효한 JSON 형식이어야 합니다. 다른 설명 없이 순수한 JSON 데이터만 반환하세요.
+마크다운 코드 블록이나 다른 형식 없이 JSON 데이터만 반환하세요.
+"""
+
+# --- 모든 시나리오 공통 ({unit}: 투자 대상을 부르는 말 - 상점, 트럭, 작전, 돼지) ---
+
+_MECHANICS_HEADER = "## 📜 중요한 게임 메커니즘 및 생성 가이드라인"
+
+# 시나리오별 가이드라인 앞에 오는 공통 규칙
+_COMMON_RULES_HEAD = [
+    "**7턴 구성**: 반드시 7개의 턴으로 구성된 JSON 배열을 생성합니다. `turn_number` 키를 사용합니다.",
+    """**News → Result → Value Change 흐름**:
+    * 현재 턴(N)의 `news`는 다음 턴(N+1)의 `result`에 영향을 미칩니다.
+    * 다음 턴(N+1)의 `result`는 이전 턴(N) 뉴스의 결과를 설명하며, 이 결과에 따라 다음 턴(N+1)의 `current_value`가 변동됩니다.
+    * 첫 턴(`turn_number: 1`)의 `result`는 지정된 환영 메시지입니다. `current_value`는 `before_value`와 동일(100)합니다.""",
+]
+
+# 시나리오별 가이드라인 뒤에 오는 공통 규칙
+_COMMON_RULES_TAIL = [
+    "**긍정적/부정적 이벤트 균형**: {unit}마다 게임 전체에 걸쳐 긍정적 이벤트(호재)와 부정적 이벤트(악재)를 모두 경험해야 합니다. 어떤 {unit}도 항상 수익을 내지는 않으며, 위험도에 따라 손실을 볼 수도 있음을 명확히 보여주세요.",
+]
+
+# 최종 검증 사항 ({consistency_check}: 시나리오별 투자 대상 일관성 항목)
+_CHECKLIST_TEMPLATE = """
+## ✅ 최종 검증 사항 (생성 후 반드시 확인)
+-   **전체 7턴 생성**: JSON 배열이 정확히 7개의 턴 객체를 포함하는지 확인합니다. (`turn_number` 키 사용)
+-   **첫 턴 규칙 준수**: 첫 턴의 `result`가 지정된 환영 메시지이고, 모든 {unit}의 `current_value`가 `before_value`(100)와 동일한지 확인합니다.
+-   **News → Result → Value 흐름 일치**: 각 턴의 `news`가 다음 턴의 `result`에 논리적으로 반영되고, 이 `result`에 따라 `current_value`가 올바르게 변동되었는지 확인합니다.
+{consistency_check}
+-   **수익/손실 범위 및 균형**: 각 {unit}의 `current_value` 변동이 해당 {unit}의 위험도에 따른 수익/손실 범위 내에서 이루어지는지, 그리고 게임 전체에 걸쳐 호재와 악재가 균형 있게 발생하는지 확인합니다. 어떤 {unit}도 항상 이익만 보지 않도록 주의합니다.
+-   **아이들 눈높이**: 모든 텍스트(특히 `news`, `news_tag`, `result`, `expectation`)가 10세 아동이 이해하기 쉽고 재미있게 작성되었는지 확인합니다.
+-   **JSON 유효성**: 전체 응답이 유효한 JSON 형식인지 확인합니다. (쉼표, 따옴표, 괄호 등)
+"""
+
+# --- 마법 왕국 ---
+
+_MAGIC_KINGDOM_STORY = """
+당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "마법 왕국 투자 게임"의 AI 어시스턴트입니다.
+플레이어는 어린 투자 마법사가 되어 7일(7턴) 동안 마법 왕국의 상점들에 투자하여 마을을 돕는 미션을 수행합니다.
+이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
+스토리는 마법 왕국을 배경으로 하며, 친숙한 판타지 요소를 사용합니다.
+생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
+
+## 🎭 게임 배경 스토리
+마법 왕국의 작은 마을에 오신 것을 환영합니다! 이곳에는 세 개의 특별한 상점이 있어요.
+당신은 마을의 어린 투자 마법사가 되어 7일 동안 이 상점들에 마법 코인을 투자하여 마을 사람들을 도와주는 미션을 받았어요!
+시작 자금: 100 마법 코인 ✨ (이것은 플레이어의 자금이며, 아래 상점들의 가치와는 별개입니다.)
+
+## 🏪 투자 가능한 3개 마법 왕국 상점 (JSON의 'stocks' 항목으로 표현)
+각 상점의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 시장 상황에 따라 변동됩니다.
+
+### 1. 🍞 빵집
+- **JSON name**: "🍞 빵집"
+- **JSON risk_level**: "저위험"
+- **특징**: 마을 사람들이 매일 필요로 하는 빵을 만드는 곳. 안정적이지만 큰 수익은 기대하기 어려움.
+- **위험도**: ⭐ (낮음)
+- **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +5% 호재, -1% ~ -3% 악재)
+- **설명**: "매일 필요한 빵이라 안전하지만, 큰 부자는 되기 어려워요."
+
+### 2. 🎪 서커스단
+- **JSON name**: "🎪 서커스단"
+- **JSON risk_level**: "중위험"
+- **특징**: 가끔 마을에 와서 공연하는 유명한 서커스단. 날씨나 시즌, 특별 이벤트에 따라 수익 변동.
+- **위험도**: ⭐⭐⭐ (보통)
+- **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 호재, -3% ~ -5% 악재, 특별 상황 시 -5~+10%)
+- **설명**: "인기가 많으면 대박이지만, 날씨가 안 좋거나 재미없으면 손님이 없어요."
+
+### 3. 🔮 마법연구소
+- **JSON name**: "🔮 마법연구소"
+- **JSON risk_level**: "고위험"
+- **특징**: 새로운 마법을 개발하는 신비한 연구소. 대발명 시 큰 수익이지만 실패하거나 부정적 뉴스 발생 시 큰 손실 가능.
+- **위험도**: ⭐⭐⭐⭐⭐ (높음)
+- **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +15% 호재, -10% ~ -15% 악재, 특별 상황 시 -20~+30%)
+- **설명**: "대단한 마법이 성공하면 엄청난 보상이지만, 실패하면 큰일나요!"
+
+## 🎮 7턴 게임 시나리오 JSON 응답 형식
+아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
+각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
+아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
+
+```json
+[
+  {
+    "turn_number": 1,
+    "result": "마법 왕국에 오신 것을 환영합니다, 어린 투자 마법사님! 당신의 7일간의 마법 같은 모험이 지금 시작됩니다!",
+    "news": "[1턴의 주요 뉴스 - 예: 내일 왕국 전체에 마법 축제가 열린다는 소문이 있어요!]",
+    "news_tag": "[1턴의 뉴스가 각 상점에 미칠 영향에 대한 아이들이 이해하기 쉬운 힌트 - 예: 축제에는 사람들이 많이 모여 빵도 많이 사 먹고, 서커스도 인기겠지만, 마법연구소는 조용할지도 몰라요!]",
+    "stocks": [
+      {
+        "name": "🍞 빵집",
+        "description": "마을 사람들이 매일 필요로 하는 빵을 만드는 곳",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "저위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 덕분에 빵 판매가 늘어날 것 같아요!]"
+      },
+      {
+        "name": "🎪 서커스단",
+        "description": "가끔 마을에 와서 공연하는 유명한 서커스단",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "중위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 기간 동안 서커스 인기가 최고일 거예요!]"
+      },
+      {
+        "name": "🔮 마법연구소",
+        "description": "새로운 마법을 개발하는 신비한 연구소",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "고위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제와 마법 연구는 큰 관련이 없을지도...]"
+      }
+    ]
+  },
+  {
+    "turn_number": 2,
+    "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '마법 축제 덕분에 빵집은 손님이 많아져 가치가 올랐고(+5%), 서커스단도 대성공을 거뒀지만(+8%), 마법연구소는 예상대로 조용했어요(+1%).']",
+    "news": "[2턴의 주요 뉴스 - 예: 옆 마을에서 전염병이 돌기 시작했다는 무서운 소식이 들려요!]",
+    "news_tag": "[2턴 뉴스의 영향 힌트 - 예: 사람들이 아프면 빵은 더 필요할 수 있지만, 서커스나 마법 연구는 어려워질 수 있어요!]",
+    "stocks": [
+      {
+        "name": "🍞 빵집",
+        "description": "마을 사람들이 매일 필요로 하는 빵을 만드는 곳",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 105]",
+        "risk_level": "저위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 아픈 사람들에게 빵은 필수품이죠!]"
+      },
+      {
+        "name": "🎪 서커스단",
+        "description": "가끔 마을에 와서 공연하는 유명한 서커스단",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 108]",
+        "risk_level": "중위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 전염병이 돌면 서커스 공연은 위험해요!]"
+      },
+      {
+        "name": "🔮 마법연구소",
+        "description": "새로운 마법을 개발하는 신비한 연구소",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 101]",
+        "risk_level": "고위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 마법연구소에서 치료 마법을 연구할지도?! 하지만 위험해요!]"
+      }
+    ]
+  }
+  // ... (이하 7턴까지 동일한 구조로 반복, 각 'description' 필드는 위 예시와 동일하게 유지)
+]
+"""
+
+_MAGIC_KINGDOM_RULES = [
+    """**위험과 보상**: 각 상점의 위험도에 따라 성공 시 수익률과 실패 시 손실률이 달라야 합니다. (위에 명시된 수익/손실 범위 참고)
+    * 빵집 (저위험): 작은 성공 또는 작은 실패.
+    * 서커스단 (중위험): 중간 정도의 성공 또는 실패.
+    * 마법연구소 (고위험): 큰 성공 또는 큰 실패.""",
+    "**스토리텔링**: 마법 왕국 배경과 판타지 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 왕의 방문, 용의 출현, 마법 대회, 가뭄, 풍년 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.",
+    "**교육적 요소**: 게임을 통해 아이들이 위험 관리, 정보의 중요성, 분산 투자의 개념을 자연스럽게 접할 수 있도록 내용을 구성해주세요. (예: 특정 뉴스에 모든 상점이 동일하게 반응하지 않도록, 어떤 상점에는 호재, 다른 상점에는 악재가 될 수 있도록)",
+    "**일관성**: 상점의 이름, `description`, 위험도 등은 게임 내내 일관되어야 합니다. `description` 필드는 예시에 제공된 내용을 모든 턴에서 동일하게 사용해주세요.",
+    '**`expectation` 필드**: 현재 턴의 `news`와 `news_tag`를 바탕으로 각 상점의 가격 변동 예상을 "가격이 오를 것 같아요!", "가격이 조금 내릴 수도 있어요.", "큰 변화는 없을 거예요." 등으로 구체적으로 작성합니다.',
+    '**`result` 필드**: 이전 턴 뉴스의 결과를 서술형으로 작성하고, 각 상점의 가치 변동률(예: +5%, -3%)을 명시하여 `current_value` 계산의 근거를 제공합니다. 아이들이 이해하기 쉽게 "왜 그렇게 되었는지"를 설명해주세요.',
+]
+
+_MAGIC_KINGDOM_NOTES = """
+## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
+-   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
+-   **게임만의 특별함**: 친숙한 판타지 세계관, 마법과 경제의 결합, 성취감 제공.
+-   **마법 왕국만의 독특한 요소**: 상점별 특성 뚜렷, 마법적 이벤트의 경제적 영향, 동화 같은 분위기.
+"""
+
+_MAGIC_KINGDOM_CONSISTENCY_CHECK = '-   **상점 정보 일관성**: 3개의 상점("빵집", "서커스단", "마법연구소")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.'
+
+
+# --- 푸드트럭 왕국 ---
+
+_FOODTRUCK_KINGDOM_STORY = """
+당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "푸드트럭 왕국 투자 게임"의 AI 어시스턴트입니다.
+플레이어는 젊은 투자 요리사가 되어 7일(7턴) 동안 푸드트럭 왕국의 트럭들에 투자하여 사람들을 행복하게 만드는 미션을 수행합니다.
+이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
+스토리는 푸드트럭 왕국을 배경으로 하며, 맛있는 음식과 관련된 요소를 사용합니다.
+생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
+
+## 🎭 게임 배경 스토리
+요리의 나라 '푸드트럭 왕국'에 오신 것을 환영합니다! 이곳에는 특별한 세 개의 푸드트럭이 있어요.
+당신은 젊은 투자 요리사가 되어 7일 동안 이 푸드트럭들에 미식 코인을 투자해서 맛있는 음식으로 사람들을 행복하게 만드는 미션을 받았습니다!
+시작 자금: 100 미식 코인 🍲 (이것은 플레이어의 자금이며, 아래 트럭들의 가치와는 별개입니다.)
+
+## 🚚 투자 가능한 3개 푸드트럭 (JSON의 'stocks' 항목으로 표현)
+각 트럭의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 시장 상황에 따라 변동됩니다.
+
+### 1. 🥪 샌드위치 트럭
+- **JSON name**: "🥪 샌드위치 트럭"
+- **JSON risk_level**: "저위험"
+- **특징**: 언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭. 안정적이지만 큰 수익은 기대하기 어려움.
+- **위험도**: ⭐ (낮음)
+- **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +5% 호재, -1% ~ -3% 악재)
+- **설명**: "매일 필요한 샌드위치라 안전하지만, 큰 부자는 되기 어려워요."
+
+### 2. 🍦 아이스크림 트럭
+- **JSON name**: "🍦 아이스크림 트럭"
+- **JSON risk_level**: "중위험"
+- **특징**: 시원하고 달콤한 아이스크림을 파는 인기 푸드트럭. 날씨나 계절, 특별 이벤트에 따라 수익 변동.
+- **위험도**: ⭐⭐⭐ (보통)
+- **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 호재, -3% ~ -5% 악재, 특별 상황 시 -5~+10%)
+- **설명**: "날씨가 좋으면 대박이지만, 비가 오거나 추우면 손님이 없어요."
+
+### 3. 🌮 퓨전 타코 트럭
+- **JSON name**: "퓨전 타코 트럭"
+- **JSON risk_level**: "고위험"
+- **특징**: 새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭. 신메뉴 성공 시 큰 수익이지만 실패하거나 부정적 뉴스 발생 시 큰 손실 가능.
+- **위험도**: ⭐⭐⭐⭐⭐ (높음)
+- **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +15% 호재, -10% ~ -15% 악재, 특별 상황 시 -20~+30%)
+- **설명**: "새로운 맛이 대성공하면 엄청난 인기지만, 실패하면 아무도 안 찾아요!"
+
+## 🎮 7턴 게임 시나리오 JSON 응답 형식
+아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
+각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
+아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
+
+```json
+[
+  {
+    "turn_number": 1,
+    "result": "푸드트럭 왕국에 오신 것을 환영합니다, 젊은 투자 요리사님! 당신의 7일간의 맛있는 모험이 지금 시작됩니다!",
+    "news": "[1턴의 주요 뉴스 - 예: 내일 푸드트럭 왕국에서 대규모 음식 축제가 열린대요!]",
+    "news_tag": "[1턴의 뉴스가 각 트럭에 미칠 영향에 대한 아이들이 이해하기 쉬운 힌트 - 예: 축제에는 사람들이 많이 모여 모든 트럭이 인기겠지만, 특히 아이스크림은 날씨가 더우면 최고일 거예요!]",
+    "stocks": [
+      {
+        "name": "🥪 샌드위치 트럭",
+        "description": "언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "저위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 덕분에 샌드위치 판매가 늘어날 것 같아요!]"
+      },
+      {
+        "name": "🍦 아이스크림 트럭",
+        "description": "시원하고 달콤한 아이스크림을 파는 인기 푸드트럭",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "중위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 기간, 특히 더운 날엔 아이스크림 인기가 폭발할 거예요!]"
+      },
+      {
+        "name": "🌮 퓨전 타코 트럭",
+        "description": "새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "고위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제에서 특별한 타코를 선보이면 대박날지도 몰라요!]"
+      }
+    ]
+  },
+  {
+    "turn_number": 2,
+    "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '음식 축제 덕분에 샌드위치 트럭은 손님이 많아져 가치가 올랐고(+4%), 아이스크림 트럭도 날씨가 더워 대성공을 거뒀지만(+7%), 퓨전 타코 트럭은 준비한 재료가 일찍 떨어져 아쉬웠어요(+2%).']",
+    "news": "[2턴의 주요 뉴스 - 예: 유명한 음식 평론가가 비밀리에 왕국을 방문했다는 소문이 있어요!]",
+    "news_tag": "[2턴 뉴스의 영향 힌트 - 예: 평론가가 어떤 트럭을 좋아할지는 아무도 몰라요! 칭찬하면 대박, 혹평하면 쪽박!]",
+    "stocks": [
+      {
+        "name": "🥪 샌드위치 트럭",
+        "description": "언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 104]",
+        "risk_level": "저위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 평론가도 든든한 샌드위치는 좋아할 거예요.]"
+      },
+      {
+        "name": "🍦 아이스크림 트럭",
+        "description": "시원하고 달콤한 아이스크림을 파는 인기 푸드트럭",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 107]",
+        "risk_level": "중위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 특별한 아이스크림이 평론가의 입맛을 사로잡을 수 있을까요?]"
+      },
+      {
+        "name": "🌮 퓨전 타코 트럭",
+        "description": "새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 102]",
+        "risk_level": "고위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 퓨전 타코는 평론가에게 모험일 거예요! 대성공 아니면 큰 실패!]"
+      }
+    ]
+  }
+  // ... (이하 7턴까지 동일한 구조로 반복, 각 'description' 필드는 위 예시와 동일하게 유지)
+]
+"""
+
+_FOODTRUCK_KINGDOM_RULES = [
+    """**위험과 보상**: 각 트럭의 위험도에 따라 성공 시 수익률과 실패 시 손실률이 달라야 합니다. (위에 명시된 수익/손실 범위 참고)
+    * 샌드위치 트럭 (저위험): 작은 성공 또는 작은 실패.
+    * 아이스크림 트럭 (중위험): 중간 정도의 성공 또는 실패.
+    * 퓨전 타코 트럭 (고위험): 큰 성공 또는 큰 실패.""",
+    "**스토리텔링**: 푸드트럭 왕국 배경과 음식 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 음식 축제, 유명 평론가 방문, 신선한 재료 발견, 폭염, 장마 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.",
+    "**교육적 요소**: 게임을 통해 아이들이 위험 관리, 정보의 중요성, 분산 투자의 개념을 자연스럽게 접할 수 있도록 내용을 구성해주세요. (예: 특정 뉴스에 모든 트럭이 동일하게 반응하지 않도록, 어떤 트럭에는 호재, 다른 트럭에는 악재가 될 수 있도록)",
+    "**일관성**: 트럭의 이름, `description`, 위험도 등은 게임 내내 일관되어야 합니다. `description` 필드는 예시에 제공된 내용을 모든 턴에서 동일하게 사용해주세요.",
+    '**`expectation` 필드**: 현재 턴의 `news`와 `news_tag`를 바탕으로 각 트럭의 가격 변동 예상을 "가격이 오를 것 같아요!", "가격이 조금 내릴 수도 있어요.", "큰 변화는 없을 거예요." 등으로 구체적으로 작성합니다.',
+    '**`result` 필드**: 이전 턴 뉴스의 결과를 서술형으로 작성하고, 각 트럭의 가치 변동률(예: +5%, -3%)을 명시하여 `current_value` 계산의 근거를 제공합니다. 아이들이 이해하기 쉽게 "왜 그렇게 되었는지"를 설명해주세요.',
+]
+
+_FOODTRUCK_KINGDOM_NOTES = """
+## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
+-   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
+-   **게임만의 특별함**: 친숙한 음식 세계관, 요리와 경제의 결합, 성취감 제공.
+-   **푸드트럭 왕국만의 독특한 요소**: 트럭별 특성 뚜렷, 음식 관련 이벤트의 경제적 영향, 맛있는 분위기.
+"""
+
+_FOODTRUCK_KINGDOM_CONSISTENCY_CHECK = '-   **트럭 정보 일관성**: 3개의 트럭("샌드위치 트럭", "아이스크림 트럭", "퓨전 타코 트럭")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.'
+
+
+# --- 달빛 도둑 ---
+
+_MOONLIGHT_THIEF_STORY = """
+당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "달빛 도둑 투자 게임"의 AI 어시스턴트입니다.
+플레이어는 견습 달빛 도둑이 되어 7일(7턴) 동안 신비로운 달빛 보물 작전에 투자하여 최고의 달빛 도둑이 되는 미션을 수행합니다.
+이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
+스토리는 은월 왕국을 배경으로 하며, 달빛이라는 아름다운 소재를 사용합니다.
+생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
+
+## 🎭 게임 배경 스토리
+달빛이 가장 아름다운 은월 왕국에 온 것을 환영합니다! 이곳에는 전설적인 달빛 도둑 길드가 있어요.
+당신은 견습 달빛 도둑이 되어 7일 동안 신비로운 달빛 보물들을 훔치는 작전에 투자하여 최고의 달빛 도둑이 되는 미션을 받았습니다!
+하지만 조심해야 해요 - 위험할수록 더 큰 보상이 기다리고 있답니다.
+시작 자금: 100 달빛 코인 🌙 (이것은 플레이어의 자금이며, 아래 작전들의 가치와는 별개입니다.)
+
+## 💎 투자 가능한 3개 달빛 보물 작전 (JSON의 'stocks' 항목으로 표현)
+각 작전의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 작전의 성공에 따라 변동됩니다.
+
+### 1. ✨ 달빛 가루 수집 작전
+- **JSON name**: "✨ 달빛 가루 수집 작전"
+- **JSON description**: "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!"
+- **JSON risk_level**: "저위험"
+- **특징**: 가볍고 숨기기 쉬운 달빛 가루를 모으기. 작고 가벼워서 들키기 어렵고, 매일 조금씩 모을 수 있음.
+- **위험도**: ⭐ (낮음)
+- **수익/손실 범위**: 작지만 꾸준함 (예: +1% ~ +5% 성공, -0% ~ -2% 실패)
+
+### 2. 🌙 달조각 목걸이 훔치기 작전
+- **JSON name**: "🌙 달조각 목걸이 훔치기 작전"
+- **JSON description**: "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요"
+- **JSON risk_level**: "중위험"
+- **특징**: 은은한 빛이 나는 중간 크기의 달조각 목걸이. 귀족들이 가끔 착용하는 보석으로 적당한 가치와 위험.
+- **위험도**: ⭐⭐⭐ (보통)
+- **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 성공, -1% ~ -5% 실패)
+
+### 3. 🛡️ 달빛 방패 강탈 작전
+- **JSON name**: "🛡️ 달빛 방패 강탈 작전"
+- **JSON description**: "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!"
+- **JSON risk_level**: "고위험"
+- **특징**: 크고 반짝이는 전설의 달빛 방패. 왕궁에 보관된 최고급 보물로 엄청난 가치이지만 매우 위험.
+- **위험도**: ⭐⭐⭐⭐⭐ (높음)
+- **수익/손실 범위**: 큰 폭으로 변동 (예: +8% ~ +15% 성공, -5% ~ -12% 실패)
+
+## 🎮 7턴 게임 시나리오 JSON 응답 형식
+아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
+각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
+사용자 제공 예시(보름달, 연회, 구름, 탐지기, 마술사, 축제, 현상금 사냥꾼, 부자 상인, 도둑 대회 등)를 참고하여 흥미로운 7턴의 스토리를 구성해주세요.
+아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
+
+```json
+[
+  {
+    "turn_number": 1,
+    "result": "게임 시작! 견습 달빛 도둑이 되어 신비로운 은월 왕국의 모험을 시작해요.",
+    "news": "[1턴의 주요 뉴스 - 예: 오늘 밤은 보름달이라서 달빛이 특히 밝아요! 모든 달빛 보물들이 더 반짝일 거라는 소문이 돌고 있어요.]",
+    "news_tag": "[뉴스가 어떤 작전에게 주로 영향을 주는지 - 'all'(모든 작전), 'high'(고위험), 'mid'(중위험), 'low'(저위험), 또는 빈 문자열]",
+    "stocks": [
+      {
+        "name": "✨ 달빛 가루 수집 작전",
+        "description": "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "저위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 보름달 덕분에 달빛 가루가 더 반짝일 거예요!]"
+      },
+      {
+        "name": "🌙 달조각 목걸이 훔치기 작전",
+        "description": "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "중위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 밝은 달빛 때문에 목걸이가 더 예쁘지만 들킬 수도 있어요!]"
+      },
+      {
+        "name": "🛡️ 달빛 방패 강탈 작전",
+        "description": "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!",
+        "before_value": 100,
+        "current_value": 100,
+        "risk_level": "고위험",
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 보름달이 방패를 더 밝게 비춰서 훔치기 어려울 수도 있어요!]"
+      }
+    ]
+  },
+  {
+    "turn_number": 2,
+    "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '보름달 덕분에 모든 달빛 보물들이 더 반짝여서 가치가 올랐어요!']",
+    "news": "[2턴의 주요 뉴스 - 예: 왕궁에서 큰 연회가 열려서 경비병들이 모두 연회장으로 갔어요! 지금이 보물을 훔칠 절호의 기회라는 소문이 돌아요.]",
+    "news_tag": "[뉴스가 어떤 작전에게 주로 영향을 주는지]",
+    "stocks": [
+      {
+        "name": "✨ 달빛 가루 수집 작전",
+        "description": "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 102]",
+        "risk_level": "저위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 더 많은 달빛 가루를 모을 수 있을 거예요!]"
+      },
+      {
+        "name": "🌙 달조각 목걸이 훔치기 작전",
+        "description": "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 104]",
+        "risk_level": "중위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 목걸이를 훔치기 좋은 기회예요!]"
+      },
+      {
+        "name": "🛡️ 달빛 방패 강탈 작전",
+        "description": "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 98]",
+        "risk_level": "고위험",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 달빛 방패를 훔치기 가장 좋은 기회예요!]"
+      }
+    ]
+  }
+  // ... (이하 7턴까지 동일한 구조로 반복, 각 작전의 'description' 필드는 위에 명시된 내용과 동일하게 유지)
+]
+"""
+
+_MOONLIGHT_THIEF_RULES = [
+    "**투자 작전별 특성 반영**: 각 작전의 위험도와 특성에 맞는 `current_value` 변동폭을 적용해주세요.",
+    "**스토리텔링**: 달빛 도둑과 은월 왕국 배경을 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 보름달, 연회, 구름, 탐지기, 마술사, 축제, 현상금 사냥꾼, 부자 상인, 도둑 대회 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.",
+    "**교육적 목적**: 위험과 수익의 관계, 신중한 계획의 중요성, 안전성의 가치 등을 아이들이 자연스럽게 배울 수 있도록 스토리를 구성해주세요.",
+    "**긍정적 마무리**: 게임의 마지막 턴에서는 모든 작전이 각자의 방식으로 성공할 수 있도록 희망적인 메시지를 전달해주세요.",
+    "**뉴스 태그 활용**: `news_tag`를 통해 어떤 작전에게 뉴스가 주로 영향을 주는지 명확히 표시해주세요.",
+    "**Expectation 필드**: 다음 턴에 대한 예상을 아이들이 쉽게 이해할 수 있도록 작성해주세요.",
+]
+
+_MOONLIGHT_THIEF_NOTES = """
+## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
+-   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
+-   **달빛 도둑만의 교육적 가치**:
+    -   신중한 계획과 정보 수집의 중요성 (달빛 가루 수집 작전의 안전성)
+    -   적당한 위험과 수익의 균형 (달조각 목걸이 작전의 중위험)
+    -   큰 보상을 위한 큰 위험 감수 (달빛 방패 작전의 고위험)
+-   **게임만의 특별함**: 친숙한 도둑 모험 세계관, 달빛과 보물의 결합, 성취감 제공.
+-   **달빛 도둑만의 독특한 요소**: 작전별 명확한 위험도, 보물=투자 대상 비유, 모험과 신중함의 균형.
+"""
+
+_MOONLIGHT_THIEF_CONSISTENCY_CHECK = '-   **작전 정보 일관성**: 3개의 작전("달빛 가루 수집 작전", "달조각 목걸이 훔치기 작전", "달빛 방패 강탈 작전")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.'
+
+
+# --- 아기돼지 삼형제 ---
+
+_THREE_LITTLE_PIGS_STORY = """
+당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "아기돼지 삼형제 투자 게임"의 AI 어시스턴트입니다.
+플레이어는 아기돼지 삼형제의 투자 고문이 되어 7일(7턴) 동안 세 마리 돼지의 집 짓기 프로젝트에 투자하여 최고의 집을 완성하는 미션을 수행합니다.
+이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
+스토리는 아기돼지 삼형제 동화를 배경으로 하며, 친숙한 캐릭터들을 사용합니다.
+생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
+
+## 🎭 게임 배경 스토리
+아기돼지 삼형제가 사는 마을에 온 것을 환영합니다! 세 마리 돼지는 각각 다른 방식으로 집을 짓고 있어요.
+당신은 돼지 삼형제의 투자 고문이 되어 7일 동안 각 돼지의 집 짓기 프로젝트에 투자하여 가장 좋은 집을 완성하도록 도와주는 미션을 받았습니다!
+각 돼지는 서로 다른 전략을 가지고 있어서, 위험과 보상이 달라요.
+시작 자금: 100 건설 코인 🏠 (이것은 플레이어의 자금이며, 아래 돼지들의 가치와는 별개입니다.)
+
+## 🐷 투자 가능한 3마리 아기돼지 (JSON의 'stocks' 항목으로 표현)
+각 돼지의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 집 짓기 진행 상황에 따라 변동됩니다.
+
+### 1. 🌾 첫째 돼지 (지푸라기 집)
+- **JSON name**: "🌾 첫째 돼지"
+- **JSON description**: "지푸라기로 집을 가장 빠르게 짓습니다."
+- **JSON risk_level**: "고위험 고수익"
+- **특징**: 지푸라기로 빠르게 집을 짓는 전략. 빨리 완성되지만 튼튼하지 않아서 위험함.
+- **위험도**: ⭐⭐⭐⭐⭐ (높음)
+- **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +20% 성공, -5% ~ -15% 실패)
+
+### 2. 🪵 둘째 돼지 (나무 집)
+- **JSON name**: "🪵 둘째 돼지"
+- **JSON description**: "나무로 적당히 빠르고 튼튼하게 집을 짓습니다."
+- **JSON risk_level**: "중위험 균형형"
+- **특징**: 나무로 적당한 속도와 튼튼함을 갖춘 집을 짓는 전략. 균형 잡힌 접근법.
+- **위험도**: ⭐⭐⭐ (보통)
+- **수익/손실 범위**: 중간 정도의 변동 (예: +5% ~ +10% 성공, -3% ~ -7% 실패)
+
+### 3. 🧱 셋째 돼지 (벽돌 집)
+- **JSON name**: "셋째 돼지"
+- **JSON description**: "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다."
+- **JSON risk_level**: "저위험 저수익"
+- **특징**: 벽돌로 천천히 하지만 가장 튼튼한 집을 짓는 전략. 안전하지만 완성이 늦음.
+- **위험도**: ⭐ (낮음)
+- **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +6% 성공, -1% ~ -3% 실패)
+
+## 🎮 7턴 게임 시나리오 JSON 응답 형식
+아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
+각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
+아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
+
+```json
+[
+  {
+    "turn_number": 1,
+    "result": "아기돼지 삼형제 마을에 오신 것을 환영합니다! 세 마리 돼지가 모두 집 짓기를 시작했어요. 당신의 7일간의 투자 모험이 지금 시작됩니다!",
+    "news": "[1턴의 주요 뉴스 - 예: 요정 할머니가 마을에 나타나, 모든 집을 더 튼튼하게 만들어줄 마법을 걸어줄 수도 있다는 소문이 돌아요!]",
+    "news_tag": "[뉴스가 어떤 돼지에게 주로 영향을 주는지 - 'all'(모든 돼지), 'high'(고위험), 'mid'(중위험), 'low'(저위험), 또는 빈 문자열]",
+    "stocks": [
+      {
+        "name": "🌾 첫째 돼지",
+        "risk_level": "고위험 고수익",
+        "description": "지푸라기로 집을 가장 빠르게 짓습니다.",
+        "before_value": 100,
+        "current_value": 100,
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
+      },
+      {
+        "name": "🪵 둘째 돼지",
+        "risk_level": "중위험 균형형",
+        "description": "나무로 적당히 빠르고 튼튼하게 집을 짓습니다.",
+        "before_value": 100,
+        "current_value": 100,
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
+      },
+      {
+        "name": "🧱 셋째 돼지",
+        "risk_level": "저위험 저수익",
+        "description": "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다.",
+        "before_value": 100,
+        "current_value": 100,
+        "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
+      }
+    ]
+  },
+  {
+    "turn_number": 2,
+    "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '요정 할머니가 나타나 마법을 걸어주어 모든 돼지 삼형제의 집이 더 튼튼해졌어요!']",
+    "news": "[2턴의 주요 뉴스 - 예: 첫째 돼지의 지푸라기 집 주변에 지푸라기를 갉아먹는 작은 벌레들이 많이 보였다는 소문이 돌아요!]",
+    "news_tag": "[뉴스가 어떤 돼지에게 주로 영향을 주는지]",
+    "stocks": [
+      {
+        "name": "🌾 첫째 돼지",
+        "risk_level": "고위험 고수익",
+        "description": "지푸라기로 집을 가장 빠르게 짓습니다.",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 115]",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 집이 약해지거나 다시 지어야 할 수도 있어요.]"
+      },
+      {
+        "name": "🪵 둘째 돼지",
+        "risk_level": "중위험 균형형",
+        "description": "나무로 적당히 빠르고 튼튼하게 집을 짓습니다.",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 107]",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 이 소식은 나무집에는 아무런 영향을 주지 않을 거예요.]"
+      },
+      {
+        "name": "🧱 셋째 돼지",
+        "risk_level": "저위험 저수익",
+        "description": "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다.",
+        "before_value": 100,
+        "current_value": "[1턴 결과가 반영된 값, 예: 103]",
+        "expectation": "[2턴 뉴스 기반 예상 - 예: 이 소식은 벽돌집에는 아무런 영향을 주지 않을 거예요.]"
+      }
+    ]
+  }
+  // ... (이하 7턴까지 동일한 구조로 반복, 각 돼지의 'description' 필드는 위에 명시된 내용과 동일하게 유지)
+]
+"""
+
+_THREE_LITTLE_PIGS_RULES = [
+    "**투자 종목별 특성 반영**: 각 돼지의 위험도와 특성에 맞는 `current_value` 변동폭을 적용해주세요.",
+    "**스토리텔링**: 아기돼지 삼형제 동화 배경과 집 짓기 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 늑대의 등장, 요정의 도움, 재료 부족, 날씨 변화, 건축 도우미 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.",
+    "**교육적 목적**: 위험과 수익의 관계, 빠른 수익의 위험성, 안정성의 가치 등을 아이들이 자연스럽게 배울 수 있도록 스토리를 구성해주세요.",
+    "**긍정적 마무리**: 게임의 마지막 턴에서는 모든 돼지가 각자의 방식으로 성공할 수 있도록 희망적인 메시지를 전달해주세요.",
+    "**뉴스 태그 활용**: `news_tag`를 통해 어떤 돼지에게 뉴스가 주로 영향을 주는지 명확히 표시해주세요.",
+    "**Expectation 필드**: 다음 턴에 대한 예상을 아이들이 쉽게 이해할 수 있도록 작성해주세요.",
+]
+
+_THREE_LITTLE_PIGS_NOTES = """
+## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
+-   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
+-   **아기돼지 삼형제만의 교육적 가치**:
+    -   빠른 수익 추구의 위험성 (첫째 돼지의 지푸라기 집)
+    -   안정성과 수익성의 균형 (둘째 돼지의 나무 집)
+    -   안전한 투자의 중요성 (셋째 돼지의 벽돌 집)
+-   **게임만의 특별함**: 친숙한 동화 세계관, 건축과 경제의 결합, 성취감 제공.
+-   **아기돼지 삼형제만의 독특한 요소**: 캐릭터별 명확한 투자 철학, 건축 재료=위험도 비유, 협력과 경쟁의 균형.
 """
 
-def get_system_prompt():
+_THREE_LITTLE_PIGS_CONSISTENCY_CHECK = '-   **돼지 정보 일관성**: 3마리 돼지("첫째 돼지", "둘째 돼지", "셋째 돼지")가 정확한 이름, `description`, `risk_level`("고위험 고수익", "중위험 균형형", "저위험 저수익")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.'
+
+# 시나리오 타입 → 시나리오별 고유 부분
+_SCENARIOS = {
+    "magic_kingdom": {
+        "unit": "상점",
+        "story": _MAGIC_KINGDOM_STORY,
+        "rules": _MAGIC_KINGDOM_RULES,
+        "notes": _MAGIC_KINGDOM_NOTES,
+        "consistency_check": _MAGIC_KINGDOM_CONSISTENCY_CHECK,
+    },
+    "foodtruck_kingdom": {
+        "unit": "트럭",
+        "story": _FOODTRUCK_KINGDOM_STORY,
+        "rules": _FOODTRUCK_KINGDOM_RULES,
+        "notes": _FOODTRUCK_KINGDOM_NOTES,
+        "consistency_check": _FOODTRUCK_KINGDOM_CONSISTENCY_CHECK,
+    },
+    "moonlight_thief": {
+        "unit": "작전",
+        "story": _MOONLIGHT_THIEF_STORY,
+        "rules": _MOONLIGHT_THIEF_RULES,
+        "notes": _MOONLIGHT_THIEF_NOTES,
+        "consistency_check": _MOONLIGHT_THIEF_CONSISTENCY_CHECK,
+    },
+    "three_little_pigs": {
+        "unit": "돼지",
+        "story": _THREE_LITTLE_PIGS_STORY,
+        "rules": _THREE_LITTLE_PIGS_RULES,
+        "notes": _THREE_LITTLE_PIGS_NOTES,
+        "consistency_check": _THREE_LITTLE_PIGS_CONSISTENCY_CHECK,
+    },
+}
+
+DEFAULT_SCENARIO_TYPE = "magic_kingdom"
+
+# 최소화 버전에서 제외하는 참고용 섹션
+_REFERENCE_SECTION = re.compile(r"^## 🎯.*?(?=^## |\Z)", re.MULTILINE | re.DOTALL)
+
+# 토큰 수 추정용 패턴 (영단어/숫자 묶음, 한글 2글자, 공백 2~4칸, 줄바꿈, 그 외 문자 각 1토큰)
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|[가-힣]{1,2}| {2,4}|\n|\S")
+
+
+def _normalize(text):
+    """들여쓰기를 제거하고 줄 끝 공백과 연속된 빈 줄을 정리합니다."""
+    lines = [line.rstrip() for line in textwrap.dedent(text).strip("\n").splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+
+
+def _minimize(text):
+    """참고용 섹션, 강조 표시, 들여쓰기, 빈 줄을 제거한 최소화 버전을 만듭니다."""
+    text = _REFERENCE_SECTION.sub("", text).replace("**", "")
+    lines = (re.sub(r" {2,}", " ", line.strip()) for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _compile_scenario_prompt(spec):
+    """시나리오별 고유 부분과 공통 규칙을 하나의 프롬프트로 조립합니다."""
+    unit = spec["unit"]
+    rules = (
+        [rule.format(unit=unit) for rule in _COMMON_RULES_HEAD]
+        + spec["rules"]
+        + [rule.format(unit=unit) for rule in _COMMON_RULES_TAIL]
+    )
+    mechanics = "\n".join([_MECHANICS_HEADER] + [f"{number}.  {rule}" for number, rule in enumerate(rules, 1)])
+    checklist = _CHECKLIST_TEMPLATE.format(unit=unit, consistency_check=spec["consistency_check"])
+    return _normalize("\n\n".join([spec["story"], mechanics, spec["notes"], checklist]))
+
+
+# 프롬프트 레지스트리 (모듈 로드 시 한 번만 조립)
+_PROMPTS = {"system": _normalize(_SYSTEM_PROMPT)}
+_PROMPTS.update({scenario_type: _compile_scenario_prompt(spec) for scenario_type, spec in _SCENARIOS.items()})
+_MINIMIZED_PROMPTS = {name: _minimize(prompt) for name, prompt in _PROMPTS.items()}
+
+# 턴별 생성 프롬프트용 배경 스토리와 상점 설명 (7턴 전체 응답 형식 안내 이전 부분)
+_BACKGROUNDS = {
+    scenario_type: _normalize(spec["story"].split("## 🎮")[0])
+    for scenario_type, spec in _SCENARIOS.items()
+}
+
+
+def _use_minimized(minimized):
+    return get_model_settings()["minimized_prompts"] if minimized is None else minimized
+
+
+def get_prompt(name, minimized=None):
     """
-    시스템 프롬프트를 반환합니다.
+    레지스트리에서 조립된 프롬프트를 반환합니다.
     
+    Args:
+        name (str): 프롬프트 이름 ("system" 또는 시나리오 타입)
+        minimized (bool, optional): 최소화 버전 사용 여부. 지정하지 않으면 설정값을 사용합니다.
+        
     Returns:
-        str: 시스템 프롬프트
+        str: 프롬프트
+        
+    Raises:
+        KeyError: 등록되지 않은 프롬프트 이름인 경우
     """
-    return """당신은 10세 이하 아동을 위한 교육용 게임 콘텐츠 제작 전문가입니다. 아이들이 이해하기 쉬운 언어와 친숙한 표현으로 돈과 투자의 기본 개념을 알려주는 것이 목표입니다.
-중요: 응답은 반드시 유효한 JSON 형식이어야 합니다. 다른 설명 없이 순수한 JSON 데이터만 반환하세요.
-마크다운 코드 블록이나 다른 형식 없이 JSON 데이터만 반환하세요."""
+    prompts = _MINIMIZED_PROMPTS if _use_minimized(minimized) else _PROMPTS
+    return prompts[name]
+
 
-def get_game_scenario_prompt(scenario_type: str = "magic_kingdom"):
+def list_prompts():
     """
-    선택된 시나리오 타입에 따른 게임 시나리오 생성 프롬프트를 반환합니다.
+    등록된 프롬프트 이름 목록을 반환합니다.
+    
+    Returns:
+        list: 프롬프트 이름 목록
+    """
+    return list(_PROMPTS)
+
+
+def estimate_tokens(text):
+    """
+    텍스트의 토큰 수를 추정합니다. (실제 토크나이저 없이 비교용으로 쓰는 근사치)
     
     Args:
-        scenario_type (str): 시나리오 타입 ("magic_kingdom", "foodtruck_kingdom", "moonlight_thief", 또는 "three_little_pigs")
+        text (str): 토큰 수를 셀 텍스트
         
     Returns:
-        str: 게임 시나리오 프롬프트
+        int: 추정 토큰 수
     """
-    if scenario_type == "magic_kingdom":
-        return get_game_scenario_prompt1()
-    elif scenario_type == "foodtruck_kingdom":
-        return get_game_scenario_prompt2()
-    elif scenario_type == "moonlight_thief":
-        return get_game_scenario_prompt3()
-    elif scenario_type == "three_little_pigs":
-        return get_game_scenario_prompt4()
-    else:
-        # 기본값으로 마법 왕국 시나리오 반환
-        return get_game_scenario_prompt1()
+    return len(_TOKEN_PATTERN.findall(text))
 
-def get_game_scenario_prompt1():
+
+def get_prompt_token_report(count_tokens=estimate_tokens):
     """
-    게임 시나리오 생성을 위한 프롬프트를 반환합니다. (마법 왕국)
+    프롬프트별 길이와 토큰 수(원본/최소화)를 계산합니다.
     
+    Args:
+        count_tokens (callable, optional): 토큰 수를 세는 함수. 기본값은 `estimate_tokens`이며,
+            정확한 값이 필요하면 `llm.get_num_tokens`를 전달합니다.
+        
     Returns:
-        str: 게임 시나리오 프롬프트
+        list: 프롬프트별 {"name", "chars", "tokens", "minimized_chars", "minimized_tokens"} 목록
     """
-    return """
-            당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "마법 왕국 투자 게임"의 AI 어시스턴트입니다.
-            플레이어는 어린 투자 마법사가 되어 7일(7턴) 동안 마법 왕국의 상점들에 투자하여 마을을 돕는 미션을 수행합니다.
-            이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
-            스토리는 마법 왕국을 배경으로 하며, 친숙한 판타지 요소를 사용합니다.
-            생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
-
-            ## 🎭 게임 배경 스토리
-            마법 왕국의 작은 마을에 오신 것을 환영합니다! 이곳에는 세 개의 특별한 상점이 있어요. 
-            당신은 마을의 어린 투자 마법사가 되어 7일 동안 이 상점들에 마법 코인을 투자하여 마을 사람들을 도와주는 미션을 받았어요! 
-            시작 자금: 100 마법 코인 ✨ (이것은 플레이어의 자금이며, 아래 상점들의 가치와는 별개입니다.)
-
-            ## 🏪 투자 가능한 3개 마법 왕국 상점 (JSON의 'stocks' 항목으로 표현)
-            각 상점의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 시장 상황에 따라 변동됩니다.
-
-            ### 1. 🍞 빵집
-            - **JSON name**: "🍞 빵집"
-            - **JSON risk_level**: "저위험"
-            - **특징**: 마을 사람들이 매일 필요로 하는 빵을 만드는 곳. 안정적이지만 큰 수익은 기대하기 어려움.
-            - **위험도**: ⭐ (낮음)
-            - **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +5% 호재, -1% ~ -3% 악재)
-            - **설명**: "매일 필요한 빵이라 안전하지만, 큰 부자는 되기 어려워요."
-
-            ### 2. 🎪 서커스단
-            - **JSON name**: "🎪 서커스단"
-            - **JSON risk_level**: "중위험"
-            - **특징**: 가끔 마을에 와서 공연하는 유명한 서커스단. 날씨나 시즌, 특별 이벤트에 따라 수익 변동.
-            - **위험도**: ⭐⭐⭐ (보통)
-            - **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 호재, -3% ~ -5% 악재, 특별 상황 시 -5~+10%)
-            - **설명**: "인기가 많으면 대박이지만, 날씨가 안 좋거나 재미없으면 손님이 없어요."
-
-            ### 3. 🔮 마법연구소
-            - **JSON name**: "🔮 마법연구소"
-            - **JSON risk_level**: "고위험"
-            - **특징**: 새로운 마법을 개발하는 신비한 연구소. 대발명 시 큰 수익이지만 실패하거나 부정적 뉴스 발생 시 큰 손실 가능.
-            - **위험도**: ⭐⭐⭐⭐⭐ (높음)
-            - **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +15% 호재, -10% ~ -15% 악재, 특별 상황 시 -20~+30%)
-            - **설명**: "대단한 마법이 성공하면 엄청난 보상이지만, 실패하면 큰일나요!"
-
-            ## 🎮 7턴 게임 시나리오 JSON 응답 형식
-            아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
-            각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
-            아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
-
-            ```json
-            [
-              {
-                "turn_number": 1,
-                "result": "마법 왕국에 오신 것을 환영합니다, 어린 투자 마법사님! 당신의 7일간의 마법 같은 모험이 지금 시작됩니다!",
-                "news": "[1턴의 주요 뉴스 - 예: 내일 왕국 전체에 마법 축제가 열린다는 소문이 있어요!]",
-                "news_tag": "[1턴의 뉴스가 각 상점에 미칠 영향에 대한 아이들이 이해하기 쉬운 힌트 - 예: 축제에는 사람들이 많이 모여 빵도 많이 사 먹고, 서커스도 인기겠지만, 마법연구소는 조용할지도 몰라요!]",
-                "stocks": [
-                  {
-                    "name": "🍞 빵집",
-                    "description": "마을 사람들이 매일 필요로 하는 빵을 만드는 곳",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "저위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 덕분에 빵 판매가 늘어날 것 같아요!]"
-                  },
-                  {
-                    "name": "🎪 서커스단",
-                    "description": "가끔 마을에 와서 공연하는 유명한 서커스단",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "중위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 기간 동안 서커스 인기가 최고일 거예요!]"
-                  },
-                  {
-                    "name": "🔮 마법연구소",
-                    "description": "새로운 마법을 개발하는 신비한 연구소",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "고위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제와 마법 연구는 큰 관련이 없을지도...]"
-                  }
-                ]
-              },
-              {
-                "turn_number": 2,
-                "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '마법 축제 덕분에 빵집은 손님이 많아져 가치가 올랐고(+5%), 서커스단도 대성공을 거뒀지만(+8%), 마법연구소는 예상대로 조용했어요(+1%).']",
-                "news": "[2턴의 주요 뉴스 - 예: 옆 마을에서 전염병이 돌기 시작했다는 무서운 소식이 들려요!]",
-                "news_tag": "[2턴 뉴스의 영향 힌트 - 예: 사람들이 아프면 빵은 더 필요할 수 있지만, 서커스나 마법 연구는 어려워질 수 있어요!]",
-                "stocks": [
-                  {
-                    "name": "🍞 빵집",
-                    "description": "마을 사람들이 매일 필요로 하는 빵을 만드는 곳",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 105]",
-                    "risk_level": "저위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 아픈 사람들에게 빵은 필수품이죠!]"
-                  },
-                  {
-                    "name": "🎪 서커스단",
-                    "description": "가끔 마을에 와서 공연하는 유명한 서커스단",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 108]",
-                    "risk_level": "중위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 전염병이 돌면 서커스 공연은 위험해요!]"
-                  },
-                  {
-                    "name": "🔮 마법연구소",
-                    "description": "새로운 마법을 개발하는 신비한 연구소",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 101]",
-                    "risk_level": "고위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 마법연구소에서 치료 마법을 연구할지도?! 하지만 위험해요!]"
-                  }
-                ]
-              }
-              // ... (이하 7턴까지 동일한 구조로 반복, 각 'description' 필드는 위 예시와 동일하게 유지)
-            ]
-
-            ## 📜 중요한 게임 메커니즘 및 생성 가이드라인
-            1.  **7턴 구성**: 반드시 7개의 턴으로 구성된 JSON 배열을 생성합니다. `turn_number` 키를 사용합니다.
-            2.  **News → Result → Value Change 흐름**:
-                * 현재 턴(N)의 `news`는 다음 턴(N+1)의 `result`에 영향을 미칩니다.
-                * 다음 턴(N+1)의 `result`는 이전 턴(N) 뉴스의 결과를 설명하며, 이 결과에 따라 다음 턴(N+1)의 `current_value`가 변동됩니다.
-                * 첫 턴(`turn_number: 1`)의 `result`는 지정된 환영 메시지입니다. `current_value`는 `before_value`와 동일(100)합니다.
-            3.  **위험과 보상**: 각 상점의 위험도에 따라 성공 시 수익률과 실패 시 손실률이 달라야 합니다. (위에 명시된 수익/손실 범위 참고)
-                * 빵집 (저위험): 작은 성공 또는 작은 실패.
-                * 서커스단 (중위험): 중간 정도의 성공 또는 실패.
-                * 마법연구소 (고위험): 큰 성공 또는 큰 실패.
-            4.  **스토리텔링**: 마법 왕국 배경과 판타지 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 왕의 방문, 용의 출현, 마법 대회, 가뭄, 풍년 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.
-            5.  **교육적 요소**: 게임을 통해 아이들이 위험 관리, 정보의 중요성, 분산 투자의 개념을 자연스럽게 접할 수 있도록 내용을 구성해주세요. (예: 특정 뉴스에 모든 상점이 동일하게 반응하지 않도록, 어떤 상점에는 호재, 다른 상점에는 악재가 될 수 있도록)
-            6.  **일관성**: 상점의 이름, `description`, 위험도 등은 게임 내내 일관되어야 합니다. `description` 필드는 예시에 제공된 내용을 모든 턴에서 동일하게 사용해주세요.
-            7.  **`expectation` 필드**: 현재 턴의 `news`와 `news_hint`를 바탕으로 각 상점의 가격 변동 예상을 "가격이 오를 것 같아요!", "가격이 조금 내릴 수도 있어요.", "큰 변화는 없을 거예요." 등으로 구체적으로 작성합니다.
-            8.  **`result` 필드**: 이전 턴 뉴스의 결과를 서술형으로 작성하고, 각 상점의 가치 변동률(예: +5%, -3%)을 명시하여 `current_value` 계산의 근거를 제공합니다. 아이들이 이해하기 쉽게 "왜 그렇게 되었는지"를 설명해주세요.
-            9.  **긍정적/부정적 이벤트 균형**: 각 상점은 게임 전체에 걸쳐 긍정적 이벤트(호재)와 부정적 이벤트(악재)를 모두 경험해야 합니다. 모든 상점이 항상 수익을 내는 것은 아니며, 위험도에 따라 손실을 볼 수도 있음을 명확히 보여주세요.
-
-            ## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
-            -   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
-            -   **게임만의 특별함**: 친숙한 판타지 세계관, 마법과 경제의 결합, 성취감 제공.
-            -   **마법 왕국만의 독특한 요소**: 상점별 특성 뚜렷, 마법적 이벤트의 경제적 영향, 동화 같은 분위기.
-
-            ## ✅ 최종 검증 사항 (생성 후 반드시 확인)
-            -   **전체 7턴 생성**: JSON 배열이 정확히 7개의 턴 객체를 포함하는지 확인합니다. (`turn_number` 키 사용)
-            -   **첫 턴 규칙 준수**: 첫 턴의 `result`가 지정된 환영 메시지이고, 모든 상점의 `current_value`가 `before_value`(100)와 동일한지 확인합니다.
-            -   **News → Result → Value 흐름 일치**: 각 턴의 `news`가 다음 턴의 `result`에 논리적으로 반영되고, 이 `result`에 따라 `current_value`가 올바르게 변동되었는지 확인합니다.
-            -   **상점 정보 일관성**: 3개의 상점("빵집", "서커스단", "마법연구소")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.
-            -   **수익/손실 범위 및 균형**: 각 상점의 `current_value` 변동이 해당 상점의 위험도에 따른 수익/손실 범위 내에서 이루어지는지, 그리고 게임 전체에 걸쳐 호재와 악재가 균형 있게 발생하는지 확인합니다. 모든 상점이 항상 이익을 보지 않도록 주의합니다.
-            -   **아이들 눈높이**: 모든 텍스트(특히 `news`, `news_hint`, `result`, `expectation`)가 10세 아동이 이해하기 쉽고 재미있게 작성되었는지 확인합니다.
-            -   **JSON 유효성**: 전체 응답이 유효한 JSON 형식인지 확인합니다. (쉼표, 따옴표, 괄호 등)
-            """
+    return [
+        {
+            "name": name,
+            "chars": len(_PROMPTS[name]),
+            "tokens": count_tokens(_PROMPTS[name]),
+            "minimized_chars": len(_MINIMIZED_PROMPTS[name]),
+            "minimized_tokens": count_tokens(_MINIMIZED_PROMPTS[name]),
+        }
+        for name in _PROMPTS
+    ]
 
-def get_game_scenario_prompt2():
+
+def get_system_prompt(minimized=None):
+    """
+    시스템 프롬프트를 반환합니다.
+    
+    Args:
+        minimized (bool, optional): 최소화 버전 사용 여부. 지정하지 않으면 설정값을 사용합니다.
+        
+    Returns:
+        str: 시스템 프롬프트
+    """
+    return get_prompt("system", minimized)
+
+def get_game_scenario_prompt(scenario_type: str = DEFAULT_SCENARIO_TYPE, minimized=None):
     """
-    게임 시나리오 생성을 위한 프롬프트를 반환합니다. (푸드트럭 왕국)
+    선택된 시나리오 타입에 따른 게임 시나리오 생성 프롬프트를 반환합니다.
     
+    Args:
+        scenario_type (str): 시나리오 타입 ("magic_kingdom", "foodtruck_kingdom", "moonlight_thief", 또는 "three_little_pigs")
+        minimized (bool, optional): 최소화 버전 사용 여부. 지정하지 않으면 설정값을 사용합니다.
+        
     Returns:
         str: 게임 시나리오 프롬프트
     """
-    return """
-            당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "푸드트럭 왕국 투자 게임"의 AI 어시스턴트입니다.
-            플레이어는 젊은 투자 요리사가 되어 7일(7턴) 동안 푸드트럭 왕국의 트럭들에 투자하여 사람들을 행복하게 만드는 미션을 수행합니다.
-            이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
-            스토리는 푸드트럭 왕국을 배경으로 하며, 맛있는 음식과 관련된 요소를 사용합니다.
-            생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
-
-            ## 🎭 게임 배경 스토리
-            요리의 나라 '푸드트럭 왕국'에 오신 것을 환영합니다! 이곳에는 특별한 세 개의 푸드트럭이 있어요. 
-            당신은 젊은 투자 요리사가 되어 7일 동안 이 푸드트럭들에 미식 코인을 투자해서 맛있는 음식으로 사람들을 행복하게 만드는 미션을 받았습니다! 
-            시작 자금: 100 미식 코인 🍲 (이것은 플레이어의 자금이며, 아래 트럭들의 가치와는 별개입니다.)
-
-            ## 🚚 투자 가능한 3개 푸드트럭 (JSON의 'stocks' 항목으로 표현)
-            각 트럭의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 시장 상황에 따라 변동됩니다.
-
-            ### 1. 🥪 샌드위치 트럭
-            - **JSON name**: "🥪 샌드위치 트럭"
-            - **JSON risk_level**: "저위험"
-            - **특징**: 언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭. 안정적이지만 큰 수익은 기대하기 어려움.
-            - **위험도**: ⭐ (낮음)
-            - **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +5% 호재, -1% ~ -3% 악재)
-            - **설명**: "매일 필요한 샌드위치라 안전하지만, 큰 부자는 되기 어려워요."
-
-            ### 2. 🍦 아이스크림 트럭
-            - **JSON name**: "🍦 아이스크림 트럭"
-            - **JSON risk_level**: "중위험"
-            - **특징**: 시원하고 달콤한 아이스크림을 파는 인기 푸드트럭. 날씨나 계절, 특별 이벤트에 따라 수익 변동.
-            - **위험도**: ⭐⭐⭐ (보통)
-            - **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 호재, -3% ~ -5% 악재, 특별 상황 시 -5~+10%)
-            - **설명**: "날씨가 좋으면 대박이지만, 비가 오거나 추우면 손님이 없어요."
-
-            ### 3. 🌮 퓨전 타코 트럭
-            - **JSON name**: "퓨전 타코 트럭"
-            - **JSON risk_level**: "고위험"
-            - **특징**: 새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭. 신메뉴 성공 시 큰 수익이지만 실패하거나 부정적 뉴스 발생 시 큰 손실 가능.
-            - **위험도**: ⭐⭐⭐⭐⭐ (높음)
-            - **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +15% 호재, -10% ~ -15% 악재, 특별 상황 시 -20~+30%)
-            - **설명**: "새로운 맛이 대성공하면 엄청난 인기지만, 실패하면 아무도 안 찾아요!"
-
-            ## 🎮 7턴 게임 시나리오 JSON 응답 형식
-            아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
-            각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
-            아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
-            
-            ```json
-            [
-              {
-                "turn_number": 1,
-                "result": "푸드트럭 왕국에 오신 것을 환영합니다, 젊은 투자 요리사님! 당신의 7일간의 맛있는 모험이 지금 시작됩니다!",
-                "news": "[1턴의 주요 뉴스 - 예: 내일 푸드트럭 왕국에서 대규모 음식 축제가 열린대요!]",
-                "news_tag": "[1턴의 뉴스가 각 트럭에 미칠 영향에 대한 아이들이 이해하기 쉬운 힌트 - 예: 축제에는 사람들이 많이 모여 모든 트럭이 인기겠지만, 특히 아이스크림은 날씨가 더우면 최고일 거예요!]",
-                "stocks": [
-                  {
-                    "name": "🥪 샌드위치 트럭",
-                    "description": "언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "저위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 덕분에 샌드위치 판매가 늘어날 것 같아요!]"
-                  },
-                  {
-                    "name": "🍦 아이스크림 트럭",
-                    "description": "시원하고 달콤한 아이스크림을 파는 인기 푸드트럭",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "중위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제 기간, 특히 더운 날엔 아이스크림 인기가 폭발할 거예요!]"
-                  },
-                  {
-                    "name": "🌮 퓨전 타코 트럭",
-                    "description": "새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭",
-                    "before_value": 100,
-                    "current_value": 100,
-                    "risk_level": "고위험",
-                    "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 축제에서 특별한 타코를 선보이면 대박날지도 몰라요!]"
-                  }
-                ]
-              },
-              {
-                "turn_number": 2,
-                "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '음식 축제 덕분에 샌드위치 트럭은 손님이 많아져 가치가 올랐고(+4%), 아이스크림 트럭도 날씨가 더워 대성공을 거뒀지만(+7%), 퓨전 타코 트럭은 준비한 재료가 일찍 떨어져 아쉬웠어요(+2%).']",
-                "news": "[2턴의 주요 뉴스 - 예: 유명한 음식 평론가가 비밀리에 왕국을 방문했다는 소문이 있어요!]",
-                "news_tag": "[2턴 뉴스의 영향 힌트 - 예: 평론가가 어떤 트럭을 좋아할지는 아무도 몰라요! 칭찬하면 대박, 혹평하면 쪽박!]",
-                "stocks": [
-                  {
-                    "name": "🥪 샌드위치 트럭",
-                    "description": "언제나 필요한 기본 식사를 제공하는 든든한 푸드트럭",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 104]",
-                    "risk_level": "저위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 평론가도 든든한 샌드위치는 좋아할 거예요.]"
-                  },
-                  {
-                    "name": "🍦 아이스크림 트럭",
-                    "description": "시원하고 달콤한 아이스크림을 파는 인기 푸드트럭",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 107]",
-                    "risk_level": "중위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 특별한 아이스크림이 평론가의 입맛을 사로잡을 수 있을까요?]"
-                  },
-                  {
-                    "name": "🌮 퓨전 타코 트럭",
-                    "description": "새롭고 독특한 퓨전 요리에 도전하는 모험적인 푸드트럭",
-                    "before_value": 100,
-                    "current_value": "[1턴 결과가 반영된 값, 예: 102]",
-                    "risk_level": "고위험",
-                    "expectation": "[2턴 뉴스 기반 예상 - 예: 퓨전 타코는 평론가에게 모험일 거예요! 대성공 아니면 큰 실패!]"
-                  }
-                ]
-              }
-              // ... (이하 7턴까지 동일한 구조로 반복, 각 'description' 필드는 위 예시와 동일하게 유지)
-            ]
-
-            ## 📜 중요한 게임 메커니즘 및 생성 가이드라인
-            1.  **7턴 구성**: 반드시 7개의 턴으로 구성된 JSON 배열을 생성합니다. `turn_number` 키를 사용합니다.
-            2.  **News → Result → Value Change 흐름**:
-                * 현재 턴(N)의 `news`는 다음 턴(N+1)의 `result`에 영향을 미칩니다.
-                * 다음 턴(N+1)의 `result`는 이전 턴(N) 뉴스의 결과를 설명하며, 이 결과에 따라 다음 턴(N+1)의 `current_value`가 변동됩니다.
-                * 첫 턴(`turn_number: 1`)의 `result`는 지정된 환영 메시지입니다. `current_value`는 `before_value`와 동일(100)합니다.
-            3.  **위험과 보상**: 각 트럭의 위험도에 따라 성공 시 수익률과 실패 시 손실률이 달라야 합니다. (위에 명시된 수익/손실 범위 참고)
-                * 샌드위치 트럭 (저위험): 작은 성공 또는 작은 실패.
-                * 아이스크림 트럭 (중위험): 중간 정도의 성공 또는 실패.
-                * 퓨전 타코 트럭 (고위험): 큰 성공 또는 큰 실패.
-            4.  **스토리텔링**: 푸드트럭 왕국 배경과 음식 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 음식 축제, 유명 평론가 방문, 신선한 재료 발견, 폭염, 장마 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.
-            5.  **교육적 요소**: 게임을 통해 아이들이 위험 관리, 정보의 중요성, 분산 투자의 개념을 자연스럽게 접할 수 있도록 내용을 구성해주세요. (예: 특정 뉴스에 모든 트럭이 동일하게 반응하지 않도록, 어떤 트럭에는 호재, 다른 트럭에는 악재가 될 수 있도록)
-            6.  **일관성**: 트럭의 이름, `description`, 위험도 등은 게임 내내 일관되어야 합니다. `description` 필드는 예시에 제공된 내용을 모든 턴에서 동일하게 사용해주세요.
-            7.  **`expectation` 필드**: 현재 턴의 `news`와 `news_hint`를 바탕으로 각 트럭의 가격 변동 예상을 "가격이 오를 것 같아요!", "가격이 조금 내릴 수도 있어요.", "큰 변화는 없을 거예요." 등으로 구체적으로 작성합니다.
-            8.  **`result` 필드**: 이전 턴 뉴스의 결과를 서술형으로 작성하고, 각 트럭의 가치 변동률(예: +5%, -3%)을 명시하여 `current_value` 계산의 근거를 제공합니다. 아이들이 이해하기 쉽게 "왜 그렇게 되었는지"를 설명해주세요.
-            9.  **긍정적/부정적 이벤트 균형**: 각 트럭은 게임 전체에 걸쳐 긍정적 이벤트(호재)와 부정적 이벤트(악재)를 모두 경험해야 합니다. 모든 트럭이 항상 수익을 내는 것은 아니며, 위험도에 따라 손실을 볼 수도 있음을 명확히 보여주세요.
-
-            ## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
-            -   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
-            -   **게임만의 특별함**: 친숙한 음식 세계관, 요리와 경제의 결합, 성취감 제공.
-            -   **푸드트럭 왕국만의 독특한 요소**: 트럭별 특성 뚜렷, 음식 관련 이벤트의 경제적 영향, 맛있는 분위기.
-
-            ## ✅ 최종 검증 사항 (생성 후 반드시 확인)
-            -   **전체 7턴 생성**: JSON 배열이 정확히 7개의 턴 객체를 포함하는지 확인합니다. (`turn_number` 키 사용)
-            -   **첫 턴 규칙 준수**: 첫 턴의 `result`가 지정된 환영 메시지이고, 모든 트럭의 `current_value`가 `before_value`(100)와 동일한지 확인합니다.
-            -   **News → Result → Value 흐름 일치**: 각 턴의 `news`가 다음 턴의 `result`에 논리적으로 반영되고, 이 `result`에 따라 `current_value`가 올바르게 변동되었는지 확인합니다.
-            -   **트럭 정보 일관성**: 3개의 트럭("샌드위치 트럭", "아이스크림 트럭", "퓨전 타코 트럭")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.
-            -   **수익/손실 범위 및 균형**: 각 트럭의 `current_value` 변동이 해당 트럭의 위험도에 따른 수익/손실 범위 내에서 이루어지는지, 그리고 게임 전체에 걸쳐 호재와 악재가 균형 있게 발생하는지 확인합니다. 모든 트럭이 항상 이익을 보지 않도록 주의합니다.
-            -   **아이들 눈높이**: 모든 텍스트(특히 `news`, `news_tag`, `result`, `expectation`)가 10세 아동이 이해하기 쉽고 재미있게 작성되었는지 확인합니다.
-            -   **JSON 유효성**: 전체 응답이 유효한 JSON 형식인지 확인합니다. (쉼표, 따옴표, 괄호 등)
-            """
+    if scenario_type not in _SCENARIOS:
+        # 기본값으로 마법 왕국 시나리오 반환
+        scenario_type = DEFAULT_SCENARIO_TYPE
+    return get_prompt(scenario_type, minimized)
 
-def get_game_scenario_prompt3():
+def get_scenario_background(scenario_type: str):
     """
-    달빛 도둑 시나리오 게임 프롬프트를 반환합니다. (10세 아동 대상, 7턴)
+    시나리오의 배경 스토리와 상점 설명을 반환합니다. (턴별 생성에서 모든 턴이 공유하는 정적 부분)
     
+    Args:
+        scenario_type (str): 시나리오 타입
+        
     Returns:
-        str: 달빛 도둑 시나리오 게임 프롬프트
+        str: 배경 스토리와 상점 설명
     """
-    return """
-    당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "달빛 도둑 투자 게임"의 AI 어시스턴트입니다.
-    플레이어는 견습 달빛 도둑이 되어 7일(7턴) 동안 신비로운 달빛 보물 작전에 투자하여 최고의 달빛 도둑이 되는 미션을 수행합니다.
-    이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
-    스토리는 은월 왕국을 배경으로 하며, 달빛이라는 아름다운 소재를 사용합니다.
-    생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
-
-    ## 🎭 게임 배경 스토리
-    달빛이 가장 아름다운 은월 왕국에 온 것을 환영합니다! 이곳에는 전설적인 달빛 도둑 길드가 있어요. 
-    당신은 견습 달빛 도둑이 되어 7일 동안 신비로운 달빛 보물들을 훔치는 작전에 투자하여 최고의 달빛 도둑이 되는 미션을 받았습니다! 
-    하지만 조심해야 해요 - 위험할수록 더 큰 보상이 기다리고 있답니다.
-    시작 자금: 100 달빛 코인 🌙 (이것은 플레이어의 자금이며, 아래 작전들의 가치와는 별개입니다.)
-
-    ## 💎 투자 가능한 3개 달빛 보물 작전 (JSON의 'stocks' 항목으로 표현)
-    각 작전의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 작전의 성공에 따라 변동됩니다.
-
-    ### 1. ✨ 달빛 가루 수집 작전
-    - **JSON name**: "✨ 달빛 가루 수집 작전"
-    - **JSON description**: "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!"
-    - **JSON risk_level**: "저위험"
-    - **특징**: 가볍고 숨기기 쉬운 달빛 가루를 모으기. 작고 가벼워서 들키기 어렵고, 매일 조금씩 모을 수 있음.
-    - **위험도**: ⭐ (낮음)
-    - **수익/손실 범위**: 작지만 꾸준함 (예: +1% ~ +5% 성공, -0% ~ -2% 실패)
-
-    ### 2. 🌙 달조각 목걸이 훔치기 작전
-    - **JSON name**: "🌙 달조각 목걸이 훔치기 작전"
-    - **JSON description**: "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요"
-    - **JSON risk_level**: "중위험"
-    - **특징**: 은은한 빛이 나는 중간 크기의 달조각 목걸이. 귀족들이 가끔 착용하는 보석으로 적당한 가치와 위험.
-    - **위험도**: ⭐⭐⭐ (보통)
-    - **수익/손실 범위**: 중간 정도의 변동 (예: +3% ~ +8% 성공, -1% ~ -5% 실패)
-
-    ### 3. 🛡️ 달빛 방패 강탈 작전
-    - **JSON name**: "🛡️ 달빛 방패 강탈 작전"
-    - **JSON description**: "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!"
-    - **JSON risk_level**: "고위험"
-    - **특징**: 크고 반짝이는 전설의 달빛 방패. 왕궁에 보관된 최고급 보물로 엄청난 가치이지만 매우 위험.
-    - **위험도**: ⭐⭐⭐⭐⭐ (높음)
-    - **수익/손실 범위**: 큰 폭으로 변동 (예: +8% ~ +15% 성공, -5% ~ -12% 실패)
-
-    ## 🎮 7턴 게임 시나리오 JSON 응답 형식
-    아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
-    각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
-    사용자 제공 예시(보름달, 연회, 구름, 탐지기, 마술사, 축제, 현상금 사냥꾼, 부자 상인, 도둑 대회 등)를 참고하여 흥미로운 7턴의 스토리를 구성해주세요.
-    아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
-
-    ```json
-    [
-      {
-        "turn_number": 1,
-        "result": "게임 시작! 견습 달빛 도둑이 되어 신비로운 은월 왕국의 모험을 시작해요.",
-        "news": "[1턴의 주요 뉴스 - 예: 오늘 밤은 보름달이라서 달빛이 특히 밝아요! 모든 달빛 보물들이 더 반짝일 거라는 소문이 돌고 있어요.]",
-        "news_tag": "[뉴스가 어떤 작전에게 주로 영향을 주는지 - 'all'(모든 작전), 'high'(고위험), 'mid'(중위험), 'low'(저위험), 또는 빈 문자열]",
-        "stocks": [
-          {
-            "name": "✨ 달빛 가루 수집 작전",
-            "description": "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!",
-            "before_value": 100,
-            "current_value": 100,
-            "risk_level": "저위험",
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 보름달 덕분에 달빛 가루가 더 반짝일 거예요!]"
-          },
-          {
-            "name": "🌙 달조각 목걸이 훔치기 작전",
-            "description": "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요",
-            "before_value": 100,
-            "current_value": 100,
-            "risk_level": "중위험",
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 밝은 달빛 때문에 목걸이가 더 예쁘지만 들킬 수도 있어요!]"
-          },
-          {
-            "name": "🛡️ 달빛 방패 강탈 작전",
-            "description": "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!",
-            "before_value": 100,
-            "current_value": 100,
-            "risk_level": "고위험",
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 보름달이 방패를 더 밝게 비춰서 훔치기 어려울 수도 있어요!]"
-          }
-        ]
-      },
-      {
-        "turn_number": 2,
-        "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '보름달 덕분에 모든 달빛 보물들이 더 반짝여서 가치가 올랐어요!']",
-        "news": "[2턴의 주요 뉴스 - 예: 왕궁에서 큰 연회가 열려서 경비병들이 모두 연회장으로 갔어요! 지금이 보물을 훔칠 절호의 기회라는 소문이 돌아요.]",
-        "news_tag": "[뉴스가 어떤 작전에게 주로 영향을 주는지]",
-        "stocks": [
-          {
-            "name": "✨ 달빛 가루 수집 작전",
-            "description": "작지만 매일 모을 수 있어서 안전해요! 들킬 위험이 거의 없어요!",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 102]",
-            "risk_level": "저위험",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 더 많은 달빛 가루를 모을 수 있을 거예요!]"
-          },
-          {
-            "name": "🌙 달조각 목걸이 훔치기 작전",
-            "description": "예쁘고 값어치 있지만, 가끔 경비병에게 들킬 수도 있어요",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 104]",
-            "risk_level": "중위험",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 목걸이를 훔치기 좋은 기회예요!]"
-          },
-          {
-            "name": "🛡️ 달빛 방패 강탈 작전",
-            "description": "성공하면 엄청난 부자가 되지만, 실패하면 감옥에 갈 수도 있어요!",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 98]",
-            "risk_level": "고위험",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 경비병이 없어서 달빛 방패를 훔치기 가장 좋은 기회예요!]"
-          }
-        ]
-      }
-      // ... (이하 7턴까지 동일한 구조로 반복, 각 작전의 'description' 필드는 위에 명시된 내용과 동일하게 유지)
-    ]
+    return _BACKGROUNDS.get(scenario_type, _BACKGROUNDS[DEFAULT_SCENARIO_TYPE])
 
-    ## 📜 중요한 게임 메커니즘 및 생성 가이드라인
-    1.  **7턴 구성**: 반드시 7개의 턴으로 구성된 JSON 배열을 생성합니다. `turn_number` 키를 사용합니다.
-    2.  **News → Result → Value Change 흐름**:
-        -   각 턴의 `news`는 다음 턴의 `result`에 반영되어야 합니다.
-        -   `result`의 실제 결과에 따라 `current_value`가 논리적으로 변동되어야 합니다.
-        -   첫 턴(`turn_number: 1`)의 `result`는 지정된 환영 메시지입니다. `current_value`는 `before_value`와 동일(100)합니다.
-    3.  **투자 작전별 특성 반영**: 각 작전의 위험도와 특성에 맞는 `current_value` 변동폭을 적용해주세요.
-    4.  **스토리텔링**: 달빛 도둑과 은월 왕국 배경을 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 보름달, 연회, 구름, 탐지기, 마술사, 축제, 현상금 사냥꾼, 부자 상인, 도둑 대회 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.
-    5.  **교육적 목적**: 위험과 수익의 관계, 신중한 계획의 중요성, 안전성의 가치 등을 아이들이 자연스럽게 배울 수 있도록 스토리를 구성해주세요.
-    6.  **긍정적 마무리**: 게임의 마지막 턴에서는 모든 작전이 각자의 방식으로 성공할 수 있도록 희망적인 메시지를 전달해주세요.
-    7.  **뉴스 태그 활용**: `news_tag`를 통해 어떤 작전에게 뉴스가 주로 영향을 주는지 명확히 표시해주세요.
-    8.  **Expectation 필드**: 다음 턴에 대한 예상을 아이들이 쉽게 이해할 수 있도록 작성해주세요.
-    9.  **긍정적/부정적 이벤트 균형**: 각 작전은 게임 전체에 걸쳐 긍정적 이벤트(호재)와 부정적 이벤트(악재)를 모두 경험해야 합니다. 모든 작전이 항상 수익을 내는 것은 아니며, 위험도에 따라 손실을 볼 수도 있음을 명확히 보여주세요.
-
-    ## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
-    -   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
-    -   **달빛 도둑만의 교육적 가치**: 
-        -   신중한 계획과 정보 수집의 중요성 (달빛 가루 수집 작전의 안전성)
-        -   적당한 위험과 수익의 균형 (달조각 목걸이 작전의 중위험)
-        -   큰 보상을 위한 큰 위험 감수 (달빛 방패 작전의 고위험)
-    -   **게임만의 특별함**: 친숙한 도둑 모험 세계관, 달빛과 보물의 결합, 성취감 제공.
-    -   **달빛 도둑만의 독특한 요소**: 작전별 명확한 위험도, 보물=투자 대상 비유, 모험과 신중함의 균형.
-
-    ## ✅ 최종 검증 사항 (생성 후 반드시 확인)
-    -   **전체 7턴 생성**: JSON 배열이 정확히 7개의 턴 객체를 포함하는지 확인합니다. (`turn_number` 키 사용)
-    -   **첫 턴 규칙 준수**: 첫 턴의 `result`가 지정된 환영 메시지이고, 모든 작전의 `current_value`가 `before_value`(100)와 동일한지 확인합니다.
-    -   **News → Result → Value 흐름 일치**: 각 턴의 `news`가 다음 턴의 `result`에 논리적으로 반영되고, 이 `result`에 따라 `current_value`가 올바르게 변동되었는지 확인합니다.
-    -   **작전 정보 일관성**: 3개의 작전("달빛 가루 수집 작전", "달조각 목걸이 훔치기 작전", "달빛 방패 강탈 작전")이 정확한 이름, `description`, `risk_level`("저위험", "중위험", "고위험")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.
-    -   **수익/손실 범위 및 균형**: 각 작전의 `current_value` 변동이 해당 작전의 위험도에 따른 수익/손실 범위 내에서 이루어지는지, 그리고 게임 전체에 걸쳐 호재와 악재가 균형 있게 발생하는지 확인합니다. 모든 작전이 항상 이익을 보지 않도록 주의합니다.
-    -   **아이들 눈높이**: 모든 텍스트(특히 `news`, `news_tag`, `result`, `expectation`)가 10세 아동이 이해하기 쉽고 재미있게 작성되었는지 확인합니다.
-    -   **JSON 유효성**: 전체 응답이 유효한 JSON 형식인지 확인합니다. (쉼표, 따옴표, 괄호 등)
+def get_turn_scenario_prompt(scenario_type: str, turn_number: int, previous_turns: list, total_turns: int = 7):
+    """
+    턴별 생성 모드에서 한 턴만 생성하기 위한 프롬프트를 반환합니다.
+    
+    시나리오 프롬프트의 배경 스토리와 상점 설명은 그대로 사용하고, 이전 턴들은
+    뉴스와 가격만 담은 요약으로 전달하여 요청을 작게 유지합니다.
+    
+    Args:
+        scenario_type (str): 시나리오 타입
+        turn_number (int): 생성할 턴 번호 (1부터 시작)
+        previous_turns (list): 이미 생성된 이전 턴 데이터
+        total_turns (int, optional): 전체 턴 수. 기본값은 7
+        
+    Returns:
+        str: 턴 생성 프롬프트
     """
+    return (get_scenario_background(scenario_type) + "\n\n"
+            + get_turn_request_prompt(turn_number, previous_turns, total_turns))
 
-def get_game_scenario_prompt4():
+def get_turn_request_prompt(turn_number: int, previous_turns: list, total_turns: int = 7):
     """
-    아기돼지 삼형제 시나리오 게임 프롬프트를 반환합니다. (10세 아동 대상, 7턴)
+    턴 생성 프롬프트 중 턴마다 달라지는 요청 부분(생성 가이드라인, 이전 턴 요약)을 반환합니다.
     
+    Args:
+        turn_number (int): 생성할 턴 번호 (1부터 시작)
+        previous_turns (list): 이미 생성된 이전 턴 데이터
+        total_turns (int, optional): 전체 턴 수. 기본값은 7
+        
     Returns:
-        str: 아기돼지 삼형제 시나리오 게임 프롬프트
+        str: 턴 요청 프롬프트
     """
-    return """
-    당신은 10세 이하 아동을 위한 주식 투자 학습 스토리텔링 게임 "아기돼지 삼형제 투자 게임"의 AI 어시스턴트입니다.
-    플레이어는 아기돼지 삼형제의 투자 고문이 되어 7일(7턴) 동안 세 마리 돼지의 집 짓기 프로젝트에 투자하여 최고의 집을 완성하는 미션을 수행합니다.
-    이 게임은 아이들이 위험과 보상, 정보 활용, 분산 투자의 개념을 재미있게 배우도록 돕는 것을 목표로 합니다.
-    스토리는 아기돼지 삼형제 동화를 배경으로 하며, 친숙한 캐릭터들을 사용합니다.
-    생성되는 모든 텍스트는 10세 아동이 이해하기 쉽고 흥미를 느낄 수 있도록 작성해주세요.
-
-    ## 🎭 게임 배경 스토리
-    아기돼지 삼형제가 사는 마을에 온 것을 환영합니다! 세 마리 돼지는 각각 다른 방식으로 집을 짓고 있어요. 
-    당신은 돼지 삼형제의 투자 고문이 되어 7일 동안 각 돼지의 집 짓기 프로젝트에 투자하여 가장 좋은 집을 완성하도록 도와주는 미션을 받았습니다! 
-    각 돼지는 서로 다른 전략을 가지고 있어서, 위험과 보상이 달라요.
-    시작 자금: 100 건설 코인 🏠 (이것은 플레이어의 자금이며, 아래 돼지들의 가치와는 별개입니다.)
-
-    ## 🐷 투자 가능한 3마리 아기돼지 (JSON의 'stocks' 항목으로 표현)
-    각 돼지의 첫 'before_value'와 'current_value'는 100으로 시작하며, 이후 'current_value'는 집 짓기 진행 상황에 따라 변동됩니다.
-
-    ### 1. 🌾 첫째 돼지 (지푸라기 집)
-    - **JSON name**: "🌾 첫째 돼지"
-    - **JSON description**: "지푸라기로 집을 가장 빠르게 짓습니다."
-    - **JSON risk_level**: "고위험 고수익"
-    - **특징**: 지푸라기로 빠르게 집을 짓는 전략. 빨리 완성되지만 튼튼하지 않아서 위험함.
-    - **위험도**: ⭐⭐⭐⭐⭐ (높음)
-    - **수익/손실 범위**: 큰 폭으로 변동 (예: +10% ~ +20% 성공, -5% ~ -15% 실패)
-
-    ### 2. 🪵 둘째 돼지 (나무 집)
-    - **JSON name**: "🪵 둘째 돼지"
-    - **JSON description**: "나무로 적당히 빠르고 튼튼하게 집을 짓습니다."
-    - **JSON risk_level**: "중위험 균형형"
-    - **특징**: 나무로 적당한 속도와 튼튼함을 갖춘 집을 짓는 전략. 균형 잡힌 접근법.
-    - **위험도**: ⭐⭐⭐ (보통)
-    - **수익/손실 범위**: 중간 정도의 변동 (예: +5% ~ +10% 성공, -3% ~ -7% 실패)
-
-    ### 3. 🧱 셋째 돼지 (벽돌 집)
-    - **JSON name**: "셋째 돼지"
-    - **JSON description**: "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다."
-    - **JSON risk_level**: "저위험 저수익"
-    - **특징**: 벽돌로 천천히 하지만 가장 튼튼한 집을 짓는 전략. 안전하지만 완성이 늦음.
-    - **위험도**: ⭐ (낮음)
-    - **수익/손실 범위**: 작지만 꾸준함 (예: +2% ~ +6% 성공, -1% ~ -3% 실패)
-
-    ## 🎮 7턴 게임 시나리오 JSON 응답 형식
-    아래 형식을 따라 **총 7턴으로 구성된 게임 시나리오 전체를 단일 JSON 배열 형식으로 반환**해주세요.
-    각 턴의 내용은 다음 턴의 'result'와 'current_value'에 논리적으로 연결되어야 합니다.
-    아이들이 이해하기 쉽도록 각 필드의 내용을 작성해주세요.
-
-    ```json
-    [
-      {
-        "turn_number": 1,
-        "result": "아기돼지 삼형제 마을에 오신 것을 환영합니다! 세 마리 돼지가 모두 집 짓기를 시작했어요. 당신의 7일간의 투자 모험이 지금 시작됩니다!",
-        "news": "[1턴의 주요 뉴스 - 예: 요정 할머니가 마을에 나타나, 모든 집을 더 튼튼하게 만들어줄 마법을 걸어줄 수도 있다는 소문이 돌아요!]",
-        "news_tag": "[뉴스가 어떤 돼지에게 주로 영향을 주는지 - 'all'(모든 돼지), 'high'(고위험), 'mid'(중위험), 'low'(저위험), 또는 빈 문자열]",
-        "stocks": [
-          {
-            "name": "🌾 첫째 돼지",
-            "risk_level": "고위험 고수익",
-            "description": "지푸라기로 집을 가장 빠르게 짓습니다.",
-            "before_value": 100,
-            "current_value": 100,
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
-          },
-          {
-            "name": "🪵 둘째 돼지",
-            "risk_level": "중위험 균형형",
-            "description": "나무로 적당히 빠르고 튼튼하게 집을 짓습니다.",
-            "before_value": 100,
-            "current_value": 100,
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
-          },
-          {
-            "name": "🧱 셋째 돼지",
-            "risk_level": "저위험 저수익",
-            "description": "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다.",
-            "before_value": 100,
-            "current_value": 100,
-            "expectation": "[1턴 뉴스 기반의 다음 턴 예상 - 예: 집이 더 튼튼해지고 빨리 지어질 거예요!]"
-          }
-        ]
-      },
-      {
-        "turn_number": 2,
-        "result": "[1턴 뉴스의 실제 결과와 그 이유를 아이들이 이해하기 쉽게 설명. 예: '요정 할머니가 나타나 마법을 걸어주어 모든 돼지 삼형제의 집이 더 튼튼해졌어요!']",
-        "news": "[2턴의 주요 뉴스 - 예: 첫째 돼지의 지푸라기 집 주변에 지푸라기를 갉아먹는 작은 벌레들이 많이 보였다는 소문이 돌아요!]",
-        "news_tag": "[뉴스가 어떤 돼지에게 주로 영향을 주는지]",
-        "stocks": [
-          {
-            "name": "🌾 첫째 돼지",
-            "risk_level": "고위험 고수익",
-            "description": "지푸라기로 집을 가장 빠르게 짓습니다.",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 115]",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 집이 약해지거나 다시 지어야 할 수도 있어요.]"
-          },
-          {
-            "name": "🪵 둘째 돼지",
-            "risk_level": "중위험 균형형",
-            "description": "나무로 적당히 빠르고 튼튼하게 집을 짓습니다.",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 107]",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 이 소식은 나무집에는 아무런 영향을 주지 않을 거예요.]"
-          },
-          {
-            "name": "🧱 셋째 돼지",
-            "risk_level": "저위험 저수익",
-            "description": "벽돌로 가장 천천히, 가장 튼튼하게 집을 짓습니다.",
-            "before_value": 100,
-            "current_value": "[1턴 결과가 반영된 값, 예: 103]",
-            "expectation": "[2턴 뉴스 기반 예상 - 예: 이 소식은 벽돌집에는 아무런 영향을 주지 않을 거예요.]"
-          }
-        ]
-      }
-      // ... (이하 7턴까지 동일한 구조로 반복, 각 돼지의 'description' 필드는 위에 명시된 내용과 동일하게 유지)
+    if turn_number == 1:
+        turn_rules = """- 이번 턴은 게임의 첫째 날입니다. `result`는 플레이어를 환영하는 메시지로 작성합니다.
+            - 모든 상점의 `before_value`와 `current_value`는 100입니다.
+            - 상점의 `name`, `description`, `risk_level`은 위 상점 설명을 그대로 사용합니다."""
+    else:
+        turn_rules = f"""- `result`는 {turn_number - 1}턴 뉴스의 실제 결과와 이유를 설명하고, 각 상점의 가치 변동률(예: +5%, -3%)을 명시합니다.
+            - 각 상점의 `before_value`는 {turn_number - 1}턴의 `current_value`이고, `current_value`는 `result`의 변동률을 반영한 값입니다.
+            - 상점의 `name`, `description`, `risk_level`은 이전 턴과 동일하게 유지합니다."""
+    if turn_number == total_turns:
+        turn_rules += "\n            - 마지막 날이므로 7일간의 이야기를 마무리하는 뉴스를 작성합니다."
+    
+    return _normalize(f"""
+            ## 🎮 {turn_number}턴 생성 요청 (전체 {total_turns}턴 중)
+            지금까지의 이야기에 이어지는 **{turn_number}턴 하나만** 생성하여, 턴 객체 1개를 담은 JSON 배열로 반환해주세요.
+            각 턴 객체는 `turn_number`, `result`, `news`, `news_tag`, `stocks` 키를 가지며,
+            `stocks`의 각 상점은 `name`, `description`, `before_value`, `current_value`, `risk_level`, `expectation` 키를 가집니다.
+
+            ## 📜 이번 턴 생성 가이드라인
+            - `turn_number`는 {turn_number}입니다.
+            {turn_rules}
+            - 각 상점의 가치 변동은 위험도에 따른 수익/손실 범위를 따르고, 게임 전체에 걸쳐 호재와 악재가 균형 있게 나오도록 합니다.
+            - `news`와 `news_tag`는 다음 턴의 결과로 이어질 새로운 사건과 힌트이며, `expectation`은 이 뉴스를 바탕으로 한 상점별 예상입니다.
+            - 모든 텍스트는 10세 아동이 이해하기 쉽고 재미있게 작성합니다.
+
+            ## 📚 지금까지의 이야기 (이전 턴 요약)
+            {_summarize_previous_turns(previous_turns)}
+            """)
+
+def _summarize_previous_turns(previous_turns):
+    """이전 턴들을 상점 정보와 턴별 뉴스/가격만 담은 간결한 JSON으로 요약합니다. 직전 턴은 힌트와 예상까지 포함합니다."""
+    if not previous_turns:
+        return "(아직 없음 - 첫 턴입니다)"
+    
+    summary = [
+        {
+            "turn_number": turn["turn_number"],
+            "news": turn["news"],
+            "prices": {stock["name"]: stock["current_value"] for stock in turn["stocks"]},
+        }
+        for turn in previous_turns
     ]
+    last_turn = previous_turns[-1]
+    summary[-1]["news_tag"] = last_turn["news_tag"]
+    summary[-1]["expectations"] = {stock["name"]: stock["expectation"] for stock in last_turn["stocks"]}
+    stocks = [
+        {key: stock[key] for key in ("name", "description", "risk_level")}
+        for stock in previous_turns[0]["stocks"]
+    ]
+    return json.dumps({"stocks": stocks, "turns": summary}, ensure_ascii=False, separators=(",", ":"))
+
 
-    ## 📜 중요한 게임 메커니즘 및 생성 가이드라인
-    1.  **7턴 구성**: 반드시 7개의 턴으로 구성된 JSON 배열을 생성합니다. `turn_number` 키를 사용합니다.
-    2.  **News → Result → Value Change 흐름**:
-        -   각 턴의 `news`는 다음 턴의 `result`에 반영되어야 합니다.
-        -   `result`의 실제 결과에 따라 `current_value`가 논리적으로 변동되어야 합니다.
-        -   첫 턴(`turn_number: 1`)의 `result`는 지정된 환영 메시지입니다. `current_value`는 `before_value`와 동일(100)합니다.
-    3.  **투자 종목별 특성 반영**: 각 돼지의 위험도와 특성에 맞는 `current_value` 변동폭을 적용해주세요.
-    4.  **스토리텔링**: 아기돼지 삼형제 동화 배경과 집 짓기 요소를 활용하여 7일간의 흥미진진하고 일관된 스토리를 만들어주세요. (예: 늑대의 등장, 요정의 도움, 재료 부족, 날씨 변화, 건축 도우미 등) 아이들이 이해하기 쉬운 단어와 표현을 사용해주세요.
-    5.  **교육적 목적**: 위험과 수익의 관계, 빠른 수익의 위험성, 안정성의 가치 등을 아이들이 자연스럽게 배울 수 있도록 스토리를 구성해주세요.
-    6.  **긍정적 마무리**: 게임의 마지막 턴에서는 모든 돼지가 각자의 방식으로 성공할 수 있도록 희망적인 메시지를 전달해주세요.
-    7.  **뉴스 태그 활용**: `news_tag`를 통해 어떤 돼지에게 뉴스가 주로 영향을 주는지 명확히 표시해주세요.
-    8.  **Expectation 필드**: 다음 턴에 대한 예상을 아이들이 쉽게 이해할 수 있도록 작성해주세요.
-    9.  **긍정적/부정적 이벤트 균형**: 각 돼지는 게임 전체에 걸쳐 긍정적 이벤트(호재)와 부정적 이벤트(악재)를 모두 경험해야 합니다. 모든 돼지가 항상 수익을 내는 것은 아니며, 위험도에 따라 손실을 볼 수도 있음을 명확히 보여주세요.
-
-    ## 🎯 교육 포인트 & 게임 특징 (생성 시 참고)
-    -   **핵심 학습 내용**: 위험과 수익의 관계, 정보 활용, 분산투자, 장기적 관점.
-    -   **아기돼지 삼형제만의 교육적 가치**: 
-        -   빠른 수익 추구의 위험성 (첫째 돼지의 지푸라기 집)
-        -   안정성과 수익성의 균형 (둘째 돼지의 나무 집)
-        -   안전한 투자의 중요성 (셋째 돼지의 벽돌 집)
-    -   **게임만의 특별함**: 친숙한 동화 세계관, 건축과 경제의 결합, 성취감 제공.
-    -   **아기돼지 삼형제만의 독특한 요소**: 캐릭터별 명확한 투자 철학, 건축 재료=위험도 비유, 협력과 경쟁의 균형.
-
-    ## ✅ 최종 검증 사항 (생성 후 반드시 확인)
-    -   **전체 7턴 생성**: JSON 배열이 정확히 7개의 턴 객체를 포함하는지 확인합니다. (`turn_number` 키 사용)
-    -   **첫 턴 규칙 준수**: 첫 턴의 `result`가 지정된 환영 메시지이고, 모든 돼지의 `current_value`가 `before_value`(100)와 동일한지 확인합니다.
-    -   **News → Result → Value 흐름 일치**: 각 턴의 `news`가 다음 턴의 `result`에 논리적으로 반영되고, 이 `result`에 따라 `current_value`가 올바르게 변동되었는지 확인합니다.
-    -   **돼지 정보 일관성**: 3마리 돼지("첫째 돼지", "둘째 돼지", "셋째 돼지")가 정확한 이름, `description`, `risk_level`("고위험 고수익", "중위험 균형형", "저위험 저수익")로 모든 턴에 일관되게 등장하는지 확인합니다. `description`은 제공된 예시와 동일해야 합니다.
-    -   **수익/손실 범위 및 균형**: 각 돼지의 `current_value` 변동이 해당 돼지의 위험도에 따른 수익/손실 범위 내에서 이루어지는지, 그리고 게임 전체에 걸쳐 호재와 악재가 균형 있게 발생하는지 확인합니다. 모든 돼지가 항상 이익을 보지 않도록 주의합니다.
-    -   **아이들 눈높이**: 모든 텍스트(특히 `news`, `news_tag`, `result`, `expectation`)가 10세 아동이 이해하기 쉽고 재미있게 작성되었는지 확인합니다.
-    -   **JSON 유효성**: 전체 응답이 유효한 JSON 형식인지 확인합니다. (쉼표, 따옴표, 괄호 등)
-    """
\ No newline at end of file
+def get_game_scenario_prompt1():
+    """게임 시나리오 생성을 위한 프롬프트를 반환합니다. (마법 왕국)"""
+    return get_game_scenario_prompt("magic_kingdom")
+
+def get_game_scenario_prompt2():
+    """게임 시나리오 생성을 위한 프롬프트를 반환합니다. (푸드트럭 왕국)"""
+    return get_game_scenario_prompt("foodtruck_kingdom")
+
+def get_game_scenario_prompt3():
+    """게임 시나리오 생성을 위한 프롬프트를 반환합니다. (달빛 도둑)"""
+    return get_game_scenario_prompt("moonlight_thief")
+
+def get_game_scenario_prompt4():
+    """게임 시나리오 생성을 위한 프롬프트를 반환합니다. (아기돼지 삼형제)"""
+    return get_game_scenario_prompt("three_little_pigs")
@@ -0,0 +1,143 @@
+"""
+시나리오 압축 저장 형식 (.scn)
+
+시나리오 JSON은 상점 이름·설명·위험도 같은 상점 정보가 모든 턴에 반복되어 대부분의 용량을
+차지합니다. 이 형식은 상점 정보를 한 번만 저장하고 턴에는 가격과 달라진 필드만 남긴 뒤
+zstd(설치되지 않았으면 표준 라이브러리 zlib)로 압축합니다. 디코딩하면 원래와 같은 턴 목록
+(dict 목록)이 됩니다.
+
+바이트 구조: 매직(4) 버전(1) 압축 방식(1) + 압축된 정규화 JSON
+압축 방식마다 프레임 체크섬(zstd content checksum, zlib adler32)으로 손상을 확인합니다.
+"""
+import zlib
+
+from src.utils import serializer
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성 - 없으면 zlib 사용
+    zstandard = None
+
+MAGIC = b"EDSC"
+VERSION = 1
+COMPRESSION_ZSTD = 1
+COMPRESSION_ZLIB = 2
+_VALUE_FIELDS = ("before_value", "current_value")
+_MISSING_FIELDS = "-"  # 공유 상점 정보에는 있지만 이 턴의 상점에는 없는 필드 목록
+
+
+class ScenarioCodecError(ValueError):
+    """압축 시나리오 데이터가 잘못되었거나 손상된 경우"""
+
+
+def _normalize(turns):
+    """
+    턴 목록을 {"stocks": 공유 상점 정보, "turns": 턴 목록}으로 바꿉니다.
+
+    턴의 상점은 [상점 인덱스, before_value, current_value(, 달라진 필드)]로 저장합니다.
+    """
+    stock_table, index_by_name = [], {}
+    normalized_turns = []
+    for turn in turns:
+        normalized_turn = {key: value for key, value in turn.items() if key != "stocks"}
+        entries = []
+        for stock in turn["stocks"]:
+            meta = {key: value for key, value in stock.items() if key not in _VALUE_FIELDS}
+            if meta.get("name") not in index_by_name:
+                index_by_name[meta.get("name")] = len(stock_table)
+                stock_table.append(meta)
+            index = index_by_name[meta.get("name")]
+            entry = [index] + [stock.get(field) for field in _VALUE_FIELDS]
+
+            shared = stock_table[index]
+            diff = {key: value for key, value in meta.items() if key not in shared or shared[key] != value}
+            missing = [key for key in shared if key not in meta]
+            missing += [field for field in _VALUE_FIELDS if field not in stock]
+            if missing:
+                diff[_MISSING_FIELDS] = missing
+            if diff:
+                entry.append(diff)
+            entries.append(entry)
+        normalized_turn["stocks"] = entries
+        normalized_turns.append(normalized_turn)
+    return {"stocks": stock_table, "turns": normalized_turns}
+
+
+def _denormalize(normalized):
+    """_normalize의 역변환"""
+    stock_table = normalized["stocks"]
+    turns = []
+    for normalized_turn in normalized["turns"]:
+        turn = dict(normalized_turn)
+        stocks = []
+        for index, before_value, current_value, *diff in normalized_turn["stocks"]:
+            stock = dict(stock_table[index])
+            stock["before_value"] = before_value
+            stock["current_value"] = current_value
+            if diff:
+                changes = dict(diff[0])
+                for key in changes.pop(_MISSING_FIELDS, ()):
+                    stock.pop(key, None)
+                stock.update(changes)
+            stocks.append(stock)
+        turn["stocks"] = stocks
+        turns.append(turn)
+    return turns
+
+
+def encode_scenario(turns, compression=None):
+    """
+    턴 목록을 압축 형식으로 인코딩합니다.
+
+    Args:
+        turns (list): 턴 목록 (검증된 시나리오의 turns)
+        compression (int, optional): COMPRESSION_ZSTD 또는 COMPRESSION_ZLIB.
+            지정하지 않으면 zstd를 쓸 수 있을 때 zstd, 아니면 zlib
+
+    Returns:
+        bytes: 인코딩된 데이터
+    """
+    if compression is None:
+        compression = COMPRESSION_ZSTD if zstandard is not None else COMPRESSION_ZLIB
+    payload = serializer.dumps(_normalize(turns))
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise ScenarioCodecError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+        body = zstandard.ZstdCompressor(level=19, write_checksum=True).compress(payload)
+    elif compression == COMPRESSION_ZLIB:
+        body = zlib.compress(payload, 9)
+    else:
+        raise ScenarioCodecError(f"알 수 없는 압축 방식입니다: {compression}")
+    return MAGIC + bytes([VERSION, compression]) + body
+
+
+def decode_scenario(data):
+    """
+    압축 형식 데이터를 턴 목록으로 디코딩합니다.
+
+    Args:
+        data (bytes): encode_scenario로 인코딩한 데이터
+
+    Returns:
+        list: 턴 목록
+
+    Raises:
+        ScenarioCodecError: 형식이 다르거나 데이터가 손상된 경우
+    """
+    if len(data) < 6 or data[:4] != MAGIC or data[4] != VERSION:
+        raise ScenarioCodecError("압축 시나리오 형식이 아닙니다.")
+    compression, body = data[5], data[6:]
+    try:
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise ScenarioCodecError("zstd로 압축된 시나리오를 읽으려면 zstandard 패키지가 필요합니다.")
+            payload = zstandard.ZstdDecompressor().decompress(body)
+        elif compression == COMPRESSION_ZLIB:
+            payload = zlib.decompress(body)
+        else:
+            raise ScenarioCodecError(f"알 수 없는 압축 방식입니다: {compression}")
+        return _denormalize(serializer.loads(payload))
+    except ScenarioCodecError:
+        raise
+    except Exception as e:
+        raise ScenarioCodecError(f"압축 시나리오를 읽을 수 없습니다 (손상된 데이터): {e}") from None
@@ -0,0 +1,126 @@
+"""
+JSON 직렬화 모듈
+
+API 응답, 시나리오 저장소, 게임 저장 파일이 같은 직렬화기를 사용하도록 모아 둔 곳입니다.
+orjson 또는 msgspec이 설치되어 있으면 사용하고, 없으면 표준 라이브러리 json을 사용합니다.
+어느 직렬화기든 UTF-8 바이트를 만들며(한글을 \\u 이스케이프하지 않음), 기본은 공백 없는 표현입니다.
+
+사용할 직렬화기는 JSON_SERIALIZER 환경 변수("orjson", "msgspec", "json")로 고정할 수 있습니다.
+"""
+import json
+
+from src.utils.config import get_storage_settings
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # 선택 의존성
+    msgspec = None
+
+
+class JsonSerializer:
+    """표준 라이브러리 json"""
+    name = "json"
+
+    def dumps(self, obj, indent=False):
+        if indent:
+            return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """orjson (numpy 배열도 직렬화)"""
+    name = "orjson"
+
+    def dumps(self, obj, indent=False):
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class MsgspecSerializer:
+    """msgspec"""
+    name = "msgspec"
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj, indent=False):
+        data = self._encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    def loads(self, data):
+        try:
+            return self._decoder.decode(data.encode("utf-8") if isinstance(data, str) else data)
+        except msgspec.DecodeError as e:
+            # 다른 직렬화기와 같은 예외 타입으로 맞춤
+            raise json.JSONDecodeError(str(e), "", 0) from None
+
+
+def available_serializers():
+    """
+    설치된 직렬화기 목록을 빠른 순서로 반환합니다.
+
+    Returns:
+        list: 직렬화기 인스턴스 목록 (마지막은 항상 표준 라이브러리 json)
+    """
+    serializers = []
+    if orjson is not None:
+        serializers.append(OrjsonSerializer())
+    if msgspec is not None:
+        serializers.append(MsgspecSerializer())
+    serializers.append(JsonSerializer())
+    return serializers
+
+
+def _select_serializer():
+    preferred = get_storage_settings()["serializer"]
+    serializers = available_serializers()
+    for serializer in serializers:
+        if serializer.name == preferred:
+            return serializer
+    if preferred:
+        print(f"JSON 직렬화기 '{preferred}'를 사용할 수 없어 {serializers[0].name}를 사용합니다.")
+    return serializers[0]
+
+
+_serializer = _select_serializer()
+
+
+def get_serializer():
+    """현재 사용 중인 직렬화기를 반환합니다."""
+    return _serializer
+
+
+def dumps(obj, indent=False):
+    """
+    객체를 JSON UTF-8 바이트로 직렬화합니다.
+
+    Args:
+        obj: 직렬화할 객체
+        indent (bool, optional): 2칸 들여쓰기 여부. 기본값은 False(공백 없는 표현)
+
+    Returns:
+        bytes: JSON 바이트
+    """
+    return _serializer.dumps(obj, indent)
+
+
+def loads(data):
+    """
+    JSON 바이트/문자열을 파이썬 객체로 역직렬화합니다.
+
+    Raises:
+        json.JSONDecodeError: JSON 형식이 아닌 경우 (orjson.JSONDecodeError도 그 하위 클래스)
+    """
+    return _serializer.loads(data)
@@ -0,0 +1,191 @@
+"""
+렌더링된 차트 캐시 모듈
+
+차트 이미지는 시나리오 내용과 렌더링 옵션(형식, 크기, 해상도)만으로 정해지므로,
+(시나리오 내용 해시 + 렌더링 옵션)을 키로 이미지 바이트를 디스크에 저장해 두고 같은 요청에는
+다시 렌더링하지 않고 저장된 바이트를 돌려줍니다. 전체 크기가 한도를 넘으면 가장 오래 쓰이지
+않은 파일(수정 시각 기준)부터 지웁니다.
+"""
+import os
+import hashlib
+import threading
+
+from src.models.scenario import validate_scenario
+from src.utils.config import get_storage_settings
+from src.utils.file_manager import write_file_atomic
+from src.visualization.chart_renderer import (CHART_FORMATS, CHART_STYLE_VERSION, DEFAULT_SIZE, DEFAULT_DPI,
+                                              compile_stock_chart, render_stock_chart)
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(project_root, "visualization_results", "cache")
+
+
+class ChartCache:
+    """
+    디스크 차트 캐시
+
+    Attributes:
+        cache_dir (str): 이미지를 저장할 디렉토리
+        max_bytes (int): 캐시 전체 크기 한도
+        hits (int): 캐시 적중 수
+        misses (int): 캐시 부재(렌더링) 수
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir (str, optional): 이미지를 저장할 디렉토리
+            max_bytes (int, optional): 캐시 전체 크기 한도. 기본값은 256MB
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = None  # 처음 쓸 때 디렉토리를 훑어 계산
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(content_hash, fmt="png", size=DEFAULT_SIZE, dpi=DEFAULT_DPI, kind="stock"):
+        """
+        캐시 키를 만듭니다. (차트 스타일 버전이 바뀌면 이전 이미지는 더 이상 쓰이지 않음)
+
+        Args:
+            content_hash (str): 시나리오 내용 해시 (Scenario.content_hash)
+            fmt (str, optional): 이미지 형식
+            size (tuple, optional): 그림 크기(인치)
+            dpi (int, optional): 해상도
+            kind (str, optional): 차트 종류
+
+        Returns:
+            str: 캐시 키 (16진수 SHA-256)
+        """
+        width, height = size
+        options = f"{kind}:v{CHART_STYLE_VERSION}:{content_hash}:{fmt}:{float(width)}x{float(height)}:{int(dpi)}"
+        return hashlib.sha256(options.encode("utf-8")).hexdigest()
+
+    def path(self, key, fmt):
+        """캐시 키의 파일 경로"""
+        return os.path.join(self.cache_dir, f"{key}.{fmt}")
+
+    def get(self, key, fmt):
+        """
+        저장된 이미지를 반환합니다.
+
+        Returns:
+            bytes: 이미지 데이터, 없으면 None
+        """
+        path = self.path(key, fmt)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # 최근 사용 시각 갱신 (크기 정리 순서)
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, fmt, data):
+        """이미지를 저장하고 한도를 넘으면 오래된 이미지를 지웁니다."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key, fmt)
+        existed = os.path.exists(path)
+        write_file_atomic(path, data)
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            elif not existed:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def get_or_render(self, game_data, fmt="png", size=DEFAULT_SIZE, dpi=DEFAULT_DPI):
+        """
+        시나리오 차트 이미지를 캐시에서 찾고, 없으면 렌더링하여 저장합니다.
+
+        Args:
+            game_data (list | Scenario): 시나리오 데이터 또는 검증된 시나리오
+            fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+            size (tuple, optional): 그림 크기(인치)
+            dpi (int, optional): 해상도
+
+        Returns:
+            bytes: 이미지 데이터
+        """
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식입니다: {fmt}")
+        scenario = validate_scenario(game_data, expected_turns=None)
+        key = self.key(scenario.content_hash, fmt, size, dpi)
+        data = self.get(key, fmt)
+        with self._lock:
+            if data is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if data is None:
+            data = render_stock_chart(compile_stock_chart(scenario), fmt, size, dpi)
+            self.put(key, fmt, data)
+        return data
+
+    def stats(self):
+        """캐시 지표를 반환합니다."""
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _entries(self):
+        """(수정 시각, 크기, 경로) 목록 - 렌더링 중인 임시 파일은 제외"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as scanned:
+                for entry in scanned:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """오래 쓰이지 않은 이미지부터 지워 한도의 90% 이하로 줄입니다."""
+        # 다른 프로세스도 같은 디렉토리를 쓸 수 있으므로 실제 파일 기준으로 다시 계산
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+
+_chart_cache = None
+_chart_cache_lock = threading.Lock()
+
+
+def get_chart_cache():
+    """
+    설정(CHART_CACHE_DIR, CHART_CACHE_MAX_MB)에 따른 공유 차트 캐시를 반환합니다.
+
+    Returns:
+        ChartCache: 차트 캐시
+    """
+    global _chart_cache
+    with _chart_cache_lock:
+        if _chart_cache is None:
+            settings = get_storage_settings()
+            _chart_cache = ChartCache(settings["chart_cache_dir"] or DEFAULT_CACHE_DIR,
+                                      settings["chart_cache_max_mb"] * 1024 * 1024)
+        return _chart_cache
@@ -0,0 +1,350 @@
+"""
+헤드리스 차트 렌더링 모듈
+
+pyplot 상태 기계(전역 현재 그림, 전역 rcParams)를 쓰지 않고 `matplotlib.figure.Figure`와
+Agg 캔버스로 그림을 직접 만들어 PNG/SVG 바이트로 렌더링합니다. 그림이 pyplot에 등록되지
+않으므로 스레드마다 따로 그려도 서로 간섭하지 않고, 오류가 나도 닫지 않은 그림이 쌓이지
+않습니다. 시나리오 여러 개는 프로세스 풀에서 나누어 렌더링합니다. (썸네일 일괄 생성 등)
+"""
+import io
+import os
+from dataclasses import dataclass
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.data.data_handler import iter_stored_scenarios
+from src.models.scenario import validate_scenario, INITIAL_STOCK_VALUE
+from src.utils.file_manager import write_file_atomic
+
+# 출력 형식 → MIME 타입
+CHART_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
+# 그리는 방식(색상, 레이아웃 등)을 바꾸면 올려서 캐시된 이미지를 무효화
+CHART_STYLE_VERSION = 1
+DEFAULT_SIZE = (14, 8)
+DEFAULT_DPI = 100
+THUMBNAIL_SIZE = (7, 4)
+THUMBNAIL_DPI = 60
+
+FONT_FAMILY = ['Arial', 'Helvetica', 'DejaVu Sans', 'sans-serif']
+# 아동 친화적 색상 팔레트 (밝고 명확한 색상)
+CHILD_FRIENDLY_COLORS = ['#FFB6C1', '#87CEEB', '#98FB98', '#F0E68C', '#DDA0DD', '#FFA07A', '#87CEFA', '#F5DEB3']
+# 투자 결과 요약 색상 팔레트
+SUMMARY_COLORS = ['gold', 'brown', 'firebrick', 'green', 'purple', 'orange', 'pink', 'cyan']
+
+
+@dataclass(frozen=True)
+class StockChart:
+    """
+    주식 가치 변동 차트를 그리는 데 필요한 데이터 (프로세스 풀로 넘길 수 있는 작은 객체)
+
+    Attributes:
+        turns (tuple): 턴 번호 목록
+        stock_names (tuple): 상점 이름 목록
+        values (numpy.ndarray): [턴 수, 상점 수] 가치 행렬
+        title (str): 차트 제목
+        event_turns (tuple): 특별 이벤트가 있는 턴 번호 목록
+    """
+    turns: tuple
+    stock_names: tuple
+    values: np.ndarray
+    title: str
+    event_turns: tuple = ()
+
+
+def chart_title(stock_names, first_turn=None):
+    """
+    상점 이름(또는 첫 턴의 scenario 필드)으로 아동 친화적인 차트 제목을 정합니다.
+
+    Args:
+        stock_names (list): 상점 이름 목록
+        first_turn (dict, optional): 첫 턴 데이터
+
+    Returns:
+        str: 차트 제목
+    """
+    if first_turn and 'scenario' in first_turn:
+        return f"🎮 {first_turn['scenario']} 모험"
+    if len(stock_names) >= 3:
+        if any("돼지" in name or "집" in name for name in stock_names):
+            return "🏠 아기돼지 삼형제의 건설 모험"
+        if any("빵" in name or "서커스" in name for name in stock_names):
+            return "🏰 마법 왕국의 투자 모험"
+        if any("트럭" in name or "푸드" in name for name in stock_names):
+            return "🚚 푸드트럭 왕국의 맛있는 모험"
+        if any("달" in name for name in stock_names):
+            return "🌙 달빛 도둑의 신비한 모험"
+    return "🎮 우리의 투자 모험"
+
+
+def event_turns(game_data):
+    """특별 이벤트(event_description)가 있는 턴 번호 목록"""
+    return tuple(turn.get('turn_number', 0) for turn in game_data
+                 if 'event_description' in turn and turn.get('event_description') != "없음")
+
+
+def compile_stock_chart(game_data):
+    """
+    시나리오를 차트 데이터로 변환합니다.
+
+    Args:
+        game_data (list | Scenario): 시나리오 데이터 또는 검증된 시나리오
+
+    Returns:
+        StockChart: 차트 데이터
+
+    Raises:
+        ScenarioValidationError: 시나리오 검증에 실패한 경우
+    """
+    scenario = validate_scenario(game_data, expected_turns=None)
+    turns = scenario.turns
+    return StockChart(
+        turns=tuple(turn['turn_number'] for turn in turns),
+        stock_names=scenario.stock_names,
+        values=np.asarray(scenario.prices, dtype=np.float64),
+        title=chart_title(scenario.stock_names, turns[0]),
+        event_turns=event_turns(turns),
+    )
+
+
+def draw_stock_chart(fig, chart):
+    """
+    그림(fig)에 주식 가치 변동 차트를 그립니다.
+
+    Args:
+        fig (matplotlib.figure.Figure): 그릴 그림 (pyplot 그림도 가능)
+        chart (StockChart): 차트 데이터
+    """
+    ax = fig.add_subplot()
+    for i, stock_name in enumerate(chart.stock_names):
+        color = CHILD_FRIENDLY_COLORS[i % len(CHILD_FRIENDLY_COLORS)]
+        # 더 굵은 선과 큰 마커로 시각적 강조
+        ax.plot(chart.turns, chart.values[:, i], 'o-', color=color,
+                label=stock_name, linewidth=3, markersize=8, alpha=0.8)
+
+    # 초기 가치 기준선
+    ax.axhline(y=INITIAL_STOCK_VALUE, color='gray', linestyle='--', alpha=0.7,
+               linewidth=2, label='처음 시작 가격')
+
+    ax.set_title(chart.title, fontsize=18, fontweight='bold', pad=20, fontfamily=FONT_FAMILY)
+    ax.set_xlabel('🗓️ 게임 날짜 (일차)', fontsize=14, fontweight='bold', fontfamily=FONT_FAMILY)
+    ax.set_ylabel('💰 투자 가치 (코인)', fontsize=14, fontweight='bold', fontfamily=FONT_FAMILY)
+    ax.set_xticks(chart.turns)
+    ax.tick_params(labelsize=12)
+    ax.grid(True, alpha=0.3, linestyle='-', linewidth=1)
+
+    legend = ax.legend(loc='upper left', framealpha=0.9, fancybox=True, shadow=True,
+                       prop={'family': FONT_FAMILY, 'size': 12})
+    legend.get_frame().set_facecolor('white')
+    ax.set_facecolor('#f8f9fa')
+
+    # 중요 이벤트 표시
+    if chart.event_turns and chart.values.size:
+        event_y_position = float(chart.values.max()) * 1.1
+        for turn_number in chart.event_turns:
+            ax.annotate("📢 특별한 일이 일어났어요!",
+                        xy=(turn_number, event_y_position),
+                        xytext=(turn_number, event_y_position + 20),
+                        arrowprops=dict(facecolor='red', shrink=0.05, width=2, alpha=0.7),
+                        fontsize=10, fontweight='bold', fontfamily=FONT_FAMILY,
+                        horizontalalignment='center',
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.8))
+
+    fig.tight_layout()
+
+
+def draw_investment_summary(fig, simulation_results):
+    """
+    그림(fig)에 투자 결과 요약(자본금 변화, 요약 문구, 투자 분포)을 그립니다.
+
+    Args:
+        fig (matplotlib.figure.Figure): 그릴 그림 (pyplot 그림도 가능)
+        simulation_results (dict): 시뮬레이션 결과 딕셔너리 (investment_history 포함)
+    """
+    history = simulation_results['investment_history']
+    initial_capital = simulation_results.get('initial_capital', 1000)
+    final_capital = simulation_results.get('final_capital', 0)
+
+    turns, capitals, investments = [], [], []
+    current_capital = initial_capital
+    for turn_data in history:
+        turns.append(turn_data.get('turn', 0))
+        current_capital = turn_data.get('capital_after', current_capital)
+        capitals.append(current_capital)
+        investments.append(turn_data.get('investment', '패스'))
+
+    # 자본금 변화 그래프
+    ax = fig.add_subplot(2, 1, 1)
+    ax.plot(turns, capitals, 'o-', color='blue', linewidth=2)
+    ax.axhline(y=initial_capital, color='gray', linestyle='--', alpha=0.7, label='Initial Capital')
+    ax.set_title('Capital Changes Throughout the Simulation', fontsize=14)
+    ax.set_xlabel('Turn', fontsize=12)
+    ax.set_ylabel('Capital', fontsize=12)
+    ax.set_xticks(turns)
+    ax.grid(True, alpha=0.3)
+
+    # 첫 번째 턴의 상점 이름과 색상 매핑
+    stock_names = []
+    game_data = simulation_results.get('game_data')
+    if game_data and 'stocks' in game_data[0]:
+        stock_names = [stock['name'] for stock in game_data[0]['stocks'] if 'name' in stock]
+    investment_colors = {name: SUMMARY_COLORS[i % len(SUMMARY_COLORS)] for i, name in enumerate(stock_names)}
+
+    labeled = set()
+    for turn_number, capital, investment in zip(turns, capitals, investments):
+        if investment != '패스' and investment in investment_colors:
+            ax.scatter(turn_number, capital, s=100, color=investment_colors[investment], zorder=5,
+                       label=investment if investment not in labeled else "")
+            labeled.add(investment)
+    ax.legend()
+
+    # 최종 결과 요약
+    text_ax = fig.add_subplot(2, 1, 2)
+    text_ax.axis('off')
+    profit_rate = ((final_capital - initial_capital) / initial_capital) * 100
+    summary_text = (
+        f"Investment Summary\n"
+        f"------------------------------------------\n"
+        f"Strategy: {simulation_results.get('strategy', 'Interactive')}\n"
+        f"Initial Capital: {initial_capital:.1f}\n"
+        f"Final Capital: {final_capital:.1f}\n"
+        f"Profit/Loss: {final_capital - initial_capital:.1f}\n"
+        f"Profit Rate: {profit_rate:.1f}%\n"
+        f"\nResult: {simulation_results.get('result_message', '')}"
+    )
+    text_ax.text(0.1, 0.7, summary_text, fontsize=12, verticalalignment='top',
+                 bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+
+    # 투자 분포 파이 차트 (투자 정보가 있는 경우에만)
+    investment_counts = {}
+    for investment in investments:
+        investment_counts[investment] = investment_counts.get(investment, 0) + 1
+    if investment_counts:
+        labels = list(investment_counts)
+        pie_ax = fig.add_axes([0.65, 0.2, 0.3, 0.3])  # [left, bottom, width, height]
+        pie_ax.pie(list(investment_counts.values()), labels=labels,
+                   colors=[investment_colors.get(label, 'lightgray') for label in labels],
+                   autopct='%1.1f%%', startangle=90)
+        pie_ax.axis('equal')
+        pie_ax.set_title('Investment Distribution', fontsize=10)
+
+    fig.tight_layout()
+
+
+def new_figure(size=DEFAULT_SIZE):
+    """pyplot에 등록되지 않는 Agg 캔버스 그림을 만듭니다."""
+    fig = Figure(figsize=size)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def render_figure(fig, fmt="png", dpi=DEFAULT_DPI):
+    """
+    그림을 이미지 바이트로 렌더링합니다.
+
+    Args:
+        fig (matplotlib.figure.Figure): 렌더링할 그림
+        fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+        dpi (int, optional): 해상도. 기본값은 100
+
+    Returns:
+        bytes: 이미지 데이터
+    """
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {fmt}")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def render_stock_chart(chart, fmt="png", size=DEFAULT_SIZE, dpi=DEFAULT_DPI):
+    """
+    주식 가치 변동 차트를 이미지 바이트로 렌더링합니다.
+
+    Args:
+        chart (StockChart | list): 차트 데이터 또는 시나리오 데이터
+        fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+        size (tuple, optional): 그림 크기(인치). 기본값은 (14, 8)
+        dpi (int, optional): 해상도. 기본값은 100
+
+    Returns:
+        bytes: 이미지 데이터
+    """
+    if not isinstance(chart, StockChart):
+        chart = compile_stock_chart(chart)
+    fig = new_figure(size)
+    draw_stock_chart(fig, chart)
+    return render_figure(fig, fmt, dpi)
+
+
+def render_investment_summary(simulation_results, fmt="png", size=(12, 8), dpi=DEFAULT_DPI):
+    """
+    투자 결과 요약을 이미지 바이트로 렌더링합니다.
+
+    Args:
+        simulation_results (dict): 시뮬레이션 결과 딕셔너리
+        fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+        size (tuple, optional): 그림 크기(인치). 기본값은 (12, 8)
+        dpi (int, optional): 해상도. 기본값은 100
+
+    Returns:
+        bytes: 이미지 데이터
+    """
+    fig = new_figure(size)
+    draw_investment_summary(fig, simulation_results)
+    return render_figure(fig, fmt, dpi)
+
+
+def render_stock_charts(charts, fmt="png", size=DEFAULT_SIZE, dpi=DEFAULT_DPI, workers=None):
+    """
+    여러 차트를 프로세스 풀에서 나누어 렌더링합니다.
+
+    Args:
+        charts (list): StockChart 목록
+        fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+        size (tuple, optional): 그림 크기(인치)
+        dpi (int, optional): 해상도
+        workers (int, optional): 프로세스 수. 기본값은 CPU 수, 1이면 현재 프로세스에서 렌더링
+
+    Returns:
+        list: 차트 순서대로 이미지 바이트 목록
+    """
+    render = partial(render_stock_chart, fmt=fmt, size=size, dpi=dpi)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(charts) <= 1:
+        return [render(chart) for chart in charts]
+    with ProcessPoolExecutor(max_workers=min(workers, len(charts))) as executor:
+        chunksize = max(1, len(charts) // (workers * 4))
+        return list(executor.map(render, charts, chunksize=chunksize))
+
+
+def render_scenario_thumbnails(data_dir, output_dir, fmt="png", size=THUMBNAIL_SIZE, dpi=THUMBNAIL_DPI,
+                               workers=None):
+    """
+    저장소의 모든 시나리오 차트를 렌더링하여 `<시나리오 파일 이름>.<형식>`으로 저장합니다.
+
+    Args:
+        data_dir (str): 시나리오 저장 디렉토리
+        output_dir (str): 이미지를 저장할 디렉토리
+        fmt (str, optional): "png" 또는 "svg". 기본값은 "png"
+        size (tuple, optional): 그림 크기(인치). 기본값은 (7, 4)
+        dpi (int, optional): 해상도. 기본값은 60
+        workers (int, optional): 프로세스 수. 기본값은 CPU 수
+
+    Returns:
+        int: 저장한 이미지 수
+    """
+    names, charts = [], []
+    for filename, scenario in iter_stored_scenarios(data_dir):
+        names.append(os.path.splitext(filename)[0])
+        charts.append(compile_stock_chart(scenario))
+
+    os.makedirs(output_dir, exist_ok=True)
+    images = render_stock_charts(charts, fmt, size, dpi, workers)
+    for name, image in zip(names, images):
+        write_file_atomic(os.path.join(output_dir, f"{name}.{fmt}"), image)
+    print(f"차트 {len(images)}개를 {output_dir}에 저장했습니다.")
+    return len(images)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+분석용 Parquet 내보내기/조회 테스트
+"""
+
+import os
+import sys
+import json
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.data.analytics_export import export_analytics, query_analytics
+
+
+def write_scenarios(data_dir):
+    for filename in ["game_scenario_magic_kingdom_20250525_133010.json",
+                     "game_scenario_moonlight_thief_20250601_090000.json",
+                     "game_scenario_moonlight_thief_20250602_090000.json"]:
+        (data_dir / filename).write_text(json.dumps(create_sample_game_data(), ensure_ascii=False), encoding="utf-8")
+
+
+def test_export_and_query(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    write_scenarios(data_dir)
+    output_dir = str(tmp_path / "analytics")
+
+    counts = export_analytics(str(data_dir), output_dir, strategies=("conservative", "trend"))
+    assert counts == {"price_paths": 3 * 7 * 3, "simulations": 3 * 2}
+    assert os.path.isdir(os.path.join(output_dir, "price_paths", "scenario_type=moonlight_thief", "date=2025-06-01"))
+
+    prices = query_analytics(output_dir, "price_paths", scenario_type="magic_kingdom")
+    assert len(prices) == 21
+    bakery = prices[prices["stock_name"] == "🍞 빵집"].sort_values("turn_number")
+    assert bakery["price"].tolist()[:2] == [100.0, 105.0]
+    assert bakery["change_pct"].tolist()[1] == 5.0
+    assert prices["crash"].any()
+
+    simulations = query_analytics(output_dir, "simulations", start_date="2025-06-02",
+                                  columns=["scenario_id", "strategy", "profit_rate"])
+    assert set(simulations["scenario_id"]) == {"game_scenario_moonlight_thief_20250602_090000.json"}
+    assert list(simulations.columns) == ["scenario_id", "strategy", "profit_rate"]
+
+    # 다시 내보내면 파티션을 덮어씀 (행이 중복되지 않음)
+    export_analytics(str(data_dir), output_dir, strategies=())
+    assert len(query_analytics(output_dir, "price_paths")) == 63
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+시나리오 대량 생성 테스트 - 가짜 LLM으로 검증/중복 제거와 처리량 집계를 확인합니다.
+"""
+
+import os
+import sys
+import json
+import threading
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.data.data_handler import create_sample_game_data
+from src.data.batch_generator import generate_scenario_batch
+from src.utils.file_manager import read_checked_json
+
+
+STORIES = {
+    "기사": "용감한 기사가 성문을 지키며 밤새 순찰을 돌았어요",
+    "상인": "바다 건너 상인들이 향신료를 가득 싣고 찾아왔어요",
+    "눈보라": "겨울 눈보라가 몰아쳐서 마을 길이 꽁꽁 얼어붙었어요",
+}
+
+
+def make_scenario(story):
+    """모든 턴의 텍스트를 story로 바꾼 샘플 시나리오 (JSON 문자열)"""
+    game_data = create_sample_game_data()
+    for turn in game_data:
+        turn['news'] = f"{STORIES[story]} ({turn['turn_number']}일째)"
+        turn['result'] = STORIES[story][::-1]
+        turn['news_tag'] = story
+    return json.dumps(game_data, ensure_ascii=False)
+
+
+def make_llm(responses):
+    """호출 순서대로 응답을 돌려주는 가짜 LLM"""
+    calls = []
+    lock = threading.Lock()
+
+    def respond(prompt):
+        with lock:
+            calls.append(prompt)
+            return AIMessage(content=responses[len(calls) - 1])
+
+    return RunnableLambda(respond)
+
+
+def test_batch_deduplicates_and_retries(tmp_path):
+    existing = tmp_path / "game_scenario_magic_kingdom_existing.json"
+    existing.write_text(make_scenario("기사"), encoding="utf-8")
+    llm = make_llm([
+        make_scenario("상인"),
+        make_scenario("기사"),  # 저장소와 중복
+        "JSON이 아닌 응답",
+        make_scenario("눈보라"),
+    ])
+
+    report = generate_scenario_batch(llm, {"magic_kingdom": 2}, str(tmp_path), workers=1)
+
+    assert report.requested == 2
+    assert report.generated == 2
+    assert report.attempts == 4
+    assert report.duplicates == 1
+    assert report.failure_rate == 0.5
+    assert len(os.listdir(tmp_path)) == 3
+    saved_tags = {read_checked_json(path)[0]['news_tag'] for path in report.saved_files}
+    assert saved_tags == {"상인", "눈보라"}
+
+
+def test_batch_gives_up_after_max_attempts(tmp_path):
+    llm = make_llm([make_scenario("상인")] * 4)
+
+    report = generate_scenario_batch(llm, {"moonlight_thief": 2}, str(tmp_path), workers=2, max_attempts=2)
+
+    assert report.generated == 1
+    assert report.attempts == 3
+    assert report.duplicates == 2
+    assert report.scenarios_per_minute > 0
+
+
+def test_failed_save_is_not_indexed(tmp_path, monkeypatch):
+    import src.data.batch_generator as batch_generator
+
+    save_game_data = batch_generator.save_game_data
+    failures = [OSError("디스크 가득 참")]
+
+    def flaky_save(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return save_game_data(*args, **kwargs)
+
+    monkeypatch.setattr(batch_generator, "save_game_data", flaky_save)
+    llm = make_llm([make_scenario("상인")] * 2)
+
+    report = generate_scenario_batch(llm, {"magic_kingdom": 1}, str(tmp_path), workers=1)
+
+    # 저장에 실패한 시나리오가 인덱스에 남지 않아 다시 생성한 같은 시나리오가 저장됨
+    assert report.generated == 1
+    assert report.duplicates == 0
+    assert report.failed_attempts == 1
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+차트 캐시 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import src.visualization.chart_cache as chart_cache
+from src.data.data_handler import create_sample_game_data
+from src.visualization.chart_cache import ChartCache
+
+
+def test_repeat_requests_are_served_from_cache(tmp_path, monkeypatch):
+    renders = []
+    monkeypatch.setattr(chart_cache, "render_stock_chart",
+                        lambda chart, fmt, size, dpi: renders.append(fmt) or f"{fmt}-{dpi}".encode())
+    cache = ChartCache(str(tmp_path))
+
+    first = cache.get_or_render(create_sample_game_data(), "png", dpi=50)
+    second = cache.get_or_render(create_sample_game_data(), "png", dpi=50)
+    other = cache.get_or_render(create_sample_game_data(), "png", dpi=80)
+
+    assert first == second == b"png-50"
+    assert other == b"png-80"
+    assert renders == ["png", "png"]
+    assert cache.stats()["hits"] == 1
+    # 새 캐시 인스턴스(다른 프로세스)도 디스크의 이미지를 사용
+    assert ChartCache(str(tmp_path)).get_or_render(create_sample_game_data(), "png", dpi=50) == b"png-50"
+    assert len(renders) == 2
+
+
+def test_cache_evicts_least_recently_used_images(tmp_path):
+    cache = ChartCache(str(tmp_path), max_bytes=250)
+    for index in range(3):
+        cache.put(f"key{index}", "png", b"x" * 100)
+        os.utime(cache.path(f"key{index}", "png"), (index, index))
+
+    cache.put("key3", "png", b"x" * 100)
+
+    assert cache.get("key0", "png") is None
+    assert cache.get("key1", "png") is None
+    assert cache.get("key3", "png") == b"x" * 100
+    assert cache.stats()["total_bytes"] <= 250
+
+
+def test_api_chart_endpoint(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.api as api
+    from src.data.data_handler import save_game_data
+    from src.data.scenario_repository import ScenarioRepository
+
+    save_game_data(create_sample_game_data(), str(tmp_path / "data"), "game_scenario_a.json")
+    cache = ChartCache(str(tmp_path / "cache"))
+    monkeypatch.setattr(api, "scenario_repository", ScenarioRepository(str(tmp_path / "data")))
+    monkeypatch.setattr(api, "get_chart_cache", lambda: cache)
+    client = TestClient(api.app)
+
+    response = client.get("/scenario/game_scenario_a/chart.png", params={"width": 4, "height": 3, "dpi": 40})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+    assert response.content.startswith(b"\x89PNG")
+
+    etag = response.headers["etag"]
+    cached = client.get("/scenario/game_scenario_a/chart.png", params={"width": 4, "height": 3, "dpi": 40},
+                        headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert client.get("/scenario/game_scenario_a/chart.gif").status_code == 404
+    assert client.get("/scenario/missing/chart.svg").status_code == 404
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+헤드리스 차트 렌더러 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import matplotlib.pyplot as plt
+
+from src.data.data_handler import create_sample_game_data, save_game_data
+from src.visualization.chart_renderer import (compile_stock_chart, render_stock_chart, render_investment_summary,
+                                              render_scenario_thumbnails)
+from src.simulation.simulator import run_automated_simulation
+
+
+def test_render_without_pyplot_figures():
+    chart = compile_stock_chart(create_sample_game_data())
+    assert chart.values.shape == (7, 3)
+    assert chart.stock_names == tuple(stock["name"] for stock in create_sample_game_data()[0]["stocks"])
+
+    png = render_stock_chart(chart, "png", size=(4, 3), dpi=50)
+    svg = render_stock_chart(create_sample_game_data(), "svg", size=(4, 3))
+    summary = render_investment_summary(run_automated_simulation(create_sample_game_data(), "random"))
+
+    assert png.startswith(b"\x89PNG")
+    assert b"<svg" in svg
+    assert summary.startswith(b"\x89PNG")
+    # pyplot 전역 상태에 그림이 남지 않음
+    assert plt.get_fignums() == []
+
+
+def test_render_scenario_thumbnails_in_process_pool(tmp_path):
+    data_dir = str(tmp_path / "data")
+    for index in range(2):
+        save_game_data(create_sample_game_data(), data_dir, f"game_scenario_magic_kingdom_{index}.json",
+                       check_duplicates=False)
+
+    output_dir = tmp_path / "thumbnails"
+    assert render_scenario_thumbnails(data_dir, str(output_dir), size=(3, 2), dpi=40, workers=2) == 2
+    assert sorted(os.listdir(output_dir)) == ["game_scenario_magic_kingdom_0.png", "game_scenario_magic_kingdom_1.png"]
+
+
+def test_prepare_stock_data_forward_fills_missing_stocks():
+    from src.models.scenario import validate_scenario
+    from src.visualization.visualize import _prepare_stock_data
+
+    game_data = create_sample_game_data()
+    turns, names, values = _prepare_stock_data(validate_scenario(game_data))
+    assert turns == list(range(1, 8))
+    assert values.shape == (7, 3)
+
+    # 검증 전 데이터: 턴 3에 첫 상점이 빠졌고, 새 상점이 턴 5에 처음 등장
+    del game_data[2]['stocks'][0]
+    game_data[4]['stocks'].append({"name": "🚀 새 상점", "current_value": 130})
+    turns, names, values = _prepare_stock_data(game_data)
+    assert names[-1] == "🚀 새 상점"
+    assert values[2, 0] == values[1, 0] == game_data[1]['stocks'][0]['current_value']
+    assert list(values[:, 3]) == [100, 100, 100, 100, 130, 130, 130]
+
+    # 'stocks'가 없는 턴과 값이 없는 상점도 직전 값으로 채움
+    del game_data[3]['stocks']
+    del game_data[5]['stocks'][1]['current_value']
+    turns, names, values = _prepare_stock_data(game_data)
+    assert list(values[3]) == list(values[2])
+    assert values[5, 1] == values[4, 1] == game_data[4]['stocks'][1]['current_value']
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+컨텍스트 캐시 테스트 - 로컬 대체 구현과 가짜 LLM으로 캐시 참조/적중 지표를 검증합니다.
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.models.context_cache import LocalContextCache, ContextCache, CACHED_REQUEST_PROMPT
+from src.models.llm_handler import create_prompt_template, generate_game_data
+
+VALID_JSON = '[{"turn_number": 1, "stocks": []}]'
+STATIC_PROMPT = "시나리오 규칙 " * 50
+
+
+def make_recording_llm():
+    """받은 메시지 목록을 기록하는 가짜 LLM"""
+    received = []
+
+    def respond(prompt):
+        received.append(prompt.to_messages())
+        return AIMessage(content=VALID_JSON)
+
+    return RunnableLambda(respond), received
+
+
+def test_static_prefix_is_sent_inline_without_cache():
+    llm, received = make_recording_llm()
+    generate_game_data(llm, create_prompt_template("system"), "턴 요청", static_prompt=STATIC_PROMPT)
+    assert received[0][0].content == "system"
+    assert received[0][1].content == f"{STATIC_PROMPT}\n\n턴 요청"
+
+
+def test_local_cache_counts_hits_and_sends_full_prompt():
+    llm, received = make_recording_llm()
+    cache = LocalContextCache()
+    for _ in range(3):
+        result = generate_game_data(llm, create_prompt_template("system"), "", static_prompt=STATIC_PROMPT,
+                                    context_cache=cache)
+        assert result == VALID_JSON
+
+    # 로컬 캐시 이름은 제공자에 보내지 않으므로 요청은 전체 프롬프트, 적중은 지표에만 기록
+    assert len(received) == 3
+    assert all([message.content for message in messages] == ["system", STATIC_PROMPT] for messages in received)
+    assert (cache.stats.lookups, cache.stats.hits, cache.stats.creations) == (3, 2, 1)
+    assert cache.stats.cached_tokens > 0
+    assert cache.stats.as_dict()["hit_rate"] == round(2 / 3, 4)
+
+
+def test_cache_creation_failure_falls_back_to_inline_prompt():
+    class FailingCache(ContextCache):
+        def _create(self, llm, system_prompt, static_prompt):
+            raise RuntimeError("최소 토큰 수 미달")
+
+    llm, received = make_recording_llm()
+    cache = FailingCache()
+    generate_game_data(llm, create_prompt_template("system"), "", static_prompt=STATIC_PROMPT, context_cache=cache)
+    assert received[0][1].content == STATIC_PROMPT
+    assert cache.stats.failures == 1
+
+
+def test_expired_entries_are_recreated():
+    cache = LocalContextCache(ttl_seconds=0)
+    llm = object()
+    first = cache.lookup(llm, "system", STATIC_PROMPT)
+    assert cache.lookup(llm, "system", STATIC_PROMPT) == first
+    assert cache.stats.creations == 2
+    cache.invalidate(first)
+    assert not cache._entries
+
+
+def test_gemini_request_falls_back_when_cache_expired(monkeypatch):
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from src.models.context_cache import GeminiContextCache
+
+    requests = []
+
+    def fake_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        requests.append((kwargs.get("cached_content"), [message.content for message in messages]))
+        if kwargs.get("cached_content"):
+            raise RuntimeError("CachedContent not found")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=VALID_JSON))])
+
+    monkeypatch.setattr(ChatGoogleGenerativeAI, "_generate", fake_generate)
+    monkeypatch.setattr(ChatGoogleGenerativeAI, "create_cached_content",
+                        lambda self, contents, **kwargs: "cachedContents/test")
+    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", google_api_key="test-key")
+    cache = GeminiContextCache()
+
+    result = generate_game_data(llm, create_prompt_template("system"), "", structured=False,
+                                static_prompt=STATIC_PROMPT, context_cache=cache)
+    assert result == VALID_JSON
+    assert requests[0] == ("cachedContents/test", [CACHED_REQUEST_PROMPT])
+    assert requests[1] == (None, ["system", STATIC_PROMPT])
+    assert not cache._entries
+
+
+def test_local_cache_handle_is_not_sent_to_gemini(monkeypatch):
+    from langchain_core.outputs import ChatGeneration, ChatResult
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    requests = []
+
+    def fake_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        requests.append(kwargs.get("cached_content"))
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=VALID_JSON))])
+
+    monkeypatch.setattr(ChatGoogleGenerativeAI, "_generate", fake_generate)
+    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", google_api_key="test-key")
+    cache = LocalContextCache()
+    for _ in range(2):
+        generate_game_data(llm, create_prompt_template("system"), "", structured=False,
+                           static_prompt=STATIC_PROMPT, context_cache=cache)
+
+    # 요청당 한 번만 호출하고 가짜 캐시 이름은 보내지 않음
+    assert requests == [None, None]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.creations) == (1, 1, 1)
+
+
+def test_incomplete_cache_backend_fails_on_creation():
+    class IncompleteCache(ContextCache):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteCache()
+
+
+def test_unknown_cache_setting_disables_cache(monkeypatch, capsys):
+    from src.models.context_cache import get_context_cache
+
+    monkeypatch.setenv("LLM_CONTEXT_CACHE", "off")
+    assert get_context_cache() is None
+    assert get_context_cache() is None
+    assert capsys.readouterr().out.count("알 수 없는 컨텍스트 캐시 설정") == 1
+
+
+def test_cache_creation_is_single_flight_and_failures_are_remembered():
+    import threading
+
+    release = threading.Event()
+    created = []
+
+    class SlowCache(ContextCache):
+        def _create(self, llm, system_prompt, static_prompt):
+            created.append(static_prompt)
+            if static_prompt == "broken":
+                raise RuntimeError("upload failed")
+            if static_prompt == "slow":
+                assert release.wait(5)
+            return f"cache/{static_prompt}"
+
+    cache = SlowCache()
+    llm = object()
+    results = []
+    workers = [threading.Thread(target=lambda: results.append(cache.lookup(llm, "system", "slow")))
+               for _ in range(3)]
+    for worker in workers:
+        worker.start()
+
+    # 느린 생성이 진행 중이어도 다른 접두부는 기다리지 않음
+    assert cache.lookup(llm, "system", "fast") == "cache/fast"
+    release.set()
+    for worker in workers:
+        worker.join(5)
+    assert results == ["cache/slow"] * 3
+    assert created.count("slow") == 1
+
+    # 실패한 생성은 잠시 기억해 두고 다시 업로드하지 않음
+    assert cache.lookup(llm, "system", "broken") is None
+    assert cache.lookup(llm, "system", "broken") is None
+    assert created.count("broken") == 1
+    assert cache.stats.failures == 1
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+이벤트 기반 게임 상태 테스트
+"""
+
+import os
+import sys
+import json
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import streamlit as st
+
+from src.data.data_handler import create_sample_game_data
+from src.game.event_log import GameEventLog
+from src.game.game_logic import process_investment, initialize_new_game, export_game_state, restore_game_state
+
+
+def test_replay_from_snapshots():
+    log = GameEventLog(1000, snapshot_interval=2)
+    log.buy(1, "🍎", 3, 100)
+    log.buy(1, "🍌", 2, 50)
+    log.advance(1, 1000)
+    log.sell(2, "🍎", 3, 120)
+    log.advance(2, 1160)
+    log.buy(3, "🍌", 1, 40)
+    log.advance(3, 1100)
+
+    assert log.balance == 1000 - 300 - 100 + 360 - 40
+    assert log.holdings == {"🍌": 3}
+    first = log.state_at(1)
+    assert (first.balance, first.holdings) == (600, {"🍎": 3, "🍌": 2})
+    assert log.state_at(2).holdings == {"🍌": 2}
+    assert log.state_at(0).balance == 1000
+    assert [record['total_asset_value'] for record in log.state_at(2).history] == [1000, 1160]
+
+    # JSON 왕복 후에도 같은 상태
+    restored = GameEventLog.from_dict(json.loads(json.dumps(log.to_dict())))
+    assert restored.state_at(3) == log.state_at(3)
+    assert restored.history() == log.history()
+
+
+def test_save_and_resume_game(monkeypatch):
+    monkeypatch.setattr("src.game.game_logic._save_scenario", lambda game_data, filename: None)
+    game_data = create_sample_game_data()
+    initialize_new_game(game_data, "magic_kingdom")
+    names = [stock['name'] for stock in game_data[0]['stocks']]
+
+    assert process_investment({names[0]: 2}, game_data[0], 1)
+    st.session_state.current_turn_index = 1
+    assert process_investment({names[0]: -1, names[1]: 1}, game_data[1], 2)
+    st.session_state.current_turn_index = 2
+    # 히스토리에는 보유 수량 사본이 없음
+    assert 'investments' not in st.session_state.investment_history[-1]
+
+    saved = json.loads(json.dumps(export_game_state()))
+    expected = (st.session_state.player_balance, st.session_state.player_investments,
+                st.session_state.investment_history)
+
+    restore_game_state(saved)
+    assert (st.session_state.player_balance, st.session_state.player_investments,
+            st.session_state.investment_history) == expected
+    assert st.session_state.current_turn_index == 2
+    assert st.session_state.current_step == 'game'
+
+
+def test_saved_game_references_scenario_file_and_resumes(tmp_path, monkeypatch):
+    import src.game.game_logic as game_logic
+    from src.data.data_handler import save_game_data
+    from src.data.session_store import MemorySessionStore, SQLiteSessionStore
+    from src.game import resources
+
+    game_data = create_sample_game_data()
+    save_game_data(game_data, str(tmp_path), "game_scenario_a.json")
+    monkeypatch.setattr(game_logic, "load_scenario", lambda filename: resources.load_scenario(filename, str(tmp_path)))
+    # 메모리 저장소면 시나리오 파일이 지워져도 이어할 수 있도록 턴 데이터를 함께 저장
+    monkeypatch.setattr(game_logic, "get_saved_game_store", lambda: MemorySessionStore())
+    initialize_new_game(game_data, "loaded", scenario_file="game_scenario_a.json")
+    assert export_game_state()['game_data'] == game_data
+    store = SQLiteSessionStore(str(tmp_path / ".sessions.db"), "saved_games")
+    monkeypatch.setattr(game_logic, "get_saved_game_store", lambda: store)
+
+    initialize_new_game(resources.load_scenario("game_scenario_a.json", str(tmp_path)).turns, "loaded",
+                        scenario_file="game_scenario_a.json")
+    names = [stock['name'] for stock in game_data[0]['stocks']]
+    assert process_investment({names[0]: 2}, game_data[0], 1)
+    st.session_state.current_turn_index = 1
+
+    # 파일로 저장된 시나리오는 턴 데이터 없이 파일명만 저장
+    saved = export_game_state()
+    assert 'game_data' not in saved and saved['scenario_file'] == "game_scenario_a.json"
+    player_id = game_logic.get_player_id()
+    store.put("saved_game_1", saved, player_id=player_id, scenario_id=saved['scenario_file'])
+    store.put("saved_game_2", saved, player_id="other-player", scenario_id=saved['scenario_file'])
+    expected = (st.session_state.player_balance, st.session_state.player_investments)
+
+    game_logic.reset_game_state()
+    assert game_logic.load_saved_game("saved_game_1")
+    assert (st.session_state.player_balance, st.session_state.player_investments) == expected
+    assert st.session_state.game_data == game_data
+    assert st.session_state.saved_game == {'id': "saved_game_1", 'events': 2, 'turn': 1}
+    assert game_logic.get_player_id() == player_id
+    # 다른 플레이어의 저장 게임은 불러올 수 없음
+    assert not game_logic.load_saved_game("saved_game_2")
+    assert not game_logic.load_saved_game("missing")
+
+
+def test_saved_scenario_name_follows_codec(tmp_path, monkeypatch):
+    from src.game.game_logic import _save_scenario
+
+    monkeypatch.setenv("SCENARIO_CODEC", "compact")
+    saved = _save_scenario(create_sample_game_data(), str(tmp_path / "game_scenario_x.json"))
+    assert saved == "game_scenario_x.scn"
+    assert os.path.exists(tmp_path / saved)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+시나리오 파일 저장 테스트 - 원자적 저장, 체크섬 검증, 압축 형식
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.utils import file_manager
+from src.utils.file_manager import (save_scenario_to_file, load_scenario_from_file, read_checked_json,
+                                    write_checked_json, get_available_scenarios, ChecksumMismatchError)
+from src.utils.scenario_codec import encode_scenario, decode_scenario, COMPRESSION_ZSTD, COMPRESSION_ZLIB
+
+
+def test_scenario_round_trip_is_compact_and_checksummed(tmp_path):
+    path = str(tmp_path / "scenario.json")
+    save_scenario_to_file(create_sample_game_data(), path)
+
+    content = open(path, encoding="utf-8").read()
+    assert "\n" not in content
+    envelope = json.loads(content)
+    assert envelope["format"] == 1
+    assert envelope["checksum"].startswith("sha256:")
+    assert load_scenario_from_file(path) == create_sample_game_data()
+    assert os.listdir(tmp_path) == ["scenario.json"]
+
+
+def test_corrupted_file_is_rejected(tmp_path):
+    path = str(tmp_path / "scenario.json")
+    save_scenario_to_file(create_sample_game_data(), path)
+    envelope = json.loads(open(path, encoding="utf-8").read())
+    envelope["data"][3]["stocks"][0]["current_value"] = 999
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(envelope, f, ensure_ascii=False)
+
+    with pytest.raises(ChecksumMismatchError):
+        read_checked_json(path)
+    assert load_scenario_from_file(path) is None
+
+
+def test_legacy_plain_file_still_loads(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps(create_sample_game_data(), ensure_ascii=False, indent=2), encoding="utf-8")
+    assert load_scenario_from_file(str(path)) == create_sample_game_data()
+
+
+def test_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "save.json")
+    write_checked_json(path, {"turn": 1})
+
+    def crash(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(file_manager.os, "replace", crash)
+    with pytest.raises(OSError):
+        write_checked_json(path, {"turn": 2})
+    assert read_checked_json(path) == {"turn": 1}
+    assert os.listdir(tmp_path) == ["save.json"]
+
+
+def test_compact_codec_round_trip(tmp_path):
+    path = save_scenario_to_file(create_sample_game_data(), str(tmp_path / "scenario.json"), codec="compact")
+    assert path.endswith(".scn")
+    assert load_scenario_from_file(path) == create_sample_game_data()
+    assert get_available_scenarios(str(tmp_path)) == []  # game_scenario_ 접두사가 아님
+
+    data = bytearray(open(path, "rb").read())
+    data[-5] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(bytes(data))
+    assert load_scenario_from_file(path) is None
+
+
+@pytest.mark.parametrize("compression", [COMPRESSION_ZSTD, COMPRESSION_ZLIB])
+def test_codec_keeps_per_turn_differences(compression):
+    turns = create_sample_game_data()
+    turns[2]['stocks'][1]['description'] = "이번 턴에만 다른 설명"
+    turns[3]['stocks'].reverse()
+    del turns[4]['stocks'][0]['expectation']
+    turns[5]['stocks'][2]['extra'] = {"note": "추가 필드"}
+    assert decode_scenario(encode_scenario(turns, compression)) == turns
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+게임 세션 API 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.data.session_store import MemorySessionStore
+
+
+def test_play_game_over_api(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.api as api
+    from src.data.data_handler import save_game_data
+    from src.data.scenario_repository import ScenarioRepository
+
+    game_data = create_sample_game_data()
+    save_game_data(game_data, str(tmp_path / "data"), "game_scenario_a.json")
+    monkeypatch.setattr(api, "scenario_repository", ScenarioRepository(str(tmp_path / "data")))
+    monkeypatch.setattr(api, "game_sessions", MemorySessionStore())
+    client = TestClient(api.app)
+    names = [stock["name"] for stock in game_data[0]["stocks"]]
+
+    created = client.post("/games", json={"scenario_id": "game_scenario_a", "player_id": "kid-1"})
+    assert created.status_code == 201
+    game = created.json()
+    assert game["scenario_id"] == "game_scenario_a.json"
+    assert game["current_turn"]["turn_number"] == 1
+    game_id = game["game_id"]
+
+    state = client.post(f"/games/{game_id}/turns", json={"orders": {names[0]: 3}}).json()
+    price = game_data[0]["stocks"][0]["current_value"]
+    assert state["balance"] == 1000 - 3 * price
+    assert state["holdings"] == {names[0]: 3}
+    assert state["current_turn_index"] == 1
+
+    # 잘못된 주문은 거절되고 게임은 그대로
+    assert client.post(f"/games/{game_id}/turns", json={"orders": {names[0]: -5}}).status_code == 400
+    assert client.post(f"/games/{game_id}/turns", json={"orders": {"없는 상점": 1}}).status_code == 400
+    assert client.get(f"/games/{game_id}").json() == state
+    assert [game["game_id"] for game in client.get("/games", params={"player_id": "kid-1"}).json()] == [game_id]
+
+    for _ in range(len(game_data) - 1):
+        state = client.post(f"/games/{game_id}/turns", json={"orders": {}}).json()
+    assert state["finished"] and state["current_turn"] is None
+    assert len(state["history"]) == len(game_data)
+    assert client.post(f"/games/{game_id}/turns", json={"orders": {}}).status_code == 409
+
+    assert client.delete(f"/games/{game_id}").status_code == 204
+    assert client.get(f"/games/{game_id}").status_code == 404
+    assert client.post("/games", json={"scenario_id": "missing"}).status_code == 404
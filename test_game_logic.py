@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+게임 투자 처리/자산 계산 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import numpy as np
+import streamlit as st
+
+from src.data.data_handler import create_sample_game_data
+from src.game.game_logic import process_investment, calculate_total_assets, portfolio_value, reset_game_state
+
+
+def start_game():
+    reset_game_state()
+    st.session_state.player_balance = 1000
+    st.session_state.player_investments = {}
+    st.session_state.investment_history = []
+    return create_sample_game_data()
+
+
+def test_process_investment_and_total_assets():
+    game_data = start_game()
+    first, second = game_data[0], game_data[1]
+    names = [stock['name'] for stock in first['stocks']]
+
+    assert process_investment({names[0]: 3, names[2]: 2, "없는 상점": 5}, first, 1)
+    assert st.session_state.player_balance == 500
+    assert st.session_state.investment_history[-1]['total_asset_value'] == 1000
+    assert isinstance(calculate_total_assets(first), int)
+
+    expected = 500 + 3 * second['stocks'][0]['current_value'] + 2 * second['stocks'][2]['current_value']
+    assert calculate_total_assets(second) == expected
+    # 매도 후에는 다시 계산
+    assert process_investment({names[0]: -3}, second, 2)
+    assert calculate_total_assets(second) == expected
+
+    # 잔액보다 큰 매수는 거절
+    assert not process_investment({names[1]: 1000}, second, 2)
+
+
+def test_portfolio_value_on_arrays():
+    shares = np.array([[1, 0, 2], [0, -1, 1]])
+    prices = np.array([[100, 50, 10], [120, 60, 30]])
+    assert list(portfolio_value(np.array([0, 10]), shares, prices)) == [120, 40]
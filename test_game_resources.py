@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Streamlit 공유 리소스(LLM 클라이언트, 시나리오 목록/캐시) 테스트
+"""
+
+import os
+import sys
+import time
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import src.game.resources as resources
+from src.data.data_handler import create_sample_game_data, save_game_data
+
+
+def test_llm_client_is_shared_without_touching_environment(monkeypatch):
+    monkeypatch.setenv("GOOGLE_API_KEY", "process-key")
+    created = []
+    monkeypatch.setattr(resources, "initialize_llm", lambda api_key: created.append(api_key) or object())
+    resources.get_llm_client.clear()
+
+    client = resources.get_llm_client("session-key")
+    assert resources.get_llm_client("session-key") is client
+    assert resources.get_llm_client("other-key") is not client
+    assert created == ["session-key", "other-key"]
+    assert os.environ["GOOGLE_API_KEY"] == "process-key"
+
+
+def test_scenarios_are_cached_until_file_or_list_changes(tmp_path):
+    data_dir = str(tmp_path)
+    path = save_game_data(create_sample_game_data(), data_dir, "game_scenario_magic_kingdom_1.json")
+
+    scenario = resources.load_scenario("game_scenario_magic_kingdom_1.json", data_dir)
+    assert resources.load_scenario("game_scenario_magic_kingdom_1.json", data_dir) is scenario
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    assert resources.load_scenario("game_scenario_magic_kingdom_1.json", data_dir) is not scenario
+    assert resources.load_scenario("missing.json", data_dir) is None
+
+    assert resources.list_scenarios(data_dir) == ("game_scenario_magic_kingdom_1.json",)
+    save_game_data(create_sample_game_data(), data_dir, "game_scenario_magic_kingdom_2.json",
+                   check_duplicates=False)
+    assert len(resources.list_scenarios(data_dir)) == 1
+    resources.invalidate_scenario_list()
+    assert len(resources.list_scenarios(data_dir)) == 2
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+LLM 응답 JSON 추출/복구 테스트
+"""
+
+import os
+import sys
+import json
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.utils.json_extractor import extract_json_array, parse_json_array, find_array_start
+from src.data.data_handler import create_sample_game_data
+
+SCENARIO_JSON = json.dumps(create_sample_game_data(), ensure_ascii=False, indent=2)
+
+
+def test_clean_array_is_returned_unchanged():
+    json_content, repairs = extract_json_array(SCENARIO_JSON)
+    assert json_content == SCENARIO_JSON
+    assert repairs == []
+
+
+def test_code_fence_and_prose_are_ignored():
+    content = f"시나리오입니다 [참고]\n```json\n{SCENARIO_JSON}\n```\n끝!"
+    assert parse_json_array(content) == create_sample_game_data()
+
+
+def test_trailing_commas_and_comments_are_repaired():
+    content = '[\n  {"a": [1, 2,], "b": {"c": 1,},},\n  // 이하 반복\n  {"d": "//문자열 안은 유지"},\n]'
+    json_content, repairs = extract_json_array(content)
+    assert json.loads(json_content) == [{"a": [1, 2], "b": {"c": 1}}, {"d": "//문자열 안은 유지"}]
+    assert "trailing comma 제거" in repairs
+    assert "주석 제거" in repairs
+
+
+def test_raw_newline_inside_string_is_escaped():
+    assert parse_json_array('[{"news": "첫 줄\n둘째 줄"}]') == [{"news": "첫 줄\n둘째 줄"}]
+
+
+def test_truncated_response_keeps_complete_turns():
+    truncated = SCENARIO_JSON[: int(len(SCENARIO_JSON) * 0.8)]
+    game_data = parse_json_array(truncated)
+    assert game_data == create_sample_game_data()[:len(game_data)]
+    assert 0 < len(game_data) < 7
+
+
+def test_no_array_returns_none():
+    assert extract_json_array("JSON이 없는 응답 [1턴]") == (None, [])
+    assert find_array_start("[1, 2] 그리고 [ {") == 11
+    assert parse_json_array('[{"a": 1') is None
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+LLM 핸들러 테스트 - 실제 API 호출 없이 가짜 LLM으로 생성 로직을 검증합니다.
+"""
+
+import os
+import sys
+import time
+import threading
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_google_genai.chat_models import ChatGoogleGenerativeAIError
+
+from src.models.llm_handler import create_prompt_template, generate_game_data, build_response_schema
+
+VALID_JSON = '[{"turn_number": 1, "stocks": []}]'
+
+
+def make_fake_llm(responses):
+    """호출 순서대로 (지연 시간, 응답 내용)을 돌려주는 가짜 LLM"""
+    calls = []
+    lock = threading.Lock()
+
+    def respond(_prompt):
+        with lock:
+            index = len(calls)
+            calls.append(index)
+        delay, content = responses[index]
+        time.sleep(delay)
+        return AIMessage(content=content)
+
+    return RunnableLambda(respond), calls
+
+
+def test_generate_without_hedge():
+    llm, calls = make_fake_llm([(0, VALID_JSON)])
+    result = generate_game_data(llm, create_prompt_template("system"), "question")
+    assert result == VALID_JSON
+    assert len(calls) == 1
+
+
+def test_hedge_wins_when_primary_is_slow():
+    llm, calls = make_fake_llm([(2.0, VALID_JSON), (0, '[{"turn_number": 2}]')])
+    started_at = time.monotonic()
+    result = generate_game_data(llm, create_prompt_template("system"), "question",
+                                hedge=True, hedge_delay=0.05)
+    assert result == '[{"turn_number": 2}]'
+    assert len(calls) == 2
+    assert time.monotonic() - started_at < 1.5
+
+
+def test_hedge_not_sent_when_primary_is_fast():
+    llm, calls = make_fake_llm([(0, VALID_JSON), (0, VALID_JSON)])
+    result = generate_game_data(llm, create_prompt_template("system"), "question",
+                                hedge=True, hedge_delay=1.0)
+    assert result == VALID_JSON
+    assert len(calls) == 1
+
+
+def test_hedge_sent_immediately_when_primary_fails():
+    llm, calls = make_fake_llm([(0, "JSON이 아닌 응답"), (0, VALID_JSON)])
+    result = generate_game_data(llm, create_prompt_template("system"), "question",
+                                hedge=True, hedge_delay=30.0)
+    assert result == VALID_JSON
+    assert len(calls) == 2
+
+
+def test_response_schema_matches_scenario_model():
+    schema = build_response_schema()
+    assert schema["type"] == "ARRAY"
+    assert schema["min_items"] == schema["max_items"] == 7
+    stock = schema["items"]["properties"]["stocks"]["items"]
+    assert stock["properties"]["current_value"]["type"] == "NUMBER"
+    assert stock["properties"]["risk_level"]["enum"] == ["저위험", "중위험", "고위험"]
+    assert "risk_level" in stock["required"]
+
+
+def test_structured_request_falls_back_to_plain(monkeypatch):
+    requests = []
+
+    def fake_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        requests.append(kwargs.get("generation_config"))
+        if kwargs.get("generation_config"):
+            raise ChatGoogleGenerativeAIError("response_schema is not supported")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=VALID_JSON))])
+
+    monkeypatch.setattr(ChatGoogleGenerativeAI, "_generate", fake_generate)
+    llm = ChatGoogleGenerativeAI(model="gemini-2.5-flash", google_api_key="test-key")
+    result = generate_game_data(llm, create_prompt_template("system"), "question", structured=True)
+    assert result == VALID_JSON
+    assert requests[0]["response_mime_type"] == "application/json"
+    assert requests[1] is None
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+유사 시나리오 탐지 테스트 (MinHash/LSH 인덱스)
+"""
+
+import os
+import sys
+import json
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.data.near_duplicates import NearDuplicateIndex, find_near_duplicates, price_similarity
+from src.models.scenario import validate_scenario
+
+
+def make_different_scenario():
+    """샘플과 텍스트와 가격 흐름이 모두 다른 시나리오"""
+    game_data = create_sample_game_data()
+    for turn in game_data:
+        turn['news'] = f"바다 건너 상인들이 {turn['turn_number']}척의 배에 향신료를 싣고 왔어요"
+        turn['result'] = "항구가 북적였고 시장 골목마다 새로운 냄새가 퍼졌어요"
+        turn['news_tag'] = "무역이 늘면 가게들이 함께 바빠져요"
+        if turn['turn_number'] > 1:
+            for stock in turn['stocks']:
+                stock['current_value'] = 100 + turn['turn_number'] * 15
+    return game_data
+
+
+def test_slightly_edited_scenario_is_near_duplicate():
+    index = NearDuplicateIndex()
+    index.add("original.json", create_sample_game_data())
+    index.add("different.json", make_different_scenario())
+
+    edited = create_sample_game_data()
+    edited[2]['news'] = edited[2]['news'].replace("마을", "왕국")
+    edited[4]['stocks'][0]['current_value'] += 2
+
+    matches = index.query(edited)
+    assert matches[0][0] == "original.json"
+    assert 0.8 <= matches[0][1] < 1.0
+    assert index.query(create_sample_game_data()) == [("original.json", 1.0)]
+    assert index.find_duplicate(make_different_scenario()) == "different.json"
+
+    other = make_different_scenario()
+    for turn in other:
+        turn['news'] = turn['result'] = turn['news_tag'] = f"겨울 눈보라가 몰아친 {turn['turn_number']}일째"
+    assert index.find_duplicate(other) is None
+
+
+def test_price_similarity():
+    prices = validate_scenario(create_sample_game_data()).prices
+    assert price_similarity(prices, prices) == 1.0
+    assert price_similarity(prices, prices[:3]) == 0.0
+
+
+def test_find_near_duplicates_keeps_first_file(tmp_path):
+    edited = create_sample_game_data()
+    edited[6]['result'] += " 모두 즐거웠어요."
+    for filename, game_data in [("a.json", create_sample_game_data()), ("b.json", make_different_scenario()),
+                                ("c.json", edited), ("d.json", create_sample_game_data())]:
+        (tmp_path / filename).write_text(json.dumps(game_data, ensure_ascii=False), encoding="utf-8")
+
+    duplicates = find_near_duplicates(str(tmp_path))
+    assert [(filename, original) for filename, original, _ in duplicates] == [("c.json", "a.json"), ("d.json", "a.json")]
+
+
+def test_save_rejects_near_duplicate_but_allows_overwrite(tmp_path):
+    from src.data.data_handler import save_game_data, DuplicateScenarioError
+
+    data_dir = str(tmp_path)
+    save_game_data(create_sample_game_data(), data_dir, "game_scenario_a.json")
+    edited = create_sample_game_data()
+    edited[0]['news'] += "!"
+    try:
+        save_game_data(edited, data_dir, "game_scenario_b.json")
+        assert False, "유사한 시나리오는 저장되지 않아야 함"
+    except DuplicateScenarioError as e:
+        assert e.duplicate_of == "game_scenario_a.json"
+    assert not os.path.exists(os.path.join(data_dir, "game_scenario_b.json"))
+
+    # 같은 파일을 고쳐 저장하는 것은 허용, 다른 시나리오도 저장됨
+    save_game_data(edited, data_dir, "game_scenario_a.json")
+    save_game_data(make_different_scenario(), data_dir, "game_scenario_c.json")
+
+
+def test_deleted_scenario_no_longer_blocks_saves(tmp_path):
+    from src.data.data_handler import save_game_data
+
+    data_dir = str(tmp_path)
+    path = save_game_data(create_sample_game_data(), data_dir, "game_scenario_a.json")
+    os.remove(path)
+
+    # 지워진 파일은 인덱스에서 빠지므로 같은 시나리오를 다시 저장할 수 있음
+    assert os.path.exists(save_game_data(create_sample_game_data(), data_dir, "game_scenario_b.json"))
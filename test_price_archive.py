@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+가격 아카이브(mmap)와 벡터화 백테스트 테스트
+"""
+
+import io
+import os
+import sys
+import json
+import random
+import contextlib
+
+import numpy as np
+import pytest
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.data.price_archive import PriceArchive, PriceArchiveError, build_price_archive, write_price_archive
+from src.models.scenario import validate_scenario
+from src.simulation.backtest import backtest_archive
+from src.simulation.simulator import run_automated_simulation
+
+
+def test_archive_round_trip(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for name in ["a.json", "b.json"]:
+        (data_dir / name).write_text(json.dumps(create_sample_game_data(), ensure_ascii=False), encoding="utf-8")
+    (data_dir / "short.json").write_text(json.dumps(create_sample_game_data()[:5], ensure_ascii=False),
+                                         encoding="utf-8")
+    path = str(tmp_path / "prices.bin")
+
+    assert build_price_archive(str(data_dir), path) == 2
+
+    scenario = validate_scenario(create_sample_game_data())
+    with PriceArchive(path) as archive:
+        assert len(archive) == 2
+        assert archive.ids == ["a.json", "b.json"]
+        prices, risk_codes = archive[1]
+        assert prices.shape == (7, 3)
+        assert np.allclose(prices, scenario.prices)
+        assert risk_codes.tolist() == [0, 1, 2]
+        assert not prices.flags.writeable
+        assert archive.offsets.tolist() == [64, 64 + 7 * 3 * 4]
+        del prices, risk_codes
+
+    (tmp_path / "broken.bin").write_bytes(open(path, "rb").read()[:-3])
+    with pytest.raises(PriceArchiveError):
+        PriceArchive(str(tmp_path / "broken.bin"))
+
+
+def test_backtest_matches_simulator(tmp_path):
+    scenario = validate_scenario(create_sample_game_data())
+    path = str(tmp_path / "prices.bin")
+    write_price_archive(path, ((str(i), scenario) for i in range(4000)))
+
+    results = backtest_archive(path, chunk_size=1000, seed=7)
+    assert np.array_equal(results["trend"], backtest_archive(path, chunk_size=1000, seed=7)["trend"])
+
+    random.seed(7)
+    for strategy in ["conservative", "aggressive", "trend"]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = [run_automated_simulation(scenario.turns, strategy)["profit_rate"] for _ in range(400)]
+        assert results[strategy].shape == (4000,)
+        assert abs(results[strategy].mean() - np.mean(expected)) < 2.5
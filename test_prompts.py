@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+프롬프트 레지스트리 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.utils.prompts import (
+    get_game_scenario_prompt, get_prompt, get_prompt_token_report, list_prompts, estimate_tokens
+)
+from src.utils.file_manager import SCENARIO_TYPES
+
+
+def test_all_scenarios_are_registered():
+    assert set(SCENARIO_TYPES.values()) <= set(list_prompts())
+    assert get_game_scenario_prompt("unknown") == get_game_scenario_prompt("magic_kingdom")
+
+
+def test_compiled_prompt_has_shared_and_scenario_sections():
+    prompt = get_game_scenario_prompt("three_little_pigs", minimized=False)
+    assert prompt.startswith("당신은")
+    assert "\n## 🎭 게임 배경 스토리\n" in prompt
+    assert "1.  **7턴 구성**" in prompt
+    assert "9.  **긍정적/부정적 이벤트 균형**: 돼지마다" in prompt
+    assert "**돼지 정보 일관성**" in prompt
+    assert prompt.index("## 📜") < prompt.index("## 🎯") < prompt.index("## ✅")
+
+
+def test_minimized_prompt_is_smaller():
+    prompt = get_prompt("moonlight_thief", minimized=False)
+    minimized = get_prompt("moonlight_thief", minimized=True)
+    assert "## 🎯" not in minimized and "**" not in minimized
+    assert "## ✅" in minimized
+    assert estimate_tokens(minimized) < estimate_tokens(prompt)
+
+
+def test_token_report_covers_every_prompt():
+    report = get_prompt_token_report(count_tokens=len)
+    assert [row["name"] for row in report] == list_prompts()
+    assert all(row["tokens"] == row["chars"] for row in report)
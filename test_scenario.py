@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+시나리오 스키마 검증 테스트
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.models.scenario import validate_scenario, ScenarioValidationError, get_turn_json_schema
+from src.data.data_handler import create_sample_game_data, parse_json_data
+
+
+def _errors(game_data, **kwargs):
+    with pytest.raises(ScenarioValidationError) as excinfo:
+        validate_scenario(game_data, **kwargs)
+    return excinfo.value.errors
+
+
+def test_sample_scenario_is_valid():
+    scenario = validate_scenario(create_sample_game_data())
+    assert len(scenario) == 7
+    assert scenario.stock_names == ("🍞 빵집", "🎪 서커스단", "🔮 마법연구소")
+    assert scenario.risk_levels == ("저위험", "중위험", "고위험")
+    assert scenario.prices[0] == (100.0, 100.0, 100.0)
+    assert scenario.turns == create_sample_game_data()
+    assert validate_scenario(scenario) is scenario
+
+
+def test_risk_level_is_normalized():
+    game_data = create_sample_game_data()
+    for turn in game_data:
+        turn['stocks'][0]['risk_level'] = "저위험 (안정적)"
+    assert validate_scenario(game_data).turns[3]['stocks'][0]['risk_level'] == "저위험"
+
+
+def test_field_errors_report_location():
+    game_data = create_sample_game_data()
+    game_data[2]['stocks'][1]['current_value'] = "[예: 105]"
+    del game_data[4]['news']
+    errors = _errors(game_data)
+    assert len(errors) == 2
+    assert errors[0].startswith("턴 3 > stocks[1] > current_value")
+    assert errors[1].startswith("턴 5 > news")
+
+
+def test_cross_turn_rules():
+    game_data = create_sample_game_data()[:6]
+    game_data[0]['stocks'][0]['current_value'] = 101
+    game_data[3]['stocks'].pop()
+    game_data[4]['stocks'][2]['risk_level'] = "저위험"
+    game_data[5]['turn_number'] = 9
+    errors = _errors(game_data)
+    assert any("턴 수" in error for error in errors)
+    assert any(error.startswith("턴 1 > 🍞 빵집") for error in errors)
+    assert any(error.startswith("턴 4: 상점 구성") for error in errors)
+    assert any(error.startswith("턴 5 > 🔮 마법연구소: 위험도") for error in errors)
+    assert any(error.startswith("턴 6: turn_number") for error in errors)
+
+
+def test_partial_scenario_allowed_without_turn_count():
+    game_data = create_sample_game_data()[:2]
+    assert len(validate_scenario(game_data, expected_turns=None)) == 2
+
+
+def test_parse_json_data_rejects_invalid_scenario():
+    game_data = create_sample_game_data()
+    game_data[1]['stocks'][0]['current_value'] = -5
+    assert parse_json_data(json.dumps(game_data)) is None
+    assert parse_json_data(json.dumps(create_sample_game_data())) == create_sample_game_data()
+
+
+def test_json_schema_describes_turns():
+    schema = get_turn_json_schema()
+    assert schema["type"] == "array"
+    assert "TurnModel" in schema["$defs"]
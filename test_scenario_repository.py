@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+시나리오 저장소 캐시와 API 시작 준비(warm-up) 테스트
+"""
+
+import os
+import sys
+import time
+import threading
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data, save_game_data
+from src.data.scenario_repository import ScenarioRepository
+
+
+def test_repository_caches_and_reloads_changed_files(tmp_path):
+    data_dir = str(tmp_path)
+    path = save_game_data(create_sample_game_data(), data_dir, "game_scenario_a.json")
+    repository = ScenarioRepository(data_dir)
+
+    first = repository.get("game_scenario_a")
+    assert first is not None
+    assert repository.get("game_scenario_a.json") is first
+    assert repository.get("missing") is None
+
+    # 파일이 바뀌면 다시 읽음
+    changed = create_sample_game_data()
+    changed[0]['news'] = "새로운 소식"
+    save_game_data(changed, data_dir, "game_scenario_a.json")
+    os.utime(path, (time.time() + 5, time.time() + 5))
+    assert repository.get("game_scenario_a.json").turns[0]['news'] == "새로운 소식"
+
+
+def test_warm_up_prefers_most_used_scenarios(tmp_path):
+    data_dir = str(tmp_path)
+    for name in ("game_scenario_a.json", "game_scenario_b.json", "game_scenario_c.json"):
+        save_game_data(create_sample_game_data(), data_dir, name, check_duplicates=False)
+    repository = ScenarioRepository(data_dir)
+    repository.refresh()
+    for _ in range(3):
+        repository.get("game_scenario_b.json")
+    repository.save_usage()
+    assert repository.list_ids() == ["game_scenario_a.json", "game_scenario_b.json", "game_scenario_c.json"]
+
+    restarted = ScenarioRepository(data_dir)
+    restarted.load_usage()
+    assert restarted.warm_up(1) == 1
+    assert restarted.most_used(1) == ["game_scenario_b.json"]
+    assert restarted.cached_count == 1
+
+
+def test_api_reports_ready_after_warm_up(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import src.api as api
+
+    save_game_data(create_sample_game_data(), str(tmp_path), "game_scenario_a.json")
+    monkeypatch.setattr(api, "scenario_repository", ScenarioRepository(str(tmp_path)))
+    monkeypatch.setattr(api, "_warmup_state", dict(api._warmup_state, ready=False))
+    monkeypatch.setattr(api, "_llm", None)
+    release = threading.Event()
+
+    def slow_initialize_llm():
+        release.wait(5)
+        raise ValueError("Google API 키를 불러올 수 없습니다.")
+
+    monkeypatch.setattr(api, "initialize_llm", slow_initialize_llm)
+
+    with TestClient(api.app) as client:
+        assert client.get("/health/ready").status_code == 503
+        assert client.get("/health/live").status_code == 200
+        release.set()
+        for _ in range(100):
+            response = client.get("/health/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.05)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["preloaded_scenarios"] == 1
+        assert body["llm_ready"] is False
+        assert client.get("/scenario/game_scenario_a").json()["data"][0]["turn_number"] == 1
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+JSON 직렬화기 테스트 - 직렬화기와 관계없이 같은 바이트와 같은 데이터를 얻는지 확인합니다.
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.utils import serializer
+from src.utils.file_manager import save_scenario_to_file, load_scenario_from_file
+
+SERIALIZERS = serializer.available_serializers()
+
+
+@pytest.mark.parametrize("backend", SERIALIZERS, ids=[backend.name for backend in SERIALIZERS])
+def test_serializers_agree(backend):
+    game_data = create_sample_game_data()
+    expected = json.dumps(game_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    assert backend.dumps(game_data) == expected
+    assert backend.loads(expected) == game_data
+    assert backend.loads(backend.dumps(game_data, indent=True)) == game_data
+    with pytest.raises(json.JSONDecodeError):
+        backend.loads(b'[{"turn_number": 1,')
+
+
+def test_files_are_readable_with_any_serializer(tmp_path, monkeypatch):
+    path = str(tmp_path / "scenario.json")
+    save_scenario_to_file(create_sample_game_data(), path)
+    for backend in SERIALIZERS:
+        monkeypatch.setattr(serializer, "_serializer", backend)
+        assert load_scenario_from_file(path) == create_sample_game_data()
+
+
+def test_api_uses_configured_serializer():
+    from fastapi.testclient import TestClient
+    from src.api import app, FastJSONResponse
+
+    assert FastJSONResponse({"상점": "빵집"}).body == '{"상점":"빵집"}'.encode("utf-8")
+    response = TestClient(app).get("/scenarios")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
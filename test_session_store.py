@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+게임 세션/저장 게임 저장소 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+import pytest
+
+import src.data.session_store as session_store
+from src.data.session_store import SessionStore, MemorySessionStore, SQLiteSessionStore, import_saved_game_files
+from src.data.scenario_repository import ScenarioRepository
+from src.utils.file_manager import write_checked_json, get_available_scenarios
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(session_store.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_index_ttl_and_cleanup(backend, tmp_path, clock):
+    if backend == "memory":
+        store = MemorySessionStore(ttl_seconds=60)
+    else:
+        store = SQLiteSessionStore(str(tmp_path / "sessions.db"), "game_sessions", ttl_seconds=60)
+
+    store.put("a", {"turn": 1}, player_id="kid-1", scenario_id="s1")
+    clock[0] += 10
+    store.put("b", {"turn": 2}, player_id="kid-1", scenario_id="s2")
+    store.put("c", {"turn": 3}, player_id="kid-2", scenario_id="s1")
+
+    assert store.get("a") == {"turn": 1}
+    assert [entry["session_id"] for entry in store.list_sessions(player_id="kid-1")] == ["b", "a"]
+    assert [entry["session_id"] for entry in store.list_sessions(scenario_id="s1")] == ["c", "a"]
+    assert store.update("b", lambda data: {"turn": data["turn"] + 1}) == {"turn": 3}
+
+    # 마지막 변경 후 60초가 지난 항목만 만료
+    clock[0] += 55
+    assert store.get("a") is None
+    assert store.evict_expired() == 0
+    assert store.cleanup(player_id="kid-2") == 1
+    assert [entry["session_id"] for entry in store.list_sessions()] == ["b"]
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemorySessionStore(max_sessions=2)
+    store.put("a", {})
+    store.put("b", {})
+    store.get("a")
+    store.put("c", {})
+    assert store.get("b") is None
+    assert len(store) == 2
+
+
+def test_saved_game_files_move_into_store(tmp_path):
+    data_dir = str(tmp_path)
+    write_checked_json(os.path.join(data_dir, "saved_game_20250101_120000.json"), {"current_turn_index": 3})
+    store = SQLiteSessionStore(str(tmp_path / ".sessions.db"), "saved_games")
+
+    assert import_saved_game_files(store, data_dir) == 1
+    assert store.get("saved_game_20250101_120000") == {"current_turn_index": 3}
+    assert get_available_scenarios(data_dir) == []
+    assert not [name for name in os.listdir(data_dir) if name.endswith(".json")]
+
+
+def test_memory_store_leaves_saved_game_files(tmp_path):
+    data_dir = str(tmp_path)
+    path = os.path.join(data_dir, "saved_game_20250101_120000.json")
+    write_checked_json(path, {"current_turn_index": 3})
+
+    # 메모리 저장소로 옮기면 다시 시작할 때 사라지므로 파일을 그대로 두고, 시나리오 목록에서는 제외
+    assert import_saved_game_files(MemorySessionStore(), data_dir) == 0
+    assert os.path.exists(path)
+    assert ScenarioRepository(data_dir).list_ids() == []
+
+
+def test_incomplete_store_cannot_be_created():
+    class NoDeleteStore(SessionStore):
+        def list_sessions(self, player_id=None, scenario_id=None, limit=100):
+            return []
+
+    with pytest.raises(TypeError):
+        NoDeleteStore()
+
+
+def test_get_can_be_limited_to_player(tmp_path):
+    store = SQLiteSessionStore(str(tmp_path / ".sessions.db"), "saved_games")
+    store.put("a", {"turn": 1}, player_id="kid-1")
+    assert store.get("a", player_id="kid-1") == {"turn": 1}
+    assert store.get("a", player_id="kid-2") is None
+    assert store.cleanup(player_id="kid-2") == 0
+    assert store.get("a") == {"turn": 1}
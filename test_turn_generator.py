@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+턴별 시나리오 생성 테스트 - 가짜 LLM으로 백그라운드 생성과 재시도를 검증합니다.
+"""
+
+import os
+import sys
+import json
+import threading
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from src.data.data_handler import create_sample_game_data
+from src.game.turn_generator import TurnByTurnGenerator
+from src.utils.prompts import get_turn_scenario_prompt
+
+SAMPLE_TURNS = create_sample_game_data()
+
+
+def make_turn_llm(responses):
+    """호출 순서대로 응답을 돌려주는 가짜 LLM (프롬프트도 기록)"""
+    prompts = []
+    lock = threading.Lock()
+
+    def respond(prompt):
+        with lock:
+            prompts.append(prompt.to_messages()[-1].content)
+            content = responses[len(prompts) - 1]
+        return AIMessage(content=content)
+
+    return RunnableLambda(respond), prompts
+
+
+def test_turns_are_generated_in_background():
+    llm, prompts = make_turn_llm([json.dumps([turn], ensure_ascii=False) for turn in SAMPLE_TURNS])
+    completed = []
+
+    def save(turns):
+        completed.append(turns)
+        return "game_scenario_magic_kingdom_1.scn"
+
+    generator = TurnByTurnGenerator(llm, "magic_kingdom", on_complete=save)
+
+    assert generator.saved_file is None
+    assert generator.generate_next_turn() == SAMPLE_TURNS[0]
+    generator.start_background()
+    assert generator.wait_for_turn(6, timeout=5) == SAMPLE_TURNS[6]
+    generator._thread.join(timeout=5)
+
+    assert generator.is_complete
+    assert completed == [SAMPLE_TURNS]
+    assert generator.saved_file == "game_scenario_magic_kingdom_1.scn"
+    assert "7턴 하나만" in prompts[6]
+    assert SAMPLE_TURNS[5]['news_tag'] in prompts[6]
+
+
+def test_invalid_turn_is_retried_then_fails():
+    bad_turn = dict(SAMPLE_TURNS[0], turn_number=3)
+    llm, prompts = make_turn_llm([json.dumps([bad_turn]), json.dumps([SAMPLE_TURNS[0]]),
+                                  "JSON 없음", "JSON 없음"])
+    generator = TurnByTurnGenerator(llm, "magic_kingdom", max_attempts=2)
+
+    assert generator.generate_next_turn() == SAMPLE_TURNS[0]
+    assert generator.generate_next_turn() is None
+    assert generator.error.startswith("2턴")
+    assert generator.wait_for_turn(1, timeout=1) is None
+    assert len(prompts) == 4
+
+
+def test_turn_prompt_summarizes_previous_turns():
+    first_prompt = get_turn_scenario_prompt("moonlight_thief", 1, [])
+    assert "아직 없음" in first_prompt
+    assert "## 🎮 7턴 게임 시나리오" not in first_prompt
+
+    prompt = get_turn_scenario_prompt("magic_kingdom", 3, SAMPLE_TURNS[:2])
+    assert '"prices":{"🍞 빵집":105' in prompt
+    assert SAMPLE_TURNS[0]['result'] not in prompt
+
+
+def test_stop_cancels_background_generation():
+    started, release = threading.Event(), threading.Event()
+    responses = [json.dumps([turn], ensure_ascii=False) for turn in SAMPLE_TURNS]
+
+    def respond(prompt):
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+        calls.append(prompt)
+        return AIMessage(content=responses[len(calls) - 1])
+
+    calls = []
+    completed = []
+    generator = TurnByTurnGenerator(RunnableLambda(respond), "magic_kingdom", on_complete=completed.append)
+    assert generator.generate_next_turn() == SAMPLE_TURNS[0]
+    generator.start_background()
+    assert started.wait(5)
+
+    generator.stop()
+    release.set()
+    generator._thread.join(timeout=5)
+
+    # 진행 중이던 요청의 턴도 추가하지 않고, 더 요청하거나 저장하지 않음
+    assert len(calls) == 2
+    assert len(generator.turns) == 1
+    assert completed == []
+    assert generator.wait_for_turn(1, timeout=1) is None
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Streamlit UI 차트(Plotly 그림) 캐시 테스트
+"""
+
+import os
+import sys
+
+# 현재 디렉토리를 패스에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, current_dir)
+
+from src.data.data_handler import create_sample_game_data
+from src.models.scenario import validate_scenario
+from src.ui.components import create_simple_stock_plot, create_investment_history_chart
+
+
+def make_history(turns):
+    return [{'turn': turn, 'total_asset_value': 1000 + turn * 10, 'balance': 900 - turn} for turn in range(1, turns + 1)]
+
+
+def test_stock_plot_is_memoized_per_scenario_and_turn():
+    game_data = create_sample_game_data()
+    fig = create_simple_stock_plot(game_data)
+
+    assert create_simple_stock_plot(create_sample_game_data()) is fig
+    assert create_simple_stock_plot(validate_scenario(game_data)) is not None
+    partial = create_simple_stock_plot(game_data, current_turn=3)
+    assert partial is not fig
+    assert len(partial.data[0].x) == 3
+
+
+def test_history_chart_is_extended_incrementally():
+    cache = {}
+    fig = create_investment_history_chart(make_history(2), cache=cache)
+
+    assert create_investment_history_chart(make_history(2), cache=cache) is fig
+    extended = create_investment_history_chart(make_history(4), cache=cache)
+    assert extended is fig
+    assert list(fig.data[0].x) == [1, 2, 3, 4]
+    assert list(fig.data[1].y) == [899, 898, 897, 896]
+
+    # 새 게임(앞부분이 다른 기록)은 새 그림
+    restarted = make_history(2)
+    restarted[0]['balance'] = 1
+    assert create_investment_history_chart(restarted, cache=cache) is not fig
+    assert fig.to_dict() == create_investment_history_chart(make_history(4)).to_dict()